@@ -0,0 +1,97 @@
+"""大きなテキストの受け渡しのベンチマーク（一括実行 vs ストリーミング）
+
+xclipの代わりにcatを使い、X11CommandExecutor.executeで全体を一括で
+受け渡す場合とexecute_streamでチャンク単位に受け渡す場合について、
+所要時間とPython側のピークメモリ（tracemalloc）をデータ量ごとに比較する
+
+使用方法:
+    cd core
+    python -m benchmarks.bench_large_payload
+    python -m benchmarks.bench_large_payload --sizes 1024 1048576
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from mini_text_core.utils.x11_command_executor import (
+    TextSink,
+    X11CommandExecutor,
+    iter_encoded_chunks,
+)
+
+
+def make_text(size: int) -> str:
+    """SVGのテキストブロックを模したASCIIテキストを作成"""
+    line = '<text x="10" y="20">sample</text>\n'
+    return (line * (size // len(line) + 1))[:size]
+
+
+def run_execute(text: str) -> str:
+    """一括実行で受け渡し"""
+    success, stdout, stderr = X11CommandExecutor.execute(["cat"], input_data=text)
+    if not success:
+        raise RuntimeError(stderr)
+    return stdout
+
+
+def run_stream(text: str) -> str:
+    """ストリーミングで受け渡し"""
+    sink = TextSink()
+    success, stderr = X11CommandExecutor.execute_stream(
+        ["cat"], source=iter_encoded_chunks(text), sink=sink
+    )
+    if not success:
+        raise RuntimeError(stderr)
+    return sink.getvalue()
+
+
+def measure(func, text: str) -> tuple[float, int]:
+    """
+    1回の受け渡しの所要時間とピークメモリを計測
+
+    Returns:
+        tuple[float, int]: (所要時間(秒), 入力テキストを除くピークメモリ(バイト))
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(text)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert result == text
+    return elapsed, peak
+
+
+def format_size(size: int) -> str:
+    """バイト数を読みやすい単位で表示"""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024 or unit == "MB":
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size}B"
+
+
+def main():
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1024, 1024**2, 50 * 1024**2],
+        help="計測するテキストのサイズ(バイト)",
+    )
+    args = parser.parse_args()
+
+    print(f"{'size':>8}  {'mode':<8}  {'time':>10}  {'peak memory':>12}")
+    for size in args.sizes:
+        text = make_text(size)
+        for name, func in (("execute", run_execute), ("stream", run_stream)):
+            elapsed, peak = measure(func, text)
+            print(
+                f"{format_size(size):>8}  {name:<8}  {elapsed * 1000:>8.1f}ms"
+                f"  {format_size(peak):>12}"
+            )
+
+
+if __name__ == "__main__":
+    main()
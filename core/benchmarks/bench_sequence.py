@@ -0,0 +1,112 @@
+"""複数テキストの連続送信のベンチマーク（1件ずつ送信 vs まとめて送信）
+
+模擬X11環境で、同じウィンドウに複数のテキストを送信する場合について
+TextService.send_textを1件ずつ呼ぶ場合（区切りのキーは別途入力）と
+send_text_sequenceでまとめて送信する場合のスループット（件/秒）を比較する。
+それぞれxdotoolのコマンド連結（chain_commands）の有無で計測する
+
+使用方法:
+    cd core
+    python -m benchmarks.bench_sequence
+    python -m benchmarks.bench_sequence --items 20 --activate-wait 0.3 --key-wait 0.1
+"""
+
+import argparse
+import time
+
+from benchmarks.fake_x11 import FakeClipboardService, FakeX11, FakeX11Executor
+from mini_text_core.services.text_service import TextService
+from mini_text_core.services.window_service import WindowService
+
+
+def create_service(
+    x11: FakeX11, args: argparse.Namespace, chain_commands: bool
+) -> tuple[TextService, FakeX11Executor]:
+    """模擬環境のTextServiceを作成"""
+    executor = FakeX11Executor(x11, args.latency)
+    clipboard = FakeClipboardService(x11, args.latency, args.throughput)
+    service = TextService(
+        WindowService(executor), clipboard, executor, chain_commands=chain_commands
+    )
+    return service, executor
+
+
+def send_per_call(
+    service: TextService,
+    executor: FakeX11Executor,
+    window_id: str,
+    texts: list[str],
+    args: argparse.Namespace,
+) -> None:
+    """1件ずつsend_textで送信（テキストの間で区切りのキーを入力）"""
+    for index, text in enumerate(texts):
+        success, error_msg = service.send_text(window_id, text, args.activate_wait, 0)
+        if success and index < len(texts) - 1:
+            success, _, error_msg = executor.execute(["xdotool", "key", "Return"])
+        if not success:
+            raise RuntimeError(error_msg)
+
+
+def send_sequence(
+    service: TextService,
+    executor: FakeX11Executor,
+    window_id: str,
+    texts: list[str],
+    args: argparse.Namespace,
+) -> None:
+    """send_text_sequenceでまとめて送信"""
+    results = service.send_text_sequence(
+        window_id, texts, args.activate_wait, args.key_wait, ["Return"]
+    )
+    for success, error_msg in results:
+        if not success:
+            raise RuntimeError(error_msg)
+
+
+def main():
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10, help="送信するテキストの数")
+    parser.add_argument(
+        "--activate-wait", type=float, default=0.3,
+        help="ウィンドウアクティブ化後の待機時間(秒)",
+    )
+    parser.add_argument(
+        "--key-wait", type=float, default=0.1,
+        help="まとめて送信する場合のペースト後の待機時間(秒)",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.005,
+        help="模擬するコマンド1回あたりの遅延(秒)",
+    )
+    parser.add_argument(
+        "--throughput", type=float, default=50 * 1024**2,
+        help="模擬するクリップボードの転送速度(バイト/秒)",
+    )
+    args = parser.parse_args()
+
+    texts = [f"テキスト{i}" for i in range(args.items)]
+    expected = "".join(texts)
+
+    print(f"{'mode':<16}  {'chain':<5}  {'time':>9}  {'items/s':>8}  {'commands':>8}")
+    for name, func in (("send_text", send_per_call), ("sequence", send_sequence)):
+        for chain_commands in (False, True):
+            x11 = FakeX11(1)
+            window_id = x11.window_ids[0]
+            service, executor = create_service(x11, args, chain_commands)
+
+            start = time.perf_counter()
+            func(service, executor, window_id, texts, args)
+            elapsed = time.perf_counter() - start
+
+            # 区切りのキー（Return）は模擬環境では入力されないため連結のみ確認
+            assert x11.buffers[window_id] == expected
+            print(
+                f"{name:<16}  {'yes' if chain_commands else 'no':<5}"
+                f"  {elapsed * 1000:>7.1f}ms  {args.items / elapsed:>8.1f}"
+                f"  {executor.call_count:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""GTK4版の起動時間（最初のフレームが描画されるまで）のベンチマーク
+
+アプリケーションを計測用のラッパー（benchmarks/startup_probe.py）経由で
+繰り返し起動し、最初のフレームの描画後に出力される経過時間を集計する。
+
+- startup/first_frame: プロセスの起動から最初のフレームまで（インタプリタの起動を含む）
+- startup/first_frame_in_process: ラッパーの実行開始（main.pyの読み込み前）から
+  最初のフレームまで
+
+結果はbench_suiteと同じ形式のJSONで出力し、--compareで比較できる
+
+使用方法:
+    cd core
+    python -m benchmarks.bench_startup --output before.json
+    python -m benchmarks.bench_startup --compare before.json
+    python -m benchmarks.bench_startup --xvfb --windows 100
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from benchmarks.bench_suite import (
+    DEFAULT_THRESHOLD,
+    SCHEMA_VERSION,
+    compare,
+    get_commit,
+    summarize,
+)
+from benchmarks.xvfb_session import XvfbSession
+
+
+# 計測対象のアプリケーション
+DEFAULT_APP = Path(__file__).resolve().parents[2] / "gtk4" / "main.py"
+
+# main.pyを読み込み、最初のフレームの描画後に起動時間を出力して終了するラッパー
+PROBE_SCRIPT = Path(__file__).resolve().with_name("startup_probe.py")
+
+# 1回の起動を待つ上限(秒)
+LAUNCH_TIMEOUT = 30.0
+
+
+def launch_once(app: Path) -> tuple[float, float]:
+    """
+    アプリケーションを1回起動し、最初のフレームまでの時間を計測
+
+    Args:
+        app: 起動するmain.py
+
+    Returns:
+        tuple[float, float]: (プロセスの起動からの秒数, main.pyの実行開始からの秒数)
+
+    Raises:
+        RuntimeError: 起動に失敗した場合・上限時間内に描画されなかった場合
+    """
+    # stderrはパイプが詰まらないようファイルに受ける（GTKの警告が多い場合がある）
+    stderr_file = tempfile.TemporaryFile(mode="w+")
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, str(PROBE_SCRIPT), str(app)],
+        cwd=str(app.parent),
+        stdout=subprocess.PIPE,
+        stderr=stderr_file,
+        text=True,
+    )
+    # 描画も終了もしない場合は上限時間で停止する
+    watchdog = threading.Timer(LAUNCH_TIMEOUT, process.kill)
+    watchdog.start()
+    try:
+        for line in process.stdout:
+            if line.startswith("first-frame "):
+                elapsed = time.perf_counter() - start
+                in_process = float(line.split()[1]) / 1000
+                break
+        else:
+            process.wait(timeout=LAUNCH_TIMEOUT)
+            stderr_file.seek(0)
+            stderr = stderr_file.read().strip()
+            raise RuntimeError(
+                f"アプリケーションが描画前に終了しました"
+                f"（終了コード{process.returncode}）: {stderr}"
+            )
+        process.wait(timeout=LAUNCH_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        raise RuntimeError("アプリケーションが終了しませんでした")
+    finally:
+        watchdog.cancel()
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+        stderr_file.close()
+    return elapsed, in_process
+
+
+def run(app: Path, repeat: int, warmup: int) -> dict:
+    """
+    起動時間を計測
+
+    Args:
+        app: 起動するmain.py
+        repeat: 計測回数
+        warmup: 計測前の起動回数（ファイルキャッシュ・.pycの作成）
+
+    Returns:
+        dict: ケース名ごとの集計
+    """
+    for _ in range(warmup):
+        launch_once(app)
+
+    elapsed_samples = []
+    in_process_samples = []
+    for _ in range(repeat):
+        elapsed, in_process = launch_once(app)
+        elapsed_samples.append(elapsed)
+        in_process_samples.append(in_process)
+
+    return {
+        "startup/first_frame": summarize(elapsed_samples),
+        "startup/first_frame_in_process": summarize(in_process_samples),
+    }
+
+
+def main(argv: Optional[list[str]] = None):
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--app", type=Path, default=DEFAULT_APP, help="起動するmain.pyのパス"
+    )
+    parser.add_argument("--repeat", type=int, default=10, help="計測回数")
+    parser.add_argument("--warmup", type=int, default=1, help="計測前の起動回数")
+    parser.add_argument(
+        "--xvfb", action="store_true", help="Xvfbを起動してその上で計測する"
+    )
+    parser.add_argument(
+        "--windows", type=int, default=0,
+        help="Xvfbで作成するウィンドウ数（ウィンドウ一覧の取得の負荷）",
+    )
+    parser.add_argument("--output", help="結果を保存するJSONファイル")
+    parser.add_argument("--compare", help="比較する基準の結果のJSONファイル")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="劣化とみなす中央値の増加率",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        if args.xvfb:
+            with XvfbSession(window_count=args.windows):
+                results = run(args.app, args.repeat, args.warmup)
+        else:
+            results = run(args.app, args.repeat, args.warmup)
+    except RuntimeError as e:
+        print(f"エラー: {str(e)}", file=sys.stderr)
+        sys.exit(2)
+
+    report = {
+        "schema": SCHEMA_VERSION,
+        "mode": "xvfb" if args.xvfb else "display",
+        "commit": get_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            "repeat": args.repeat,
+            "warmup": args.warmup,
+            "windows": args.windows if args.xvfb else None,
+        },
+        "results": results,
+    }
+
+    print(f"{'case':<32}  {'median':>10}  {'p90':>10}  {'stdev':>10}")
+    for name, result in results.items():
+        print(
+            f"{name:<32}  {result['median'] * 1000:>8.2f}ms"
+            f"  {result['p90'] * 1000:>8.2f}ms  {result['stdev'] * 1000:>8.2f}ms"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n劣化したケース: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
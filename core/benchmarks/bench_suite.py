@@ -0,0 +1,472 @@
+"""送受信処理のベンチマークスイート（模擬環境 / Xvfb）
+
+以下のケースを計測し、結果をJSONで出力する。
+コミット間で結果を比較して性能の劣化を検出できる
+
+- window_list/<ウィンドウ数>: WindowService.get_window_list（xdotool経由）
+- window_list_xcb/<ウィンドウ数>: XCBバックエンドでの取得（Xvfbのみ）
+- window_list_diff/<ウィンドウ数>: 一覧の更新時の差分計算
+  （1件の追加・削除・タイトル変更、模擬環境のみ）
+- clipboard/<サイズ>: クリップボードへのコピーと取得
+- send_text/<サイズ>, receive_text/<サイズ>, round_trip/<サイズ>:
+  TextServiceでの送信・受信・送信してから受信
+- chain/send_text/<サイズ>ほか: 同じケースをxdotoolのコマンド連結
+  （chain_commands）で実行（模擬環境のみ）
+
+模擬環境（--mode fake、既定）はコマンドごとに一定の遅延を入れる
+決定的なExecutorを使用する。Xvfb（--mode xvfb）はXvfbを起動して
+xcffibでウィンドウを作成し、実際のxdotool/xclipで計測する。
+ウィンドウマネージャーがないとwindowactivateが失敗するため、
+Xvfbでの送受信のケースは--wmを指定した場合のみ計測する
+
+使用方法:
+    cd core
+    python -m benchmarks.bench_suite --output before.json
+    python -m benchmarks.bench_suite --output after.json --compare before.json
+    python -m benchmarks.bench_suite --mode xvfb --wm openbox
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from benchmarks.fake_x11 import FakeClipboardService, FakeX11, FakeX11Executor
+from benchmarks.xvfb_session import XvfbSession
+from mini_text_core.services.text_service import TextService
+from mini_text_core.services.window_list_diff import diff_window_lists
+from mini_text_core.services.window_service import WindowService
+from mini_text_core.services.xcb_window_backend import create_xcb_window_backend
+from mini_text_core.utils.timing import get_tracer
+from mini_text_core.utils.x11_command_executor import (
+    TextSink,
+    X11CommandExecutor,
+    iter_encoded_chunks,
+)
+
+
+# 結果のJSONの形式のバージョン
+SCHEMA_VERSION = 1
+
+# 比較時に劣化とみなす中央値の増加率の既定値
+DEFAULT_THRESHOLD = 0.10
+
+
+def summarize(samples: list[float]) -> dict:
+    """
+    計測値を集計
+
+    Args:
+        samples: 1回ごとの所要時間(秒)
+
+    Returns:
+        dict: 平均・中央値・90パーセンタイル・最小・最大・標準偏差(秒)と計測値
+    """
+    ordered = sorted(samples)
+    return {
+        "unit": "s",
+        "count": len(samples),
+        "mean": statistics.fmean(samples),
+        "median": statistics.median(samples),
+        "p90": ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))],
+        "min": ordered[0],
+        "max": ordered[-1],
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "samples": samples,
+    }
+
+
+def measure(
+    func: Callable[[], None],
+    repeat: int,
+    warmup: int,
+    setup: Optional[Callable[[], None]] = None,
+) -> dict:
+    """
+    関数の所要時間を繰り返し計測（setupは計測に含めない）
+
+    Args:
+        func: 計測する関数
+        repeat: 計測回数
+        warmup: 計測前に実行する回数
+        setup: 毎回funcの前に実行する準備処理
+
+    Returns:
+        dict: summarizeの結果
+    """
+    samples = []
+    for i in range(warmup + repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            samples.append(elapsed)
+    return summarize(samples)
+
+
+def make_text(size: int) -> str:
+    """送受信するASCIIテキストを作成"""
+    line = "The quick brown fox jumps over the lazy dog.\n"
+    return (line * (size // len(line) + 1))[:size]
+
+
+def format_size(size: int) -> str:
+    """ケース名用にサイズを表示"""
+    for unit, factor in (("MB", 1024**2), ("KB", 1024)):
+        if size >= factor and size % factor == 0:
+            return f"{size // factor}{unit}"
+    return f"{size}B"
+
+
+def check(result: tuple, message: str) -> None:
+    """サービスの戻り値が失敗の場合は例外を送出"""
+    if not result[0]:
+        raise RuntimeError(f"{message}: {result[-1]}")
+
+
+def run_text_cases(
+    results: dict,
+    service: TextService,
+    window_id: str,
+    sizes: list[int],
+    args: argparse.Namespace,
+    reset: Callable[[], None],
+    verify: bool,
+    prefix: str = "",
+) -> None:
+    """
+    送信・受信・往復のケースを計測
+
+    Args:
+        results: 結果を追加する辞書
+        service: 計測するTextService
+        window_id: 送信先のウィンドウID
+        sizes: テキストのサイズ(バイト)のリスト
+        args: コマンドライン引数
+        reset: 送信先のテキストを空にする関数
+        verify: 往復で受信したテキストが送信したものと一致するか確認するか
+        prefix: ケース名の接頭辞
+    """
+    for size in sizes:
+        text = make_text(size)
+        name = format_size(size)
+
+        def send():
+            check(service.send_text(window_id, text, 0, 0), "送信に失敗しました")
+
+        def receive():
+            check(service.receive_text(0), "受信に失敗しました")
+
+        def round_trip():
+            send()
+            success, received, error_msg = service.receive_text(0)
+            check((success, error_msg), "受信に失敗しました")
+            if verify and received != text:
+                raise RuntimeError("受信したテキストが送信したテキストと一致しません")
+
+        def prepare():
+            reset()
+            send()
+
+        results[f"{prefix}send_text/{name}"] = measure(
+            send, args.repeat, args.warmup, reset
+        )
+        results[f"{prefix}receive_text/{name}"] = measure(
+            receive, args.repeat, args.warmup, prepare
+        )
+        results[f"{prefix}round_trip/{name}"] = measure(
+            round_trip, args.repeat, args.warmup, reset
+        )
+
+
+def run_fake(args: argparse.Namespace) -> dict:
+    """模擬環境で全ケースを計測"""
+    results = {}
+
+    for count in args.counts:
+        executor = FakeX11Executor(FakeX11(count), args.latency)
+        service = WindowService(executor, max_workers=args.workers)
+
+        def get_window_list():
+            if len(service.get_window_list()) != count:
+                raise RuntimeError("ウィンドウ数が一致しません")
+
+        results[f"window_list/{count}"] = measure(
+            get_window_list, args.repeat, args.warmup
+        )
+
+        # 1件の追加・削除・タイトル変更（フロントエンドの一覧の更新）
+        old = service.get_window_list()
+        new = old[1:] + [("new", "新規")]
+        if new:
+            new[len(new) // 2] = (new[len(new) // 2][0], "変更後")
+
+        def diff():
+            diff_window_lists(old, new)
+
+        results[f"window_list_diff/{count}"] = measure(diff, args.repeat, args.warmup)
+
+    x11 = FakeX11(1)
+    executor = FakeX11Executor(x11, args.latency)
+    clipboard = FakeClipboardService(x11, args.latency, args.throughput)
+
+    for size in args.sizes:
+        text = make_text(size)
+
+        def copy_and_get():
+            check(clipboard.copy_to_clipboard(text), "コピーに失敗しました")
+            check(clipboard.get_from_clipboard(), "取得に失敗しました")
+
+        results[f"clipboard/{format_size(size)}"] = measure(
+            copy_and_get, args.repeat, args.warmup
+        )
+
+    window_id = x11.window_ids[0]
+    service = TextService(
+        WindowService(executor), clipboard, executor, clipboard_notifier=clipboard
+    )
+
+    def reset():
+        x11.buffers[window_id] = ""
+
+    run_text_cases(
+        results, service, window_id, args.text_sizes, args, reset, verify=True
+    )
+
+    # アクティブ化・待機・キー入力を連結した場合（xdotoolの起動回数が減る）
+    service = TextService(
+        WindowService(executor),
+        clipboard,
+        executor,
+        clipboard_notifier=clipboard,
+        chain_commands=True,
+    )
+    run_text_cases(
+        results,
+        service,
+        window_id,
+        args.text_sizes,
+        args,
+        reset,
+        verify=True,
+        prefix="chain/",
+    )
+    return results
+
+
+class XclipClipboard:
+    """xclipでCLIPBOARDを読み書きするクリップボードサービス（Xvfbでの計測用）"""
+
+    def copy_to_clipboard(self, text: str) -> tuple[bool, str]:
+        """クリップボードにテキストをコピー"""
+        return X11CommandExecutor.execute_stream(
+            ["xclip", "-selection", "clipboard", "-i"],
+            source=iter_encoded_chunks(text),
+        )
+
+    def get_from_clipboard(self) -> tuple[bool, str, str]:
+        """クリップボードからテキストを取得"""
+        sink = TextSink()
+        success, stderr = X11CommandExecutor.execute_stream(
+            ["xclip", "-selection", "clipboard", "-o"], sink=sink
+        )
+        return success, sink.getvalue(), stderr
+
+
+def run_xvfb(args: argparse.Namespace) -> dict:
+    """Xvfbで全ケースを計測"""
+    results = {}
+
+    with XvfbSession() as session:
+        for count in args.counts:
+            session.set_window_count(count)
+            service = WindowService(X11CommandExecutor(), max_workers=args.workers)
+            backend = create_xcb_window_backend(session.display)
+
+            def get_window_list():
+                if len(service.get_window_list()) != count:
+                    raise RuntimeError("ウィンドウ数が一致しません")
+
+            def get_window_list_xcb():
+                windows = backend.get_window_list()
+                if windows is None or len(windows) != count:
+                    raise RuntimeError("ウィンドウ数が一致しません")
+
+            results[f"window_list/{count}"] = measure(
+                get_window_list, args.repeat, args.warmup
+            )
+            if backend is not None:
+                results[f"window_list_xcb/{count}"] = measure(
+                    get_window_list_xcb, args.repeat, args.warmup
+                )
+                backend.close()
+
+        clipboard = XclipClipboard()
+        for size in args.sizes:
+            text = make_text(size)
+
+            def copy_and_get():
+                check(clipboard.copy_to_clipboard(text), "コピーに失敗しました")
+                success, received, error_msg = clipboard.get_from_clipboard()
+                if not success or received != text:
+                    raise RuntimeError(f"取得に失敗しました: {error_msg}")
+
+            results[f"clipboard/{format_size(size)}"] = measure(
+                copy_and_get, args.repeat, args.warmup
+            )
+
+        if args.wm:
+            # 計測用ウィンドウはテキストを受け付けないため、往復の内容は確認しない
+            wm = subprocess.Popen(args.wm.split(), stderr=subprocess.DEVNULL)
+            try:
+                time.sleep(1.0)
+                executor = X11CommandExecutor()
+                service = TextService(WindowService(executor), clipboard, executor)
+                run_text_cases(
+                    results, service, session.window_ids[0], args.text_sizes,
+                    args, reset=lambda: None, verify=False,
+                )
+            finally:
+                wm.terminate()
+                wm.wait()
+
+    return results
+
+
+def get_commit() -> Optional[str]:
+    """計測したコミットのハッシュを取得（gitが使えない場合はNone）"""
+    success, stdout, _ = X11CommandExecutor.execute(["git", "rev-parse", "HEAD"])
+    return stdout.strip() if success else None
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    中央値を基準の結果と比較して表示
+
+    Args:
+        current: 今回の結果
+        baseline: 基準の結果
+        threshold: 劣化とみなす中央値の増加率
+
+    Returns:
+        list[str]: 劣化したケース名
+    """
+    regressions = []
+    print(f"\n{'case':<24}  {'baseline':>10}  {'current':>10}  {'ratio':>6}")
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        ratio = result["median"] / base["median"] if base["median"] else 1.0
+        mark = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            mark = "  劣化"
+        print(
+            f"{name:<24}  {base['median'] * 1000:>8.2f}ms"
+            f"  {result['median'] * 1000:>8.2f}ms  {ratio:>6.2f}{mark}"
+        )
+    return regressions
+
+
+def main():
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=["fake", "xvfb"], default="fake")
+    parser.add_argument(
+        "--counts", type=int, nargs="+", default=[10, 100, 500],
+        help="計測するウィンドウ数",
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1024, 64 * 1024, 1024**2],
+        help="クリップボードのケースのテキストサイズ(バイト)",
+    )
+    parser.add_argument(
+        "--text-sizes", type=int, nargs="+", default=[1024, 64 * 1024],
+        help="送受信のケースのテキストサイズ(バイト)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="計測回数")
+    parser.add_argument("--warmup", type=int, default=1, help="計測前の実行回数")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="タイトル取得の同時実行数"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.003,
+        help="模擬環境での1回のコマンド実行の遅延(秒)",
+    )
+    parser.add_argument(
+        "--throughput", type=float, default=100 * 1024**2,
+        help="模擬環境でのクリップボードの転送速度(バイト/秒)",
+    )
+    parser.add_argument("--wm", help="Xvfbで起動するウィンドウマネージャーのコマンド")
+    parser.add_argument(
+        "--phases", action="store_true",
+        help="処理段階ごとの所要時間（Tracerのヒストグラム）も出力する",
+    )
+    parser.add_argument("--output", help="結果を保存するJSONファイル")
+    parser.add_argument("--compare", help="比較する基準の結果のJSONファイル")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="劣化とみなす中央値の増加率",
+    )
+    args = parser.parse_args()
+
+    tracer = get_tracer()
+    tracer.set_enabled(args.phases)
+
+    try:
+        results = run_fake(args) if args.mode == "fake" else run_xvfb(args)
+    except RuntimeError as e:
+        print(f"エラー: {str(e)}", file=sys.stderr)
+        sys.exit(2)
+    phases = tracer.get_histograms()
+    tracer.set_enabled(False)
+
+    report = {
+        "schema": SCHEMA_VERSION,
+        "mode": args.mode,
+        "commit": get_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            "repeat": args.repeat,
+            "warmup": args.warmup,
+            "workers": args.workers,
+            "latency": args.latency,
+            "throughput": args.throughput,
+        },
+        "results": results,
+    }
+    if args.phases:
+        report["phases"] = phases
+
+    print(f"{'case':<24}  {'median':>10}  {'p90':>10}  {'stdev':>10}")
+    for name, result in results.items():
+        print(
+            f"{name:<24}  {result['median'] * 1000:>8.2f}ms"
+            f"  {result['p90'] * 1000:>8.2f}ms  {result['stdev'] * 1000:>8.2f}ms"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n劣化したケース: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
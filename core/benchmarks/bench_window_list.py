@@ -0,0 +1,83 @@
+"""WindowService.get_window_listのベンチマーク（ウィンドウ数 vs 取得時間）
+
+xdotoolの起動コストを模した遅延付きのExecutorを使い、
+逐次取得と並列取得の所要時間をウィンドウ数ごとに比較する
+
+使用方法:
+    cd core
+    python -m benchmarks.bench_window_list
+    python -m benchmarks.bench_window_list --latency 0.005 --workers 4 8 16
+"""
+
+import argparse
+import time
+
+from mini_text_core.services.window_service import WindowService
+
+
+class LatencyExecutor:
+    """1回のコマンド実行ごとに一定の遅延を入れるExecutor"""
+
+    def __init__(self, window_count: int, latency: float):
+        """
+        Args:
+            window_count: 模擬するウィンドウ数
+            latency: 1回のコマンド実行にかかる時間(秒)
+        """
+        self.window_ids = [str(10000000 + i) for i in range(window_count)]
+        self.latency = latency
+
+    def execute(self, command, input_data=None):
+        time.sleep(self.latency)
+        if command[1] == "search":
+            return True, "\n".join(self.window_ids) + "\n", ""
+        return True, f"ウィンドウ {command[2]}", ""
+
+
+def measure(window_count: int, latency: float, max_workers: int) -> float:
+    """
+    一覧取得1回の所要時間を計測
+
+    Returns:
+        float: 所要時間(秒)
+    """
+    executor = LatencyExecutor(window_count, latency)
+    service = WindowService(executor, max_workers=max_workers)
+
+    start = time.perf_counter()
+    windows = service.get_window_list()
+    elapsed = time.perf_counter() - start
+
+    assert len(windows) == window_count
+    return elapsed
+
+
+def main():
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--counts", type=int, nargs="+", default=[10, 50, 100, 200],
+        help="計測するウィンドウ数",
+    )
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 4, 8, 16],
+        help="計測する同時実行数（1は逐次取得）",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.003,
+        help="1回のxdotool実行を模した遅延(秒)",
+    )
+    args = parser.parse_args()
+
+    header = "windows" + "".join(f"  workers={w:<3}" for w in args.workers)
+    print(f"latency per call: {args.latency * 1000:.1f} ms")
+    print(header)
+    for count in args.counts:
+        row = f"{count:>7}"
+        for workers in args.workers:
+            row += f"  {measure(count, args.latency, workers) * 1000:>9.1f}ms"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""ベンチマーク用の決定的なX11環境の模擬
+
+xdotoolの各コマンドとクリップボード操作に一定の遅延を入れ、
+ウィンドウ・キー入力・クリップボードの状態を再現する。
+乱数を使わないため、同じ引数なら毎回同じ処理が実行される
+"""
+
+import time
+from typing import Optional
+
+
+class FakeX11:
+    """ウィンドウごとのテキストとクリップボードを保持する模擬X11環境"""
+
+    def __init__(self, window_count: int):
+        """
+        Args:
+            window_count: 模擬するウィンドウ数
+        """
+        self.window_ids = [str(10000000 + i) for i in range(window_count)]
+        self.buffers = {window_id: "" for window_id in self.window_ids}
+        self.active: Optional[str] = None
+        self.clipboard = ""
+        self.primary = ""
+        self.change_count = 0
+
+    def set_clipboard(self, text: str) -> None:
+        """クリップボードの内容を設定"""
+        self.clipboard = text
+        self.change_count += 1
+
+
+class FakeX11Executor:
+    """
+    xdotoolの実行を模したExecutor
+
+    1回のコマンド実行ごとにlatency秒待機してからFakeX11の状態を更新する
+    （search, getwindowname, windowactivate, key ctrl+a/ctrl+c/ctrl+v、
+    windowactivate・key・sleepは連結したコマンドも実行できる）
+    """
+
+    def __init__(self, x11: FakeX11, latency: float):
+        """
+        Args:
+            x11: 模擬X11環境
+            latency: 1回のコマンド実行にかかる時間(秒)
+        """
+        self.x11 = x11
+        self.latency = latency
+        self.call_count = 0
+
+    def execute(
+        self, command: list[str], input_data: Optional[str] = None
+    ) -> tuple[bool, str, str]:
+        """コマンドを模擬実行"""
+        self.call_count += 1
+        time.sleep(self.latency)
+
+        action = command[1]
+        if action == "search":
+            return True, "\n".join(self.x11.window_ids) + "\n", ""
+        if action == "getwindowname":
+            return True, f"ウィンドウ {command[2]}\n", ""
+        return self._run_chain(command[1:])
+
+    def _run_chain(self, args: list[str]) -> tuple[bool, str, str]:
+        """連結したコマンド（windowactivate, key, sleep, getactivewindow）を模擬実行"""
+        stdout = ""
+        while args:
+            action = args[0]
+            if action == "windowactivate":
+                # windowactivate [--sync] <id>
+                size = 3 if args[1] == "--sync" else 2
+                window_id = args[size - 1]
+                if window_id not in self.x11.buffers:
+                    return False, stdout, f"BadWindow: {window_id}"
+                self.x11.active = window_id
+            elif action == "key":
+                size = 2
+                self._key(args[1])
+            elif action == "sleep":
+                size = 2
+                time.sleep(float(args[1]))
+            elif action == "getactivewindow":
+                size = 1
+                stdout += f"{self.x11.active or 0}\n"
+            else:
+                return False, stdout, f"未対応のコマンド: {args}"
+            args = args[size:]
+        return True, stdout, ""
+
+    def _key(self, key: str) -> None:
+        """アクティブウィンドウへのキー入力を模擬"""
+        if self.x11.active is None:
+            return
+        if key == "ctrl+v":
+            self.x11.buffers[self.x11.active] += self.x11.clipboard
+        elif key == "ctrl+a":
+            self.x11.primary = self.x11.buffers[self.x11.active]
+        elif key == "ctrl+c":
+            self.x11.set_clipboard(self.x11.buffers[self.x11.active])
+
+
+class FakeClipboardService:
+    """
+    クリップボード操作を模したサービス
+
+    1回の操作ごとにlatency秒、加えてUTF-8のバイト数をthroughputで割った時間だけ待機する
+    """
+
+    def __init__(self, x11: FakeX11, latency: float, throughput: float):
+        """
+        Args:
+            x11: 模擬X11環境
+            latency: 1回の操作にかかる時間(秒)
+            throughput: 転送速度(バイト/秒)
+        """
+        self.x11 = x11
+        self.latency = latency
+        self.throughput = throughput
+
+    def copy_to_clipboard(self, text: str) -> tuple[bool, str]:
+        """クリップボードにテキストをコピー"""
+        self._transfer(text)
+        self.x11.set_clipboard(text)
+        return True, ""
+
+    def get_from_clipboard(self) -> tuple[bool, str, str]:
+        """クリップボードからテキストを取得"""
+        text = self.x11.clipboard
+        self._transfer(text)
+        return True, text, ""
+
+    def get_from_primary(self) -> tuple[bool, str, str]:
+        """PRIMARY（全選択したテキスト）を取得"""
+        text = self.x11.primary
+        self._transfer(text)
+        return True, text, ""
+
+    def mark_change(self) -> int:
+        """現時点のクリップボード更新回数を取得"""
+        return self.x11.change_count
+
+    def wait_for_change(self, mark: int, timeout: float) -> bool:
+        """更新済みかを返す（模擬環境ではキー入力時点で更新済み）"""
+        return self.x11.change_count > mark
+
+    def _transfer(self, text: str) -> None:
+        """転送時間を模擬"""
+        time.sleep(self.latency + len(text.encode("utf-8")) / self.throughput)
@@ -0,0 +1,86 @@
+"""GTK4版を起動し、最初のフレームの描画後に経過時間を出力して終了するラッパー
+
+bench_startupが子プロセスとして実行する。main.pyのMiniTextApplicationを
+計測用のサブクラスに置き換えてからmain()を呼ぶため、アプリケーション側に
+計測のための処理は持たない
+
+使用方法:
+    python benchmarks/startup_probe.py ../gtk4/main.py
+"""
+
+import sys
+import time
+
+# 起動時間の計測の基準（GTK・サービスの読み込み前）
+STARTED_AT = time.perf_counter()
+
+import importlib.util
+from pathlib import Path
+
+
+def load_app_module(app: Path):
+    """
+    main.pyをモジュールとして読み込む（__main__としては実行しない）
+
+    Args:
+        app: 起動するmain.py
+
+    Returns:
+        読み込んだモジュール
+    """
+    # main.pyと同じディレクトリのパッケージ（mini_text）を読み込めるようにする
+    sys.path.insert(0, str(app.parent))
+    spec = importlib.util.spec_from_file_location("mini_text_main", app)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def report_first_frame(application, window) -> None:
+    """最初のフレームの描画後に起動からの経過時間(ミリ秒)を出力して終了"""
+
+    def on_after_paint(frame_clock):
+        frame_clock.disconnect(handler_ids.pop())
+        elapsed_ms = (time.perf_counter() - STARTED_AT) * 1000
+        print(f"first-frame {elapsed_ms:.1f}", flush=True)
+        application.quit()
+
+    def on_map(widget):
+        frame_clock = widget.get_frame_clock()
+        handler_ids.append(frame_clock.connect("after-paint", on_after_paint))
+
+    handler_ids = []
+    if window.get_mapped():
+        on_map(window)
+    else:
+        window.connect("map", on_map)
+
+
+def main():
+    """メイン関数"""
+    app = Path(sys.argv[1]).resolve()
+    module = load_app_module(app)
+
+    from gi.repository import Gio
+
+    class ProbeApplication(module.MiniTextApplication):
+        """最初のフレームの描画後に終了するアプリケーション"""
+
+        def __init__(self):
+            super().__init__()
+            # 計測中の起動が起動済みのインスタンスに転送されないようにする
+            self.set_flags(self.get_flags() | Gio.ApplicationFlags.NON_UNIQUE)
+
+        def do_activate(self):
+            first = self.main_window is None
+            super().do_activate()
+            if first:
+                report_first_frame(self, self.main_window)
+
+    module.MiniTextApplication = ProbeApplication
+    sys.argv = [str(app)] + sys.argv[2:]
+    sys.exit(module.main())
+
+
+if __name__ == "__main__":
+    main()
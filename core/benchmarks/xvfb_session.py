@@ -0,0 +1,158 @@
+"""ベンチマーク用のXvfbセッション
+
+Xvfbを起動し、xcffibで指定数のウィンドウを作成する。
+ウィンドウマネージャーは起動しないため、ルートウィンドウの
+_NET_CLIENT_LISTと各ウィンドウの_NET_WM_NAMEはこのモジュールで設定する
+"""
+
+import os
+import selectors
+import struct
+import subprocess
+from typing import Optional
+
+try:
+    import xcffib
+    import xcffib.xproto
+except ImportError:  # xcffibは任意依存
+    xcffib = None
+
+from mini_text_core.services.xcb_window_backend import ATOM_WINDOW
+
+
+# Xvfbの起動を待つ上限(秒)
+STARTUP_TIMEOUT = 10.0
+
+
+class XvfbSession:
+    """
+    Xvfbとベンチマーク用のウィンドウを管理するクラス
+
+    with文で使用し、終了時にXvfbを停止して$DISPLAYを元に戻す
+    """
+
+    def __init__(self, window_count: int = 0, screen: str = "1280x1024x24"):
+        """
+        Args:
+            window_count: 作成するウィンドウ数
+            screen: Xvfbの画面サイズと色深度
+        """
+        self.window_count = window_count
+        self.screen = screen
+        self.display: Optional[str] = None
+        self.window_ids: list[str] = []
+        self._process: Optional[subprocess.Popen] = None
+        self._connection = None
+        self._saved_display: Optional[str] = None
+
+    def __enter__(self) -> "XvfbSession":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Xvfbを起動してウィンドウを作成
+
+        Raises:
+            RuntimeError: Xvfbまたはxcffibが利用できない場合
+        """
+        if xcffib is None:
+            raise RuntimeError("xcffibがインストールされていません")
+
+        # -displayfdで空いているディスプレイ番号を選ばせる
+        try:
+            self._process = subprocess.Popen(
+                ["Xvfb", "-displayfd", "1", "-screen", "0", self.screen,
+                 "-nolisten", "tcp"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError:
+            raise RuntimeError("Xvfbが見つかりません (sudo apt install xvfb)")
+
+        number = self._read_display_number()
+        self.display = f":{number}"
+        self._saved_display = os.environ.get("DISPLAY")
+        os.environ["DISPLAY"] = self.display
+
+        self._connection = xcffib.connect(display=self.display)
+        self.set_window_count(self.window_count)
+
+    def stop(self) -> None:
+        """Xvfbを停止して$DISPLAYを元に戻す"""
+        if self._connection is not None:
+            self._connection.disconnect()
+            self._connection = None
+        if self._process is not None:
+            self._process.terminate()
+            self._process.wait()
+            self._process = None
+        if self._saved_display is None:
+            os.environ.pop("DISPLAY", None)
+        else:
+            os.environ["DISPLAY"] = self._saved_display
+
+    def set_window_count(self, window_count: int) -> None:
+        """
+        表示するウィンドウを指定数にする
+
+        不足分を作成し、超過分は非表示にして_NET_CLIENT_LISTから除く
+        """
+        connection = self._connection
+        screen = connection.get_setup().roots[connection.pref_screen]
+        atoms = self._intern_atoms(["_NET_CLIENT_LIST", "_NET_WM_NAME", "UTF8_STRING"])
+
+        while len(self.window_ids) < window_count:
+            window = connection.generate_id()
+            connection.core.CreateWindow(
+                screen.root_depth, window, screen.root, 0, 0, 100, 100, 0,
+                xcffib.xproto.WindowClass.InputOutput, screen.root_visual,
+                xcffib.xproto.CW.BackPixel, [screen.white_pixel],
+            )
+            name = f"bench window {len(self.window_ids)}".encode("utf-8")
+            for atom, atom_type in (
+                (xcffib.xproto.Atom.WM_NAME, xcffib.xproto.Atom.STRING),
+                (atoms["_NET_WM_NAME"], atoms["UTF8_STRING"]),
+            ):
+                connection.core.ChangeProperty(
+                    xcffib.xproto.PropMode.Replace, window, atom, atom_type,
+                    8, len(name), name,
+                )
+            self.window_ids.append(str(window))
+
+        ids = [int(window_id) for window_id in self.window_ids]
+        for index, window in enumerate(ids):
+            if index < window_count:
+                connection.core.MapWindow(window)
+            else:
+                connection.core.UnmapWindow(window)
+        visible = ids[:window_count]
+        connection.core.ChangeProperty(
+            xcffib.xproto.PropMode.Replace, screen.root,
+            atoms["_NET_CLIENT_LIST"], ATOM_WINDOW, 32, len(visible),
+            struct.pack(f"={len(visible)}I", *visible),
+        )
+        connection.flush()
+        # 作成と設定が反映されるまで待つ
+        connection.core.GetInputFocus().reply()
+
+    def _read_display_number(self) -> int:
+        """-displayfdで出力されるディスプレイ番号を読み取る"""
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._process.stdout, selectors.EVENT_READ)
+            if not selector.select(STARTUP_TIMEOUT):
+                self._process.kill()
+                raise RuntimeError("Xvfbの起動がタイムアウトしました")
+        line = self._process.stdout.readline().strip()
+        if not line:
+            raise RuntimeError("Xvfbの起動に失敗しました")
+        return int(line)
+
+    def _intern_atoms(self, names: list[str]) -> dict[str, int]:
+        """アトムを解決"""
+        core = self._connection.core
+        cookies = {name: core.InternAtom(False, len(name), name) for name in names}
+        return {name: cookie.reply().atom for name, cookie in cookies.items()}
@@ -0,0 +1,7 @@
+"""
+mini-text共通パッケージ: UIに依存しないコマンド実行・ウィンドウ操作・テキスト送受信・設定管理
+
+PyQt6版とGTK4版の両方がこのパッケージを使用する
+"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,234 @@
+"""mini-textのコマンドラインインターフェース（常駐プロセスとクライアント）
+
+使用方法:
+    mini-text --daemon                  # 常駐プロセスを起動（フォアグラウンド）
+    mini-text list                      # ウィンドウ一覧（ID<TAB>タイトル）
+    mini-text send 123 456 --text 本文   # テキストを送信（--text省略時は標準入力）
+    mini-text copy --wait 3             # 3秒後にアクティブウィンドウから取得
+    mini-text copy --window 123         # ウィンドウ123をアクティブ化してすぐに取得
+    mini-text batch < requests.jsonl    # JSONのリクエストを1接続でまとめて送信
+    mini-text stop                      # 常駐プロセスを終了
+"""
+
+import argparse
+import json
+import signal
+import sys
+from typing import Optional
+
+from mini_text_core.config.config_manager import ConfigManager
+from mini_text_core.engine import create_engine
+from mini_text_core.utils.dependency_checker import (
+    DependencyCache,
+    DependencyChecker,
+)
+from mini_text_core.utils.timing import get_tracer
+from mini_text_core.daemon.client import DaemonClient
+from mini_text_core.daemon.protocol import (
+    ProtocolError,
+    decode_message,
+    get_default_socket_path,
+)
+from mini_text_core.daemon.server import (
+    DaemonServer,
+    RequestDispatcher,
+    prepare_socket_path,
+)
+
+
+# 常駐プロセスが使用する外部コマンド（クリップボードはxclipが所有する）
+DAEMON_COMMANDS = ["xdotool", "xclip"]
+
+# 終了コード: リクエストの失敗 / 常駐プロセスに接続できない・起動できない
+EXIT_FAILURE = 1
+EXIT_UNAVAILABLE = 2
+
+
+def run_daemon(socket_path: str, config_manager: ConfigManager) -> int:
+    """
+    常駐プロセスを起動し、終了するまでリクエストを処理
+
+    ウィンドウ一覧のキャッシュ・準備完了判定を
+    起動時に1回だけ作成し、以降のリクエストで使い回す
+
+    Args:
+        socket_path: 待ち受けるソケットのパス
+        config_manager: 設定マネージャー
+
+    Returns:
+        int: 終了コード
+    """
+    all_available, missing = DependencyChecker.check_all(
+        DAEMON_COMMANDS, cache=DependencyCache()
+    )
+    if not all_available:
+        print(
+            "エラー: 以下のツールがインストールされていません: " + " ".join(missing),
+            file=sys.stderr,
+        )
+        return EXIT_UNAVAILABLE
+
+    success, error_msg = prepare_socket_path(socket_path)
+    if not success:
+        print(f"エラー: {error_msg}", file=sys.stderr)
+        return EXIT_UNAVAILABLE
+
+    get_tracer().set_enabled(config_manager.is_timing_enabled())
+
+    engine = create_engine(config_manager)
+    dispatcher = RequestDispatcher(
+        engine.create_text_service(), engine.window_service, config_manager
+    )
+    try:
+        server = DaemonServer(socket_path, dispatcher)
+    except OSError as e:
+        engine.close()
+        print(f"エラー: ソケットを作成できません: {str(e)}", file=sys.stderr)
+        return EXIT_UNAVAILABLE
+    dispatcher.on_shutdown = server.request_shutdown
+    signal.signal(signal.SIGTERM, lambda signum, frame: server.request_shutdown())
+
+    print(f"待ち受け中: {socket_path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        engine.close()
+    return 0
+
+
+def run_client(args: argparse.Namespace) -> int:
+    """
+    サブコマンドのリクエストを常駐プロセスに送信して結果を表示
+
+    Args:
+        args: コマンドライン引数
+
+    Returns:
+        int: 終了コード
+    """
+    if args.command == "batch":
+        return _run_batch(args.socket)
+
+    request = _build_request(args)
+    if request is None:
+        return EXIT_FAILURE
+
+    with DaemonClient(args.socket) as client:
+        success, error_msg = client.connect()
+        if not success:
+            print(f"エラー: {error_msg}", file=sys.stderr)
+            return EXIT_UNAVAILABLE
+        response = client.request(**request)
+
+    if not response["ok"]:
+        print(f"エラー: {response['error']}", file=sys.stderr)
+        return EXIT_FAILURE
+
+    if args.command == "list":
+        for window_id, name in response["windows"]:
+            print(f"{window_id}\t{name}")
+    elif args.command == "copy":
+        sys.stdout.write(response["text"])
+    elif args.command == "ping":
+        print(f"mini-text {response['version']}")
+    return 0
+
+
+def _build_request(args: argparse.Namespace) -> Optional[dict]:
+    """サブコマンドの引数からリクエストを作成（不正な場合はNone）"""
+    if args.command == "send":
+        text = args.text if args.text is not None else sys.stdin.read()
+        if not text:
+            print("エラー: 送信するテキストがありません", file=sys.stderr)
+            return None
+        return {"command": "send", "window_ids": args.window_ids, "text": text}
+    if args.command == "copy":
+        if args.window is not None:
+            return {"command": "copy", "window_id": args.window}
+        return {"command": "copy", "wait": args.wait}
+    if args.command == "stop":
+        return {"command": "shutdown"}
+    return {"command": args.command}
+
+
+def _run_batch(socket_path: Optional[str]) -> int:
+    """
+    標準入力の1行1件のJSONリクエストを1つの接続で続けて送信し、
+    レスポンスを1行1件のJSONで出力
+    """
+    requests = []
+    for line_number, line in enumerate(sys.stdin.buffer, start=1):
+        if not line.strip():
+            continue
+        try:
+            requests.append(decode_message(line))
+        except ProtocolError as e:
+            print(f"エラー: {line_number}行目: {str(e)}", file=sys.stderr)
+            return EXIT_FAILURE
+
+    with DaemonClient(socket_path) as client:
+        success, error_msg = client.connect()
+        if not success:
+            print(f"エラー: {error_msg}", file=sys.stderr)
+            return EXIT_UNAVAILABLE
+        responses = client.request_many(requests)
+
+    for response in responses:
+        print(json.dumps(response, ensure_ascii=False))
+    return 0 if all(response["ok"] for response in responses) else EXIT_FAILURE
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """コマンドライン引数のパーサーを作成"""
+    parser = argparse.ArgumentParser(
+        prog="mini-text",
+        description="ウィンドウ間のテキスト送受信（常駐プロセスとクライアント）",
+    )
+    parser.add_argument(
+        "--daemon", action="store_true", help="常駐プロセスを起動する"
+    )
+    parser.add_argument(
+        "--socket", help="ソケットのパス（既定: $XDG_RUNTIME_DIR/mini-text/daemon.sock）"
+    )
+    parser.add_argument("--config", help="設定ファイルのパス（常駐プロセスのみ）")
+
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("ping", help="常駐プロセスの起動を確認する")
+    subparsers.add_parser("list", help="ウィンドウ一覧を表示する")
+    send_parser = subparsers.add_parser("send", help="テキストを送信する")
+    send_parser.add_argument("window_ids", nargs="+", help="送信先のウィンドウID")
+    send_parser.add_argument("--text", help="送信するテキスト（省略時は標準入力）")
+    copy_parser = subparsers.add_parser(
+        "copy", help="アクティブウィンドウのテキストを取得する"
+    )
+    copy_parser.add_argument(
+        "--wait", type=float, default=0.0, help="取得を開始するまでの待機時間(秒)"
+    )
+    copy_parser.add_argument(
+        "--window", help="取得元のウィンドウID（アクティブ化して待たずに取得する）"
+    )
+    subparsers.add_parser("batch", help="標準入力のJSONリクエストをまとめて送信する")
+    subparsers.add_parser("stop", help="常駐プロセスを終了する")
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """メイン関数"""
+    parser = create_parser()
+    args = parser.parse_args(argv)
+
+    if args.daemon:
+        socket_path = args.socket or get_default_socket_path()
+        return run_daemon(socket_path, ConfigManager(args.config))
+
+    if args.command is None:
+        parser.print_help(sys.stderr)
+        return EXIT_FAILURE
+    return run_client(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""設定管理モジュール"""
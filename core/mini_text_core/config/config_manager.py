@@ -0,0 +1,237 @@
+"""設定ファイル管理"""
+
+import copy
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+
+class ConfigManager:
+    """設定ファイルの読み書きを管理するクラス (JSON形式)"""
+
+    # デフォルト設定値
+    DEFAULT_CONFIG = {
+        "window": {"width": 800, "height": 600},
+        "timing": {
+            "window_activate_wait": 0.3,
+            "key_input_wait": 0.3,
+            "copyfrom_wait": 3.0,
+            # Trueの場合、待機時間は上限としてのみ使用し、ウィンドウのアクティブ化や
+            # 選択範囲の更新を検知した時点で次の処理に進む
+            "adaptive_wait": True,
+        },
+        "debug": {
+            # Trueの場合、コマンド実行と送受信の処理段階ごとの所要時間を記録する
+            "timing": False,
+        },
+        "sequence": {
+            # まとめて送信する際にテキストの間で入力するキー（xdotoolのキー名）
+            "separator_keys": ["Return"],
+            # ペースト後、次のテキストをコピーするまでの待機時間（秒）
+            # （貼り付け先がクリップボードを読み終える前に内容を置き換えないため）
+            "paste_wait": 0.1,
+        },
+        "window_list": {
+            # xdotoolでウィンドウ一覧を取得する際のタイトル取得の同時実行数
+            "title_workers": 1,
+            # タイトル取得全体の制限時間（秒、超過分のウィンドウは一覧から除外）
+            # （nullの場合は無制限）
+            "title_deadline": 2.0,
+        },
+        "receive": {
+            # Trueの場合、コピーはまずPRIMARY（マウスで選択済みのテキスト）を
+            # 読み取り、選択されていない場合のみ全選択・コピーのキー入力を行う
+            "use_primary": False,
+        },
+        "hotkeys": {
+            # Trueの場合、他のアプリケーションにフォーカスがある状態でも
+            # キーの組み合わせ（xdotoolと同じ書式）で送受信を開始する
+            # （他のアプリケーションのキー入力を奪うため、既定では無効）
+            "enabled": False,
+            # 最後に送信したウィンドウに入力欄のテキストを送信
+            "send": "ctrl+alt+v",
+            # フォーカスのあるウィンドウからテキストを取得
+            "copy": "ctrl+alt+c",
+        },
+    }
+
+    def __init__(self, config_path: Optional[str] = None):
+        """
+        Args:
+            config_path: 設定ファイルのパス (Noneの場合は $HOME/.config/mini-text/config.json)
+        """
+        self.config_path = config_path or self._get_default_config_path()
+        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
+        self.load_config()
+
+    def _get_default_config_path(self) -> str:
+        """デフォルトの設定ファイルパスを取得"""
+        home = Path.home()
+        config_dir = home / ".config" / "mini-text"
+        return str(config_dir / "config.json")
+
+    def _ensure_config_dir(self) -> None:
+        """設定ファイルディレクトリが存在しない場合は作成"""
+        config_dir = Path(self.config_path).parent
+        config_dir.mkdir(parents=True, exist_ok=True)
+
+    def load_config(self) -> None:
+        """設定ファイルを読み込む。ファイルが存在しない場合はデフォルト値を使用"""
+        if not os.path.exists(self.config_path):
+            # ファイルが存在しない場合はデフォルト値を使用
+            self.config = copy.deepcopy(self.DEFAULT_CONFIG)
+            return
+
+        try:
+            with open(self.config_path, "r", encoding="utf-8") as f:
+                loaded_config = json.load(f)
+
+            # デフォルト設定とマージ（不足しているキーがあっても動作するように）
+            self.config = copy.deepcopy(self.DEFAULT_CONFIG)
+            if "window" in loaded_config:
+                self.config["window"].update(loaded_config["window"])
+            if "timing" in loaded_config:
+                self.config["timing"].update(loaded_config["timing"])
+            if "debug" in loaded_config:
+                self.config["debug"].update(loaded_config["debug"])
+            if "sequence" in loaded_config:
+                self.config["sequence"].update(loaded_config["sequence"])
+            if "window_list" in loaded_config:
+                self.config["window_list"].update(loaded_config["window_list"])
+            if "receive" in loaded_config:
+                self.config["receive"].update(loaded_config["receive"])
+            if "hotkeys" in loaded_config:
+                self.config["hotkeys"].update(loaded_config["hotkeys"])
+
+        except (json.JSONDecodeError, IOError) as e:
+            # 読み込み失敗時はデフォルト値を使用
+            print(f"警告: 設定ファイルの読み込みに失敗しました: {e}")
+            self.config = copy.deepcopy(self.DEFAULT_CONFIG)
+
+    def save_config(self) -> None:
+        """現在の設定をファイルに保存"""
+        try:
+            # ディレクトリが存在しない場合は作成
+            self._ensure_config_dir()
+
+            with open(self.config_path, "w", encoding="utf-8") as f:
+                json.dump(self.config, f, indent=2, ensure_ascii=False)
+
+        except IOError as e:
+            print(f"エラー: 設定ファイルの保存に失敗しました: {e}")
+
+    def get_window_size(self) -> tuple[int, int]:
+        """ウィンドウサイズを取得"""
+        return self.config["window"]["width"], self.config["window"]["height"]
+
+    def set_window_size(self, width: int, height: int) -> None:
+        """ウィンドウサイズを設定"""
+        self.config["window"]["width"] = width
+        self.config["window"]["height"] = height
+
+    def get_timing(self, key: str) -> float:
+        """
+        指定したタイミング設定値を取得
+
+        Args:
+            key: "window_activate_wait", "key_input_wait", "copyfrom_wait"
+        """
+        return self.config["timing"].get(key, 0.3)
+
+    def set_timing(self, key: str, value: float) -> None:
+        """指定したタイミング設定値を設定"""
+        self.config["timing"][key] = value
+
+    def is_adaptive_wait_enabled(self) -> bool:
+        """待機時間を上限として扱う準備完了判定を使用するか"""
+        return bool(self.config["timing"].get("adaptive_wait", True))
+
+    def set_adaptive_wait_enabled(self, enabled: bool) -> None:
+        """準備完了判定の使用有無を設定"""
+        self.config["timing"]["adaptive_wait"] = enabled
+
+    def is_timing_enabled(self) -> bool:
+        """所要時間の計測を有効にするか"""
+        return bool(self.config["debug"].get("timing", False))
+
+    def set_timing_enabled(self, enabled: bool) -> None:
+        """所要時間の計測の有効・無効を設定"""
+        self.config["debug"]["timing"] = enabled
+
+    def get_separator_keys(self) -> list[str]:
+        """まとめて送信する際にテキストの間で入力するキーを取得"""
+        return list(self.config["sequence"].get("separator_keys", []))
+
+    def set_separator_keys(self, keys: list[str]) -> None:
+        """まとめて送信する際にテキストの間で入力するキーを設定"""
+        self.config["sequence"]["separator_keys"] = list(keys)
+
+    def get_paste_wait(self) -> float:
+        """まとめて送信する際のペースト後の待機時間を取得"""
+        return self.config["sequence"].get("paste_wait", 0.1)
+
+    def set_paste_wait(self, value: float) -> None:
+        """まとめて送信する際のペースト後の待機時間を設定"""
+        self.config["sequence"]["paste_wait"] = value
+
+    def get_title_workers(self) -> int:
+        """xdotoolでのタイトル取得の同時実行数を取得"""
+        return max(1, int(self.config["window_list"].get("title_workers", 1)))
+
+    def set_title_workers(self, workers: int) -> None:
+        """xdotoolでのタイトル取得の同時実行数を設定"""
+        self.config["window_list"]["title_workers"] = workers
+
+    def get_title_deadline(self) -> Optional[float]:
+        """xdotoolでのタイトル取得全体の制限時間を取得（Noneの場合は無制限）"""
+        deadline = self.config["window_list"].get("title_deadline")
+        return None if deadline is None else float(deadline)
+
+    def set_title_deadline(self, deadline: Optional[float]) -> None:
+        """xdotoolでのタイトル取得全体の制限時間を設定（Noneの場合は無制限）"""
+        self.config["window_list"]["title_deadline"] = deadline
+
+    def is_primary_receive_enabled(self) -> bool:
+        """コピーでPRIMARY（選択済みのテキスト）を先に読み取るか"""
+        return bool(self.config["receive"].get("use_primary", False))
+
+    def set_primary_receive_enabled(self, enabled: bool) -> None:
+        """コピーでPRIMARYを先に読み取るかを設定"""
+        self.config["receive"]["use_primary"] = enabled
+
+    def is_hotkeys_enabled(self) -> bool:
+        """グローバルホットキーが有効か"""
+        return bool(self.config["hotkeys"].get("enabled", False))
+
+    def set_hotkeys_enabled(self, enabled: bool) -> None:
+        """グローバルホットキーの有効・無効を設定"""
+        self.config["hotkeys"]["enabled"] = enabled
+
+    def get_hotkeys(self) -> dict[str, str]:
+        """
+        グローバルホットキーのキーの組み合わせを取得
+
+        Returns:
+            dict[str, str]: {"send": "ctrl+alt+v", "copy": "ctrl+alt+c"}
+                （空文字列のものは含まない）
+        """
+        return {
+            action: self.config["hotkeys"].get(action, "")
+            for action in ("send", "copy")
+            if self.config["hotkeys"].get(action, "")
+        }
+
+    def set_hotkey(self, action: str, binding: str) -> None:
+        """
+        グローバルホットキーのキーの組み合わせを設定
+
+        Args:
+            action: "send" または "copy"
+            binding: キーの組み合わせ（空文字列の場合は使用しない）
+        """
+        self.config["hotkeys"][action] = binding
+
+    def get_all_config(self) -> dict:
+        """全設定を辞書で取得"""
+        return self.config.copy()
@@ -0,0 +1 @@
+"""常駐プロセス（デーモン）とクライアント"""
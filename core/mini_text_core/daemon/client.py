@@ -0,0 +1,146 @@
+"""常駐プロセス（デーモン）のクライアント"""
+
+import socket
+import threading
+from typing import Iterable, Optional
+
+from mini_text_core.daemon.protocol import (
+    ProtocolError,
+    encode_message,
+    get_default_socket_path,
+    read_message,
+)
+
+
+class DaemonClient:
+    """
+    デーモンにリクエストを送信するクライアント
+
+    1つの接続を使い回し、request_manyでは全リクエストを続けて送信してから
+    レスポンスを順に受け取る（パイプライン）
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: float = 30.0):
+        """
+        Args:
+            socket_path: ソケットのパス（Noneの場合はデフォルトのパス）
+            timeout: 1件のレスポンスを待つ上限(秒)
+        """
+        self.socket_path = socket_path or get_default_socket_path()
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._rfile = None
+        self._next_id = 1
+
+    def connect(self) -> tuple[bool, str]:
+        """
+        デーモンに接続
+
+        Returns:
+            tuple[bool, str]: (成功したか, エラーメッセージ)
+        """
+        if self._sock is not None:
+            return True, ""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError as e:
+            sock.close()
+            return False, f"デーモンに接続できません（{self.socket_path}）: {str(e)}"
+        self._sock = sock
+        self._rfile = sock.makefile("rb")
+        return True, ""
+
+    def close(self) -> None:
+        """接続を閉じる"""
+        if self._rfile is not None:
+            self._rfile.close()
+            self._rfile = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def request(self, command: str, **params) -> dict:
+        """
+        1件のリクエストを送信してレスポンスを受け取る
+
+        Args:
+            command: コマンド（"ping", "list", "send", "copy", "shutdown"）
+            **params: コマンドの引数
+
+        Returns:
+            dict: レスポンス（接続・通信に失敗した場合は"ok"がFalse）
+        """
+        return self.request_many([dict(params, command=command)])[0]
+
+    def request_many(self, requests: Iterable[dict]) -> list[dict]:
+        """
+        複数のリクエストを続けて送信し、レスポンスを順に受け取る
+
+        送信は別スレッドで行うため、レスポンスが大きい場合も
+        ソケットのバッファが埋まって止まることはない
+
+        Args:
+            requests: リクエスト（"id"は自動で付与）
+
+        Returns:
+            list[dict]: リクエストと同じ順序のレスポンス
+        """
+        requests = [dict(request, id=self._take_id()) for request in requests]
+        success, error_msg = self.connect()
+        if not success:
+            return [_failure(request, error_msg) for request in requests]
+
+        send_error: list[str] = []
+        sender = threading.Thread(
+            target=self._send_all, args=(requests, send_error), daemon=True
+        )
+        sender.start()
+
+        responses = []
+        for request in requests:
+            try:
+                response = read_message(self._rfile)
+            except (OSError, ProtocolError) as e:
+                response = None
+                error_msg = f"レスポンスの受信に失敗しました: {str(e)}"
+            else:
+                error_msg = "デーモンが接続を閉じました"
+            if response is None:
+                self.close()
+                if send_error:
+                    error_msg = send_error[0]
+                responses.extend(
+                    _failure(r, error_msg) for r in requests[len(responses):]
+                )
+                break
+            responses.append(response)
+
+        sender.join()
+        return responses
+
+    def _send_all(self, requests: list[dict], errors: list[str]) -> None:
+        """リクエストを順に送信（送信用スレッド）"""
+        try:
+            for request in requests:
+                self._sock.sendall(encode_message(request))
+        except OSError as e:
+            errors.append(f"リクエストの送信に失敗しました: {str(e)}")
+
+    def _take_id(self) -> int:
+        """リクエストのidを採番"""
+        request_id = self._next_id
+        self._next_id += 1
+        return request_id
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _failure(request: dict, error_msg: str) -> dict:
+    """通信に失敗したリクエストのレスポンス"""
+    return {"id": request.get("id"), "ok": False, "error": error_msg}
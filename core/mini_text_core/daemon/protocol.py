@@ -0,0 +1,116 @@
+"""常駐プロセス（デーモン）との通信プロトコル
+
+1行に1つのJSONオブジェクト（UTF-8、改行区切り）を送受信する。
+
+- リクエスト: {"id": 1, "command": "send", ...}
+- レスポンス: {"id": 1, "ok": true, "error": "", ...}
+
+1つの接続で複数のリクエストを続けて送信でき（パイプライン）、
+レスポンスはリクエストと同じ順序で返される
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+
+# 1件のリクエスト・レスポンスの最大サイズ(バイト)
+MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+
+# デーモンが受け付けるコマンド
+COMMANDS = ("ping", "list", "send", "copy", "shutdown")
+
+
+class ProtocolError(Exception):
+    """プロトコルに従っていないメッセージを受信した"""
+
+
+def get_default_socket_path() -> str:
+    """
+    デーモンのソケットのデフォルトパスを取得
+
+    Returns:
+        str: $XDG_RUNTIME_DIR/mini-text/daemon.sock
+            （未設定の場合は一時ディレクトリのmini-text-<uid>/daemon.sock）
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        base = Path(runtime_dir) / "mini-text"
+    else:
+        base = Path(tempfile.gettempdir()) / f"mini-text-{os.getuid()}"
+    return str(base / "daemon.sock")
+
+
+def encode_message(message: dict) -> bytes:
+    """
+    メッセージを送信用の1行に変換
+
+    Args:
+        message: リクエストまたはレスポンス
+
+    Returns:
+        bytes: 改行で終わるJSON
+    """
+    return json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def decode_message(line: bytes) -> dict:
+    """
+    受信した1行をメッセージに変換
+
+    Args:
+        line: 改行で終わるJSON
+
+    Returns:
+        dict: リクエストまたはレスポンス
+
+    Raises:
+        ProtocolError: JSONオブジェクトでない場合
+    """
+    try:
+        message = json.loads(line.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ProtocolError(f"メッセージを解析できません: {str(e)}") from e
+    if not isinstance(message, dict):
+        raise ProtocolError("メッセージがJSONオブジェクトではありません")
+    return message
+
+
+def read_message(stream, max_size: int = MAX_MESSAGE_SIZE) -> Optional[dict]:
+    """
+    ストリームから1件のメッセージを読み込む
+
+    Args:
+        stream: バイナリモードのファイルオブジェクト（socket.makefile("rb")）
+        max_size: 1件の最大サイズ(バイト)
+
+    Returns:
+        Optional[dict]: メッセージ（接続が閉じられた場合はNone）
+
+    Raises:
+        ProtocolError: 解析できない場合・最大サイズを超えた場合
+    """
+    line = stream.readline(max_size + 1)
+    if not line:
+        return None
+    if not line.endswith(b"\n"):
+        if len(line) > max_size:
+            raise ProtocolError(f"メッセージが大きすぎます（上限{max_size}バイト）")
+        raise ProtocolError("メッセージの途中で接続が閉じられました")
+    return decode_message(line)
+
+
+def error_response(request_id, error: str) -> dict:
+    """
+    失敗のレスポンスを作成
+
+    Args:
+        request_id: リクエストのid
+        error: エラーメッセージ
+
+    Returns:
+        dict: レスポンス
+    """
+    return {"id": request_id, "ok": False, "error": error}
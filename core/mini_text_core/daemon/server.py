@@ -0,0 +1,272 @@
+"""常駐プロセス（デーモン）のUnixドメインソケットサーバー"""
+
+import os
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from mini_text_core import __version__
+from mini_text_core.config.config_manager import ConfigManager
+from mini_text_core.services.text_service import TextService
+from mini_text_core.services.window_service import WindowService
+from mini_text_core.utils.timing import Tracer, get_tracer
+from mini_text_core.daemon.protocol import (
+    COMMANDS,
+    ProtocolError,
+    encode_message,
+    error_response,
+    read_message,
+)
+
+
+class RequestDispatcher:
+    """
+    リクエストを送受信サービスの呼び出しに変換するクラス (SRP)
+
+    ウィンドウのアクティブ化とキー入力が混ざらないよう、送信・コピーは
+    接続をまたいで1件ずつ実行する（一覧の取得は並行して実行できる）
+    """
+
+    def __init__(
+        self,
+        text_service: TextService,
+        window_service: WindowService,
+        config_manager: ConfigManager,
+        on_shutdown: Optional[Callable[[], None]] = None,
+        tracer: Optional[Tracer] = None,
+    ):
+        """
+        Args:
+            text_service: テキスト送受信サービス
+            window_service: ウィンドウ操作サービス
+            config_manager: 設定マネージャー（待機時間の既定値）
+            on_shutdown: shutdownリクエストを受信した時に呼ばれる関数
+            tracer: 処理段階ごとの所要時間の計測（Noneの場合は共有のものを使用）
+        """
+        self.text_service = text_service
+        self.window_service = window_service
+        self.config_manager = config_manager
+        self.on_shutdown = on_shutdown
+        self.tracer = tracer or get_tracer()
+        self._input_lock = threading.Lock()
+
+    def handle(self, request: dict) -> dict:
+        """
+        リクエストを処理
+
+        Args:
+            request: {"id": ..., "command": ..., ...}
+
+        Returns:
+            dict: レスポンス（"id"・"ok"・"error"とコマンドごとの結果）
+        """
+        request_id = request.get("id")
+        command = request.get("command")
+        if command not in COMMANDS:
+            return error_response(request_id, f"不明なコマンドです: {command}")
+
+        with self.tracer.span(f"daemon.{command}") as span:
+            try:
+                response = getattr(self, f"_handle_{command}")(request)
+            except (TypeError, ValueError) as e:
+                response = {"ok": False, "error": f"不正なリクエストです: {str(e)}"}
+            except Exception as e:
+                # サービスの予期しない例外でも接続を切らず、このidへの応答を返す
+                # （パイプラインで送信しているクライアントが応答を待ち続けないように）
+                response = {
+                    "ok": False,
+                    "error": f"処理中にエラーが発生しました: {str(e)}",
+                }
+            span.set(ok=response["ok"])
+
+        response["id"] = request_id
+        return response
+
+    def _handle_ping(self, request: dict) -> dict:
+        """起動確認"""
+        return {"ok": True, "error": "", "version": __version__}
+
+    def _handle_list(self, request: dict) -> dict:
+        """ウィンドウ一覧を取得"""
+        windows = self.window_service.get_window_list()
+        return {
+            "ok": True,
+            "error": "",
+            "windows": [[window_id, name] for window_id, name in windows],
+        }
+
+    def _handle_send(self, request: dict) -> dict:
+        """テキストを1つ以上のウィンドウに送信"""
+        text = request.get("text")
+        if not isinstance(text, str) or not text:
+            raise ValueError("textが指定されていません")
+        window_ids = request.get("window_ids")
+        if window_ids is None and "window_id" in request:
+            window_ids = [request["window_id"]]
+        # 文字列を渡された場合に1文字ずつのIDとして扱わないよう、リストに限る
+        if (
+            not isinstance(window_ids, list)
+            or not window_ids
+            or not all(isinstance(w, str) and w for w in window_ids)
+        ):
+            raise ValueError("window_idsが指定されていません")
+
+        activate_wait = self._get_wait(request, "activate_wait", "window_activate_wait")
+        key_wait = self._get_wait(request, "key_wait", "key_input_wait")
+
+        with self._input_lock:
+            if len(window_ids) == 1:
+                success, error_msg = self.text_service.send_text(
+                    window_ids[0], text, activate_wait, key_wait
+                )
+                results = [(window_ids[0], success, error_msg)]
+            else:
+                results = self.text_service.send_text_many(
+                    window_ids, text, activate_wait, key_wait
+                )
+
+        failures = [
+            f"{window_id}: {error_msg}"
+            for window_id, success, error_msg in results
+            if not success
+        ]
+        return {
+            "ok": not failures,
+            "error": ", ".join(failures),
+            "results": [list(result) for result in results],
+        }
+
+    def _handle_copy(self, request: dict) -> dict:
+        """
+        wait秒待ってからアクティブウィンドウのテキストを取得
+
+        window_id指定時は待たずにそのウィンドウをアクティブ化して取得する
+        （focus_point: [x, y] 指定時はウィンドウ内のその位置をクリックしてから）
+        """
+        wait = float(request.get("wait", 0.0))
+        key_wait = self._get_wait(request, "key_wait", "key_input_wait")
+        window_id = request.get("window_id")
+        if window_id is not None and not isinstance(window_id, str):
+            raise ValueError("window_idが不正です")
+        focus_point = request.get("focus_point")
+        if focus_point is not None:
+            if not isinstance(focus_point, list) or len(focus_point) != 2:
+                raise ValueError("focus_pointが不正です")
+            focus_point = (int(focus_point[0]), int(focus_point[1]))
+
+        with self._input_lock:
+            if window_id is not None:
+                activate_wait = self._get_wait(
+                    request, "activate_wait", "window_activate_wait"
+                )
+                success, text, error_msg = self.text_service.receive_text_from(
+                    window_id, activate_wait, key_wait, focus_point
+                )
+            else:
+                if wait > 0:
+                    time.sleep(wait)
+                success, text, error_msg = self.text_service.receive_text(key_wait)
+
+        return {"ok": success, "error": error_msg, "text": text}
+
+    def _handle_shutdown(self, request: dict) -> dict:
+        """デーモンを終了"""
+        if self.on_shutdown is not None:
+            self.on_shutdown()
+        return {"ok": True, "error": ""}
+
+    def _get_wait(self, request: dict, key: str, config_key: str) -> float:
+        """リクエストの待機時間（未指定の場合は設定値）"""
+        if key in request:
+            return float(request[key])
+        return self.config_manager.get_timing(config_key)
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    """1つの接続のリクエストを順に処理し、同じ順序でレスポンスを返す"""
+
+    def handle(self):
+        while True:
+            try:
+                request = read_message(self.rfile)
+            except ProtocolError as e:
+                self.wfile.write(encode_message(error_response(None, str(e))))
+                return
+            if request is None:
+                return
+            response = self.server.dispatcher.handle(request)
+            try:
+                self.wfile.write(encode_message(response))
+            except (BrokenPipeError, ConnectionResetError):
+                return
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Unixドメインソケットでリクエストを受け付けるサーバー
+
+    接続ごとにスレッドで処理するため、複数のクライアントが同時に接続できる
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, dispatcher: RequestDispatcher):
+        """
+        Args:
+            socket_path: ソケットのパス（prepare_socket_pathで準備済みのもの）
+            dispatcher: リクエストの処理
+        """
+        self.socket_path = socket_path
+        self.dispatcher = dispatcher
+        super().__init__(socket_path, _ConnectionHandler)
+        # 他のユーザーからは接続できないようにする
+        os.chmod(socket_path, 0o600)
+
+    def request_shutdown(self) -> None:
+        """serve_foreverを終了させる（処理中のリクエストのスレッドから呼び出せる）"""
+        threading.Thread(target=self.shutdown, daemon=True).start()
+
+    def server_close(self) -> None:
+        """ソケットを閉じてソケットファイルを削除"""
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+
+def prepare_socket_path(socket_path: str) -> tuple[bool, str]:
+    """
+    ソケットのディレクトリを作成し、残っている古いソケットファイルを削除
+
+    Args:
+        socket_path: ソケットのパス
+
+    Returns:
+        tuple[bool, str]: (使用できるか, エラーメッセージ)
+    """
+    path = Path(socket_path)
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    except OSError as e:
+        return False, f"ソケットのディレクトリを作成できません: {str(e)}"
+
+    if not path.exists():
+        return True, ""
+
+    # 接続できる場合は別のデーモンが起動している
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+            return False, f"デーモンは既に起動しています: {socket_path}"
+        except OSError:
+            pass
+
+    try:
+        path.unlink()
+    except OSError as e:
+        return False, f"古いソケットファイルを削除できません: {str(e)}"
+    return True, ""
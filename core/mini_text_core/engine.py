@@ -0,0 +1,184 @@
+"""UIに依存しない送受信エンジンの組み立て"""
+
+from typing import Optional
+from mini_text_core.utils.x11_command_executor import X11CommandExecutor
+from mini_text_core.utils.persistent_command_executor import (
+    PersistentX11CommandExecutor,
+)
+from mini_text_core.config.config_manager import ConfigManager
+from mini_text_core.services.window_service import (
+    WindowListBackendProtocol,
+    WindowService,
+)
+from mini_text_core.services.xcb_window_backend import create_xcb_window_backend
+from mini_text_core.services.window_list_cache import WindowListCache
+from mini_text_core.services.readiness_probe import (
+    ReadinessProbeProtocol,
+    create_readiness_probe,
+)
+from mini_text_core.services.text_service import (
+    ClipboardChangeNotifierProtocol,
+    ClipboardServiceProtocol,
+    TextService,
+)
+from mini_text_core.services.async_window_service import AsyncWindowService
+from mini_text_core.services.async_text_service import (
+    AsyncClipboardServiceProtocol,
+    AsyncTextService,
+)
+
+
+class Engine:
+    """
+    フロントエンドが共有するコマンド実行・ウィンドウ一覧・準備完了判定 (SRP)
+
+    クリップボードはフロントエンドごとに異なる（QClipboard / Gdk.Clipboard）ため、
+    テキスト送受信サービスはクリップボードサービスを受け取って作成する
+    """
+
+    def __init__(
+        self,
+        executor: X11CommandExecutor,
+        backend: Optional[WindowListBackendProtocol] = None,
+        window_cache: Optional[WindowListCache] = None,
+        readiness: Optional[ReadinessProbeProtocol] = None,
+        read_primary: bool = False,
+        title_workers: int = 1,
+        title_deadline: Optional[float] = None,
+    ):
+        """
+        Args:
+            executor: コマンド実行ユーティリティ
+            backend: ウィンドウ一覧バックエンド（Noneの場合はxdotoolを使用）
+            window_cache: 停止が必要なウィンドウ一覧キャッシュ
+            readiness: 準備完了判定（Noneの場合は固定時間待機）
+            read_primary: Trueの場合、受信はまずPRIMARY（選択済みのテキスト）を読み取る
+            title_workers: xdotoolでのタイトル取得の同時実行数（2以上の場合、
+                ウィンドウ一覧は同時呼び出しを直列化しないX11CommandExecutorで取得）
+            title_deadline: xdotoolでのタイトル取得全体の制限時間(秒)
+                （超過分のウィンドウは一覧から除外、Noneの場合は無制限）
+        """
+        self.executor = executor
+        self.backend = backend
+        self.window_cache = window_cache
+        self.readiness = readiness
+        self.read_primary = read_primary
+        # 常駐ワーカーは同時呼び出しを直列化するため、並列に取得する場合は
+        # コマンドごとにプロセスを起動するExecutorを使う
+        window_executor = executor
+        if title_workers > 1 and isinstance(executor, PersistentX11CommandExecutor):
+            window_executor = X11CommandExecutor()
+        self.window_service = WindowService(
+            window_executor,
+            backend=backend,
+            max_workers=title_workers,
+            deadline=title_deadline,
+        )
+
+    def create_text_service(
+        self,
+        clipboard_service: Optional[ClipboardServiceProtocol] = None,
+        clipboard_notifier: Optional[ClipboardChangeNotifierProtocol] = None,
+    ) -> TextService:
+        """
+        テキスト送受信サービスを作成
+
+        Args:
+            clipboard_service: クリップボード操作サービス（Noneの場合はxclipを使用）
+            clipboard_notifier: クリップボード更新通知
+
+        Returns:
+            TextService: エンジンのコマンド実行・ウィンドウ操作を使用するサービス
+                （アクティブ化・ペーストなどは連結したxdotoolコマンドで実行）
+        """
+        return TextService(
+            self.window_service,
+            clipboard_service,
+            self.executor,
+            readiness=self.readiness,
+            clipboard_notifier=clipboard_notifier,
+            chain_commands=True,
+            read_primary=self.read_primary,
+        )
+
+    def create_async_text_service(
+        self,
+        clipboard_service: AsyncClipboardServiceProtocol,
+        clipboard_notifier: Optional[ClipboardChangeNotifierProtocol] = None,
+    ) -> AsyncTextService:
+        """
+        asyncio版テキスト送受信サービスを作成
+
+        Args:
+            clipboard_service: 非同期クリップボード操作サービス
+            clipboard_notifier: クリップボード更新通知
+
+        Returns:
+            AsyncTextService: エンジンのウィンドウ一覧・準備完了判定を使用するサービス
+        """
+        return AsyncTextService(
+            AsyncWindowService(backend=self.backend),
+            clipboard_service,
+            readiness=self.readiness,
+            clipboard_notifier=clipboard_notifier,
+            chain_commands=True,
+            read_primary=self.read_primary,
+        )
+
+    def close(self) -> None:
+        """イベント処理スレッド・常駐ワーカー（使用している場合）・X接続を停止"""
+        if self.window_cache is not None:
+            self.window_cache.stop()
+        close = getattr(self.executor, "close", None)
+        if close is not None:
+            close()
+        if self.readiness is not None:
+            self.readiness.close()
+
+
+def create_engine(
+    config_manager: ConfigManager,
+    executor: Optional[X11CommandExecutor] = None,
+    backend: Optional[WindowListBackendProtocol] = None,
+    readiness: Optional[ReadinessProbeProtocol] = None,
+) -> Engine:
+    """
+    設定に従ってエンジンを作成
+
+    Args:
+        config_manager: 設定マネージャー
+        executor: コマンド実行ユーティリティ（Noneの場合はX11CommandExecutorを使用）
+        backend: ウィンドウ一覧バックエンド（Noneの場合はX11イベントで更新される
+            キャッシュ、利用できない場合はXCBで直接取得、さらにxdotoolにフォールバック）
+        readiness: 準備完了判定（Noneの場合は設定が有効ならXCBのものを使用）
+
+    Returns:
+        Engine: 作成したエンジン
+    """
+    # 常駐ワーカー（PersistentX11CommandExecutor）もコマンドごとにプロセスを
+    # 起動するため起動コストはほぼ変わらず、同時呼び出しを直列化するため使用しない
+    if executor is None:
+        executor = X11CommandExecutor()
+
+    window_cache = None
+    if backend is None:
+        backend = create_xcb_window_backend()
+        if backend is not None:
+            window_cache = WindowListCache(backend)
+            if window_cache.start():
+                backend = window_cache
+
+    # 待機時間を上限として扱い、アクティブ化・コピーの完了を検知したら次に進む
+    # （利用できない場合は固定時間待機）
+    if readiness is None and config_manager.is_adaptive_wait_enabled():
+        readiness = create_readiness_probe()
+
+    return Engine(
+        executor,
+        backend=backend,
+        window_cache=window_cache,
+        readiness=readiness,
+        read_primary=config_manager.is_primary_receive_enabled(),
+        title_workers=config_manager.get_title_workers(),
+        title_deadline=config_manager.get_title_deadline(),
+    )
@@ -0,0 +1 @@
+"""サービスレイヤーモジュール"""
@@ -0,0 +1,75 @@
+"""asyncio版クリップボード操作サービス"""
+
+from typing import Optional
+from mini_text_core.utils.async_x11_command_executor import AsyncX11CommandExecutor
+from mini_text_core.utils.x11_command_executor import iter_encoded_chunks
+
+
+class AsyncClipboardService:
+    """asyncio版クリップボード操作サービス (SRP)"""
+
+    def __init__(self, executor: Optional[AsyncX11CommandExecutor] = None):
+        """
+        Args:
+            executor: 非同期コマンド実行ユーティリティ（Noneの場合はデフォルトを使用）
+        """
+        self.executor = executor or AsyncX11CommandExecutor()
+
+    async def copy_to_clipboard(self, text: str) -> tuple[bool, str]:
+        """
+        クリップボードにテキストをコピー
+
+        Args:
+            text: コピーするテキスト
+
+        Returns:
+            tuple[bool, str]: (成功したか, エラーメッセージ)
+        """
+        # xclip -selection clipboard でクリップボードにコピー
+        # （フォークした子がstdout/stderrを保持し続けるため、EOFを待たずに
+        # 親プロセスの終了で完了とするexecute_streamで渡す）
+        success, stderr = await self.executor.execute_stream(
+            ["xclip", "-selection", "clipboard"], source=iter_encoded_chunks(text)
+        )
+
+        if not success:
+            return False, f"クリップボードへのコピーに失敗しました: {stderr}"
+
+        return True, ""
+
+    async def get_from_clipboard(self) -> tuple[bool, str, str]:
+        """
+        クリップボードからテキストを取得
+
+        Returns:
+            tuple[bool, str, str]: (成功したか, テキスト, エラーメッセージ)
+        """
+        # xclip -selection clipboard -o でクリップボードから取得
+        success, stdout, stderr = await self.executor.execute(
+            ["xclip", "-selection", "clipboard", "-o"]
+        )
+
+        if not success:
+            return False, "", f"クリップボードからの取得に失敗しました: {stderr}"
+
+        return True, stdout, ""
+
+    async def get_from_primary(self) -> tuple[bool, str, str]:
+        """
+        PRIMARY（マウスで選択中のテキスト）を取得
+
+        選択しているアプリケーションがない場合、xclipは失敗するため
+        空のテキストとして返す
+
+        Returns:
+            tuple[bool, str, str]: (成功したか, テキスト, エラーメッセージ)
+        """
+        # xclip -selection primary -o でPRIMARYから取得
+        success, stdout, stderr = await self.executor.execute(
+            ["xclip", "-selection", "primary", "-o"]
+        )
+
+        if not success:
+            return True, "", ""
+
+        return True, stdout, ""
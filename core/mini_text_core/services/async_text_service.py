@@ -0,0 +1,476 @@
+"""asyncio版テキスト送受信統合サービス"""
+
+import asyncio
+from typing import Callable, Optional, Protocol
+
+from mini_text_core.services.async_window_service import AsyncWindowService
+from mini_text_core.services.readiness_probe import ReadinessProbeProtocol
+from mini_text_core.services.text_service import (
+    COPY_ERROR,
+    PASTE_ERROR,
+    RECEIVE_TIMEOUT_MESSAGE,
+    SELECT_ALL_ERROR,
+    SEPARATOR_ERROR,
+    SEQUENCE_ABORTED_MESSAGE,
+    ClipboardChangeNotifierProtocol,
+    TextService,
+)
+from mini_text_core.utils import xdotool_chain
+from mini_text_core.utils.async_x11_command_executor import AsyncX11CommandExecutor
+from mini_text_core.utils.timing import Tracer, get_tracer
+from mini_text_core.utils.xdotool_chain import AsyncXdotoolChainRunner
+
+
+class AsyncClipboardServiceProtocol(Protocol):
+    """非同期クリップボードサービスのプロトコル（型ヒント用）"""
+
+    async def copy_to_clipboard(self, text: str) -> tuple[bool, str]:
+        ...
+
+    async def get_from_clipboard(self) -> tuple[bool, str, str]:
+        ...
+
+    async def get_from_primary(self) -> tuple[bool, str, str]:
+        ...
+
+
+class AsyncTextService:
+    """asyncio版テキスト送受信の統合サービス (SRP, DIP)"""
+
+    def __init__(
+        self,
+        window_service: Optional[AsyncWindowService],
+        clipboard_service: AsyncClipboardServiceProtocol,
+        executor: Optional[AsyncX11CommandExecutor] = None,
+        readiness: Optional[ReadinessProbeProtocol] = None,
+        clipboard_notifier: Optional[ClipboardChangeNotifierProtocol] = None,
+        tracer: Optional[Tracer] = None,
+        chain_commands: bool = False,
+        read_primary: bool = False,
+    ):
+        """
+        Args:
+            window_service: 非同期ウィンドウ操作サービス（Noneの場合はデフォルトを使用）
+            clipboard_service: 非同期クリップボード操作サービス
+            executor: 非同期コマンド実行ユーティリティ（Noneの場合はデフォルトを使用）
+            readiness: 準備完了判定（指定した場合は待機時間を上限として扱う）
+            clipboard_notifier: クリップボード更新通知（wait_for_changeは
+                ブロッキング呼び出しのため別スレッドで実行される）
+            tracer: 処理段階ごとの所要時間の計測（Noneの場合は共有のものを使用）
+            chain_commands: Trueの場合、アクティブ化・待機・ペースト（全選択・待機・
+                コピー）を連結したxdotoolコマンドで実行する
+            read_primary: Trueの場合、receive_textはまずPRIMARYを読み取り、
+                空の場合のみ全選択・コピーする
+        """
+        self.executor = executor or AsyncX11CommandExecutor()
+        self.window_service = window_service or AsyncWindowService(self.executor)
+        self.clipboard_service = clipboard_service
+        self.readiness = readiness
+        self.clipboard_notifier = clipboard_notifier
+        self.tracer = tracer or get_tracer()
+        self.chain_commands = chain_commands
+        self.chain_runner = AsyncXdotoolChainRunner(
+            self.executor, fuse=chain_commands
+        )
+        self.read_primary = read_primary
+
+    async def send_text(
+        self, window_id: str, text: str, activate_wait: float, key_wait: float
+    ) -> tuple[bool, str]:
+        """
+        テキストを指定ウィンドウに送信
+
+        処理フローはTextService.send_textと同じ
+
+        Args:
+            window_id: 送信先ウィンドウのID
+            text: 送信するテキスト
+            activate_wait: ウィンドウアクティブ化後の待機時間
+            key_wait: キー入力後の待機時間(現在未使用)
+
+        Returns:
+            tuple[bool, str]: (成功したか, エラーメッセージ)
+        """
+        with self.tracer.span("send_text", chars=len(text)) as span:
+            # 1. クリップボードにテキストをコピー
+            with self.tracer.span("send_text.copy", chars=len(text)):
+                success, error_msg = await self.clipboard_service.copy_to_clipboard(
+                    text
+                )
+            if not success:
+                span.set(success=False)
+                return False, error_msg
+
+            # 2〜4. ウィンドウをアクティブ化してペースト
+            success, error_msg = await self._activate_and_paste(
+                window_id, activate_wait
+            )
+            span.set(success=success)
+            return success, error_msg
+
+    async def send_text_many(
+        self,
+        window_ids: list[str],
+        text: str,
+        activate_wait: float,
+        key_wait: float,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> list[tuple[str, bool, str]]:
+        """
+        同じテキストを複数のウィンドウに送信
+
+        クリップボードへのコピーは最初の1回だけ行い、以降は送信先ごとに
+        アクティブ化とペーストのみを繰り返す。途中の送信先で失敗しても
+        残りの送信先への送信は続行する
+
+        Args:
+            window_ids: 送信先ウィンドウのIDのリスト（この順に送信）
+            text: 送信するテキスト
+            activate_wait: ウィンドウアクティブ化後の待機時間
+            key_wait: キー入力後の待機時間(現在未使用)
+            on_progress: 送信先ごとの送信後に(送信済みの数, 全体数)で呼ばれる関数
+
+        Returns:
+            list[tuple[str, bool, str]]: 送信先ごとの(window_id, 成功したか, エラーメッセージ)
+        """
+        with self.tracer.span("send_text_many", targets=len(window_ids)):
+            # クリップボードにテキストをコピー（1回のみ）
+            with self.tracer.span("send_text.copy", chars=len(text)):
+                success, error_msg = await self.clipboard_service.copy_to_clipboard(
+                    text
+                )
+            if not success:
+                return [(window_id, False, error_msg) for window_id in window_ids]
+
+            results = []
+            for window_id in window_ids:
+                success, error_msg = await self._activate_and_paste(
+                    window_id, activate_wait
+                )
+                results.append((window_id, success, error_msg))
+                if on_progress is not None:
+                    on_progress(len(results), len(window_ids))
+            return results
+
+    async def send_text_sequence(
+        self,
+        window_id: str,
+        texts: list[str],
+        activate_wait: float,
+        key_wait: float,
+        separator_keys: Optional[list[str]] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> list[tuple[bool, str]]:
+        """
+        複数のテキストを1つのウィンドウに順に送信
+
+        処理フローはTextService.send_text_sequenceと同じ
+
+        Args:
+            window_id: 送信先ウィンドウのID
+            texts: 送信するテキストのリスト（この順に送信）
+            activate_wait: ウィンドウアクティブ化後の待機時間
+            key_wait: ペースト後、次のテキストをコピーするまでの待機時間
+            separator_keys: テキストの間で入力するキー（例: ["Return"]）
+            on_progress: テキストごとの送信後に(送信済みの数, 全体数)で呼ばれる関数
+
+        Returns:
+            list[tuple[bool, str]]: テキストごとの(成功したか, エラーメッセージ)
+        """
+        with self.tracer.span("send_text_sequence", items=len(texts)):
+            results: list[tuple[bool, str]] = []
+            for index, text in enumerate(texts):
+                with self.tracer.span("send_text.copy", chars=len(text)):
+                    success, error_msg = await self.clipboard_service.copy_to_clipboard(
+                        text
+                    )
+                if success:
+                    with self.tracer.span("send_text_sequence.paste", index=index):
+                        success, error_msg = await self.chain_runner.run(
+                            self._sequence_operations(
+                                window_id,
+                                index,
+                                len(texts),
+                                activate_wait,
+                                key_wait,
+                                separator_keys or [],
+                            )
+                        )
+                results.append((success, error_msg))
+                if on_progress is not None:
+                    on_progress(len(results), len(texts))
+                if not success:
+                    break
+
+            aborted = [(False, SEQUENCE_ABORTED_MESSAGE)] * (len(texts) - len(results))
+            return results + aborted
+
+    async def receive_text(self, key_wait: float) -> tuple[bool, str, str]:
+        """
+        アクティブウィンドウからテキストを取得
+
+        処理フローはTextService.receive_textと同じ
+
+        Args:
+            key_wait: キー入力間の待機時間
+
+        Returns:
+            tuple[bool, str, str]: (成功したか, テキスト, エラーメッセージ)
+        """
+        with self.tracer.span("receive_text") as span:
+            if self.read_primary:
+                text = await self._read_primary()
+                if text:
+                    span.set(success=True, chars=len(text), source="primary")
+                    return True, text, ""
+            success, text, error_msg = await self._receive_text(key_wait)
+            span.set(success=success, chars=len(text))
+            return success, text, error_msg
+
+    async def receive_text_from(
+        self,
+        window_id: str,
+        activate_wait: float,
+        key_wait: float,
+        focus_point: Optional[tuple[int, int]] = None,
+    ) -> tuple[bool, str, str]:
+        """
+        指定したウィンドウをアクティブ化してテキストを取得
+
+        処理フローはTextService.receive_text_fromと同じ
+
+        Args:
+            window_id: 取得元ウィンドウのID
+            activate_wait: ウィンドウアクティブ化後の待機時間
+            key_wait: キー入力間の待機時間
+            focus_point: クリックする位置（ウィンドウの左上からの(x, y)）
+
+        Returns:
+            tuple[bool, str, str]: (成功したか, テキスト, エラーメッセージ)
+        """
+        with self.tracer.span("receive_text_from") as span:
+            success, text, error_msg = await self._receive_text(
+                key_wait,
+                self._focus_operations(window_id, activate_wait, focus_point),
+            )
+            span.set(success=success, chars=len(text))
+            return success, text, error_msg
+
+    async def _receive_text(
+        self,
+        key_wait: float,
+        focus_operations: Optional[list[xdotool_chain.Operation]] = None,
+    ) -> tuple[bool, str, str]:
+        """
+        receive_textの処理本体（処理段階ごとに計測）
+
+        focus_operations指定時は全選択の前に実行する（アクティブ化など）
+        """
+        focus_operations = focus_operations or []
+        if self.chain_commands:
+            # 1〜3. 全選択・待機・コピーを連結して実行
+            primary_mark = self._mark_selection("PRIMARY")
+            mark = self._mark_clipboard()
+            if self.readiness is None:
+                wait_operation = xdotool_chain.sleep(key_wait)
+            else:
+                wait_operation = xdotool_chain.wait(
+                    lambda: self._wait_for_primary(primary_mark, key_wait)
+                )
+            with self.tracer.span("receive_text.select_copy"):
+                success, error_msg = await self.chain_runner.run(
+                    focus_operations
+                    + [
+                        xdotool_chain.key("ctrl+a", SELECT_ALL_ERROR),
+                        wait_operation,
+                        xdotool_chain.key("ctrl+c", COPY_ERROR),
+                    ]
+                )
+            if not success:
+                return False, "", error_msg
+        else:
+            if focus_operations:
+                with self.tracer.span("receive_text.activate"):
+                    success, error_msg = await self.chain_runner.run(
+                        focus_operations
+                    )
+                if not success:
+                    return False, "", error_msg
+
+            # 1. Ctrl+A (全選択)
+            mark = self._mark_selection("PRIMARY")
+            with self.tracer.span("receive_text.select_all"):
+                success, stdout, stderr = await self.executor.execute(
+                    ["xdotool", "key", "ctrl+a"]
+                )
+            if not success:
+                return False, "", f"{SELECT_ALL_ERROR}: {stderr}"
+
+            # 2. 待機
+            with self.tracer.span("receive_text.wait_primary", limit=key_wait):
+                await self._wait_for_selection("PRIMARY", mark, key_wait)
+
+            # 3. Ctrl+C (コピー)
+            mark = self._mark_clipboard()
+            with self.tracer.span("receive_text.copy"):
+                success, stdout, stderr = await self.executor.execute(
+                    ["xdotool", "key", "ctrl+c"]
+                )
+            if not success:
+                return False, "", f"{COPY_ERROR}: {stderr}"
+
+        # 4. 待機
+        with self.tracer.span("receive_text.wait_clipboard", limit=key_wait) as span:
+            if self.clipboard_notifier is not None:
+                deadline = max(key_wait, TextService.RECEIVE_DEADLINE)
+                changed = await asyncio.to_thread(
+                    self.clipboard_notifier.wait_for_change, mark, deadline
+                )
+                span.set(limit=deadline, changed=changed)
+                if not changed:
+                    return False, "", RECEIVE_TIMEOUT_MESSAGE
+            else:
+                await self._wait_for_selection("CLIPBOARD", mark, key_wait)
+
+        # 5. クリップボードから取得
+        with self.tracer.span("receive_text.read"):
+            success, text, error_msg = await self.clipboard_service.get_from_clipboard()
+        if not success:
+            return False, "", error_msg
+
+        return True, text, ""
+
+    async def _read_primary(self) -> str:
+        """PRIMARYのテキストを取得（選択されていない場合や失敗した場合は空）"""
+        with self.tracer.span("receive_text.read_primary") as span:
+            success, text, _ = await self.clipboard_service.get_from_primary()
+            if not success:
+                text = ""
+            span.set(chars=len(text))
+        return text
+
+    async def _activate_and_paste(
+        self, window_id: str, activate_wait: float
+    ) -> tuple[bool, str]:
+        """ウィンドウをアクティブ化し、クリップボードの内容をペースト"""
+        if self.chain_commands:
+            return await self._activate_and_paste_chained(window_id, activate_wait)
+
+        # ウィンドウをアクティブ化（activate_wait秒待機込み）
+        if self.readiness is None:
+            with self.tracer.span("send_text.activate", wait=activate_wait):
+                success, error_msg = await self.window_service.activate_window(
+                    window_id, activate_wait
+                )
+            if not success:
+                return False, error_msg
+        else:
+            with self.tracer.span("send_text.activate", wait=0):
+                success, error_msg = await self.window_service.activate_window(
+                    window_id, 0
+                )
+            if not success:
+                return False, error_msg
+            # 判定はブロッキング呼び出しのため別スレッドで待機
+            await asyncio.to_thread(self._wait_for_active, window_id, activate_wait)
+
+        # Ctrl+Vでペースト
+        with self.tracer.span("send_text.paste"):
+            success, stdout, stderr = await self.executor.execute(
+                ["xdotool", "key", "ctrl+v"]
+            )
+        if not success:
+            return False, f"{PASTE_ERROR}: {stderr}"
+
+        return True, ""
+
+    async def _activate_and_paste_chained(
+        self, window_id: str, activate_wait: float
+    ) -> tuple[bool, str]:
+        """アクティブ化・待機・ペーストを連結したxdotoolコマンドで実行"""
+        with self.tracer.span("send_text.activate_paste", wait=activate_wait):
+            return await self.chain_runner.run(
+                self._activation_operations(window_id, activate_wait)
+                + [xdotool_chain.key("ctrl+v", PASTE_ERROR)]
+            )
+
+    def _activation_operations(
+        self, window_id: str, activate_wait: float
+    ) -> list[xdotool_chain.Operation]:
+        """ウィンドウのアクティブ化と待機の操作（TextServiceと同じ）"""
+        if self.readiness is None:
+            wait_operation = xdotool_chain.sleep(activate_wait)
+        else:
+            wait_operation = xdotool_chain.wait(
+                lambda: self._wait_for_active(window_id, activate_wait)
+            )
+        return [xdotool_chain.activate(window_id), wait_operation]
+
+    def _focus_operations(
+        self,
+        window_id: str,
+        activate_wait: float,
+        focus_point: Optional[tuple[int, int]],
+    ) -> list[xdotool_chain.Operation]:
+        """受信前のウィンドウのアクティブ化と、入力欄のクリックの操作"""
+        operations = self._activation_operations(window_id, activate_wait)
+        if focus_point is not None:
+            operations.append(xdotool_chain.click(window_id, *focus_point))
+        return operations
+
+    def _sequence_operations(
+        self,
+        window_id: str,
+        index: int,
+        count: int,
+        activate_wait: float,
+        key_wait: float,
+        separator_keys: list[str],
+    ) -> list[xdotool_chain.Operation]:
+        """連続送信の1件分の操作（最初の1件はアクティブ化を含む）"""
+        operations = []
+        if index == 0:
+            operations += self._activation_operations(window_id, activate_wait)
+        operations.append(xdotool_chain.key("ctrl+v", PASTE_ERROR))
+        if index < count - 1:
+            # 貼り付け先がクリップボードを読み終える前に次のキー入力・コピーをしない
+            operations.append(xdotool_chain.sleep(key_wait))
+            operations += [
+                xdotool_chain.key(key, SEPARATOR_ERROR) for key in separator_keys
+            ]
+        return operations
+
+    def _wait_for_active(self, window_id: str, activate_wait: float) -> None:
+        """ウィンドウがアクティブになるまで待機（ブロッキング、readiness指定時のみ）"""
+        # 上限に達した場合も従来の固定待機と同じく送信を続行
+        with self.tracer.span("send_text.wait_active", limit=activate_wait) as span:
+            active = self.readiness.wait_for_active_window(window_id, activate_wait)
+            span.set(active=active)
+
+    def _wait_for_primary(self, mark: int, key_wait: float) -> None:
+        """全選択後、PRIMARYが更新されるまで待機（ブロッキング、readiness指定時のみ）"""
+        with self.tracer.span("receive_text.wait_primary", limit=key_wait):
+            self.readiness.wait_for_selection_change("PRIMARY", mark, key_wait)
+
+    def _mark_clipboard(self) -> int:
+        """コピー前のクリップボードの状態を記録"""
+        if self.clipboard_notifier is not None:
+            return self.clipboard_notifier.mark_change()
+        return self._mark_selection("CLIPBOARD")
+
+    def _mark_selection(self, selection: str) -> int:
+        """キー入力前の選択範囲の状態を記録（readiness未指定の場合は0）"""
+        if self.readiness is None:
+            return 0
+        return self.readiness.mark_selection(selection)
+
+    async def _wait_for_selection(
+        self, selection: str, mark: int, timeout: float
+    ) -> None:
+        """選択範囲が更新されるまで待機（readiness未指定の場合はtimeout秒待機）"""
+        if self.readiness is None:
+            await asyncio.sleep(timeout)
+            return
+        await asyncio.to_thread(
+            self.readiness.wait_for_selection_change, selection, mark, timeout
+        )
@@ -0,0 +1,125 @@
+"""asyncio版ウィンドウ操作サービス"""
+
+import asyncio
+from typing import Optional
+
+from mini_text_core.services.window_service import WindowListBackendProtocol
+from mini_text_core.utils.async_x11_command_executor import AsyncX11CommandExecutor
+
+
+class AsyncWindowService:
+    """asyncio版ウィンドウ操作サービス (SRP)"""
+
+    def __init__(
+        self,
+        executor: Optional[AsyncX11CommandExecutor] = None,
+        backend: Optional[WindowListBackendProtocol] = None,
+        max_workers: int = 8,
+        deadline: Optional[float] = None,
+    ):
+        """
+        Args:
+            executor: 非同期コマンド実行ユーティリティ（Noneの場合はデフォルトを使用）
+            backend: ウィンドウ一覧バックエンド（Noneの場合はxdotoolを使用）
+            max_workers: xdotoolでのタイトル取得の同時実行数
+            deadline: xdotoolでのタイトル取得全体の制限時間(秒)
+                （超過分のウィンドウは結果から除外、Noneの場合は無制限）
+        """
+        self.executor = executor or AsyncX11CommandExecutor()
+        self.backend = backend
+        self.max_workers = max_workers
+        self.deadline = deadline
+
+    async def get_window_list(self) -> list[tuple[str, str]]:
+        """
+        現在開いているウィンドウの一覧を取得
+
+        バックエンドが設定されている場合はワーカースレッドで問い合わせ、
+        結果を返せない場合はxdotoolにフォールバック
+
+        Returns:
+            list[tuple[str, str]]: [(window_id, window_name), ...]
+        """
+        if self.backend is not None:
+            windows = await asyncio.to_thread(self.backend.get_window_list)
+            if windows is not None:
+                return windows
+
+        success, stdout, stderr = await self.executor.execute(
+            ["xdotool", "search", "--onlyvisible", "--name", "."]
+        )
+
+        if not success:
+            return []
+
+        # ウィンドウIDのリストを取得
+        window_ids = [line.strip() for line in stdout.split("\n") if line.strip()]
+
+        # 各ウィンドウのタイトルを並列に取得（search結果の順序を維持）
+        titles = await self._get_titles(window_ids)
+
+        return [
+            (window_id, titles[window_id])
+            for window_id in window_ids
+            if window_id in titles
+        ]
+
+    async def activate_window(
+        self, window_id: str, wait_time: float
+    ) -> tuple[bool, str]:
+        """
+        指定したウィンドウをアクティブ化
+
+        Args:
+            window_id: アクティブ化するウィンドウのID
+            wait_time: アクティブ化後の待機時間(秒)
+
+        Returns:
+            tuple[bool, str]: (成功したか, エラーメッセージ)
+        """
+        success, stdout, stderr = await self.executor.execute(
+            ["xdotool", "windowactivate", "--sync", window_id]
+        )
+
+        if not success:
+            return False, f"ウィンドウのアクティブ化に失敗しました: {stderr}"
+
+        # 指定時間待機
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+        return True, ""
+
+    async def _get_titles(self, window_ids: list[str]) -> dict[str, str]:
+        """
+        ウィンドウのタイトルを同時実行数を制限して取得
+
+        途中で閉じられたウィンドウと制限時間内に取得できなかったウィンドウは含まれない
+        """
+        if not window_ids:
+            return {}
+
+        semaphore = asyncio.Semaphore(max(1, self.max_workers))
+
+        async def fetch(window_id: str) -> tuple[str, Optional[str]]:
+            async with semaphore:
+                success, title, stderr = await self.executor.execute(
+                    ["xdotool", "getwindowname", window_id]
+                )
+            if success and title.strip():
+                return window_id, title.strip()
+            return window_id, None
+
+        tasks = [asyncio.ensure_future(fetch(window_id)) for window_id in window_ids]
+        done, pending = await asyncio.wait(tasks, timeout=self.deadline)
+
+        # 制限時間を超えた未完了分は破棄
+        for task in pending:
+            task.cancel()
+
+        titles = {}
+        for task in done:
+            window_id, title = task.result()
+            if title:
+                titles[window_id] = title
+        return titles
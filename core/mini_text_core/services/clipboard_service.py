@@ -0,0 +1,86 @@
+"""クリップボード操作サービス"""
+
+from typing import Optional
+from mini_text_core.utils.x11_command_executor import (
+    TextSink,
+    X11CommandExecutor,
+    iter_encoded_chunks,
+)
+
+
+class ClipboardService:
+    """クリップボード操作サービス (SRP)"""
+
+    def __init__(self, executor: Optional[X11CommandExecutor] = None):
+        """
+        Args:
+            executor: コマンド実行ユーティリティ（Noneの場合はデフォルトを使用）
+        """
+        self.executor = executor or X11CommandExecutor()
+
+    def copy_to_clipboard(self, text: str) -> tuple[bool, str]:
+        """
+        クリップボードにテキストをコピー
+
+        Args:
+            text: コピーするテキスト
+
+        Returns:
+            tuple[bool, str]: (成功したか, エラーメッセージ)
+        """
+        # xclip -selection clipboard でクリップボードにコピー
+        # xclipはフォークした子が選択を保持し続け、stdout/stderrも開いたままになる。
+        # 出力を最後まで読み取るexecuteでは制限時間まで待ってしまうため、
+        # 親プロセスの終了で完了とするexecute_streamで渡す
+        # （エンコード済みの全体を作らず、制限時間も転送量に比例して延長される）
+        success, stderr = self.executor.execute_stream(
+            ["xclip", "-selection", "clipboard"], source=iter_encoded_chunks(text)
+        )
+
+        if not success:
+            return False, f"クリップボードへのコピーに失敗しました: {stderr}"
+
+        return True, ""
+
+    def get_from_clipboard(self) -> tuple[bool, str, str]:
+        """
+        クリップボードからテキストを取得
+
+        出力はパイプから読み取りながらデコードするため、出力が大きくても
+        パイプが詰まらず、制限時間も転送量に比例して延長される。
+        ただし戻り値はテキスト全体のstrのため、メモリ使用量は
+        テキスト全体の大きさ程度になる（bytesとstrを同時に保持しないのみ）
+
+        Returns:
+            tuple[bool, str, str]: (成功したか, テキスト, エラーメッセージ)
+        """
+        # xclip -selection clipboard -o でクリップボードから取得
+        sink = TextSink()
+        success, stderr = self.executor.execute_stream(
+            ["xclip", "-selection", "clipboard", "-o"], sink=sink
+        )
+
+        if not success:
+            return False, "", f"クリップボードからの取得に失敗しました: {stderr}"
+
+        return True, sink.getvalue(), ""
+
+    def get_from_primary(self) -> tuple[bool, str, str]:
+        """
+        PRIMARY（マウスで選択中のテキスト）を取得
+
+        選択しているアプリケーションがない場合、xclipは失敗するため
+        空のテキストとして返す
+
+        Returns:
+            tuple[bool, str, str]: (成功したか, テキスト, エラーメッセージ)
+        """
+        # xclip -selection primary -o でPRIMARYから取得
+        success, stdout, stderr = self.executor.execute(
+            ["xclip", "-selection", "primary", "-o"]
+        )
+
+        if not success:
+            return True, "", ""
+
+        return True, stdout, ""
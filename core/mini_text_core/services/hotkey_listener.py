@@ -0,0 +1,367 @@
+"""X11のキーグラブによるグローバルホットキー
+
+ルートウィンドウに対してGrabKeyでキーの組み合わせを登録し、
+他のアプリケーションにフォーカスがある状態でも送受信を開始できるようにする。
+イベントはバックグラウンドスレッドで受信し、コールバックは
+dispatch経由でUIスレッドに渡す（AsyncRunnerと同じ）
+"""
+
+import select
+import threading
+import time
+from typing import Callable, Optional
+
+try:
+    import xcffib
+    import xcffib.xproto
+except ImportError:  # xcffibは任意依存
+    xcffib = None
+
+
+# 修飾キーのマスク（X11プロトコルで定義済み）
+MODIFIER_MASKS = {
+    "shift": 1,
+    "ctrl": 4,
+    "control": 4,
+    "alt": 8,
+    "mod1": 8,
+    "super": 64,
+    "mod4": 64,
+}
+
+# 登録時に無視する修飾キー: CapsLock(Lock), NumLock(Mod2)
+# （これらが有効な状態でも反応するよう、組み合わせごとに登録する）
+LOCK_MASK = 2
+NUM_LOCK_MASK = 16
+IGNORED_MASKS = (0, LOCK_MASK, NUM_LOCK_MASK, LOCK_MASK | NUM_LOCK_MASK)
+
+# 名前付きのキーシンボル（1文字のキーは文字コードを使用）
+KEYSYMS = {
+    "space": 0x0020,
+    "BackSpace": 0xFF08,
+    "Tab": 0xFF09,
+    "Return": 0xFF0D,
+    "Pause": 0xFF13,
+    "Escape": 0xFF1B,
+    "Home": 0xFF50,
+    "Left": 0xFF51,
+    "Up": 0xFF52,
+    "Right": 0xFF53,
+    "Down": 0xFF54,
+    "Prior": 0xFF55,
+    "Page_Up": 0xFF55,
+    "Next": 0xFF56,
+    "Page_Down": 0xFF56,
+    "End": 0xFF57,
+    "Print": 0xFF61,
+    "Insert": 0xFF63,
+    "Delete": 0xFFFF,
+    **{f"F{number}": 0xFFBD + number for number in range(1, 13)},
+}
+
+# GrabKeyのモード: GrabModeAsync
+GRAB_MODE_ASYNC = 1
+
+# イベント待機のポーリング間隔(秒) - 停止要求の確認間隔
+POLL_INTERVAL = 0.5
+
+# 修飾キーが離されるまで待つ上限(秒)
+RELEASE_TIMEOUT = 1.0
+RELEASE_POLL_INTERVAL = 0.01
+
+
+def parse_binding(binding: str) -> tuple[int, int]:
+    """
+    キーの組み合わせ（xdotoolと同じ書式、例: "ctrl+alt+v"）を解析
+
+    Args:
+        binding: キーの組み合わせ
+
+    Returns:
+        tuple[int, int]: (修飾キーのマスク, キーシンボル)
+
+    Raises:
+        ValueError: 解析できない場合
+    """
+    *modifiers, key = [part.strip() for part in binding.split("+")]
+    mask = 0
+    for modifier in modifiers:
+        if modifier.lower() not in MODIFIER_MASKS:
+            raise ValueError(f"不明な修飾キーです: {modifier}")
+        mask |= MODIFIER_MASKS[modifier.lower()]
+
+    if key in KEYSYMS:
+        return mask, KEYSYMS[key]
+    if len(key) == 1 and 0x20 < ord(key.lower()) <= 0xFF:
+        # 英字は小文字のキーシンボル（Shiftの有無は修飾キーで指定する）
+        return mask, ord(key.lower())
+    raise ValueError(f"不明なキーです: {key}")
+
+
+class XcbHotkeyListener:
+    """
+    ルートウィンドウのキーグラブでホットキーを検知するクラス (SRP)
+
+    押されたホットキーは、修飾キーが離されるのを待ってから通知する
+    （押したままの修飾キーがxdotoolのキー入力と組み合わさらないように）。
+    通知には押された時刻（time.perf_counter()）を渡すため、
+    完了までの所要時間を計測できる
+    """
+
+    def __init__(
+        self,
+        bindings: dict[str, str],
+        on_hotkey: Callable[[str, float], None],
+        dispatch: Optional[Callable[[Callable[[], None]], None]] = None,
+        connection=None,
+        display: Optional[str] = None,
+    ):
+        """
+        Args:
+            bindings: {操作名: キーの組み合わせ} （例: {"send": "ctrl+alt+v"}）
+            on_hotkey: ホットキーが押されたときに(操作名, 押された時刻)で呼ばれる関数
+            dispatch: 関数をUIスレッドで実行させる関数
+                （Noneの場合はイベント処理スレッドで呼ぶ）
+            connection: xcffibの接続（Noneの場合はdisplayに接続）
+            display: 接続先ディスプレイ名（Noneの場合は$DISPLAY）
+
+        Raises:
+            RuntimeError: xcffibが利用できない、またはXサーバーに接続できない場合
+        """
+        if connection is None:
+            if xcffib is None:
+                raise RuntimeError("xcffibがインストールされていません")
+            try:
+                connection = xcffib.connect(display=display)
+            except Exception as e:
+                raise RuntimeError(f"Xサーバーに接続できません: {str(e)}")
+
+        self.connection = connection
+        setup = connection.get_setup()
+        self.root = setup.roots[connection.pref_screen].root
+        self._min_keycode = setup.min_keycode
+        self._max_keycode = setup.max_keycode
+
+        self.bindings = bindings
+        self.on_hotkey = on_hotkey
+        self.dispatch = dispatch
+
+        # (キーコード, 修飾キーのマスク) -> 操作名（登録できたもの）
+        self._grabs: dict[tuple[int, int], str] = {}
+        # キーコード -> 最後にキーが離された時刻（自動リピートの判別用）
+        self._released_at: dict[int, int] = {}
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        # メトリクス
+        self._press_count = 0
+
+    def start(self) -> tuple[bool, str]:
+        """
+        ホットキーを登録し、イベント処理スレッドを開始
+
+        他のアプリケーションが登録済みのキーなど、登録できなかったものは
+        エラーメッセージに含め、残りのホットキーで開始する
+
+        Returns:
+            tuple[bool, str]: (1つ以上登録できたか, 登録できなかったホットキーのエラー)
+        """
+        if self._running:
+            return True, ""
+
+        errors = []
+        try:
+            keycodes = self._get_keycodes()
+            for action, binding in self.bindings.items():
+                error_msg = self._grab(action, binding, keycodes)
+                if error_msg:
+                    errors.append(f"{binding}: {error_msg}")
+        except Exception as e:
+            return False, f"ホットキーを登録できません: {str(e)}"
+
+        if not self._grabs:
+            return False, ", ".join(errors)
+
+        self._running = True
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._event_loop, name="hotkey-listener", daemon=True
+        )
+        self._thread.start()
+        return True, ", ".join(errors)
+
+    def stop(self) -> None:
+        """イベント処理スレッドを停止し、ホットキーの登録を解除"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=POLL_INTERVAL * 2)
+            self._thread = None
+        self._running = False
+
+        try:
+            for keycode, modifiers in self._grabs:
+                self._ungrab(keycode, modifiers)
+            self.connection.flush()
+        except Exception:
+            pass
+        self._grabs.clear()
+
+    def close(self) -> None:
+        """停止してXサーバーとの接続を閉じる"""
+        self.stop()
+        try:
+            self.connection.disconnect()
+        except Exception:
+            pass
+
+    def get_metrics(self) -> dict:
+        """
+        メトリクスを取得
+
+        Returns:
+            dict: running, actions（登録できた操作名）, press_count
+        """
+        return {
+            "running": self._running,
+            "actions": sorted(set(self._grabs.values())),
+            "press_count": self._press_count,
+        }
+
+    def handle_event(self, event) -> None:
+        """
+        イベント1件を処理（xcffibのイベントはクラス名で種類を判別する）
+
+        自動リピートでは離した時刻と同じ時刻に再び押されるため、
+        その場合は通知しない
+        """
+        name = type(event).__name__
+        if name == "KeyReleaseEvent":
+            self._released_at[event.detail] = event.time
+            return
+        if name != "KeyPressEvent":
+            return
+
+        pressed_at = time.perf_counter()
+        if self._released_at.get(event.detail) == event.time:
+            return
+        modifiers = event.state & ~(LOCK_MASK | NUM_LOCK_MASK) & 0xFF
+        action = self._grabs.get((event.detail, modifiers))
+        if action is None:
+            return
+
+        self._press_count += 1
+        self._wait_for_release(modifiers)
+        if self.dispatch is None:
+            self.on_hotkey(action, pressed_at)
+        else:
+            self.dispatch(lambda: self.on_hotkey(action, pressed_at))
+
+    def _event_loop(self) -> None:
+        """イベントを受信して処理（バックグラウンドスレッド）"""
+        fd = self.connection.get_file_descriptor()
+        try:
+            while not self._stop_event.is_set():
+                # 停止要求を確認できるようにタイムアウト付きで待機
+                select.select([fd], [], [], POLL_INTERVAL)
+                while True:
+                    event = self.connection.poll_for_event()
+                    if event is None:
+                        break
+                    self.handle_event(event)
+        except Exception:
+            # 接続断などの場合は停止（ボタンからの操作は引き続き使用できる）
+            pass
+        finally:
+            self._running = False
+
+    def _get_keycodes(self) -> dict[int, int]:
+        """キーシンボル -> キーコード（現在のキーボード配列で最初に見つかったもの）"""
+        count = self._max_keycode - self._min_keycode + 1
+        reply = self.connection.core.GetKeyboardMapping(
+            self._min_keycode, count
+        ).reply()
+        per_keycode = reply.keysyms_per_keycode
+        keysyms = list(reply.keysyms)
+
+        keycodes = {}
+        for index, keysym in enumerate(keysyms):
+            if keysym and keysym not in keycodes:
+                keycodes[keysym] = self._min_keycode + index // per_keycode
+        return keycodes
+
+    def _grab(self, action: str, binding: str, keycodes: dict[int, int]) -> str:
+        """
+        ホットキーを1つ登録（CapsLock・NumLockの組み合わせごと）
+
+        Returns:
+            str: エラーメッセージ（登録できた場合は空）
+        """
+        try:
+            modifiers, keysym = parse_binding(binding)
+        except ValueError as e:
+            return str(e)
+        keycode = keycodes.get(keysym)
+        if keycode is None:
+            return "キーボード配列にないキーです"
+
+        try:
+            for ignored in IGNORED_MASKS:
+                self.connection.core.GrabKeyChecked(
+                    True,
+                    self.root,
+                    modifiers | ignored,
+                    keycode,
+                    GRAB_MODE_ASYNC,
+                    GRAB_MODE_ASYNC,
+                ).check()
+        except Exception:
+            # 他のアプリケーションが登録済み（BadAccess）
+            self._ungrab(keycode, modifiers)
+            self.connection.flush()
+            return "他のアプリケーションが使用しています"
+
+        self._grabs[(keycode, modifiers)] = action
+        return ""
+
+    def _ungrab(self, keycode: int, modifiers: int) -> None:
+        """ホットキーの登録を解除（CapsLock・NumLockの組み合わせごと）"""
+        for ignored in IGNORED_MASKS:
+            self.connection.core.UngrabKey(keycode, self.root, modifiers | ignored)
+
+    def _wait_for_release(self, modifiers: int) -> None:
+        """修飾キーが離されるまで待機（最大RELEASE_TIMEOUT秒）"""
+        end_time = time.monotonic() + RELEASE_TIMEOUT
+        while time.monotonic() < end_time:
+            try:
+                mask = self.connection.core.QueryPointer(self.root).reply().mask
+            except Exception:
+                return
+            if mask & modifiers == 0:
+                return
+            time.sleep(RELEASE_POLL_INTERVAL)
+
+
+def create_hotkey_listener(
+    bindings: dict[str, str],
+    on_hotkey: Callable[[str, float], None],
+    dispatch: Optional[Callable[[Callable[[], None]], None]] = None,
+    display: Optional[str] = None,
+) -> Optional[XcbHotkeyListener]:
+    """
+    グローバルホットキーのリスナーを作成（開始はstart()で行う）
+
+    Args:
+        bindings: {操作名: キーの組み合わせ}
+        on_hotkey: ホットキーが押されたときに(操作名, 押された時刻)で呼ばれる関数
+        dispatch: 関数をUIスレッドで実行させる関数
+        display: 接続先ディスプレイ名（Noneの場合は$DISPLAY）
+
+    Returns:
+        Optional[XcbHotkeyListener]: xcffibが利用できない場合などはNone
+    """
+    try:
+        return XcbHotkeyListener(bindings, on_hotkey, dispatch, display=display)
+    except Exception:
+        return None
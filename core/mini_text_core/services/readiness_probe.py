@@ -0,0 +1,232 @@
+"""ウィンドウのアクティブ化・選択範囲の更新を検知する準備完了判定"""
+
+import select
+import threading
+import time
+from typing import Optional, Protocol
+
+try:
+    import xcffib
+    import xcffib.xfixes
+except ImportError:  # xcffibは任意依存
+    xcffib = None
+
+from mini_text_core.services.xcb_window_backend import ATOM_WINDOW
+
+
+# _NET_ACTIVE_WINDOW / 入力フォーカスを確認する間隔(秒)
+POLL_INTERVAL = 0.01
+
+# XFixesSelectSelectionInputのイベントマスク: SetSelectionOwner
+XFIXES_SET_SELECTION_OWNER_MASK = 1
+
+# 監視する選択範囲
+SELECTIONS = ("PRIMARY", "CLIPBOARD")
+
+
+class ReadinessProbeProtocol(Protocol):
+    """準備完了判定のプロトコル（型ヒント用）"""
+
+    def wait_for_active_window(self, window_id: str, timeout: float) -> bool:
+        ...
+
+    def mark_selection(self, selection: str) -> int:
+        ...
+
+    def wait_for_selection_change(
+        self, selection: str, mark: int, timeout: float
+    ) -> bool:
+        ...
+
+
+class XcbReadinessProbe:
+    """
+    固定時間の待機の代わりに、条件が満たされた時点で処理を進めるための判定 (SRP)
+
+    - ウィンドウのアクティブ化: _NET_ACTIVE_WINDOWと入力フォーカスをポーリング
+    - コピー・全選択の完了: XFixesSelectionNotifyでPRIMARY/CLIPBOARDの所有者の
+      設定を検知（同じアプリケーションが所有し直した場合も通知される）
+
+    待機時間は上限としてのみ使用し、条件を満たせなかった場合はFalseを返す
+    """
+
+    def __init__(self, connection=None, display: Optional[str] = None):
+        """
+        Args:
+            connection: xcffibの接続（Noneの場合はdisplayに接続）
+            display: 接続先ディスプレイ名（Noneの場合は$DISPLAY）
+
+        Raises:
+            RuntimeError: xcffibが利用できない、またはXサーバーに接続できない場合
+        """
+        if connection is None:
+            if xcffib is None:
+                raise RuntimeError("xcffibがインストールされていません")
+            try:
+                connection = xcffib.connect(display=display)
+            except Exception as e:
+                raise RuntimeError(f"Xサーバーに接続できません: {str(e)}")
+
+        self.connection = connection
+        setup = connection.get_setup()
+        self.root = setup.roots[connection.pref_screen].root
+
+        names = ["_NET_ACTIVE_WINDOW", *SELECTIONS]
+        cookies = {
+            name: connection.core.InternAtom(False, len(name), name) for name in names
+        }
+        self._atoms = {name: cookie.reply().atom for name, cookie in cookies.items()}
+        self._selections = {self._atoms[name]: name for name in SELECTIONS}
+
+        # 選択範囲ごとの所有者設定の通知回数
+        self._selection_counts = {name: 0 for name in SELECTIONS}
+        self._lock = threading.Lock()
+
+        self._select_selection_input()
+
+    def wait_for_active_window(self, window_id: str, timeout: float) -> bool:
+        """
+        指定ウィンドウがアクティブになるまで待機
+
+        Args:
+            window_id: 対象ウィンドウのID
+            timeout: 待機時間の上限(秒)
+
+        Returns:
+            bool: 上限時間内にアクティブになったか
+        """
+        target = int(window_id)
+        end_time = time.monotonic() + timeout
+
+        with self._lock:
+            while True:
+                try:
+                    if self._is_active(target):
+                        return True
+                except Exception:
+                    return False
+                remaining = end_time - time.monotonic()
+                if remaining <= 0:
+                    return False
+                time.sleep(min(POLL_INTERVAL, remaining))
+
+    def mark_selection(self, selection: str) -> int:
+        """
+        現時点の選択範囲の通知回数を取得（キー入力の前に呼び出す）
+
+        Args:
+            selection: "PRIMARY" または "CLIPBOARD"
+
+        Returns:
+            int: wait_for_selection_changeに渡す値
+        """
+        with self._lock:
+            try:
+                self._process_pending_events()
+            except Exception:
+                pass
+            return self._selection_counts[selection]
+
+    def wait_for_selection_change(
+        self, selection: str, mark: int, timeout: float
+    ) -> bool:
+        """
+        mark_selection以降に選択範囲の所有者が設定されるまで待機
+
+        Args:
+            selection: "PRIMARY" または "CLIPBOARD"
+            mark: mark_selectionの戻り値
+            timeout: 待機時間の上限(秒)
+
+        Returns:
+            bool: 上限時間内に所有者が設定されたか
+        """
+        end_time = time.monotonic() + timeout
+
+        with self._lock:
+            while True:
+                try:
+                    self._process_pending_events()
+                except Exception:
+                    return False
+                if self._selection_counts[selection] > mark:
+                    return True
+                remaining = end_time - time.monotonic()
+                if remaining <= 0:
+                    return False
+                select.select(
+                    [self.connection.get_file_descriptor()], [], [], remaining
+                )
+
+    def mark_change(self) -> int:
+        """CLIPBOARDの現時点の通知回数を取得（クリップボード更新通知として使用）"""
+        return self.mark_selection("CLIPBOARD")
+
+    def wait_for_change(self, mark: int, timeout: float) -> bool:
+        """mark_change以降にCLIPBOARDの所有者が設定されるまで待機"""
+        return self.wait_for_selection_change("CLIPBOARD", mark, timeout)
+
+    def close(self) -> None:
+        """Xサーバーとの接続を閉じる"""
+        try:
+            self.connection.disconnect()
+        except Exception:
+            pass
+
+    def _select_selection_input(self) -> None:
+        """XFixesで選択範囲の所有者の設定を購読"""
+        xfixes = self.connection(xcffib.xfixes.key)
+        # 拡張を使用する前にバージョンの合意が必要
+        xfixes.QueryVersion(5, 0).reply()
+        for name in SELECTIONS:
+            xfixes.SelectSelectionInput(
+                self.root, self._atoms[name], XFIXES_SET_SELECTION_OWNER_MASK
+            )
+        self.connection.flush()
+
+    def _is_active(self, target: int) -> bool:
+        """_NET_ACTIVE_WINDOWまたは入力フォーカスが対象ウィンドウか"""
+        core = self.connection.core
+        active_cookie = core.GetProperty(
+            False, self.root, self._atoms["_NET_ACTIVE_WINDOW"], ATOM_WINDOW, 0, 1
+        )
+        focus_cookie = core.GetInputFocus()
+        self.connection.flush()
+
+        active = active_cookie.reply()
+        if active.format == 32 and active.value_len > 0:
+            if active.value.to_atoms()[0] == target:
+                return True
+
+        return focus_cookie.reply().focus == target
+
+    def _process_pending_events(self) -> None:
+        """受信済みのイベントをすべて処理"""
+        while True:
+            event = self.connection.poll_for_event()
+            if event is None:
+                return
+            # この接続ではConvertSelectionを送らないため、
+            # 同名のコアSelectionNotifyは届かずXFixesの通知のみ
+            if type(event).__name__ == "SelectionNotifyEvent":
+                name = self._selections.get(event.selection)
+                if name is not None:
+                    self._selection_counts[name] += 1
+
+
+def create_readiness_probe(
+    display: Optional[str] = None,
+) -> Optional[XcbReadinessProbe]:
+    """
+    準備完了判定を作成
+
+    Args:
+        display: 接続先ディスプレイ名（Noneの場合は$DISPLAY）
+
+    Returns:
+        Optional[XcbReadinessProbe]: 利用できない場合はNone（固定時間の待機を使用）
+    """
+    try:
+        return XcbReadinessProbe(display=display)
+    except Exception:
+        return None
@@ -0,0 +1,281 @@
+"""X11イベント駆動のウィンドウ一覧キャッシュ"""
+
+import select
+import sys
+import threading
+import time
+from typing import Optional
+
+try:
+    import xcffib
+except ImportError:  # xcffibは任意依存
+    xcffib = None
+
+from mini_text_core.services.xcb_window_backend import ATOM_WM_NAME, XcbWindowBackend
+
+
+# ChangeWindowAttributesの値マスク: CWEventMask
+CW_EVENT_MASK = 1 << 11
+
+# イベントマスク: StructureNotifyMask | PropertyChangeMask
+EVENT_MASK_STRUCTURE_NOTIFY = 1 << 17
+EVENT_MASK_PROPERTY_CHANGE = 1 << 22
+
+# イベント待機のポーリング間隔(秒) - 停止要求の確認間隔
+POLL_INTERVAL = 0.5
+
+# 個々のリクエストのエラーとして無視する例外
+# （購読直後に閉じられたウィンドウへのBadWindowなど。接続断などは含まない）
+PROTOCOL_ERRORS = (xcffib.ProtocolException,) if xcffib is not None else ()
+
+
+class WindowListCache:
+    """
+    PropertyNotifyイベントで差分更新されるウィンドウ一覧キャッシュ (SRP)
+
+    ルートウィンドウの_NET_CLIENT_LISTと各ウィンドウの_NET_WM_NAME/WM_NAME、
+    マップ状態・破棄の通知を購読し、変更のあったウィンドウだけを再取得する。
+    get_window_list()はXサーバーに問い合わせずにキャッシュを返すため、
+    WindowServiceのバックエンドとしてそのまま使用できる
+    """
+
+    def __init__(self, backend: XcbWindowBackend):
+        """
+        Args:
+            backend: Xサーバーとの接続を持つXCBバックエンド
+        """
+        self.backend = backend
+        self.connection = backend.connection
+
+        # ウィンドウID -> (タイトル, 表示中か)
+        self._windows: dict[int, tuple[str, bool]] = {}
+        # _NET_CLIENT_LISTの順序
+        self._order: list[int] = []
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        # メトリクス
+        self._last_sync = 0.0
+        self._event_count = 0
+        self._client_list_refresh_count = 0
+        self._invalidation_count = 0
+        self._error_count = 0
+
+    def start(self) -> bool:
+        """
+        初回の一覧取得とイベント購読を行い、イベント処理スレッドを開始
+
+        Returns:
+            bool: 開始できたか（_NET_CLIENT_LISTがない場合などはFalse）
+        """
+        if self._running:
+            return True
+
+        try:
+            self._select_input(self.backend.root, EVENT_MASK_PROPERTY_CHANGE)
+            if not self._refresh_client_list():
+                return False
+        except Exception:
+            return False
+
+        self._running = True
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._event_loop, name="window-list-cache", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        """イベント処理スレッドを停止"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=POLL_INTERVAL * 2)
+            self._thread = None
+        self._running = False
+
+    def get_window_list(self) -> Optional[list[tuple[str, str]]]:
+        """
+        キャッシュからウィンドウ一覧を取得
+
+        Returns:
+            Optional[list[tuple[str, str]]]: [(window_id, window_name), ...]
+                イベント処理が停止している場合はNone（呼び出し側でフォールバック）
+        """
+        if not self._running:
+            return None
+
+        with self._lock:
+            result = []
+            for window_id in self._order:
+                title, viewable = self._windows.get(window_id, ("", False))
+                if viewable and title:
+                    result.append((str(window_id), title))
+            return result
+
+    def get_staleness(self) -> Optional[float]:
+        """
+        キャッシュが最後に一覧を再取得するかイベントを反映してからの経過時間を取得
+
+        Returns:
+            Optional[float]: 経過秒数（イベント処理が停止している場合はNone）
+        """
+        if not self._running:
+            return None
+        return time.monotonic() - self._last_sync
+
+    def get_metrics(self) -> dict:
+        """
+        キャッシュのメトリクスを取得
+
+        Returns:
+            dict: running, window_count, staleness, event_count,
+                client_list_refresh_count, invalidation_count, error_count
+        """
+        with self._lock:
+            window_count = len(self._order)
+        return {
+            "running": self._running,
+            "window_count": window_count,
+            "staleness": self.get_staleness(),
+            "event_count": self._event_count,
+            "client_list_refresh_count": self._client_list_refresh_count,
+            "invalidation_count": self._invalidation_count,
+            "error_count": self._error_count,
+        }
+
+    def _event_loop(self) -> None:
+        """イベントを受信してキャッシュに反映（バックグラウンドスレッド）"""
+        fd = self.connection.get_file_descriptor()
+        try:
+            while not self._stop_event.is_set():
+                # 停止要求を確認できるようにタイムアウト付きで待機
+                # (リクエストの返信待ち中にキューに入ったイベントも拾うため毎回処理する)
+                select.select([fd], [], [], POLL_INTERVAL)
+                self.process_pending_events()
+        except Exception as e:
+            # 接続断などの場合はキャッシュを無効化（WindowServiceがフォールバック）
+            print(
+                f"警告: ウィンドウ一覧のイベント処理を停止しました: {str(e)}",
+                file=sys.stderr,
+            )
+        finally:
+            self._running = False
+
+    def process_pending_events(self) -> None:
+        """
+        受信済みのイベントをすべて処理
+
+        閉じられたウィンドウへのリクエストのエラー（BadWindow）は
+        イベントと同じキューで届くため、数えて読み飛ばす
+        （ウィンドウの削除は_NET_CLIENT_LISTの変更・DestroyNotifyで反映される）
+        """
+        handled = False
+        while True:
+            try:
+                event = self.connection.poll_for_event()
+                if event is None:
+                    break
+                self.handle_event(event)
+            except PROTOCOL_ERRORS:
+                self._error_count += 1
+                continue
+            handled = True
+        self.connection.flush()
+        # イベントを反映した場合のみ同期時刻を更新（一覧の再取得時は別途更新）
+        if handled:
+            self._last_sync = time.monotonic()
+
+    def handle_event(self, event) -> None:
+        """
+        イベント1件をキャッシュに反映
+
+        xcffibのイベントはクラス名で種類を判別する
+        """
+        self._event_count += 1
+        name = type(event).__name__
+
+        if name == "PropertyNotifyEvent":
+            if event.window == self.backend.root:
+                if event.atom == self.backend.get_atom("_NET_CLIENT_LIST"):
+                    self._refresh_client_list()
+            elif event.atom in (self.backend.get_atom("_NET_WM_NAME"), ATOM_WM_NAME):
+                self._refresh_windows([event.window])
+        elif name == "MapNotifyEvent":
+            self._set_viewable(event.window, True)
+        elif name == "UnmapNotifyEvent":
+            self._set_viewable(event.window, False)
+        elif name == "DestroyNotifyEvent":
+            self._invalidate(event.window)
+
+    def _refresh_client_list(self) -> bool:
+        """_NET_CLIENT_LISTを再取得し、追加されたウィンドウだけを取得"""
+        window_ids = self.backend.get_client_list()
+        if window_ids is None:
+            return False
+
+        with self._lock:
+            known = set(self._windows)
+        added = [window_id for window_id in window_ids if window_id not in known]
+
+        # 新しいウィンドウのイベントを購読してから状態を取得（取りこぼし防止）
+        for window_id in added:
+            self._select_input(
+                window_id, EVENT_MASK_PROPERTY_CHANGE | EVENT_MASK_STRUCTURE_NOTIFY
+            )
+        states = self.backend.get_window_states(added) if added else {}
+
+        with self._lock:
+            current = set(window_ids)
+            for window_id in list(self._windows):
+                if window_id not in current:
+                    del self._windows[window_id]
+                    self._invalidation_count += 1
+            self._windows.update(states)
+            self._order = [
+                window_id for window_id in window_ids if window_id in self._windows
+            ]
+            self._client_list_refresh_count += 1
+
+        self._last_sync = time.monotonic()
+        return True
+
+    def _refresh_windows(self, window_ids: list[int]) -> None:
+        """指定ウィンドウの状態を再取得"""
+        states = self.backend.get_window_states(window_ids)
+        with self._lock:
+            for window_id in window_ids:
+                if window_id not in self._windows:
+                    continue
+                if window_id in states:
+                    self._windows[window_id] = states[window_id]
+                else:
+                    self._remove(window_id)
+
+    def _set_viewable(self, window_id: int, viewable: bool) -> None:
+        """マップ状態を更新"""
+        with self._lock:
+            if window_id in self._windows:
+                title, _ = self._windows[window_id]
+                self._windows[window_id] = (title, viewable)
+
+    def _invalidate(self, window_id: int) -> None:
+        """破棄されたウィンドウをキャッシュから削除"""
+        with self._lock:
+            if window_id in self._windows:
+                self._remove(window_id)
+
+    def _remove(self, window_id: int) -> None:
+        """キャッシュからウィンドウを削除（ロック取得済みで呼ぶこと）"""
+        del self._windows[window_id]
+        self._order = [w for w in self._order if w != window_id]
+        self._invalidation_count += 1
+
+    def _select_input(self, window_id: int, mask: int) -> None:
+        """ウィンドウのイベント購読を設定"""
+        self.connection.core.ChangeWindowAttributes(
+            window_id, CW_EVENT_MASK, [mask]
+        )
@@ -0,0 +1,102 @@
+"""ウィンドウ一覧の差分計算
+
+一覧の更新のたびにリストを作り直すと、ウィンドウが多い場合（数百〜数千件）に
+変更がなくても全件分の行の削除・作成が発生する。
+前回と今回の一覧（ウィンドウIDの並び）を比較し、フロントエンドのリストモデル
+（Gio.ListStore、QAbstractListModel）に適用する最小限の編集を求める。
+
+編集は2種類:
+- 置換（splice）: (位置, 削除数, 追加する項目) - Gio.ListStore.spliceと同じ形式
+- タイトルの更新: (位置, 新しいタイトル) - 行を作り直さずに表示だけ更新する
+"""
+
+from difflib import SequenceMatcher
+
+
+# 置換: (位置, 削除数, 追加する[(window_id, window_name), ...])
+Splice = tuple[int, int, list[tuple[str, str]]]
+
+# タイトルの更新: (位置, 新しいタイトル)
+TitleUpdate = tuple[int, str]
+
+
+def diff_window_lists(
+    old: list[tuple[str, str]],
+    new: list[tuple[str, str]],
+) -> tuple[list[Splice], list[TitleUpdate]]:
+    """
+    ウィンドウ一覧の差分を計算
+
+    置換は後ろの位置から順に並べるため、先頭から順に適用しても
+    残りの置換の位置（変更前の一覧での位置）はずれない。
+    タイトルの更新の位置は変更後の一覧での位置で、置換をすべて適用した後に適用する
+
+    Args:
+        old: 変更前の一覧 [(window_id, window_name), ...]
+        new: 変更後の一覧 [(window_id, window_name), ...]
+
+    Returns:
+        tuple[list[Splice], list[TitleUpdate]]: (置換のリスト, タイトルの更新のリスト)
+    """
+    old_ids = [window_id for window_id, _ in old]
+    new_ids = [window_id for window_id, _ in new]
+
+    # 先頭・末尾の一致部分は比較の対象から除く（通常の更新は変更が少ない）
+    prefix = 0
+    limit = min(len(old_ids), len(new_ids))
+    while prefix < limit and old_ids[prefix] == new_ids[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < limit - prefix
+        and old_ids[-1 - suffix] == new_ids[-1 - suffix]
+    ):
+        suffix += 1
+
+    # 一致している範囲: (変更前の開始位置, 変更後の開始位置, 件数)
+    matches = [(0, 0, prefix)]
+    splices: list[Splice] = []
+    old_end = len(old_ids) - suffix
+    new_end = len(new_ids) - suffix
+    if prefix < old_end or prefix < new_end:
+        matcher = SequenceMatcher(
+            None, old_ids[prefix:old_end], new_ids[prefix:new_end], autojunk=False
+        )
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                matches.append((prefix + i1, prefix + j1, i2 - i1))
+            else:
+                splices.append(
+                    (prefix + i1, i2 - i1, list(new[prefix + j1:prefix + j2]))
+                )
+    matches.append((old_end, new_end, suffix))
+    splices.reverse()
+
+    updates: list[TitleUpdate] = []
+    for old_start, new_start, count in matches:
+        for offset in range(count):
+            old_name = old[old_start + offset][1]
+            _, new_name = new[new_start + offset]
+            if old_name != new_name:
+                updates.append((new_start + offset, new_name))
+
+    return splices, updates
+
+
+def apply_window_list_diff(
+    windows: list[tuple[str, str]],
+    splices: list[Splice],
+    updates: list[TitleUpdate],
+) -> None:
+    """
+    差分をリストに適用（フロントエンドのモデルが保持する一覧の更新用）
+
+    Args:
+        windows: 更新するリスト（その場で変更する）
+        splices: 置換のリスト
+        updates: タイトルの更新のリスト
+    """
+    for position, removed, added in splices:
+        windows[position:position + removed] = added
+    for position, window_name in updates:
+        windows[position] = (windows[position][0], window_name)
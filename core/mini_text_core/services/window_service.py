@@ -0,0 +1,225 @@
+"""ウィンドウ操作サービス"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Optional, Protocol
+from mini_text_core.utils.x11_command_executor import X11CommandExecutor
+
+
+class WindowListBackendProtocol(Protocol):
+    """ウィンドウ一覧バックエンドのプロトコル（型ヒント用）"""
+
+    def get_window_list(self) -> Optional[list[tuple[str, str]]]:
+        ...
+
+
+class WindowService:
+    """ウィンドウ操作サービス (SRP)"""
+
+    def __init__(
+        self,
+        executor: Optional[X11CommandExecutor] = None,
+        backend: Optional[WindowListBackendProtocol] = None,
+        max_workers: int = 1,
+        deadline: Optional[float] = None,
+    ):
+        """
+        Args:
+            executor: コマンド実行ユーティリティ（Noneの場合はデフォルトを使用）
+            backend: ウィンドウ一覧バックエンド（Noneの場合はxdotoolを使用）
+            max_workers: xdotoolでのタイトル取得の同時実行数（1の場合は逐次実行）
+                ※executorが同時呼び出しを直列化する場合
+                （PersistentX11CommandExecutor）は効果がない
+                （create_engineは設定のwindow_list.title_workersを渡し、
+                常駐ワーカーを指定された場合もX11CommandExecutorを使用する）
+            deadline: xdotoolでのタイトル取得全体の制限時間(秒)
+                （超過分のウィンドウは結果から除外、Noneの場合は無制限。
+                create_engineは設定のwindow_list.title_deadlineを渡す）
+        """
+        self.executor = executor or X11CommandExecutor()
+        self.backend = backend
+        self.max_workers = max_workers
+        self.deadline = deadline
+
+    def get_window_list(self) -> list[tuple[str, str]]:
+        """
+        現在開いているウィンドウの一覧を取得
+
+        バックエンドが設定されている場合はそれを使用し、
+        バックエンドが結果を返せない場合はxdotoolにフォールバック
+
+        Returns:
+            list[tuple[str, str]]: [(window_id, window_name), ...]
+        """
+        if self.backend is not None:
+            windows = self.backend.get_window_list()
+            if windows is not None:
+                return windows
+
+        return self._get_window_list_with_xdotool()
+
+    def _get_window_list_with_xdotool(self) -> list[tuple[str, str]]:
+        """xdotoolでウィンドウ一覧を取得"""
+        # xdotool search でデスクトップ上の全ウィンドウを検索
+        success, stdout, stderr = self.executor.execute(
+            ["xdotool", "search", "--onlyvisible", "--name", "."]
+        )
+
+        if not success:
+            return []
+
+        # ウィンドウIDのリストを取得
+        window_ids = [line.strip() for line in stdout.split("\n") if line.strip()]
+
+        # 各ウィンドウのタイトルを取得（search結果の順序を維持）
+        titles = self._get_titles(window_ids)
+
+        return [
+            (window_id, titles[window_id])
+            for window_id in window_ids
+            if window_id in titles
+        ]
+
+    def _get_titles(self, window_ids: list[str]) -> dict[str, str]:
+        """
+        ウィンドウのタイトルをまとめて取得
+
+        max_workersが2以上の場合はスレッドプールで並列に取得する。
+        途中で閉じられたウィンドウと制限時間内に取得できなかったウィンドウは含まれない
+
+        Args:
+            window_ids: ウィンドウIDのリスト
+
+        Returns:
+            dict[str, str]: {window_id: タイトル}
+        """
+        end_time = None
+        if self.deadline is not None:
+            end_time = time.monotonic() + self.deadline
+
+        titles = {}
+
+        if self.max_workers <= 1 or len(window_ids) <= 1:
+            for window_id in window_ids:
+                if end_time is not None and time.monotonic() >= end_time:
+                    break
+                title = self._get_title(window_id)
+                if title:
+                    titles[window_id] = title
+            return titles
+
+        pool = ThreadPoolExecutor(max_workers=min(self.max_workers, len(window_ids)))
+        try:
+            futures = {
+                pool.submit(self._get_title, window_id): window_id
+                for window_id in window_ids
+            }
+            timeout = None
+            if end_time is not None:
+                timeout = max(0.0, end_time - time.monotonic())
+            done, _ = wait(futures, timeout=timeout)
+
+            for future in done:
+                title = future.result()
+                if title:
+                    titles[futures[future]] = title
+        finally:
+            # 制限時間を超えた未完了分は待たずに破棄
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return titles
+
+    def _get_title(self, window_id: str) -> Optional[str]:
+        """
+        ウィンドウのタイトルを取得
+
+        Returns:
+            Optional[str]: タイトル（取得できない・空の場合はNone）
+        """
+        success, title, stderr = self.executor.execute(
+            ["xdotool", "getwindowname", window_id]
+        )
+
+        if success and title.strip():
+            return title.strip()
+        return None
+
+    def activate_window(self, window_id: str, wait_time: float) -> tuple[bool, str]:
+        """
+        指定したウィンドウをアクティブ化
+
+        Args:
+            window_id: アクティブ化するウィンドウのID
+            wait_time: アクティブ化後の待機時間(秒)
+
+        Returns:
+            tuple[bool, str]: (成功したか, エラーメッセージ)
+        """
+        # xdotool windowactivate でウィンドウをアクティブ化
+        success, stdout, stderr = self.executor.execute(
+            ["xdotool", "windowactivate", "--sync", window_id]
+        )
+
+        if not success:
+            return False, f"ウィンドウのアクティブ化に失敗しました: {stderr}"
+
+        # 指定時間待機
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+        return True, ""
+
+    def get_pointer_in_active_window(self) -> Optional[tuple[str, tuple[int, int]]]:
+        """
+        アクティブウィンドウと、その中でのマウスポインタの位置を取得
+
+        コピー対象の入力欄をクリックした直後に呼び、次回以降のコピーで
+        同じ入力欄にフォーカスするための位置を記録する
+
+        Returns:
+            Optional[tuple[str, tuple[int, int]]]: (window_id, (x, y))
+                （ウィンドウの左上からの位置。取得できない場合・
+                ポインタがウィンドウの外にある場合はNone）
+        """
+        success, stdout, stderr = self.executor.execute(["xdotool", "getactivewindow"])
+        window_id = stdout.strip()
+        if not success or not window_id:
+            return None
+
+        success, stdout, stderr = self.executor.execute(
+            ["xdotool", "getwindowgeometry", "--shell", window_id]
+        )
+        geometry = parse_shell_output(stdout) if success else {}
+        success, stdout, stderr = self.executor.execute(
+            ["xdotool", "getmouselocation", "--shell"]
+        )
+        pointer = parse_shell_output(stdout) if success else {}
+
+        try:
+            x = int(pointer["X"]) - int(geometry["X"])
+            y = int(pointer["Y"]) - int(geometry["Y"])
+            width = int(geometry["WIDTH"])
+            height = int(geometry["HEIGHT"])
+        except (KeyError, ValueError):
+            return None
+        if not (0 <= x < width and 0 <= y < height):
+            return None
+        return window_id, (x, y)
+
+
+def parse_shell_output(stdout: str) -> dict[str, str]:
+    """
+    xdotoolの--shell形式の出力（KEY=VALUEの行）を辞書に変換
+
+    Args:
+        stdout: xdotoolの出力
+
+    Returns:
+        dict[str, str]: {KEY: VALUE}
+    """
+    values = {}
+    for line in stdout.splitlines():
+        key, separator, value = line.partition("=")
+        if separator:
+            values[key.strip()] = value.strip()
+    return values
@@ -0,0 +1,198 @@
+"""XCBでXサーバーと直接通信するウィンドウ一覧バックエンド"""
+
+from typing import Optional
+
+try:
+    import xcffib
+    import xcffib.xproto
+except ImportError:  # xcffibは任意依存
+    xcffib = None
+
+
+# X11プロトコルで定義済みのアトム値
+ATOM_ANY = 0
+ATOM_WINDOW = 33
+ATOM_WM_NAME = 39
+
+# GetWindowAttributesのmap_state: IsViewable
+MAP_STATE_VIEWABLE = 2
+
+# プロパティ取得時の最大長(32bit単位)
+PROPERTY_MAX_LENGTH = 2**32 - 1
+
+
+class XcbWindowBackend:
+    """
+    xdotoolを起動せずにウィンドウ一覧を取得するバックエンド (SRP)
+
+    ルートウィンドウの_NET_CLIENT_LISTを読み取り、各ウィンドウの
+    _NET_WM_NAME / WM_NAME / マップ状態の取得リクエストをまとめて送信してから
+    返信を回収するため、ウィンドウ数に関わらず往復は1回で済む
+    """
+
+    def __init__(self, connection=None, display: Optional[str] = None):
+        """
+        Args:
+            connection: xcffibの接続（Noneの場合はdisplayに接続）
+            display: 接続先ディスプレイ名（Noneの場合は$DISPLAY）
+
+        Raises:
+            RuntimeError: xcffibが利用できない、またはXサーバーに接続できない場合
+        """
+        if connection is None:
+            if xcffib is None:
+                raise RuntimeError("xcffibがインストールされていません")
+            try:
+                connection = xcffib.connect(display=display)
+            except Exception as e:
+                raise RuntimeError(f"Xサーバーに接続できません: {str(e)}")
+
+        self.connection = connection
+        setup = connection.get_setup()
+        self.root = setup.roots[connection.pref_screen].root
+        self._atoms = self._intern_atoms(
+            ["_NET_CLIENT_LIST", "_NET_WM_NAME", "UTF8_STRING"]
+        )
+
+    def get_window_list(self) -> Optional[list[tuple[str, str]]]:
+        """
+        現在開いているウィンドウの一覧を取得
+
+        Returns:
+            Optional[list[tuple[str, str]]]: [(window_id, window_name), ...]
+                _NET_CLIENT_LISTが取得できない場合はNone（呼び出し側でフォールバック）
+        """
+        try:
+            window_ids = self.get_client_list()
+            if window_ids is None:
+                return None
+            states = self.get_window_states(window_ids)
+        except Exception:
+            return None
+
+        result = []
+        for window_id in window_ids:
+            if window_id not in states:
+                continue
+            title, viewable = states[window_id]
+            # 最小化などで表示されていないウィンドウは除外（--onlyvisible相当）
+            if viewable and title:
+                result.append((str(window_id), title))
+
+        return result
+
+    def get_atom(self, name: str) -> int:
+        """解決済みのアトム値を取得（_NET_CLIENT_LIST, _NET_WM_NAME, UTF8_STRING）"""
+        return self._atoms[name]
+
+    def close(self) -> None:
+        """Xサーバーとの接続を閉じる"""
+        try:
+            self.connection.disconnect()
+        except Exception:
+            pass
+
+    def _intern_atoms(self, names: list[str]) -> dict[str, int]:
+        """アトム名をまとめて解決（リクエストを一括送信してから返信を回収）"""
+        cookies = {
+            name: self.connection.core.InternAtom(False, len(name), name)
+            for name in names
+        }
+        return {name: cookie.reply().atom for name, cookie in cookies.items()}
+
+    def get_client_list(self) -> Optional[list[int]]:
+        """
+        ルートウィンドウの_NET_CLIENT_LISTからウィンドウIDを取得
+
+        Returns:
+            Optional[list[int]]: ウィンドウIDのリスト（プロパティがない場合はNone）
+        """
+        reply = self.connection.core.GetProperty(
+            False,
+            self.root,
+            self._atoms["_NET_CLIENT_LIST"],
+            ATOM_WINDOW,
+            0,
+            PROPERTY_MAX_LENGTH,
+        ).reply()
+
+        # EWMH対応のウィンドウマネージャーがいない場合はプロパティがない
+        if reply.format != 32:
+            return None
+
+        return list(reply.value.to_atoms())
+
+    def get_window_states(
+        self, window_ids: list[int]
+    ) -> dict[int, tuple[str, bool]]:
+        """
+        各ウィンドウのタイトルとマップ状態を1往復でまとめて取得
+
+        Args:
+            window_ids: 取得対象のウィンドウIDのリスト
+
+        Returns:
+            dict[int, tuple[str, bool]]: {window_id: (タイトル, 表示中か)}
+                取得中に閉じられたウィンドウは含まれない
+        """
+        core = self.connection.core
+        requests = []
+        for window_id in window_ids:
+            requests.append(
+                (
+                    window_id,
+                    core.GetWindowAttributes(window_id),
+                    core.GetProperty(
+                        False,
+                        window_id,
+                        self._atoms["_NET_WM_NAME"],
+                        self._atoms["UTF8_STRING"],
+                        0,
+                        PROPERTY_MAX_LENGTH,
+                    ),
+                    core.GetProperty(
+                        False, window_id, ATOM_WM_NAME, ATOM_ANY, 0, PROPERTY_MAX_LENGTH
+                    ),
+                )
+            )
+        self.connection.flush()
+
+        result = {}
+        for window_id, attributes, net_wm_name, wm_name in requests:
+            try:
+                viewable = attributes.reply().map_state == MAP_STATE_VIEWABLE
+                title = self._decode(net_wm_name.reply()) or self._decode(
+                    wm_name.reply()
+                )
+            except Exception:
+                # 取得中に閉じられたウィンドウは除外
+                continue
+
+            result[window_id] = (title.strip(), viewable)
+
+        return result
+
+    @staticmethod
+    def _decode(reply) -> str:
+        """プロパティの値を文字列にデコード"""
+        if reply.format != 8 or reply.value_len == 0:
+            return ""
+        return bytes(reply.value.buf()).decode("utf-8", errors="replace")
+
+
+def create_xcb_window_backend(
+    display: Optional[str] = None,
+) -> Optional[XcbWindowBackend]:
+    """
+    XCBバックエンドを作成
+
+    Args:
+        display: 接続先ディスプレイ名（Noneの場合は$DISPLAY）
+
+    Returns:
+        Optional[XcbWindowBackend]: 利用できない場合はNone
+    """
+    try:
+        return XcbWindowBackend(display=display)
+    except Exception:
+        return None
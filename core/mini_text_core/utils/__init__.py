@@ -0,0 +1 @@
+"""ユーティリティモジュール"""
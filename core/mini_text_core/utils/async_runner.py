@@ -0,0 +1,84 @@
+"""UIスレッドからコルーチンを実行するためのランナー"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Coroutine, Optional
+
+
+class AsyncRunner:
+    """
+    コルーチンをasyncioイベントループで実行し、結果をUIスレッドに返すクラス
+
+    UIのメインループと統合されたイベントループ（GLibEventLoopPolicy、qasync）が
+    渡された場合はそれを使用し、渡されない場合は専用スレッドでループを動かす。
+    完了コールバックはdispatch経由でUIスレッドに渡される
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[Callable[[], None]], None],
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ):
+        """
+        Args:
+            dispatch: 関数をUIスレッドで実行させる関数（GLib.idle_add、Qtシグナルなど）
+            loop: UIと統合されたイベントループ（Noneの場合は専用スレッドで作成）
+        """
+        self.dispatch = dispatch
+        self._thread: Optional[threading.Thread] = None
+        self._owns_loop = loop is None
+
+        if loop is None:
+            loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=loop.run_forever, name="async-runner", daemon=True
+            )
+            self._thread.start()
+        self.loop = loop
+
+    def submit(
+        self,
+        coro: Coroutine[Any, Any, Any],
+        on_done: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+    ) -> Future:
+        """
+        コルーチンの実行を開始（呼び出し元はブロックしない）
+
+        Args:
+            coro: 実行するコルーチン
+            on_done: 正常終了時にUIスレッドで呼ばれるコールバック(戻り値を受け取る)
+            on_error: 例外発生時にUIスレッドで呼ばれるコールバック
+
+        Returns:
+            Future: 実行中のタスク（cancel()でキャンセル可能）
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+        def on_future_done(f: Future) -> None:
+            if f.cancelled():
+                return
+            error = f.exception()
+            if error is not None:
+                if on_error is not None:
+                    self.dispatch(lambda: on_error(error))
+            elif on_done is not None:
+                result = f.result()
+                self.dispatch(lambda: on_done(result))
+
+        future.add_done_callback(on_future_done)
+        return future
+
+    def owns_loop(self) -> bool:
+        """イベントループを専用スレッドで動かしているか"""
+        return self._owns_loop
+
+    def close(self) -> None:
+        """専用スレッドで動かしているイベントループを停止"""
+        if self._thread is None:
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=1)
+        self._thread = None
+        self.loop.close()
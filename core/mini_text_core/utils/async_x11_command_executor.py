@@ -0,0 +1,162 @@
+"""asyncio版X11コマンド実行ユーティリティ"""
+
+import asyncio
+import os
+import tempfile
+from typing import Iterable, Optional
+
+from mini_text_core.utils.timing import get_tracer
+from mini_text_core.utils.x11_command_executor import (
+    STDERR_LIMIT,
+    STREAM_BASE_TIMEOUT,
+    STREAM_MIN_THROUGHPUT,
+)
+
+
+class AsyncX11CommandExecutor:
+    """xdotool/xclipコマンドをasyncioのサブプロセスで実行するクラス"""
+
+    # タイムアウト(秒) - X11CommandExecutorと同じ
+    TIMEOUT = 10.0
+
+    async def execute(
+        self, command: list[str], input_data: Optional[str] = None
+    ) -> tuple[bool, str, str]:
+        """
+        コマンドを実行（イベントループをブロックしない）
+
+        Args:
+            command: 実行するコマンドと引数のリスト
+            input_data: 標準入力に渡すデータ(オプション)
+
+        Returns:
+            tuple[bool, str, str]: (成功したか, stdout, stderr)
+        """
+        with get_tracer().span("exec", command=command) as span:
+            try:
+                # input_dataがある場合はbytesに変換
+                input_bytes = input_data.encode("utf-8") if input_data else None
+
+                stdin = asyncio.subprocess.DEVNULL
+                if input_bytes:
+                    stdin = asyncio.subprocess.PIPE
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    stdin=stdin,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+
+                try:
+                    stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                        process.communicate(input_bytes), timeout=self.TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+                    return False, "", "コマンドがタイムアウトしました"
+                except asyncio.CancelledError:
+                    # 呼び出し側でキャンセルされた場合はプロセスを残さない
+                    process.kill()
+                    raise
+
+                # 出力をデコード
+                stdout = stdout_bytes.decode("utf-8", errors="replace")
+                stderr = stderr_bytes.decode("utf-8", errors="replace")
+
+                span.set(
+                    exit_code=process.returncode,
+                    bytes_in=len(input_bytes) if input_bytes else 0,
+                    bytes_out=len(stdout_bytes),
+                )
+                return process.returncode == 0, stdout, stderr
+
+            except FileNotFoundError:
+                return False, "", f"コマンドが見つかりません: {command[0]}"
+            except Exception as e:
+                return False, "", f"コマンド実行エラー: {str(e)}"
+
+    async def execute_stream(
+        self,
+        command: list[str],
+        source: Optional[Iterable[bytes]] = None,
+        timeout: float = STREAM_BASE_TIMEOUT,
+    ) -> tuple[bool, str]:
+        """
+        標準入力にチャンク単位で書き込んでコマンドを実行（出力は破棄）
+
+        stdout/stderrのEOFは待たず、プロセスの終了で完了とする
+        （xclipのようにフォークした子がstdout/stderrを保持し続けるコマンドのため、
+        stderrはパイプではなく一時ファイルで受ける）。
+        制限時間は書き込んだバイト数に比例して延長される
+        （STREAM_MIN_THROUGHPUTバイトごとに1秒）
+
+        Args:
+            command: 実行するコマンドと引数のリスト
+            source: 標準入力に渡すデータのチャンク列(オプション)
+            timeout: データ転送がない場合の制限時間(秒)
+
+        Returns:
+            tuple[bool, str]: (成功したか, stderr)
+        """
+        with get_tracer().span("exec_stream", command=command) as span:
+            with tempfile.TemporaryFile() as stderr_file:
+                try:
+                    process = await asyncio.create_subprocess_exec(
+                        *command,
+                        stdin=(
+                            asyncio.subprocess.PIPE
+                            if source is not None
+                            else asyncio.subprocess.DEVNULL
+                        ),
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=stderr_file,
+                    )
+                except FileNotFoundError:
+                    return False, f"コマンドが見つかりません: {command[0]}"
+                except Exception as e:
+                    return False, f"コマンド実行エラー: {str(e)}"
+
+                loop = asyncio.get_running_loop()
+                start_time = loop.time()
+                bytes_in = 0
+
+                def remaining() -> float:
+                    deadline = (
+                        start_time + timeout + bytes_in / STREAM_MIN_THROUGHPUT
+                    )
+                    return max(0.0, deadline - loop.time())
+
+                try:
+                    if source is not None:
+                        try:
+                            for chunk in source:
+                                process.stdin.write(chunk)
+                                bytes_in += len(chunk)
+                                await asyncio.wait_for(
+                                    process.stdin.drain(), remaining()
+                                )
+                        except (BrokenPipeError, ConnectionResetError):
+                            # 入力を読み終える前にプロセスが終了した
+                            pass
+                        finally:
+                            process.stdin.close()
+                    returncode = await asyncio.wait_for(process.wait(), remaining())
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+                    return False, "コマンドがタイムアウトしました"
+                except asyncio.CancelledError:
+                    # 呼び出し側でキャンセルされた場合はプロセスを残さない
+                    process.kill()
+                    raise
+                except Exception as e:
+                    process.kill()
+                    await process.wait()
+                    return False, f"コマンド実行エラー: {str(e)}"
+
+                span.set(exit_code=returncode, bytes_in=bytes_in, bytes_out=0)
+                size = os.fstat(stderr_file.fileno()).st_size
+                stderr_file.seek(max(0, size - STDERR_LIMIT))
+                stderr = stderr_file.read().decode("utf-8", errors="replace")
+                return returncode == 0, stderr
@@ -0,0 +1,245 @@
+"""依存関係チェックユーティリティ
+
+使用方法（起動スクリプトから1つのインタプリタでまとめて確認する）:
+    python3 -m mini_text_core.utils.dependency_checker --gtk4
+    # 不足しているaptパッケージを1行に1つ出力し、不足がある場合は終了コード1
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Optional
+
+
+class DependencyChecker:
+    """xdotoolのインストール確認を行うクラス"""
+
+    # 必要な外部コマンドのリスト
+    REQUIRED_COMMANDS = ["xdotool"]
+
+    @staticmethod
+    def check_dependencies(
+        commands: Optional[list[str]] = None,
+    ) -> tuple[bool, list[str]]:
+        """
+        必要な外部コマンドがインストールされているかチェック
+
+        Args:
+            commands: 確認するコマンド（Noneの場合はREQUIRED_COMMANDS）
+
+        Returns:
+            tuple[bool, list[str]]: (全て利用可能か, 不足しているツールのリスト)
+        """
+        missing_tools = []
+
+        for command in commands or DependencyChecker.REQUIRED_COMMANDS:
+            # shutil.which()でコマンドの存在を確認
+            if shutil.which(command) is None:
+                missing_tools.append(command)
+
+        # 全てのツールが利用可能ならTrue
+        all_available = len(missing_tools) == 0
+
+        return all_available, missing_tools
+
+    @staticmethod
+    def check_gtk4() -> tuple[list[str], list[str]]:
+        """
+        GTK4版に必要なPyGObjectとGTK4のライブラリがあるかチェック
+
+        Returns:
+            tuple[list[str], list[str]]: (不足しているaptパッケージのリスト,
+                キャッシュの検証に使うファイルのリスト)
+        """
+        try:
+            import gi
+        except ImportError:
+            return ["python3-gi"], []
+        files = [gi.__file__]
+
+        try:
+            gi.require_version("Gtk", "4.0")
+            from gi.repository import Gtk  # noqa: F401
+        except (ImportError, ValueError):
+            return ["gir1.2-gtk-4.0"], files
+
+        # GTK4の型情報ファイルが更新された場合もキャッシュを無効にする
+        try:
+            from gi.repository import GIRepository
+
+            typelib = GIRepository.Repository.get_default().get_typelib_path("Gtk")
+            if typelib:
+                files.append(typelib)
+        except Exception:
+            pass
+        return [], files
+
+    @staticmethod
+    def check_all(
+        commands: Optional[list[str]] = None,
+        gtk4: bool = False,
+        cache: Optional["DependencyCache"] = None,
+    ) -> tuple[bool, list[str]]:
+        """
+        外部コマンド（とGTK4）をまとめてチェック
+
+        前回すべて利用可能だった場合、PATH・Pythonインタプリタ・各ツールの
+        更新日時が変わっていなければ確認を省略する
+
+        Args:
+            commands: 確認するコマンド（Noneの場合はREQUIRED_COMMANDS）
+            gtk4: PyGObjectとGTK4も確認するか
+            cache: 確認結果のキャッシュ（Noneの場合はキャッシュしない）
+
+        Returns:
+            tuple[bool, list[str]]: (全て利用可能か, 不足しているツール・パッケージのリスト)
+        """
+        commands = commands or DependencyChecker.REQUIRED_COMMANDS
+        key = ",".join(sorted(commands)) + ("+gtk4" if gtk4 else "")
+        if cache is not None and cache.is_valid(key):
+            return True, []
+
+        all_available, missing = DependencyChecker.check_dependencies(commands)
+        files = [shutil.which(command) for command in commands]
+        if gtk4:
+            missing_packages, gtk4_files = DependencyChecker.check_gtk4()
+            missing.extend(missing_packages)
+            files.extend(gtk4_files)
+
+        if missing:
+            return False, missing
+        if cache is not None:
+            cache.store(key, [f for f in files if f is not None])
+        return True, []
+
+
+class DependencyCache:
+    """
+    依存関係の確認結果のキャッシュ (SRP)
+
+    すべて利用可能だった確認のみを記録する（不足がある場合は毎回確認する）。
+    記録時のPATH・Pythonインタプリタと、確認したファイル（ツールの実体、
+    PyGObject、GTK4の型情報）の更新日時が一致する場合のみ有効とする
+    """
+
+    # キャッシュの形式のバージョン
+    VERSION = 1
+
+    def __init__(self, cache_path: Optional[str] = None):
+        """
+        Args:
+            cache_path: キャッシュファイルのパス
+                （Noneの場合は $HOME/.cache/mini-text/dependencies.json）
+        """
+        self.cache_path = cache_path or str(
+            Path.home() / ".cache" / "mini-text" / "dependencies.json"
+        )
+
+    def is_valid(self, key: str) -> bool:
+        """
+        記録した確認結果が現在も有効か
+
+        Args:
+            key: 確認の種類（確認したコマンドとGTK4の有無）
+
+        Returns:
+            bool: 有効な場合True（確認を省略できる）
+        """
+        entry = self._load().get("entries", {}).get(key)
+        if not isinstance(entry, dict):
+            return False
+        if entry.get("path") != os.environ.get("PATH", ""):
+            return False
+        if entry.get("python") != sys.executable:
+            return False
+
+        files = entry.get("files")
+        if not isinstance(files, dict):
+            return False
+        for file_path, mtime_ns in files.items():
+            try:
+                if os.stat(file_path).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def store(self, key: str, files: list[str]) -> None:
+        """
+        すべて利用可能だった確認結果を記録（書き込めない場合は何もしない）
+
+        Args:
+            key: 確認の種類
+            files: 確認したファイルのリスト（更新日時を記録する）
+        """
+        try:
+            mtimes = {path: os.stat(path).st_mtime_ns for path in files}
+        except OSError:
+            return
+
+        data = self._load()
+        entries = data.get("entries")
+        if data.get("version") != self.VERSION or not isinstance(entries, dict):
+            entries = {}
+        entries[key] = {
+            "path": os.environ.get("PATH", ""),
+            "python": sys.executable,
+            "files": mtimes,
+        }
+
+        path = Path(self.cache_path)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(".tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": self.VERSION, "entries": entries}, f, indent=2)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+
+    def _load(self) -> dict:
+        """キャッシュファイルを読み込む（ない場合・壊れている場合は空）"""
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return {}
+        return data
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    依存関係をまとめて確認し、不足しているものを1行に1つ出力
+
+    Returns:
+        int: 終了コード（不足がある場合は1）
+    """
+    parser = argparse.ArgumentParser(description="mini-textの依存関係の確認")
+    parser.add_argument(
+        "--commands", nargs="+", default=DependencyChecker.REQUIRED_COMMANDS,
+        help="確認する外部コマンド",
+    )
+    parser.add_argument(
+        "--gtk4", action="store_true", help="PyGObjectとGTK4も確認する"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="キャッシュを使用しない"
+    )
+    args = parser.parse_args(argv)
+
+    cache = None if args.no_cache else DependencyCache()
+    all_available, missing = DependencyChecker.check_all(
+        args.commands, gtk4=args.gtk4, cache=cache
+    )
+    for name in missing:
+        print(name)
+    return 0 if all_available else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
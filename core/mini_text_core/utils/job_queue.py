@@ -0,0 +1,227 @@
+"""送受信ジョブのキュー"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Coroutine, Hashable, Optional
+
+from mini_text_core.utils.async_runner import AsyncRunner
+
+
+# 進捗通知の関数: (完了数, 全体数)
+ProgressCallback = Callable[[int, int], None]
+
+
+class Job:
+    """キューに投入されたジョブ"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    def __init__(self, key: Optional[Hashable]):
+        """
+        Args:
+            key: 連続投入をまとめるためのキー（Noneの場合はまとめない）
+        """
+        self.key = key
+        # このジョブにまとめられた（キャンセルされた）待機中のジョブ数
+        self.coalesced = 0
+        self.state = self.PENDING
+        self.submitted_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._future: Optional[Future] = None
+
+    def cancel(self) -> None:
+        """ジョブをキャンセル（実行中の場合は実行中のコマンドも停止）"""
+        if self._future is not None:
+            self._future.cancel()
+
+
+class JobQueue:
+    """
+    送受信ジョブを投入順に1件ずつ実行するキュー (SRP)
+
+    ジョブ（コルーチン）はAsyncRunnerのイベントループで実行されるため、
+    UIスレッドはX11の入出力を待たない。ウィンドウのアクティブ化と
+    キー入力が混ざらないよう、同時に実行するのは1件のみ。
+
+    - 待機中のジョブ数はmax_pendingまで（超えた場合は投入を拒否）
+    - 同じキーのジョブが待機中の場合は古い方をキャンセルしてまとめる
+      （キーには、まとめても結果が変わらない操作の内容を含めること）
+    - 結果・エラー・進捗のコールバックはAsyncRunnerのdispatch経由でUIスレッドに渡す
+    """
+
+    # 待機中のジョブ数の上限
+    MAX_PENDING = 8
+
+    def __init__(self, runner: AsyncRunner, max_pending: int = MAX_PENDING):
+        """
+        Args:
+            runner: ジョブを実行するランナー
+            max_pending: 待機中のジョブ数の上限
+        """
+        self.runner = runner
+        self.max_pending = max_pending
+
+        # 待機中・実行中のジョブ（UIスレッドとイベントループの両方から参照）
+        self._jobs: list[Job] = []
+        self._lock = threading.Lock()
+        # ジョブを1件ずつ実行するためのロック（イベントループ上で作成）
+        self._run_lock: Optional[asyncio.Lock] = None
+
+        # メトリクス
+        self._submitted_count = 0
+        self._completed_count = 0
+        self._failed_count = 0
+        self._cancelled_count = 0
+        self._coalesced_count = 0
+        self._rejected_count = 0
+        self._started_count = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+        self._total_run_time = 0.0
+
+    def submit(
+        self,
+        factory: Callable[[ProgressCallback], Coroutine[Any, Any, Any]],
+        on_done: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        key: Optional[Hashable] = None,
+    ) -> Optional[Job]:
+        """
+        ジョブを投入
+
+        Args:
+            factory: 進捗通知の関数を受け取り、実行するコルーチンを返す関数
+            on_done: 正常終了時にUIスレッドで呼ばれるコールバック(戻り値を受け取る)
+            on_error: 例外発生時にUIスレッドで呼ばれるコールバック
+            on_progress: 進捗通知時にUIスレッドで呼ばれるコールバック
+            key: 同じキーの待機中のジョブをまとめるためのキー
+                （まとめたジョブ数は戻り値のJob.coalescedで取得できる）
+
+        Returns:
+            Optional[Job]: 投入したジョブ（待機中のジョブが上限に達している場合はNone）
+        """
+        job = Job(key)
+
+        with self._lock:
+            pending = [j for j in self._jobs if j.state == Job.PENDING]
+            coalesced = [j for j in pending if key is not None and j.key == key]
+            if len(pending) - len(coalesced) >= self.max_pending:
+                self._rejected_count += 1
+                return None
+
+            self._jobs.append(job)
+            self._submitted_count += 1
+            self._coalesced_count += len(coalesced)
+            job.coalesced = len(coalesced)
+
+        # キャンセル時のコールバックがロックを取得するため、ロックの外でキャンセル
+        for old_job in coalesced:
+            old_job.cancel()
+
+        def progress(done: int, total: int) -> None:
+            if on_progress is not None:
+                self.runner.dispatch(lambda: on_progress(done, total))
+
+        job._future = self.runner.submit(
+            self._run(job, factory, progress), on_done, on_error
+        )
+        job._future.add_done_callback(lambda future: self._on_finished(job, future))
+        return job
+
+    def cancel_all(self) -> int:
+        """
+        待機中・実行中のジョブをすべてキャンセル
+
+        Returns:
+            int: キャンセルしたジョブ数
+        """
+        with self._lock:
+            jobs = list(self._jobs)
+        for job in jobs:
+            job.cancel()
+        return len(jobs)
+
+    def get_queue_depth(self) -> int:
+        """待機中・実行中のジョブ数を取得"""
+        with self._lock:
+            return len(self._jobs)
+
+    def get_metrics(self) -> dict:
+        """
+        キューのメトリクスを取得
+
+        Returns:
+            dict: 待機中のジョブ数、実行中か、件数の集計、待機・実行時間
+        """
+        with self._lock:
+            started = self._started_count
+            finished = self._completed_count + self._failed_count
+            return {
+                "queue_depth": sum(1 for j in self._jobs if j.state == Job.PENDING),
+                "running": any(j.state == Job.RUNNING for j in self._jobs),
+                "submitted_count": self._submitted_count,
+                "completed_count": self._completed_count,
+                "failed_count": self._failed_count,
+                "cancelled_count": self._cancelled_count,
+                "coalesced_count": self._coalesced_count,
+                "rejected_count": self._rejected_count,
+                "average_wait_time": (
+                    self._total_wait_time / started if started else 0.0
+                ),
+                "max_wait_time": self._max_wait_time,
+                "average_run_time": (
+                    self._total_run_time / finished if finished else 0.0
+                ),
+            }
+
+    async def _run(
+        self,
+        job: Job,
+        factory: Callable[[ProgressCallback], Coroutine[Any, Any, Any]],
+        progress: ProgressCallback,
+    ) -> Any:
+        """前のジョブの完了を待ってからジョブを実行（イベントループ上）"""
+        if self._run_lock is None:
+            self._run_lock = asyncio.Lock()
+
+        async with self._run_lock:
+            with self._lock:
+                # 待機中にキャンセルされた場合は実行しない
+                if job.state != Job.PENDING:
+                    raise asyncio.CancelledError()
+                job.state = Job.RUNNING
+                job.started_at = time.monotonic()
+                wait_time = job.started_at - job.submitted_at
+                self._started_count += 1
+                self._total_wait_time += wait_time
+                self._max_wait_time = max(self._max_wait_time, wait_time)
+
+            return await factory(progress)
+
+    def _on_finished(self, job: Job, future: Future) -> None:
+        """ジョブ終了時にキューから取り除き、メトリクスを更新"""
+        with self._lock:
+            if job in self._jobs:
+                self._jobs.remove(job)
+
+            job.finished_at = time.monotonic()
+            if job.started_at is not None and not future.cancelled():
+                self._total_run_time += job.finished_at - job.started_at
+
+            if future.cancelled():
+                job.state = Job.CANCELLED
+                self._cancelled_count += 1
+            elif future.exception() is not None:
+                job.state = Job.FAILED
+                self._failed_count += 1
+            else:
+                job.state = Job.DONE
+                self._completed_count += 1
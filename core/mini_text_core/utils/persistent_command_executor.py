@@ -0,0 +1,235 @@
+"""常駐ワーカーを使用するX11コマンド実行ユーティリティ"""
+
+import os
+import selectors
+import shlex
+import signal
+import subprocess
+import threading
+import time
+import uuid
+from typing import Optional
+
+from mini_text_core.utils.timing import get_tracer
+from mini_text_core.utils.x11_command_executor import X11CommandExecutor
+
+
+class PersistentX11CommandExecutor(X11CommandExecutor):
+    """
+    常駐シェルワーカーにコマンドを流し込んで実行するクラス
+
+    長寿命の/bin/shを1つ保持し、標準入力経由でコマンドを送る。
+    各コマンドの終了後にマーカー行と終了コードを出力させ、
+    (成功したか, stdout, stderr) の契約を維持する。
+
+    注意: 各コマンドはワーカーのシェルから起動されるため、コマンドごとの
+    プロセスの起動とX接続の確立は残る（省略できるのはPython側の
+    subprocessの準備のみ）。同時呼び出しは直列化されるため、
+    create_engineの既定のExecutorには使用しない。
+    xdotoolのスクリプトモード (xdotool -) はコマンドごとの
+    終了コードや完了通知を返さないため、ワーカーにはシェルを使用する
+    """
+
+    # 1コマンドあたりのタイムアウト(秒) - X11CommandExecutorと同じ
+    TIMEOUT = 10.0
+
+    # コマンドが見つからない場合に終了コードの代わりに出力する値
+    # （コマンド自身の終了コード127と区別するため、実行前にcommand -vで確認する）
+    COMMAND_NOT_FOUND = "missing"
+
+    def __init__(self, shell: str = "/bin/sh"):
+        """
+        Args:
+            shell: ワーカーとして使用するシェルのパス
+        """
+        self.shell = shell
+        self._process: Optional[subprocess.Popen] = None
+        self._marker = b""
+        self._lock = threading.Lock()
+
+    def execute(
+        self, command: list[str], input_data: Optional[str] = None
+    ) -> tuple[bool, str, str]:
+        """
+        コマンドを実行
+
+        input_dataがある場合(xclipへの書き込みなど)は、標準入力を
+        ワーカーと共有できないため従来の単発実行にフォールバックする
+
+        Args:
+            command: 実行するコマンドと引数のリスト
+            input_data: 標準入力に渡すデータ(オプション)
+
+        Returns:
+            tuple[bool, str, str]: (成功したか, stdout, stderr)
+        """
+        if input_data:
+            return X11CommandExecutor.execute(command, input_data)
+
+        # ロックの待ち時間も含めて計測
+        with get_tracer().span("exec", command=command, worker=True) as span:
+            with self._lock:
+                try:
+                    return self._execute_in_worker(command, span)
+                except Exception as e:
+                    self._stop_worker()
+                    return False, "", f"コマンド実行エラー: {str(e)}"
+
+    def close(self) -> None:
+        """ワーカーを停止"""
+        with self._lock:
+            self._stop_worker()
+
+    def __enter__(self) -> "PersistentX11CommandExecutor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _execute_in_worker(self, command: list[str], span) -> tuple[bool, str, str]:
+        """
+        ワーカーでコマンドを1つ実行し、マーカーまでの出力を読み取る
+
+        終了コードと出力のバイト数はspanに記録する
+        （コマンドが見つからない場合は実行せずにエラーを返す）
+        """
+        # ワーカーが停止していれば再起動（この時点ではコマンド未送信なので安全）
+        if self._process is None or self._process.poll() is not None:
+            self._start_worker()
+
+        try:
+            self._process.stdin.write(self._build_script(command))
+            self._process.stdin.flush()
+        except (BrokenPipeError, OSError):
+            # 書き込み前後でワーカーが落ちた場合は一度だけ再起動して再送
+            self._start_worker()
+            self._process.stdin.write(self._build_script(command))
+            self._process.stdin.flush()
+
+        result = self._read_result()
+        if result is None:
+            # タイムアウトまたはワーカーの異常終了
+            timed_out = self._process.poll() is None
+            self._stop_worker()
+            if timed_out:
+                return False, "", "コマンドがタイムアウトしました"
+            return False, "", "ワーカープロセスが異常終了しました"
+
+        returncode, stdout_bytes, stderr_bytes = result
+        if returncode is None:
+            return False, "", f"コマンドが見つかりません: {command[0]}"
+
+        span.set(exit_code=returncode, bytes_in=0, bytes_out=len(stdout_bytes))
+        stdout = stdout_bytes.decode("utf-8", errors="replace")
+        stderr = stderr_bytes.decode("utf-8", errors="replace")
+
+        return returncode == 0, stdout, stderr
+
+    def _build_script(self, command: list[str]) -> bytes:
+        """
+        コマンド本体と終了マーカー出力を1行のシェルスクリプトにする
+
+        コマンドが見つからない場合は実行せず、終了コードの代わりに
+        COMMAND_NOT_FOUNDを出力する
+        """
+        marker = self._marker.decode("ascii")
+        line = (
+            f"if command -v {shlex.quote(command[0])} >/dev/null 2>&1; then "
+            f"{shlex.join(command)} </dev/null; "
+            f"printf '\\n{marker} %d\\n' $?; "
+            f"else printf '\\n{marker} {self.COMMAND_NOT_FOUND}\\n'; fi; "
+            f"printf '\\n{marker}\\n' >&2\n"
+        )
+        return line.encode("utf-8")
+
+    def _read_result(self) -> Optional[tuple[Optional[int], bytes, bytes]]:
+        """
+        stdout/stderrの両方からマーカーが現れるまで読み取る
+
+        Returns:
+            Optional[tuple[Optional[int], bytes, bytes]]: (終了コード, stdout, stderr)
+                コマンドが見つからない場合の終了コードはNone、
+                タイムアウトまたはEOFの場合はNone
+        """
+        stdout_fd = self._process.stdout.fileno()
+        stderr_fd = self._process.stderr.fileno()
+        buffers = {stdout_fd: bytearray(), stderr_fd: bytearray()}
+        stdout_tail = b"\n" + self._marker + b" "
+        stderr_tail = b"\n" + self._marker + b"\n"
+        returncode: Optional[int] = None
+        stdout_done = stderr_done = False
+
+        deadline = time.monotonic() + self.TIMEOUT
+        with selectors.DefaultSelector() as selector:
+            selector.register(stdout_fd, selectors.EVENT_READ)
+            selector.register(stderr_fd, selectors.EVENT_READ)
+
+            while not (stdout_done and stderr_done):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+
+                for key, _ in selector.select(remaining):
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        return None
+                    buffers[key.fd].extend(chunk)
+
+                if not stdout_done:
+                    buf = buffers[stdout_fd]
+                    pos = buf.find(stdout_tail)
+                    end = buf.find(b"\n", pos + len(stdout_tail))
+                    if pos >= 0 and end >= 0:
+                        status = bytes(buf[pos + len(stdout_tail):end])
+                        if status != self.COMMAND_NOT_FOUND.encode("ascii"):
+                            returncode = int(status)
+                        del buf[pos:]
+                        stdout_done = True
+                        selector.unregister(stdout_fd)
+
+                if not stderr_done:
+                    buf = buffers[stderr_fd]
+                    pos = buf.find(stderr_tail)
+                    if pos >= 0:
+                        del buf[pos:]
+                        stderr_done = True
+                        selector.unregister(stderr_fd)
+
+        return returncode, bytes(buffers[stdout_fd]), bytes(buffers[stderr_fd])
+
+    def _start_worker(self) -> None:
+        """ワーカーを(再)起動"""
+        self._stop_worker()
+        # 実行ごとにユニークなマーカーを生成（出力との衝突を避ける）
+        self._marker = f"__MINI_TEXT_{uuid.uuid4().hex}__".encode("ascii")
+        self._process = subprocess.Popen(
+            [self.shell],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,  # タイムアウト時に子プロセスごと停止するため
+        )
+
+    def _stop_worker(self) -> None:
+        """ワーカーをプロセスグループごと停止"""
+        process = self._process
+        self._process = None
+        if process is None:
+            return
+
+        if process.poll() is None:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass
+
+        for stream in (process.stdin, process.stdout, process.stderr):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+        try:
+            process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            pass
@@ -0,0 +1,320 @@
+"""送受信処理の所要時間の計測"""
+
+import bisect
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Optional
+
+
+# 保持するスパンの上限（古いものから破棄）
+MAX_SPANS = 10000
+
+# ヒストグラムのバケットの上限値(ミリ秒)
+BUCKET_BOUNDS_MS = (
+    1, 2, 5, 10, 20, 50, 100, 200, 300, 500, 1000, 2000, 5000, 10000
+)
+
+
+class Span:
+    """計測中の区間（withブロックの開始から終了まで）"""
+
+    __slots__ = ("tracer", "name", "attrs", "start")
+
+    def __init__(self, tracer: "Tracer", name: str, attrs: dict):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.start = 0.0
+
+    def set(self, **attrs: Any) -> None:
+        """区間の属性（終了コード、バイト数など）を追加"""
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        end = time.perf_counter()
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self.tracer._record(self, end)
+
+
+class _NullSpan:
+    """計測無効時の区間（何も記録しない）"""
+
+    __slots__ = ()
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Histogram:
+    """区間名ごとの所要時間の分布"""
+
+    def __init__(self):
+        # BUCKET_BOUNDS_MSの各上限以下の件数（最後は上限超過）
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def add(self, duration_ms: float) -> None:
+        """所要時間を追加"""
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total += duration_ms
+        self.min = min(self.min, duration_ms)
+        self.max = max(self.max, duration_ms)
+
+    def percentile(self, ratio: float) -> float:
+        """
+        パーセンタイルを推定（該当バケットの上限値、最大値を超えない）
+
+        Args:
+            ratio: 0〜1の割合（0.5で中央値）
+        """
+        if self.count == 0:
+            return 0.0
+        target = ratio * self.count
+        cumulative = 0
+        for bound, count in zip(BUCKET_BOUNDS_MS, self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return min(float(bound), self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        """件数・合計・平均・最小・最大・パーセンタイル(ミリ秒)を取得"""
+        return {
+            "count": self.count,
+            "total_ms": self.total,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "min_ms": self.min if self.count else 0.0,
+            "max_ms": self.max,
+            "p50_ms": self.percentile(0.5),
+            "p90_ms": self.percentile(0.9),
+            "p99_ms": self.percentile(0.99),
+            "buckets": {
+                **{f"<={bound}": n for bound, n in zip(BUCKET_BOUNDS_MS, self.counts)},
+                f">{BUCKET_BOUNDS_MS[-1]}": self.counts[-1],
+            },
+        }
+
+
+class Tracer:
+    """
+    区間の所要時間を記録し、ヒストグラムに集計するクラス (SRP)
+
+    無効時のspan()は何も記録しない共有オブジェクトを返すため、
+    計測箇所のオーバーヘッドは属性の辞書を作る程度に収まる。
+    記録した区間はJSONまたはChrome trace形式
+    （chrome://tracing、Perfettoで表示可能）で保存できる
+    """
+
+    def __init__(self, enabled: bool = False, max_spans: int = MAX_SPANS):
+        """
+        Args:
+            enabled: 計測を有効にするか
+            max_spans: 保持するスパンの上限
+        """
+        self.enabled = enabled
+        self._spans: deque = deque(maxlen=max_spans)
+        self._histograms: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+        # Chrome traceの時刻の基準
+        self._epoch = time.perf_counter()
+
+    def set_enabled(self, enabled: bool) -> None:
+        """計測の有効・無効を切り替え"""
+        self.enabled = enabled
+
+    def span(self, name: str, **attrs: Any):
+        """
+        区間を計測するコンテキストマネージャーを取得
+
+        使用例:
+            with tracer.span("exec", command=command) as span:
+                ...
+                span.set(exit_code=0)
+
+        Args:
+            name: 区間名（ヒストグラムの集計単位）
+            **attrs: 区間の属性
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, attrs)
+
+    def record(self, name: str, start: float, **attrs: Any) -> None:
+        """
+        開始時刻を指定して、現在までの区間を記録
+
+        別のスレッドで始まった処理（ホットキーの押下から完了までなど）のように
+        withブロックで囲めない区間に使用する
+
+        Args:
+            name: 区間名
+            start: 開始時刻（time.perf_counter()の値）
+            **attrs: 区間の属性
+        """
+        if not self.enabled:
+            return
+        span = Span(self, name, attrs)
+        span.start = start
+        self._record(span, time.perf_counter())
+
+    def get_spans(self) -> list[dict]:
+        """
+        記録した区間を取得
+
+        Returns:
+            list[dict]: name, start_ms（計測開始からの時刻）, duration_ms,
+                thread_id, attrs を持つ辞書のリスト
+        """
+        with self._lock:
+            return list(self._spans)
+
+    def get_histograms(self) -> dict[str, dict]:
+        """区間名ごとのヒストグラムの集計を取得"""
+        with self._lock:
+            return {
+                name: histogram.summary()
+                for name, histogram in sorted(self._histograms.items())
+            }
+
+    def clear(self) -> None:
+        """記録した区間と集計を破棄"""
+        with self._lock:
+            self._spans.clear()
+            self._histograms.clear()
+            self._epoch = time.perf_counter()
+
+    def to_chrome_trace(self) -> dict:
+        """記録した区間をChrome trace形式（Trace Event Format）に変換"""
+        pid = os.getpid()
+        events = [
+            {
+                "name": span["name"],
+                "cat": span["name"].split(".")[0],
+                "ph": "X",
+                "ts": span["start_ms"] * 1000,
+                "dur": span["duration_ms"] * 1000,
+                "pid": pid,
+                "tid": span["thread_id"],
+                "args": span["attrs"],
+            }
+            for span in self.get_spans()
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump_json(self, path: str) -> tuple[bool, str]:
+        """
+        記録した区間とヒストグラムをJSONファイルに保存
+
+        Args:
+            path: 保存先のパス
+
+        Returns:
+            tuple[bool, str]: (成功したか, エラーメッセージ)
+        """
+        data = {"histograms": self.get_histograms(), "spans": self.get_spans()}
+        return _write_json(path, data)
+
+    def dump_chrome_trace(self, path: str) -> tuple[bool, str]:
+        """
+        記録した区間をChrome trace形式のファイルに保存
+
+        Args:
+            path: 保存先のパス
+
+        Returns:
+            tuple[bool, str]: (成功したか, エラーメッセージ)
+        """
+        return _write_json(path, self.to_chrome_trace())
+
+    def format_summary(self) -> str:
+        """ヒストグラムの集計を表形式の文字列にする（デバッグパネル表示用）"""
+        histograms = self.get_histograms()
+        if not histograms:
+            return "計測結果はありません"
+
+        width = max(len(name) for name in histograms)
+        lines = [
+            f"{'name':<{width}}  {'count':>6}  {'mean':>8}  {'p50':>8}"
+            f"  {'p90':>8}  {'p99':>8}  {'max':>8}"
+        ]
+        for name, h in histograms.items():
+            lines.append(
+                f"{name:<{width}}  {h['count']:>6}  {h['mean_ms']:>6.1f}ms"
+                f"  {h['p50_ms']:>6.1f}ms  {h['p90_ms']:>6.1f}ms"
+                f"  {h['p99_ms']:>6.1f}ms  {h['max_ms']:>6.1f}ms"
+            )
+        return "\n".join(lines)
+
+    def _record(self, span: Span, end: float) -> None:
+        """終了した区間を記録"""
+        duration_ms = (end - span.start) * 1000
+        with self._lock:
+            self._spans.append(
+                {
+                    "name": span.name,
+                    "start_ms": (span.start - self._epoch) * 1000,
+                    "duration_ms": duration_ms,
+                    "thread_id": threading.get_ident(),
+                    "attrs": span.attrs,
+                }
+            )
+            histogram = self._histograms.get(span.name)
+            if histogram is None:
+                histogram = self._histograms[span.name] = Histogram()
+            histogram.add(duration_ms)
+
+
+def _write_json(path: str, data: dict) -> tuple[bool, str]:
+    """JSONファイルに書き込む（ディレクトリがなければ作成）"""
+    try:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, default=str)
+        return True, ""
+    except (IOError, OSError) as e:
+        return False, f"計測結果の保存に失敗しました: {str(e)}"
+
+
+def get_default_dump_path(kind: str) -> str:
+    """
+    計測結果の保存先のパスを取得
+
+    Args:
+        kind: "timing"（JSON）または "trace"（Chrome trace）
+
+    Returns:
+        str: $HOME/.cache/mini-text/timing/<kind>-<日時>.json
+    """
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return str(Path.home() / ".cache" / "mini-text" / "timing" / f"{kind}-{stamp}.json")
+
+
+# アプリケーション全体で共有するトレーサー（既定では無効）
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """アプリケーション全体で共有するトレーサーを取得"""
+    return _tracer
@@ -0,0 +1,263 @@
+"""X11コマンド実行ユーティリティ"""
+
+import codecs
+import os
+import selectors
+import subprocess
+import time
+from typing import Callable, Iterable, Iterator, Optional
+
+from mini_text_core.utils.timing import get_tracer
+
+
+# ストリーミング時の読み書きの単位(バイト)
+CHUNK_SIZE = 64 * 1024
+
+# ストリーミング時に保持するstderrの上限(バイト)
+STDERR_LIMIT = 64 * 1024
+
+# ストリーミング時のタイムアウトの基準値(秒)
+STREAM_BASE_TIMEOUT = 10.0
+
+# 転送量に比例してタイムアウトを延長する際の想定最低転送速度(バイト/秒)
+STREAM_MIN_THROUGHPUT = 1024 * 1024
+
+# ストリーミング時のプロセス終了確認の間隔(秒)
+STREAM_POLL_INTERVAL = 0.1
+
+
+class X11CommandExecutor:
+    """xdotool/xclipコマンドの実行を担当するクラス"""
+
+    @staticmethod
+    def execute(
+        command: list[str], input_data: Optional[str] = None
+    ) -> tuple[bool, str, str]:
+        """
+        コマンドを実行
+
+        Args:
+            command: 実行するコマンドと引数のリスト
+            input_data: 標準入力に渡すデータ(オプション)
+
+        Returns:
+            tuple[bool, str, str]: (成功したか, stdout, stderr)
+        """
+        with get_tracer().span("exec", command=command) as span:
+            try:
+                # input_dataがある場合はbytesに変換
+                input_bytes = input_data.encode("utf-8") if input_data else None
+
+                # コマンドを実行
+                result = subprocess.run(
+                    command,
+                    input=input_bytes,
+                    capture_output=True,
+                    timeout=10,  # タイムアウトを10秒に設定
+                )
+                span.set(
+                    exit_code=result.returncode,
+                    bytes_in=len(input_bytes) if input_bytes else 0,
+                    bytes_out=len(result.stdout),
+                )
+
+                # 出力をデコード
+                stdout = result.stdout.decode("utf-8", errors="replace")
+                stderr = result.stderr.decode("utf-8", errors="replace")
+
+                # 成功判定
+                success = result.returncode == 0
+
+                return success, stdout, stderr
+
+            except subprocess.TimeoutExpired:
+                span.set(timeout=True)
+                return False, "", "コマンドがタイムアウトしました"
+            except FileNotFoundError:
+                return False, "", f"コマンドが見つかりません: {command[0]}"
+            except Exception as e:
+                return False, "", f"コマンド実行エラー: {str(e)}"
+
+    @staticmethod
+    def execute_stream(
+        command: list[str],
+        source: Optional[Iterable[bytes]] = None,
+        sink: Optional[Callable[[bytes], None]] = None,
+        timeout: float = STREAM_BASE_TIMEOUT,
+    ) -> tuple[bool, str]:
+        """
+        コマンドを実行し、標準入出力をチャンク単位でストリーミング
+
+        この関数自体は入力・出力の全体をメモリに保持しない
+        （メモリ使用量がチャンクサイズ程度に収まるかはsourceとsinkによる）。
+        制限時間は転送したバイト数に比例して延長される
+        （STREAM_MIN_THROUGHPUTバイトごとに1秒）
+
+        Args:
+            command: 実行するコマンドと引数のリスト
+            source: 標準入力に渡すデータのチャンク列(オプション)
+            sink: 標準出力のチャンクを受け取る関数(オプション、Noneの場合は破棄)
+            timeout: データ転送がない場合の制限時間(秒)
+
+        Returns:
+            tuple[bool, str]: (成功したか, stderr)
+        """
+        with get_tracer().span("exec_stream", command=command) as span:
+            return X11CommandExecutor._execute_stream(
+                command, source, sink, timeout, span
+            )
+
+    @staticmethod
+    def _execute_stream(
+        command: list[str],
+        source: Optional[Iterable[bytes]],
+        sink: Optional[Callable[[bytes], None]],
+        timeout: float,
+        span,
+    ) -> tuple[bool, str]:
+        """execute_streamの処理本体（転送量と終了コードをspanに記録）"""
+        try:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE if source is not None else subprocess.DEVNULL,
+                stdout=subprocess.PIPE if sink is not None else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            return False, f"コマンドが見つかりません: {command[0]}"
+        except Exception as e:
+            return False, f"コマンド実行エラー: {str(e)}"
+
+        selector = selectors.DefaultSelector()
+        chunks = iter(source) if source is not None else None
+        pending = b""
+        stderr = bytearray()
+        bytes_in = bytes_out = 0
+        start_time = time.monotonic()
+
+        try:
+            if process.stdin is not None:
+                os.set_blocking(process.stdin.fileno(), False)
+                selector.register(process.stdin, selectors.EVENT_WRITE)
+            if process.stdout is not None:
+                selector.register(process.stdout, selectors.EVENT_READ)
+            selector.register(process.stderr, selectors.EVENT_READ)
+
+            while selector.get_map():
+                transferred = bytes_in + bytes_out
+                deadline = start_time + timeout + transferred / STREAM_MIN_THROUGHPUT
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    process.kill()
+                    process.wait()
+                    return False, "コマンドがタイムアウトしました"
+
+                # stdin/stdoutが完了してプロセスが終了している場合は待たない
+                # （xclipのようにフォークした子がstderrを保持し続けるコマンドのため）
+                if len(selector.get_map()) == 1 and process.poll() is not None:
+                    # 終了までに書き込まれたstderrは読み取ってから抜ける
+                    os.set_blocking(process.stderr.fileno(), False)
+                    try:
+                        while data := os.read(process.stderr.fileno(), CHUNK_SIZE):
+                            stderr += data
+                            del stderr[:-STDERR_LIMIT]
+                    except BlockingIOError:
+                        pass
+                    break
+
+                events = selector.select(min(remaining, STREAM_POLL_INTERVAL))
+                for key, _ in events:
+                    stream = key.fileobj
+                    if stream is process.stdin:
+                        if not pending:
+                            pending = next(chunks, b"")
+                            if not pending:
+                                selector.unregister(stream)
+                                stream.close()
+                                continue
+                        try:
+                            written = os.write(stream.fileno(), pending)
+                        except BrokenPipeError:
+                            # 入力を読み終える前にプロセスが終了した
+                            selector.unregister(stream)
+                            stream.close()
+                            continue
+                        pending = pending[written:]
+                        bytes_in += written
+                        continue
+
+                    data = os.read(stream.fileno(), CHUNK_SIZE)
+                    if not data:
+                        selector.unregister(stream)
+                        continue
+                    if stream is process.stdout:
+                        sink(data)
+                        bytes_out += len(data)
+                    else:
+                        stderr += data
+                        del stderr[:-STDERR_LIMIT]
+
+            span.set(bytes_in=bytes_in, bytes_out=bytes_out)
+            transferred = bytes_in + bytes_out
+            deadline = start_time + timeout + transferred / STREAM_MIN_THROUGHPUT
+            try:
+                returncode = process.wait(
+                    timeout=max(0.0, deadline - time.monotonic())
+                )
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                return False, "コマンドがタイムアウトしました"
+
+            span.set(exit_code=returncode)
+            return returncode == 0, stderr.decode("utf-8", errors="replace")
+
+        except Exception as e:
+            process.kill()
+            process.wait()
+            return False, f"コマンド実行エラー: {str(e)}"
+        finally:
+            selector.close()
+            for stream in (process.stdin, process.stdout, process.stderr):
+                if stream is not None and not stream.closed:
+                    stream.close()
+
+
+def iter_encoded_chunks(text: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    テキストをチャンクごとにUTF-8へエンコード（全体のbytesを作らない）
+
+    Args:
+        text: エンコードするテキスト
+        chunk_size: 1チャンクの文字数
+
+    Yields:
+        bytes: エンコード済みのチャンク
+    """
+    for start in range(0, len(text), chunk_size):
+        yield text[start:start + chunk_size].encode("utf-8")
+
+
+class TextSink:
+    """
+    チャンク単位で受け取ったUTF-8のbytesを順次デコードするsink
+
+    マルチバイト文字がチャンクの境界で分割されても正しくデコードする。
+    デコードしたテキストは全体を保持するため、メモリ使用量は
+    テキスト全体の大きさ程度になる
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._parts: list[str] = []
+
+    def __call__(self, data: bytes) -> None:
+        """チャンクを受け取る（execute_streamのsinkとして使用）"""
+        self._parts.append(self._decoder.decode(data))
+
+    def getvalue(self) -> str:
+        """受け取ったテキスト全体を取得"""
+        self._parts.append(self._decoder.decode(b"", final=True))
+        text = "".join(self._parts)
+        self._parts = [text]
+        return text
@@ -0,0 +1,272 @@
+"""xdotoolのコマンド連結（チェイン）による操作の実行
+
+xdotoolは1回の起動で複数のコマンドを順に実行できる
+（例: xdotool windowactivate --sync <id> sleep 0.3 key ctrl+v）。
+送受信の「アクティブ化→待機→ペースト」「全選択→待機→コピー」を操作の列として
+受け取り、Python側で待つ必要がある箇所（準備完了判定）以外は1回の起動にまとめる。
+
+連結したコマンドは途中で失敗するとそこで終了し、どのコマンドで失敗したかは
+終了コードからは分からない。アクティブ化を含む連結が失敗した場合は
+アクティブウィンドウを確認し、アクティブ化とその後のキー入力のどちらで
+失敗したかを判定する（キー入力同士は区別できないため先頭のものとする）
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Optional
+
+from mini_text_core.utils.timing import get_tracer
+
+
+# 操作: (種類, 引数, 失敗時のエラーメッセージ)
+# 種類は "activate"（引数: ウィンドウID）, "key"（引数: キー）,
+# "click"（引数: (ウィンドウID, x, y)）, "sleep"（引数: 秒数）,
+# "wait"（引数: Python側で待機する関数）
+Operation = tuple[str, Any, str]
+
+# 実行単位: ("chain", [操作, ...]) - 1回のxdotoolの起動
+#           ("sleep", 秒数) - 連結するコマンドがない場合の待機
+#           ("wait", 関数) - Python側での待機
+Step = tuple[str, Any]
+
+# アクティブ化の失敗時のエラーメッセージ（WindowService.activate_windowと同じ）
+ACTIVATE_ERROR = "ウィンドウのアクティブ化に失敗しました"
+
+# クリックによるフォーカスの失敗時のエラーメッセージ
+CLICK_ERROR = "入力欄のクリックに失敗しました"
+
+
+def activate(window_id: str) -> Operation:
+    """ウィンドウをアクティブ化する操作（アクティブになるまで待つ）"""
+    return ("activate", window_id, ACTIVATE_ERROR)
+
+
+def key(keys: str, error_message: str) -> Operation:
+    """
+    キー入力の操作
+
+    Args:
+        keys: 入力するキー（例: "ctrl+v"）
+        error_message: 失敗時のエラーメッセージ
+    """
+    return ("key", keys, error_message)
+
+
+def click(window_id: str, x: int, y: int) -> Operation:
+    """
+    ウィンドウ内の位置をクリックする操作（クリック後にポインタの位置を戻す）
+
+    Args:
+        window_id: ウィンドウのID
+        x: ウィンドウの左上からの横方向の位置
+        y: ウィンドウの左上からの縦方向の位置
+    """
+    return ("click", (window_id, x, y), CLICK_ERROR)
+
+
+def sleep(seconds: float) -> Operation:
+    """待機する操作（xdotoolのsleepコマンドとして連結する）"""
+    return ("sleep", seconds, "")
+
+
+def wait(func: Callable[[], Any]) -> Operation:
+    """Python側で待機する操作（前後の連結を分割する）"""
+    return ("wait", func, "")
+
+
+def plan(operations: list[Operation], fuse: bool = True) -> list[Step]:
+    """
+    操作の列を最小限のxdotoolの起動にまとめる
+
+    - Python側の待機（wait）で分割し、その間の操作を1回の起動に連結する
+    - 0秒以下の待機は省略する
+    - 待機（sleep）だけの区間はxdotoolを起動せずに待機する
+
+    Args:
+        operations: 操作の列
+        fuse: Falseの場合は連結せず、操作ごとに起動する（待機はPython側で行う）
+
+    Returns:
+        list[Step]: 実行単位の列
+    """
+    steps: list[Step] = []
+    chain: list[Operation] = []
+
+    def flush():
+        if any(kind != "sleep" for kind, _, _ in chain):
+            steps.append(("chain", list(chain)))
+        else:
+            seconds = sum(argument for _, argument, _ in chain)
+            if seconds > 0:
+                steps.append(("sleep", seconds))
+        chain.clear()
+
+    for operation in operations:
+        kind, argument, _ = operation
+        if kind == "wait":
+            flush()
+            steps.append(("wait", argument))
+        elif kind == "sleep" and argument <= 0:
+            continue
+        else:
+            chain.append(operation)
+            if not fuse:
+                flush()
+    flush()
+    return steps
+
+
+def build_command(chain: list[Operation]) -> list[str]:
+    """
+    連結した操作のxdotoolコマンドを作成
+
+    Args:
+        chain: 連結する操作の列（waitを含まない）
+
+    Returns:
+        list[str]: 実行するコマンドと引数のリスト
+    """
+    command = ["xdotool"]
+    for kind, argument, _ in chain:
+        if kind == "activate":
+            command += ["windowactivate", "--sync", argument]
+        elif kind == "key":
+            command += ["key", argument]
+        elif kind == "click":
+            window_id, x, y = argument
+            command += [
+                "mousemove", "--window", window_id, str(x), str(y),
+                "click", "1", "mousemove", "restore",
+            ]
+        elif kind == "sleep":
+            command += ["sleep", f"{argument:g}"]
+        else:
+            raise ValueError(f"連結できない操作です: {kind}")
+    return command
+
+
+class XdotoolChainRunner:
+    """連結したxdotoolコマンドで操作の列を実行するクラス (SRP)"""
+
+    def __init__(self, executor, fuse: bool = True):
+        """
+        Args:
+            executor: コマンド実行ユーティリティ（X11CommandExecutor互換）
+            fuse: Falseの場合は連結せず、操作ごとにxdotoolを起動する
+        """
+        self.executor = executor
+        self.fuse = fuse
+
+    def run(self, operations: list[Operation]) -> tuple[bool, str]:
+        """
+        操作の列を実行（失敗した時点で中断）
+
+        Args:
+            operations: 操作の列
+
+        Returns:
+            tuple[bool, str]: (成功したか, 失敗した操作のエラーメッセージ)
+        """
+        for kind, argument in plan(operations, self.fuse):
+            if kind == "wait":
+                argument()
+            elif kind == "sleep":
+                time.sleep(argument)
+            else:
+                with get_tracer().span("xdotool_chain", operations=len(argument)):
+                    success, stdout, stderr = self.executor.execute(
+                        build_command(argument)
+                    )
+                if not success:
+                    error_message = self._find_failed(argument)
+                    return False, f"{error_message}: {stderr}"
+        return True, ""
+
+    def _find_failed(self, chain: list[Operation]) -> str:
+        """連結したコマンドのうち失敗した操作のエラーメッセージ"""
+        window_id, remaining = _split_activation(chain)
+        if window_id is None or not remaining:
+            return _first_error(chain)
+        success, stdout, _ = self.executor.execute(["xdotool", "getactivewindow"])
+        return _classify_failure(window_id, remaining, success, stdout)
+
+
+class AsyncXdotoolChainRunner:
+    """連結したxdotoolコマンドで操作の列を実行するクラス（asyncio版）"""
+
+    def __init__(self, executor, fuse: bool = True):
+        """
+        Args:
+            executor: 非同期コマンド実行ユーティリティ（AsyncX11CommandExecutor互換）
+            fuse: Falseの場合は連結せず、操作ごとにxdotoolを起動する
+        """
+        self.executor = executor
+        self.fuse = fuse
+
+    async def run(self, operations: list[Operation]) -> tuple[bool, str]:
+        """
+        操作の列を実行（失敗した時点で中断）
+
+        Python側の待機（wait）はブロッキング呼び出しのため別スレッドで実行する
+
+        Args:
+            operations: 操作の列
+
+        Returns:
+            tuple[bool, str]: (成功したか, 失敗した操作のエラーメッセージ)
+        """
+        for kind, argument in plan(operations, self.fuse):
+            if kind == "wait":
+                await asyncio.to_thread(argument)
+            elif kind == "sleep":
+                await asyncio.sleep(argument)
+            else:
+                with get_tracer().span("xdotool_chain", operations=len(argument)):
+                    success, stdout, stderr = await self.executor.execute(
+                        build_command(argument)
+                    )
+                if not success:
+                    error_message = await self._find_failed(argument)
+                    return False, f"{error_message}: {stderr}"
+        return True, ""
+
+    async def _find_failed(self, chain: list[Operation]) -> str:
+        """連結したコマンドのうち失敗した操作のエラーメッセージ"""
+        window_id, remaining = _split_activation(chain)
+        if window_id is None or not remaining:
+            return _first_error(chain)
+        success, stdout, _ = await self.executor.execute(
+            ["xdotool", "getactivewindow"]
+        )
+        return _classify_failure(window_id, remaining, success, stdout)
+
+
+def _split_activation(
+    chain: list[Operation],
+) -> tuple[Optional[str], list[Operation]]:
+    """先頭の（待機を除く）操作がアクティブ化の場合、そのウィンドウIDと残りの操作"""
+    operations = [operation for operation in chain if operation[0] != "sleep"]
+    if not operations or operations[0][0] != "activate":
+        return None, operations
+    return operations[0][1], operations[1:]
+
+
+def _first_error(chain: list[Operation]) -> str:
+    """先頭の（待機を除く）操作のエラーメッセージ"""
+    for kind, _, error_message in chain:
+        if kind != "sleep":
+            return error_message
+    return ""
+
+
+def _classify_failure(
+    window_id: str, remaining: list[Operation], success: bool, stdout: str
+) -> str:
+    """アクティブウィンドウの確認結果から失敗した操作のエラーメッセージを判定"""
+    try:
+        activated = success and int(stdout.strip()) == int(window_id, 0)
+    except ValueError:
+        activated = False
+    if not activated:
+        return ACTIVATE_ERROR
+    return _first_error(remaining)
@@ -0,0 +1,109 @@
+"""AsyncClipboardServiceのpytestテスト"""
+
+import asyncio
+import os
+import time
+
+import pytest
+from unittest.mock import AsyncMock
+from mini_text_core.services.async_clipboard_service import AsyncClipboardService
+
+
+@pytest.fixture
+def mock_executor():
+    """モック非同期Executorのフィクスチャ"""
+    return AsyncMock()
+
+
+@pytest.fixture
+def service(mock_executor):
+    """AsyncClipboardServiceのフィクスチャ"""
+    return AsyncClipboardService(mock_executor)
+
+
+def test_copy_to_clipboard_success(service, mock_executor):
+    """クリップボードへのコピーが成功することを確認"""
+    received = []
+
+    async def execute_stream(command, source):
+        received.extend(source)
+        return True, ""
+
+    mock_executor.execute_stream.side_effect = execute_stream
+
+    success, error_msg = asyncio.run(service.copy_to_clipboard("テストテキスト"))
+
+    assert success
+    assert error_msg == ""
+    assert mock_executor.execute_stream.call_args.args[0] == [
+        "xclip", "-selection", "clipboard"
+    ]
+    assert b"".join(received).decode("utf-8") == "テストテキスト"
+    mock_executor.execute.assert_not_awaited()
+
+
+def test_copy_to_clipboard_failure(service, mock_executor):
+    """クリップボードへのコピーが失敗した場合の処理を確認"""
+    mock_executor.execute_stream.return_value = (False, "xclipエラー")
+
+    success, error_msg = asyncio.run(service.copy_to_clipboard("テストテキスト"))
+
+    assert not success
+    assert "コピーに失敗" in error_msg
+
+
+def test_copy_does_not_wait_for_forked_xclip(tmp_path, monkeypatch):
+    """フォークした子がstdout/stderrを保持するxclipでも終了を待たないことを確認"""
+    # 実際のxclipと同様に、入力を読み終えたら選択を保持する子を残して終了する
+    fake_xclip = tmp_path / "xclip"
+    fake_xclip.write_text(
+        f"#!/bin/sh\ncat > {tmp_path / 'selection'}\nsleep 5 &\nexit 0\n"
+    )
+    fake_xclip.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+    service = AsyncClipboardService()
+
+    start = time.monotonic()
+    success, error_msg = asyncio.run(service.copy_to_clipboard("テストテキスト"))
+    elapsed = time.monotonic() - start
+
+    assert success, error_msg
+    assert elapsed < 2.0
+    assert (tmp_path / "selection").read_text(encoding="utf-8") == "テストテキスト"
+
+
+def test_get_from_clipboard_success(service, mock_executor):
+    """クリップボードからの取得が成功することを確認"""
+    mock_executor.execute.return_value = (True, "取得したテキスト", "")
+
+    success, text, error_msg = asyncio.run(service.get_from_clipboard())
+
+    assert success
+    assert text == "取得したテキスト"
+    mock_executor.execute.assert_awaited_once_with(
+        ["xclip", "-selection", "clipboard", "-o"]
+    )
+
+
+def test_get_from_clipboard_failure(service, mock_executor):
+    """クリップボードからの取得が失敗した場合の処理を確認"""
+    mock_executor.execute.return_value = (False, "", "xclipエラー")
+
+    success, text, error_msg = asyncio.run(service.get_from_clipboard())
+
+    assert not success
+    assert text == ""
+    assert "取得に失敗" in error_msg
+
+
+def test_get_from_primary_success(service, mock_executor):
+    """PRIMARYから選択中のテキストを取得できることを確認"""
+    mock_executor.execute.return_value = (True, "選択したテキスト", "")
+
+    success, text, error_msg = asyncio.run(service.get_from_primary())
+
+    assert success
+    assert text == "選択したテキスト"
+    mock_executor.execute.assert_awaited_once_with(
+        ["xclip", "-selection", "primary", "-o"]
+    )
@@ -0,0 +1,126 @@
+"""AsyncRunnerのpytestテスト"""
+
+import asyncio
+import threading
+
+import pytest
+from mini_text_core.utils.async_runner import AsyncRunner
+
+
+class RecordingDispatcher:
+    """UIスレッドへのディスパッチを記録して同期的に実行するディスパッチャ"""
+
+    def __init__(self):
+        self.calls = 0
+        self.event = threading.Event()
+
+    def __call__(self, func):
+        self.calls += 1
+        func()
+        self.event.set()
+
+
+@pytest.fixture
+def dispatcher():
+    """ディスパッチャのフィクスチャ"""
+    return RecordingDispatcher()
+
+
+@pytest.fixture
+def runner(dispatcher):
+    """専用スレッドで動くAsyncRunnerのフィクスチャ"""
+    runner = AsyncRunner(dispatcher)
+    yield runner
+    runner.close()
+
+
+def test_submit_returns_result_through_dispatch(runner, dispatcher):
+    """結果がdispatch経由でコールバックに渡されることを確認"""
+    results = []
+
+    async def work():
+        await asyncio.sleep(0.01)
+        return 42
+
+    runner.submit(work(), on_done=results.append)
+
+    assert dispatcher.event.wait(1)
+    assert results == [42]
+    assert dispatcher.calls == 1
+
+
+def test_submit_does_not_block_caller(runner, dispatcher):
+    """submitが呼び出し元をブロックしないことを確認"""
+    release = threading.Event()
+
+    async def work():
+        while not release.is_set():
+            await asyncio.sleep(0.01)
+        return "done"
+
+    future = runner.submit(work())
+
+    assert not future.done()
+    release.set()
+    assert future.result(timeout=1) == "done"
+
+
+def test_submit_error(runner, dispatcher):
+    """例外がon_errorに渡されることを確認"""
+    errors = []
+
+    async def work():
+        raise RuntimeError("失敗")
+
+    runner.submit(work(), on_done=lambda r: None, on_error=errors.append)
+
+    assert dispatcher.event.wait(1)
+    assert str(errors[0]) == "失敗"
+
+
+def test_cancel(runner, dispatcher):
+    """キャンセルされた場合はコールバックが呼ばれないことを確認"""
+
+    async def work():
+        await asyncio.sleep(10)
+
+    future = runner.submit(work(), on_done=lambda r: None)
+    future.cancel()
+
+    assert not dispatcher.event.wait(0.1)
+    assert dispatcher.calls == 0
+
+
+def test_owns_loop(runner):
+    """ループを渡さない場合は専用スレッドで動かすことを確認"""
+    assert runner.owns_loop()
+    assert runner._thread.is_alive()
+
+
+def test_close_stops_loop(dispatcher):
+    """close()で専用スレッドのループが停止することを確認"""
+    runner = AsyncRunner(dispatcher)
+    thread = runner._thread
+
+    runner.close()
+
+    assert not thread.is_alive()
+    assert runner.loop.is_closed()
+
+
+def test_external_loop(dispatcher):
+    """UIと統合されたループが渡された場合はスレッドを作らないことを確認"""
+    loop = asyncio.new_event_loop()
+    runner = AsyncRunner(dispatcher, loop=loop)
+    results = []
+
+    async def work():
+        return "統合ループ"
+
+    future = runner.submit(work(), on_done=results.append)
+    loop.run_until_complete(asyncio.wrap_future(future, loop=loop))
+    loop.close()
+
+    assert not runner.owns_loop()
+    assert runner._thread is None
+    assert results == ["統合ループ"]
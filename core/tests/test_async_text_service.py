@@ -0,0 +1,341 @@
+"""AsyncTextServiceのpytestテスト"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+from mini_text_core.services.async_text_service import AsyncTextService
+
+
+@pytest.fixture
+def mock_executor():
+    """モック非同期Executorのフィクスチャ"""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_window_service():
+    """モック非同期WindowServiceのフィクスチャ"""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_clipboard_service():
+    """モック非同期ClipboardServiceのフィクスチャ"""
+    return AsyncMock()
+
+
+@pytest.fixture
+def service(mock_executor, mock_window_service, mock_clipboard_service):
+    """AsyncTextServiceのフィクスチャ"""
+    return AsyncTextService(
+        window_service=mock_window_service,
+        clipboard_service=mock_clipboard_service,
+        executor=mock_executor,
+    )
+
+
+def test_send_text_success(service, mock_executor, mock_window_service, mock_clipboard_service):
+    """テキスト送信が成功することを確認"""
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_window_service.activate_window.return_value = (True, "")
+    mock_executor.execute.return_value = (True, "", "")
+
+    success, error_msg = asyncio.run(service.send_text("12345", "テストテキスト", 0.1, 0.1))
+
+    assert success
+    assert error_msg == ""
+    mock_clipboard_service.copy_to_clipboard.assert_awaited_once_with("テストテキスト")
+    mock_window_service.activate_window.assert_awaited_once_with("12345", 0.1)
+    mock_executor.execute.assert_awaited_once_with(["xdotool", "key", "ctrl+v"])
+
+
+def test_send_text_clipboard_failure(service, mock_window_service, mock_clipboard_service):
+    """クリップボードコピー失敗時の処理を確認"""
+    mock_clipboard_service.copy_to_clipboard.return_value = (False, "クリップボードエラー")
+
+    success, error_msg = asyncio.run(service.send_text("12345", "テストテキスト", 0.1, 0.1))
+
+    assert not success
+    assert "クリップボードエラー" in error_msg
+    mock_window_service.activate_window.assert_not_called()
+
+
+def test_send_text_activate_failure(service, mock_executor, mock_window_service, mock_clipboard_service):
+    """ウィンドウアクティベート失敗時の処理を確認"""
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_window_service.activate_window.return_value = (False, "ウィンドウエラー")
+
+    success, error_msg = asyncio.run(service.send_text("12345", "テストテキスト", 0.1, 0.1))
+
+    assert not success
+    assert "ウィンドウエラー" in error_msg
+    mock_executor.execute.assert_not_called()
+
+
+def test_send_text_paste_failure(service, mock_executor, mock_window_service, mock_clipboard_service):
+    """ペースト操作失敗時の処理を確認"""
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_window_service.activate_window.return_value = (True, "")
+    mock_executor.execute.return_value = (False, "", "ペーストエラー")
+
+    success, error_msg = asyncio.run(service.send_text("12345", "テストテキスト", 0.1, 0.1))
+
+    assert not success
+    assert "ペースト操作に失敗" in error_msg
+
+
+def test_receive_text_success(service, mock_executor, mock_clipboard_service):
+    """テキスト受信が成功することを確認"""
+    mock_executor.execute.return_value = (True, "", "")
+    mock_clipboard_service.get_from_clipboard.return_value = (True, "受信したテキスト", "")
+
+    success, text, error_msg = asyncio.run(service.receive_text(0.0))
+
+    assert success
+    assert text == "受信したテキスト"
+    assert error_msg == ""
+    assert mock_executor.execute.await_count == 2
+
+
+def test_receive_text_select_all_failure(service, mock_executor):
+    """全選択操作失敗時の処理を確認"""
+    mock_executor.execute.return_value = (False, "", "全選択エラー")
+
+    success, text, error_msg = asyncio.run(service.receive_text(0.0))
+
+    assert not success
+    assert "全選択操作に失敗" in error_msg
+
+
+def test_receive_text_copy_failure(service, mock_executor):
+    """コピー操作失敗時の処理を確認"""
+    mock_executor.execute.side_effect = [
+        (True, "", ""),  # Ctrl+A成功
+        (False, "", "コピーエラー"),  # Ctrl+C失敗
+    ]
+
+    success, text, error_msg = asyncio.run(service.receive_text(0.0))
+
+    assert not success
+    assert "コピー操作に失敗" in error_msg
+
+
+def test_receive_text_clipboard_get_failure(service, mock_executor, mock_clipboard_service):
+    """クリップボード取得失敗時の処理を確認"""
+    mock_executor.execute.return_value = (True, "", "")
+    mock_clipboard_service.get_from_clipboard.return_value = (False, "", "クリップボード取得エラー")
+
+    success, text, error_msg = asyncio.run(service.receive_text(0.0))
+
+    assert not success
+    assert "クリップボード取得エラー" in error_msg
+
+
+def test_send_text_with_readiness(mock_executor, mock_window_service, mock_clipboard_service):
+    """readiness指定時は固定待機せず、アクティブになるまで待つことを確認"""
+    readiness = Mock()
+    service = AsyncTextService(
+        mock_window_service, mock_clipboard_service, mock_executor, readiness=readiness
+    )
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_window_service.activate_window.return_value = (True, "")
+    mock_executor.execute.return_value = (True, "", "")
+
+    success, error_msg = asyncio.run(service.send_text("12345", "テストテキスト", 0.3, 0.3))
+
+    assert success
+    mock_window_service.activate_window.assert_awaited_once_with("12345", 0)
+    readiness.wait_for_active_window.assert_called_once_with("12345", 0.3)
+
+
+def test_receive_text_with_readiness(mock_executor, mock_window_service, mock_clipboard_service):
+    """readiness指定時はPRIMARY・CLIPBOARDの更新を待つことを確認"""
+    readiness = Mock()
+    readiness.mark_selection.return_value = 0
+    service = AsyncTextService(
+        mock_window_service, mock_clipboard_service, mock_executor, readiness=readiness
+    )
+    mock_executor.execute.return_value = (True, "", "")
+    mock_clipboard_service.get_from_clipboard.return_value = (True, "受信したテキスト", "")
+
+    success, text, error_msg = asyncio.run(service.receive_text(10.0))
+
+    assert success
+    assert [c.args[0] for c in readiness.wait_for_selection_change.call_args_list] == [
+        "PRIMARY",
+        "CLIPBOARD",
+    ]
+
+
+def test_receive_text_clipboard_not_changed(mock_executor, mock_window_service, mock_clipboard_service):
+    """期限内にクリップボードが更新されない場合は古い内容を返さないことを確認"""
+    notifier = Mock()
+    notifier.mark_change.return_value = 0
+    notifier.wait_for_change.return_value = False
+    service = AsyncTextService(
+        mock_window_service,
+        mock_clipboard_service,
+        mock_executor,
+        clipboard_notifier=notifier,
+    )
+    mock_executor.execute.return_value = (True, "", "")
+
+    success, text, error_msg = asyncio.run(service.receive_text(0.0))
+
+    assert not success
+    assert "更新されませんでした" in error_msg
+    mock_clipboard_service.get_from_clipboard.assert_not_called()
+
+
+def test_send_text_many(service, mock_executor, mock_window_service, mock_clipboard_service):
+    """クリップボードへのコピーは1回で、送信先ごとの結果を返すことを確認"""
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_window_service.activate_window.side_effect = [(True, ""), (False, "エラー")]
+    mock_executor.execute.return_value = (True, "", "")
+
+    results = asyncio.run(service.send_text_many(["1", "2"], "テストテキスト", 0.1, 0.1))
+
+    assert results == [("1", True, ""), ("2", False, "エラー")]
+    mock_clipboard_service.copy_to_clipboard.assert_awaited_once_with("テストテキスト")
+
+
+def test_send_text_chained(mock_executor, mock_window_service, mock_clipboard_service):
+    """chain_commands指定時はアクティブ化・待機・ペーストを1回の起動で行うことを確認"""
+    service = AsyncTextService(
+        mock_window_service, mock_clipboard_service, mock_executor, chain_commands=True
+    )
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_executor.execute.return_value = (True, "", "")
+
+    success, error_msg = asyncio.run(service.send_text("12345", "テスト", 0.3, 0.1))
+
+    assert success
+    mock_window_service.activate_window.assert_not_awaited()
+    mock_executor.execute.assert_awaited_once_with(
+        [
+            "xdotool", "windowactivate", "--sync", "12345",
+            "sleep", "0.3", "key", "ctrl+v",
+        ]
+    )
+
+
+def test_receive_text_chained_with_readiness(
+    mock_executor, mock_window_service, mock_clipboard_service
+):
+    """readiness指定時はPRIMARYの更新の待機の前後で2回起動することを確認"""
+    readiness = Mock()
+    readiness.mark_selection.return_value = 1
+    service = AsyncTextService(
+        mock_window_service,
+        mock_clipboard_service,
+        mock_executor,
+        readiness=readiness,
+        chain_commands=True,
+    )
+    mock_executor.execute.return_value = (True, "", "")
+    mock_clipboard_service.get_from_clipboard.return_value = (True, "取得", "")
+
+    success, text, _ = asyncio.run(service.receive_text(0.2))
+
+    assert success
+    assert text == "取得"
+    assert [c.args[0] for c in mock_executor.execute.await_args_list] == [
+        ["xdotool", "key", "ctrl+a"],
+        ["xdotool", "key", "ctrl+c"],
+    ]
+    readiness.wait_for_selection_change.assert_any_call("PRIMARY", 1, 0.2)
+
+
+def test_send_text_sequence_with_readiness(
+    mock_executor, mock_window_service, mock_clipboard_service
+):
+    """readiness指定時はアクティブになるまで待ってから最初のテキストをペーストすることを確認"""
+    readiness = Mock()
+    service = AsyncTextService(
+        mock_window_service,
+        mock_clipboard_service,
+        mock_executor,
+        readiness=readiness,
+        chain_commands=True,
+    )
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_executor.execute.return_value = (True, "", "")
+
+    results = asyncio.run(
+        service.send_text_sequence("12345", ["一", "二"], 0.3, 0.1, ["Tab"])
+    )
+
+    assert results == [(True, ""), (True, "")]
+    readiness.wait_for_active_window.assert_called_once_with("12345", 0.3)
+    assert [c.args[0] for c in mock_executor.execute.await_args_list] == [
+        ["xdotool", "windowactivate", "--sync", "12345"],
+        ["xdotool", "key", "ctrl+v", "sleep", "0.1", "key", "Tab"],
+        ["xdotool", "key", "ctrl+v"],
+    ]
+
+
+def test_receive_text_from_chained_with_readiness(
+    mock_executor, mock_window_service, mock_clipboard_service
+):
+    """readiness指定時はアクティブになるまで待ってからクリック・全選択することを確認"""
+    readiness = Mock()
+    readiness.mark_selection.return_value = 1
+    service = AsyncTextService(
+        mock_window_service,
+        mock_clipboard_service,
+        mock_executor,
+        readiness=readiness,
+        chain_commands=True,
+    )
+    mock_executor.execute.return_value = (True, "", "")
+    mock_clipboard_service.get_from_clipboard.return_value = (True, "取得", "")
+
+    success, text, _ = asyncio.run(
+        service.receive_text_from("12345", 0.3, 0.2, focus_point=(5, 6))
+    )
+
+    assert success
+    assert text == "取得"
+    assert [c.args[0] for c in mock_executor.execute.await_args_list] == [
+        ["xdotool", "windowactivate", "--sync", "12345"],
+        [
+            "xdotool", "mousemove", "--window", "12345", "5", "6", "click", "1",
+            "mousemove", "restore", "key", "ctrl+a",
+        ],
+        ["xdotool", "key", "ctrl+c"],
+    ]
+    readiness.wait_for_active_window.assert_called_once_with("12345", 0.3)
+
+
+def test_receive_text_reads_primary(mock_executor, mock_window_service, mock_clipboard_service):
+    """read_primary指定時は選択済みのテキストをキー入力なしで返すことを確認"""
+    service = AsyncTextService(
+        mock_window_service, mock_clipboard_service, mock_executor, read_primary=True
+    )
+    mock_clipboard_service.get_from_primary.return_value = (True, "選択したテキスト", "")
+
+    success, text, error_msg = asyncio.run(service.receive_text(0.3))
+
+    assert success
+    assert text == "選択したテキスト"
+    mock_executor.execute.assert_not_awaited()
+    mock_clipboard_service.get_from_clipboard.assert_not_awaited()
+
+
+def test_receive_text_falls_back_when_primary_empty(
+    mock_executor, mock_window_service, mock_clipboard_service
+):
+    """PRIMARYが空の場合は全選択・コピーで取得することを確認"""
+    service = AsyncTextService(
+        mock_window_service, mock_clipboard_service, mock_executor, read_primary=True
+    )
+    mock_clipboard_service.get_from_primary.return_value = (True, "", "")
+    mock_executor.execute.return_value = (True, "", "")
+    mock_clipboard_service.get_from_clipboard.return_value = (True, "受信したテキスト", "")
+
+    success, text, error_msg = asyncio.run(service.receive_text(0.0))
+
+    assert success
+    assert text == "受信したテキスト"
+    assert mock_executor.execute.await_count == 2
@@ -0,0 +1,122 @@
+"""AsyncWindowServiceのpytestテスト"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+from mini_text_core.services.async_window_service import AsyncWindowService
+
+
+@pytest.fixture
+def mock_executor():
+    """モック非同期Executorのフィクスチャ"""
+    return AsyncMock()
+
+
+@pytest.fixture
+def service(mock_executor):
+    """AsyncWindowServiceのフィクスチャ"""
+    return AsyncWindowService(mock_executor)
+
+
+def test_get_window_list_success(service, mock_executor):
+    """ウィンドウ一覧取得が成功することを確認"""
+    titles = {"12345": "テストウィンドウ1", "67890": "テストウィンドウ2"}
+
+    async def execute(command, input_data=None):
+        if command[1] == "search":
+            return True, "12345\n67890\n", ""
+        return True, titles[command[2]], ""
+
+    mock_executor.execute.side_effect = execute
+
+    result = asyncio.run(service.get_window_list())
+
+    assert result == [("12345", "テストウィンドウ1"), ("67890", "テストウィンドウ2")]
+
+
+def test_get_window_list_preserves_order_and_drops_vanished(mock_executor):
+    """順序が維持され、取得中に閉じられたウィンドウが除外されることを確認"""
+    delays = {"1": 0.05, "2": 0.0, "3": 0.01}
+
+    async def execute(command, input_data=None):
+        if command[1] == "search":
+            return True, "1\n2\n3\n", ""
+        window_id = command[2]
+        await asyncio.sleep(delays[window_id])
+        if window_id == "2":
+            return False, "", "BadWindow"
+        return True, f"ウィンドウ{window_id}", ""
+
+    mock_executor.execute.side_effect = execute
+    service = AsyncWindowService(mock_executor, max_workers=3)
+
+    result = asyncio.run(service.get_window_list())
+
+    assert result == [("1", "ウィンドウ1"), ("3", "ウィンドウ3")]
+
+
+def test_get_window_list_concurrency_limit_and_deadline(mock_executor):
+    """同時実行数の制限と制限時間が守られることを確認"""
+    running = 0
+    max_running = 0
+
+    async def execute(command, input_data=None):
+        nonlocal running, max_running
+        if command[1] == "search":
+            return True, "\n".join(str(i) for i in range(6)) + "\n", ""
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(1.0 if command[2] == "5" else 0.01)
+        running -= 1
+        return True, f"ウィンドウ{command[2]}", ""
+
+    mock_executor.execute.side_effect = execute
+    service = AsyncWindowService(mock_executor, max_workers=2, deadline=0.3)
+
+    result = asyncio.run(service.get_window_list())
+
+    assert [window_id for window_id, _ in result] == ["0", "1", "2", "3", "4"]
+    assert max_running <= 2
+
+
+def test_get_window_list_search_failure(service, mock_executor):
+    """ウィンドウ検索が失敗した場合の処理を確認"""
+    mock_executor.execute.return_value = (False, "", "エラー")
+
+    assert asyncio.run(service.get_window_list()) == []
+
+
+def test_get_window_list_with_backend(mock_executor):
+    """バックエンドが設定されている場合はxdotoolを使わないことを確認"""
+    backend = Mock()
+    backend.get_window_list.return_value = [("12345", "テストウィンドウ")]
+    service = AsyncWindowService(mock_executor, backend=backend)
+
+    result = asyncio.run(service.get_window_list())
+
+    assert result == [("12345", "テストウィンドウ")]
+    mock_executor.execute.assert_not_called()
+
+
+def test_activate_window_success(service, mock_executor):
+    """ウィンドウアクティベートが成功することを確認"""
+    mock_executor.execute.return_value = (True, "", "")
+
+    success, error_msg = asyncio.run(service.activate_window("12345", 0.0))
+
+    assert success
+    assert error_msg == ""
+    mock_executor.execute.assert_awaited_once_with(
+        ["xdotool", "windowactivate", "--sync", "12345"]
+    )
+
+
+def test_activate_window_failure(service, mock_executor):
+    """ウィンドウアクティベートが失敗した場合の処理を確認"""
+    mock_executor.execute.return_value = (False, "", "ウィンドウが見つかりません")
+
+    success, error_msg = asyncio.run(service.activate_window("99999", 0.0))
+
+    assert not success
+    assert "アクティブ化に失敗" in error_msg
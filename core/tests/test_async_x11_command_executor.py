@@ -0,0 +1,141 @@
+"""AsyncX11CommandExecutorのpytestテスト"""
+
+import asyncio
+
+import pytest
+from mini_text_core.utils.async_x11_command_executor import AsyncX11CommandExecutor
+
+
+@pytest.fixture
+def executor():
+    """AsyncX11CommandExecutorのフィクスチャ"""
+    return AsyncX11CommandExecutor()
+
+
+def test_execute_simple_command(executor):
+    """単純なコマンド実行が成功することを確認"""
+    success, stdout, stderr = asyncio.run(executor.execute(["echo", "test"]))
+
+    assert success
+    assert "test" in stdout
+    assert stderr == ""
+
+
+def test_execute_with_input_data(executor):
+    """標準入力を使用したコマンド実行が成功することを確認"""
+    success, stdout, stderr = asyncio.run(
+        executor.execute(["cat"], input_data="テスト入力")
+    )
+
+    assert success
+    assert stdout == "テスト入力"
+
+
+def test_execute_nonexistent_command(executor):
+    """存在しないコマンドの実行が適切に失敗することを確認"""
+    success, stdout, stderr = asyncio.run(
+        executor.execute(["nonexistent_command_12345"])
+    )
+
+    assert not success
+    assert "見つかりません" in stderr
+
+
+def test_execute_command_with_error(executor):
+    """エラーを返すコマンドが適切に処理されることを確認"""
+    success, stdout, stderr = asyncio.run(
+        executor.execute(["ls", "/nonexistent_directory_12345"])
+    )
+
+    assert not success
+    assert stderr != ""
+
+
+def test_timeout(executor, monkeypatch):
+    """タイムアウトした場合に失敗を返すことを確認"""
+    monkeypatch.setattr(executor, "TIMEOUT", 0.1)
+
+    success, stdout, stderr = asyncio.run(executor.execute(["sleep", "5"]))
+
+    assert not success
+    assert "タイムアウト" in stderr
+
+
+def test_does_not_block_event_loop(executor):
+    """実行中も他のタスクが進むことを確認"""
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.ensure_future(ticker())
+        await executor.execute(["sleep", "0.2"])
+        task.cancel()
+        return ticks
+
+    assert asyncio.run(scenario()) >= 5
+
+
+def test_execute_stream_writes_input(executor, tmp_path):
+    """チャンク単位の入力がコマンドの標準入力に渡されることを確認"""
+    output = tmp_path / "output"
+    chunks = [b"a" * 100_000, "テスト".encode("utf-8")]
+
+    success, stderr = asyncio.run(
+        executor.execute_stream(["sh", "-c", f"cat > {output}"], source=chunks)
+    )
+
+    assert success
+    assert output.read_bytes() == b"".join(chunks)
+
+
+def test_execute_stream_failure(executor):
+    """失敗したコマンドのstderrが返されることを確認"""
+    success, stderr = asyncio.run(
+        executor.execute_stream(["sh", "-c", "echo エラー >&2; exit 1"], source=[])
+    )
+
+    assert not success
+    assert stderr == "エラー\n"
+
+
+def test_execute_stream_does_not_wait_for_forked_child(executor):
+    """stdout/stderrを保持した子プロセスが残っても終了を待たないことを確認（xclip対策）"""
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = await executor.execute_stream(
+            ["sh", "-c", "cat > /dev/null; sleep 5 & exit 0"], source=[b"x"]
+        )
+        return result, loop.time() - start
+
+    (success, stderr), elapsed = asyncio.run(scenario())
+
+    assert success
+    assert elapsed < 2.0
+
+
+def test_execute_stream_timeout(executor):
+    """転送がないまま制限時間を超えるとタイムアウトすることを確認"""
+    success, stderr = asyncio.run(
+        executor.execute_stream(["sleep", "5"], timeout=0.1)
+    )
+
+    assert not success
+    assert "タイムアウト" in stderr
+
+
+def test_execute_stream_nonexistent_command(executor):
+    """存在しないコマンドの実行が適切に失敗することを確認"""
+    success, stderr = asyncio.run(
+        executor.execute_stream(["nonexistent_command_12345"], source=[])
+    )
+
+    assert not success
+    assert "見つかりません" in stderr
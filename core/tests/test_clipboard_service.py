@@ -0,0 +1,156 @@
+"""ClipboardServiceのpytestテスト"""
+
+import os
+import time
+
+import pytest
+from unittest.mock import Mock
+from mini_text_core.services.clipboard_service import ClipboardService
+
+
+@pytest.fixture
+def mock_executor():
+    """モックExecutorのフィクスチャ"""
+    return Mock()
+
+
+@pytest.fixture
+def service(mock_executor):
+    """ClipboardServiceのフィクスチャ"""
+    return ClipboardService(mock_executor)
+
+
+def test_copy_to_clipboard_success(service, mock_executor):
+    """クリップボードへのコピーが成功することを確認"""
+    received = []
+
+    def execute_stream(command, source):
+        received.extend(source)
+        return True, ""
+
+    mock_executor.execute_stream.side_effect = execute_stream
+
+    success, error_msg = service.copy_to_clipboard("テストテキスト")
+
+    assert success
+    assert error_msg == ""
+    assert mock_executor.execute_stream.call_args.args[0] == [
+        "xclip", "-selection", "clipboard"
+    ]
+    assert b"".join(received).decode("utf-8") == "テストテキスト"
+    mock_executor.execute.assert_not_called()
+
+
+def test_copy_to_clipboard_failure(service, mock_executor):
+    """クリップボードへのコピーが失敗した場合の処理を確認"""
+    mock_executor.execute_stream.return_value = (False, "xclipエラー")
+
+    success, error_msg = service.copy_to_clipboard("テストテキスト")
+
+    assert not success
+    assert "コピーに失敗" in error_msg
+
+
+def test_get_from_clipboard_success(service, mock_executor):
+    """クリップボードからの取得が成功することを確認"""
+
+    # 出力はチャンク単位でsinkに渡される
+    def execute_stream(command, sink):
+        sink("取得した".encode("utf-8"))
+        sink("テキスト".encode("utf-8"))
+        return True, ""
+
+    mock_executor.execute_stream.side_effect = execute_stream
+
+    success, text, error_msg = service.get_from_clipboard()
+
+    assert success
+    assert text == "取得したテキスト"
+    assert error_msg == ""
+    assert mock_executor.execute_stream.call_args.args[0] == [
+        "xclip", "-selection", "clipboard", "-o"
+    ]
+
+
+def test_get_from_clipboard_failure(service, mock_executor):
+    """クリップボードからの取得が失敗した場合の処理を確認"""
+    mock_executor.execute_stream.return_value = (False, "xclipエラー")
+
+    success, text, error_msg = service.get_from_clipboard()
+
+    assert not success
+    assert text == ""
+    assert "取得に失敗" in error_msg
+
+
+def test_copy_large_text_streams(service, mock_executor):
+    """大きなテキストもチャンク単位で渡すことを確認"""
+    received = []
+
+    def execute_stream(command, source):
+        received.extend(source)
+        return True, ""
+
+    mock_executor.execute_stream.side_effect = execute_stream
+
+    success, error_msg = service.copy_to_clipboard("あ" * 200_000)
+
+    assert success
+    assert len(received) > 1
+    assert b"".join(received).decode("utf-8") == "あ" * 200_000
+
+
+def test_copy_empty_string(service, mock_executor):
+    """空文字列のコピーが正常に処理されることを確認"""
+    mock_executor.execute_stream.return_value = (True, "")
+
+    success, error_msg = service.copy_to_clipboard("")
+
+    assert success
+    assert list(mock_executor.execute_stream.call_args.kwargs["source"]) == []
+
+
+def test_copy_does_not_wait_for_forked_xclip(tmp_path, monkeypatch):
+    """フォークした子がstdout/stderrを保持するxclipでも終了を待たないことを確認"""
+    # 実際のxclipと同様に、入力を読み終えたら選択を保持する子を残して終了する
+    fake_xclip = tmp_path / "xclip"
+    fake_xclip.write_text(
+        f"#!/bin/sh\ncat > {tmp_path / 'selection'}\nsleep 5 &\nexit 0\n"
+    )
+    fake_xclip.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+    service = ClipboardService()
+
+    start = time.monotonic()
+    success, error_msg = service.copy_to_clipboard("テストテキスト")
+    elapsed = time.monotonic() - start
+
+    assert success, error_msg
+    assert elapsed < 2.0
+    assert (tmp_path / "selection").read_text(encoding="utf-8") == "テストテキスト"
+
+
+def test_get_from_primary_success(service, mock_executor):
+    """PRIMARYから選択中のテキストを取得できることを確認"""
+    mock_executor.execute.return_value = (True, "選択したテキスト", "")
+
+    success, text, error_msg = service.get_from_primary()
+
+    assert success
+    assert text == "選択したテキスト"
+    mock_executor.execute.assert_called_once_with(
+        ["xclip", "-selection", "primary", "-o"]
+    )
+
+
+def test_get_from_primary_without_selection(service, mock_executor):
+    """選択しているアプリケーションがない場合は空のテキストを返すことを確認"""
+    mock_executor.execute.return_value = (
+        False, "", "Error: target STRING not available"
+    )
+
+    success, text, error_msg = service.get_from_primary()
+
+    assert success
+    assert text == ""
+    assert error_msg == ""
@@ -3,7 +3,7 @@
 import pytest
 import json
 from pathlib import Path
-from mini_text.config.config_manager import ConfigManager
+from mini_text_core.config.config_manager import ConfigManager
 
 
 def test_default_config(temp_config_file):
@@ -108,3 +108,103 @@ def test_default_config_path():
 
     expected_path = str(Path.home() / ".config" / "mini-text" / "config.json")
     assert config.config_path == expected_path
+
+
+def test_adaptive_wait(temp_config_file):
+    """準備完了判定の設定の既定値と保存を確認"""
+    config1 = ConfigManager(temp_config_file)
+    assert config1.is_adaptive_wait_enabled()
+
+    config1.set_adaptive_wait_enabled(False)
+    config1.save_config()
+
+    config2 = ConfigManager(temp_config_file)
+    assert not config2.is_adaptive_wait_enabled()
+
+
+def test_timing_enabled(temp_config_file):
+    """所要時間の計測の設定の既定値と保存を確認"""
+    config1 = ConfigManager(temp_config_file)
+    assert not config1.is_timing_enabled()
+
+    config1.set_timing_enabled(True)
+    config1.save_config()
+
+    config2 = ConfigManager(temp_config_file)
+    assert config2.is_timing_enabled()
+    # 他の設定は既定値のまま
+    assert config2.is_adaptive_wait_enabled()
+
+
+def test_separator_keys(temp_config_file):
+    """まとめて送信する際の区切りのキーと待機時間の既定値と保存を確認"""
+    config1 = ConfigManager(temp_config_file)
+    assert config1.get_separator_keys() == ["Return"]
+    assert config1.get_paste_wait() == 0.1
+
+    config1.set_separator_keys(["Tab", "Tab"])
+    config1.set_paste_wait(0.05)
+    config1.save_config()
+
+    config2 = ConfigManager(temp_config_file)
+    assert config2.get_separator_keys() == ["Tab", "Tab"]
+    assert config2.get_paste_wait() == 0.05
+
+
+def test_hotkeys(temp_config_file):
+    """グローバルホットキーの既定値と保存を確認"""
+    config1 = ConfigManager(temp_config_file)
+    # キー入力を奪うため既定では無効（設定で有効にする）
+    assert not config1.is_hotkeys_enabled()
+    assert config1.get_hotkeys() == {"send": "ctrl+alt+v", "copy": "ctrl+alt+c"}
+
+    config1.set_hotkeys_enabled(True)
+    config1.set_hotkey("send", "super+v")
+    config1.set_hotkey("copy", "")
+    config1.save_config()
+
+    config2 = ConfigManager(temp_config_file)
+    assert config2.is_hotkeys_enabled()
+    # 空文字列のものは含まない
+    assert config2.get_hotkeys() == {"send": "super+v"}
+
+
+def test_title_workers(temp_config_file):
+    """タイトル取得の同時実行数の既定値と保存を確認"""
+    config1 = ConfigManager(temp_config_file)
+    assert config1.get_title_workers() == 1
+
+    config1.set_title_workers(8)
+    config1.save_config()
+
+    config2 = ConfigManager(temp_config_file)
+    assert config2.get_title_workers() == 8
+
+
+def test_title_deadline(temp_config_file):
+    """タイトル取得の制限時間の既定値と保存（無制限を含む）を確認"""
+    config1 = ConfigManager(temp_config_file)
+    assert config1.get_title_deadline() == 2.0
+
+    config1.set_title_deadline(None)
+    config1.save_config()
+
+    config2 = ConfigManager(temp_config_file)
+    assert config2.get_title_deadline() is None
+
+    config2.set_title_deadline(0.5)
+    config2.save_config()
+
+    assert ConfigManager(temp_config_file).get_title_deadline() == 0.5
+
+
+def test_primary_receive(temp_config_file):
+    """コピーでPRIMARYを先に読み取る設定の既定値と保存を確認"""
+    config1 = ConfigManager(temp_config_file)
+    assert not config1.is_primary_receive_enabled()
+
+    config1.set_primary_receive_enabled(True)
+    config1.save_config()
+
+    config2 = ConfigManager(temp_config_file)
+    assert config2.is_primary_receive_enabled()
@@ -0,0 +1,345 @@
+"""常駐プロセス（デーモン）のpytestテスト"""
+
+import io
+import socket
+import threading
+import pytest
+from unittest.mock import Mock
+from mini_text_core.daemon.client import DaemonClient
+from mini_text_core.daemon.protocol import (
+    ProtocolError,
+    encode_message,
+    read_message,
+)
+from mini_text_core.daemon.server import (
+    DaemonServer,
+    RequestDispatcher,
+    prepare_socket_path,
+)
+from mini_text_core.utils.timing import Tracer
+
+
+@pytest.fixture
+def mock_text_service():
+    """モックTextServiceのフィクスチャ"""
+    service = Mock()
+    service.send_text.return_value = (True, "")
+    service.receive_text.return_value = (True, "取得したテキスト", "")
+    return service
+
+
+@pytest.fixture
+def mock_window_service():
+    """モックWindowServiceのフィクスチャ"""
+    service = Mock()
+    service.get_window_list.return_value = [("0x1", "ウィンドウ1"), ("0x2", "ウィンドウ2")]
+    return service
+
+
+@pytest.fixture
+def mock_config():
+    """モックConfigManagerのフィクスチャ"""
+    config = Mock()
+    config.get_timing.side_effect = {
+        "window_activate_wait": 0.3,
+        "key_input_wait": 0.2,
+    }.__getitem__
+    return config
+
+
+@pytest.fixture
+def dispatcher(mock_text_service, mock_window_service, mock_config):
+    """RequestDispatcherのフィクスチャ"""
+    return RequestDispatcher(
+        mock_text_service, mock_window_service, mock_config, tracer=Tracer()
+    )
+
+
+@pytest.fixture
+def server(tmp_path, dispatcher):
+    """起動済みのDaemonServerのフィクスチャ"""
+    socket_path = str(tmp_path / "daemon.sock")
+    server = DaemonServer(socket_path, dispatcher)
+    dispatcher.on_shutdown = server.request_shutdown
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+def test_list(dispatcher):
+    """ウィンドウ一覧が返されることを確認"""
+    response = dispatcher.handle({"id": 1, "command": "list"})
+
+    assert response == {
+        "id": 1,
+        "ok": True,
+        "error": "",
+        "windows": [["0x1", "ウィンドウ1"], ["0x2", "ウィンドウ2"]],
+    }
+
+
+def test_send_uses_configured_waits(dispatcher, mock_text_service):
+    """待機時間が未指定の場合は設定値で送信することを確認"""
+    response = dispatcher.handle(
+        {"id": 2, "command": "send", "window_id": "0x1", "text": "テスト"}
+    )
+
+    assert response["ok"]
+    assert response["results"] == [["0x1", True, ""]]
+    mock_text_service.send_text.assert_called_once_with("0x1", "テスト", 0.3, 0.2)
+
+
+def test_send_many_reports_failures(dispatcher, mock_text_service):
+    """複数ウィンドウへの送信で失敗した送信先がエラーに含まれることを確認"""
+    mock_text_service.send_text_many.return_value = [
+        ("0x1", True, ""),
+        ("0x2", False, "アクティブ化に失敗"),
+    ]
+
+    response = dispatcher.handle(
+        {
+            "id": 3,
+            "command": "send",
+            "window_ids": ["0x1", "0x2"],
+            "text": "テスト",
+            "activate_wait": 0.1,
+            "key_wait": 0.05,
+        }
+    )
+
+    assert not response["ok"]
+    assert response["error"] == "0x2: アクティブ化に失敗"
+    mock_text_service.send_text_many.assert_called_once_with(
+        ["0x1", "0x2"], "テスト", 0.1, 0.05
+    )
+
+
+@pytest.mark.parametrize(
+    "request_body",
+    [
+        {"command": "send", "window_ids": ["0x1"]},
+        {"command": "send", "text": "テスト"},
+        {"command": "send", "window_ids": [1], "text": "テスト"},
+        {"command": "send", "window_ids": "12345", "text": "テスト"},
+        {"command": "send", "window_ids": ["0x1", ""], "text": "テスト"},
+        {"command": "send", "window_ids": [], "text": "テスト"},
+        {"command": "send", "window_id": "", "text": "テスト"},
+        {"command": "copy", "wait": "abc"},
+        {"command": "copy", "window_id": 1},
+        {"command": "copy", "window_id": "0x1", "focus_point": [1]},
+    ],
+)
+def test_invalid_request(dispatcher, mock_text_service, request_body):
+    """不正な引数のリクエストが失敗のレスポンスになることを確認"""
+    response = dispatcher.handle(dict(request_body, id=4))
+
+    assert response["id"] == 4
+    assert not response["ok"]
+    assert "不正なリクエストです" in response["error"]
+    mock_text_service.send_text.assert_not_called()
+    mock_text_service.send_text_many.assert_not_called()
+
+
+def test_service_error_becomes_error_response(dispatcher, mock_window_service):
+    """サービスの予期しない例外が失敗のレスポンスになることを確認"""
+    mock_window_service.get_window_list.side_effect = OSError(
+        "xdotoolを起動できません"
+    )
+
+    response = dispatcher.handle({"id": 7, "command": "list"})
+
+    assert response["id"] == 7
+    assert not response["ok"]
+    assert "xdotoolを起動できません" in response["error"]
+
+
+def test_client_pipeline_continues_after_service_error(server, mock_text_service):
+    """例外が発生したリクエストにも応答し、後続のリクエストも処理することを確認"""
+    mock_text_service.receive_text.side_effect = [
+        RuntimeError("失敗"),
+        (True, "取得したテキスト", ""),
+    ]
+
+    with DaemonClient(server.socket_path) as client:
+        responses = client.request_many([{"command": "copy"}, {"command": "copy"}])
+
+    assert [response["ok"] for response in responses] == [False, True]
+    assert responses[1]["text"] == "取得したテキスト"
+
+
+def test_unknown_command(dispatcher):
+    """不明なコマンドが失敗のレスポンスになることを確認"""
+    response = dispatcher.handle({"id": 5, "command": "unknown"})
+
+    assert not response["ok"]
+    assert "不明なコマンドです" in response["error"]
+
+
+def test_copy(dispatcher, mock_text_service):
+    """アクティブウィンドウのテキストが返されることを確認"""
+    response = dispatcher.handle({"id": 6, "command": "copy"})
+
+    assert response["ok"]
+    assert response["text"] == "取得したテキスト"
+    mock_text_service.receive_text.assert_called_once_with(0.2)
+
+
+def test_copy_from_window(dispatcher, mock_text_service):
+    """window_id指定時は待たずにそのウィンドウから取得することを確認"""
+    mock_text_service.receive_text_from.return_value = (True, "選択先のテキスト", "")
+
+    response = dispatcher.handle(
+        {"id": 7, "command": "copy", "window_id": "0x1", "focus_point": [40, 120]}
+    )
+
+    assert response["ok"]
+    assert response["text"] == "選択先のテキスト"
+    mock_text_service.receive_text_from.assert_called_once_with(
+        "0x1", 0.3, 0.2, (40, 120)
+    )
+    mock_text_service.receive_text.assert_not_called()
+
+
+def test_requests_are_traced(mock_text_service, mock_window_service, mock_config):
+    """リクエストごとに所要時間が記録されることを確認"""
+    tracer = Tracer(enabled=True)
+    dispatcher = RequestDispatcher(
+        mock_text_service, mock_window_service, mock_config, tracer=tracer
+    )
+
+    dispatcher.handle({"id": 1, "command": "ping"})
+
+    spans = tracer.get_spans()
+    assert [span["name"] for span in spans] == ["daemon.ping"]
+    assert spans[0]["attrs"] == {"ok": True}
+
+
+def test_client_round_trip(server):
+    """ソケット経由でリクエストとレスポンスを送受信できることを確認"""
+    with DaemonClient(server.socket_path) as client:
+        response = client.request("list")
+
+    assert response["ok"]
+    assert response["windows"][0] == ["0x1", "ウィンドウ1"]
+
+
+def test_client_pipelines_requests(server, mock_text_service):
+    """1つの接続で続けて送信したリクエストに同じ順序で応答することを確認"""
+    requests = [
+        {"command": "send", "window_id": f"0x{i}", "text": f"テキスト{i}"}
+        for i in range(100)
+    ]
+    requests.append({"command": "list"})
+
+    with DaemonClient(server.socket_path) as client:
+        responses = client.request_many(requests)
+
+    assert [response["id"] for response in responses] == list(range(1, 102))
+    assert all(response["ok"] for response in responses)
+    assert [c.args[0] for c in mock_text_service.send_text.call_args_list] == [
+        f"0x{i}" for i in range(100)
+    ]
+
+
+def test_client_large_responses_do_not_block(server, mock_window_service):
+    """レスポンスが大きい場合もパイプラインが止まらないことを確認"""
+    mock_window_service.get_window_list.return_value = [
+        (f"0x{i}", "ウィンドウ" * 20) for i in range(2000)
+    ]
+
+    with DaemonClient(server.socket_path) as client:
+        responses = client.request_many([{"command": "list"}] * 20)
+
+    assert len(responses) == 20
+    assert all(len(response["windows"]) == 2000 for response in responses)
+
+
+def test_client_connection_failure(tmp_path):
+    """デーモンが起動していない場合は失敗のレスポンスになることを確認"""
+    client = DaemonClient(str(tmp_path / "missing.sock"))
+
+    success, error_msg = client.connect()
+    response = client.request("ping")
+
+    assert not success
+    assert "デーモンに接続できません" in error_msg
+    assert not response["ok"]
+
+
+def test_server_rejects_invalid_json(server):
+    """JSONでない行を受信した場合はエラーを返して接続を閉じることを確認"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(server.socket_path)
+        sock.sendall(b"not json\n" + encode_message({"command": "ping"}))
+        data = sock.makefile("rb").read()
+
+    lines = data.splitlines()
+    assert len(lines) == 1
+    assert b"\"ok\": false" in lines[0]
+
+
+def test_shutdown_request(tmp_path, dispatcher):
+    """shutdownリクエストでサーバーが終了することを確認"""
+    socket_path = str(tmp_path / "daemon.sock")
+    server = DaemonServer(socket_path, dispatcher)
+    dispatcher.on_shutdown = server.request_shutdown
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+
+    with DaemonClient(socket_path) as client:
+        response = client.request("shutdown")
+    thread.join(timeout=5)
+    server.server_close()
+
+    assert response["ok"]
+    assert not thread.is_alive()
+    assert not (tmp_path / "daemon.sock").exists()
+
+
+def test_prepare_socket_path_removes_stale_socket(tmp_path):
+    """接続できない古いソケットファイルは削除されることを確認"""
+    socket_path = tmp_path / "run" / "daemon.sock"
+    socket_path.parent.mkdir()
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(socket_path))
+    stale.close()
+
+    success, error_msg = prepare_socket_path(str(socket_path))
+
+    assert success
+    assert not socket_path.exists()
+
+
+def test_prepare_socket_path_detects_running_daemon(server):
+    """起動中のデーモンがある場合は失敗することを確認"""
+    success, error_msg = prepare_socket_path(server.socket_path)
+
+    assert not success
+    assert "既に起動しています" in error_msg
+
+
+def test_read_message_enforces_max_size():
+    """上限を超えるメッセージがエラーになることを確認"""
+    stream = io.BytesIO(encode_message({"command": "send", "text": "x" * 100}))
+
+    with pytest.raises(ProtocolError, match="大きすぎます"):
+        read_message(stream, max_size=16)
+
+
+def test_read_message_sequence():
+    """続けて送信されたメッセージを1件ずつ読み込めることを確認"""
+    stream = io.BytesIO(
+        encode_message({"id": 1, "command": "ping"})
+        + encode_message({"id": 2, "text": "改行を含む\nテキスト"})
+    )
+
+    assert read_message(stream) == {"id": 1, "command": "ping"}
+    assert read_message(stream) == {"id": 2, "text": "改行を含む\nテキスト"}
+    assert read_message(stream) is None
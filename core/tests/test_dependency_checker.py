@@ -0,0 +1,151 @@
+"""DependencyCheckerのpytestテスト"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from mini_text_core.utils.dependency_checker import (
+    DependencyCache,
+    DependencyChecker,
+    main,
+)
+
+
+def test_check_dependencies():
+    """依存関係チェックが動作することを確認"""
+    all_available, missing = DependencyChecker.check_dependencies()
+
+    # 戻り値の型を確認
+    assert isinstance(all_available, bool)
+    assert isinstance(missing, list)
+
+    # missingリストの要素が文字列であることを確認
+    for tool in missing:
+        assert isinstance(tool, str)
+
+    # all_availableとmissingの整合性を確認
+    if all_available:
+        assert len(missing) == 0, "all_availableがTrueの場合、missingは空であるべき"
+    else:
+        assert len(missing) > 0, "all_availableがFalseの場合、missingに要素があるべき"
+
+
+def test_required_commands_defined():
+    """必要なコマンドリストが定義されていることを確認"""
+    assert hasattr(DependencyChecker, "REQUIRED_COMMANDS")
+    assert isinstance(DependencyChecker.REQUIRED_COMMANDS, list)
+    assert len(DependencyChecker.REQUIRED_COMMANDS) > 0
+
+
+@pytest.fixture
+def fake_tool(tmp_path, monkeypatch):
+    """PATH上の偽のxdotoolと、一時ディレクトリのキャッシュ"""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    tool = bin_dir / "xdotool"
+    tool.write_text("#!/bin/sh\n", encoding="utf-8")
+    tool.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir))
+    cache = DependencyCache(str(tmp_path / "cache" / "dependencies.json"))
+    return tool, cache
+
+
+def test_check_all_uses_cache(fake_tool):
+    """すべて利用可能だった確認結果はキャッシュされ、2回目は確認を省略することを確認"""
+    _, cache = fake_tool
+
+    assert DependencyChecker.check_all(["xdotool"], cache=cache) == (True, [])
+
+    with patch.object(DependencyChecker, "check_dependencies") as mock_check:
+        assert DependencyChecker.check_all(["xdotool"], cache=cache) == (True, [])
+        mock_check.assert_not_called()
+
+
+def test_cache_invalidated_by_path_change(fake_tool, monkeypatch, tmp_path):
+    """PATHが変わった場合はキャッシュを使用しないことを確認"""
+    _, cache = fake_tool
+    DependencyChecker.check_all(["xdotool"], cache=cache)
+
+    monkeypatch.setenv("PATH", f"{tmp_path / 'other'}:{tmp_path / 'bin'}")
+
+    assert not cache.is_valid("xdotool")
+
+
+def test_cache_invalidated_by_tool_update(fake_tool):
+    """ツールが更新された（更新日時が変わった）場合はキャッシュを使用しないことを確認"""
+    tool, cache = fake_tool
+    DependencyChecker.check_all(["xdotool"], cache=cache)
+    assert cache.is_valid("xdotool")
+
+    stat = tool.stat()
+    os.utime(tool, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert not cache.is_valid("xdotool")
+
+
+def test_cache_invalidated_by_tool_removal(fake_tool):
+    """ツールが削除された場合は再確認して不足を報告することを確認"""
+    tool, cache = fake_tool
+    DependencyChecker.check_all(["xdotool"], cache=cache)
+
+    tool.unlink()
+
+    assert DependencyChecker.check_all(["xdotool"], cache=cache) == (
+        False,
+        ["xdotool"],
+    )
+
+
+def test_missing_result_not_cached(fake_tool):
+    """不足がある場合は記録しないことを確認"""
+    _, cache = fake_tool
+
+    all_available, missing = DependencyChecker.check_all(
+        ["xdotool", "mini-text-missing-tool"], cache=cache
+    )
+
+    assert not all_available
+    assert missing == ["mini-text-missing-tool"]
+    assert not Path(cache.cache_path).exists()
+
+
+def test_cache_key_includes_gtk4(fake_tool):
+    """GTK4の確認の有無は別々に記録されることを確認"""
+    _, cache = fake_tool
+    with patch.object(DependencyChecker, "check_gtk4", return_value=([], [])):
+        DependencyChecker.check_all(["xdotool"], gtk4=True, cache=cache)
+
+    assert cache.is_valid("xdotool+gtk4")
+    assert not cache.is_valid("xdotool")
+
+
+def test_check_all_reports_gtk4_packages(fake_tool):
+    """PyGObject・GTK4の不足がaptパッケージ名で報告されることを確認"""
+    _, cache = fake_tool
+    with patch.object(
+        DependencyChecker, "check_gtk4", return_value=(["python3-gi"], [])
+    ):
+        result = DependencyChecker.check_all(["xdotool"], gtk4=True, cache=cache)
+
+    assert result == (False, ["python3-gi"])
+
+
+def test_corrupt_cache_is_ignored(fake_tool):
+    """壊れたキャッシュファイルは無視して上書きすることを確認"""
+    _, cache = fake_tool
+    path = Path(cache.cache_path)
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json", encoding="utf-8")
+
+    assert not cache.is_valid("xdotool")
+    assert DependencyChecker.check_all(["xdotool"], cache=cache) == (True, [])
+    assert cache.is_valid("xdotool")
+
+
+def test_main_prints_missing(fake_tool, capsys):
+    """コマンドラインから不足しているものが1行に1つ出力されることを確認"""
+    exit_code = main(["--commands", "xdotool", "mini-text-missing-tool", "--no-cache"])
+
+    assert exit_code == 1
+    assert capsys.readouterr().out.splitlines() == ["mini-text-missing-tool"]
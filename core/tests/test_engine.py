@@ -0,0 +1,180 @@
+"""共通パッケージ（mini_text_core）のエンジンのpytestテスト"""
+
+import pytest
+from unittest.mock import Mock, patch
+from mini_text_core import engine as engine_module
+from mini_text_core.engine import Engine, create_engine
+from mini_text_core.services.clipboard_service import ClipboardService
+from mini_text_core.services.async_text_service import AsyncTextService
+from mini_text_core.services.text_service import TextService
+from mini_text_core.utils.persistent_command_executor import (
+    PersistentX11CommandExecutor,
+)
+from mini_text_core.utils.x11_command_executor import X11CommandExecutor
+
+
+@pytest.fixture
+def mock_executor():
+    """モックX11CommandExecutorのフィクスチャ"""
+    return Mock()
+
+
+@pytest.fixture
+def mock_config():
+    """モックConfigManagerのフィクスチャ"""
+    config = Mock()
+    config.is_adaptive_wait_enabled.return_value = False
+    config.is_primary_receive_enabled.return_value = False
+    config.get_title_workers.return_value = 1
+    config.get_title_deadline.return_value = None
+    return config
+
+
+def test_create_engine_uses_given_executor_and_backend(mock_executor, mock_config):
+    """指定したコマンド実行・ウィンドウ一覧バックエンドが使われることを確認"""
+    backend = Mock()
+    backend.get_window_list.return_value = [("1", "ウィンドウ1")]
+
+    with patch.object(engine_module, "create_xcb_window_backend") as create_backend:
+        engine = create_engine(mock_config, executor=mock_executor, backend=backend)
+
+    create_backend.assert_not_called()
+    assert engine.executor is mock_executor
+    assert engine.window_service.executor is mock_executor
+    assert engine.window_service.get_window_list() == [("1", "ウィンドウ1")]
+    assert engine.window_cache is None
+    assert engine.readiness is None
+
+
+def test_create_engine_falls_back_to_xdotool(mock_executor, mock_config):
+    """XCBが利用できない場合はバックエンドなし（xdotool）になることを確認"""
+    with patch.object(
+        engine_module, "create_xcb_window_backend", return_value=None
+    ):
+        engine = create_engine(mock_config, executor=mock_executor)
+
+    assert engine.backend is None
+    assert engine.window_service.backend is None
+
+
+def test_create_engine_creates_readiness_when_enabled(mock_executor, mock_config):
+    """適応的な待機が有効な場合は準備完了判定を作成することを確認"""
+    mock_config.is_adaptive_wait_enabled.return_value = True
+    probe = Mock()
+
+    with patch.object(
+        engine_module, "create_xcb_window_backend", return_value=None
+    ), patch.object(engine_module, "create_readiness_probe", return_value=probe):
+        engine = create_engine(mock_config, executor=mock_executor)
+
+    assert engine.readiness is probe
+    assert engine.create_text_service(Mock()).readiness is probe
+
+
+def test_create_engine_reads_primary_when_enabled(mock_executor, mock_config):
+    """PRIMARYの読み取りが有効な場合は送受信サービスに引き継ぐことを確認"""
+    mock_config.is_primary_receive_enabled.return_value = True
+
+    with patch.object(engine_module, "create_xcb_window_backend", return_value=None):
+        engine = create_engine(mock_config, executor=mock_executor)
+
+    assert engine.create_text_service(Mock()).read_primary
+    assert engine.create_async_text_service(Mock()).read_primary
+
+
+def test_create_engine_defaults_to_spawning_executor(mock_config):
+    """既定ではコマンドごとに起動するExecutorを送受信と一覧で共有することを確認"""
+    mock_config.get_title_workers.return_value = 4
+
+    with patch.object(engine_module, "create_xcb_window_backend", return_value=None):
+        engine = create_engine(mock_config)
+
+    assert type(engine.executor) is X11CommandExecutor
+    assert engine.window_service.executor is engine.executor
+    assert engine.window_service.max_workers == 4
+
+
+def test_create_engine_passes_title_deadline(mock_executor, mock_config):
+    """タイトル取得の制限時間が設定からウィンドウ一覧に渡されることを確認"""
+    mock_config.get_title_deadline.return_value = 1.5
+
+    with patch.object(engine_module, "create_xcb_window_backend", return_value=None):
+        engine = create_engine(mock_config, executor=mock_executor)
+
+    assert engine.window_service.deadline == 1.5
+
+
+def test_create_engine_fetches_titles_in_parallel(mock_config):
+    """常駐ワーカーを指定した場合も一覧は並列に実行できるExecutorを使うことを確認"""
+    mock_config.get_title_workers.return_value = 4
+    executor = PersistentX11CommandExecutor()
+
+    with patch.object(engine_module, "create_xcb_window_backend", return_value=None):
+        engine = create_engine(mock_config, executor=executor)
+    try:
+        assert engine.window_service.max_workers == 4
+        assert type(engine.window_service.executor) is X11CommandExecutor
+        # 送受信は指定した常駐ワーカーを使用
+        assert engine.executor is executor
+    finally:
+        engine.close()
+
+
+def test_create_engine_sequential_titles_share_executor(mock_config):
+    """同時実行数が1の場合は一覧も指定した常駐ワーカーを使うことを確認"""
+    executor = PersistentX11CommandExecutor()
+
+    with patch.object(engine_module, "create_xcb_window_backend", return_value=None):
+        engine = create_engine(mock_config, executor=executor)
+    try:
+        assert engine.window_service.max_workers == 1
+        assert engine.window_service.executor is executor
+    finally:
+        engine.close()
+
+
+def test_create_text_service_defaults_to_xclip(mock_executor):
+    """クリップボードサービス未指定の場合はxclipを使用することを確認"""
+    engine = Engine(mock_executor)
+
+    service = engine.create_text_service()
+
+    assert isinstance(service, TextService)
+    assert isinstance(service.clipboard_service, ClipboardService)
+    assert service.executor is mock_executor
+    assert service.window_service is engine.window_service
+
+
+def test_create_async_text_service_shares_backend(mock_executor):
+    """asyncio版サービスがエンジンのバックエンドを共有することを確認"""
+    backend = Mock()
+    clipboard = Mock()
+    engine = Engine(mock_executor, backend=backend)
+
+    service = engine.create_async_text_service(clipboard, clipboard_notifier=clipboard)
+
+    assert isinstance(service, AsyncTextService)
+    assert service.window_service.backend is backend
+    assert service.clipboard_notifier is clipboard
+
+
+def test_close_stops_cache_executor_and_readiness(mock_executor):
+    """closeでキャッシュ・常駐ワーカー・準備完了判定を停止することを確認"""
+    cache = Mock()
+    readiness = Mock()
+    engine = Engine(
+        mock_executor, backend=cache, window_cache=cache, readiness=readiness
+    )
+
+    engine.close()
+
+    cache.stop.assert_called_once()
+    mock_executor.close.assert_called_once()
+    readiness.close.assert_called_once()
+
+
+def test_close_without_close_method():
+    """closeを持たないコマンド実行ユーティリティでも停止できることを確認"""
+    engine = Engine(object())
+
+    engine.close()
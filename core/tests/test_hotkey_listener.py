@@ -0,0 +1,242 @@
+"""XcbHotkeyListenerのpytestテスト"""
+
+import pytest
+from unittest.mock import Mock
+from mini_text_core.services.hotkey_listener import (
+    IGNORED_MASKS,
+    XcbHotkeyListener,
+    parse_binding,
+)
+
+
+ROOT = 1
+MIN_KEYCODE = 8
+
+# キーコード -> キーシンボル（1キーコードあたり2列: 通常, Shift）
+KEYBOARD = {
+    54: (ord("c"), ord("C")),
+    55: (ord("v"), ord("V")),
+    36: (0xFF0D, 0),
+}
+
+
+class FakeReply:
+    """xcffibの返信の代用"""
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+class FakeCookie:
+    """xcffibのクッキーの代用"""
+
+    def __init__(self, reply=None, error=None):
+        self._reply = reply
+        self._error = error
+
+    def reply(self):
+        return self._reply
+
+    def check(self):
+        if self._error is not None:
+            raise self._error
+
+
+class FakeCore:
+    """xcffibのcoreリクエストの代用"""
+
+    def __init__(self):
+        self.grabs = []
+        self.ungrabs = []
+        # 他のアプリケーションが登録済みのキーコード
+        self.taken = set()
+        # QueryPointerで返す修飾キーのマスク（呼ばれるたびに先頭から取り出す）
+        self.masks = []
+
+    def GetKeyboardMapping(self, first_keycode, count):
+        keysyms = []
+        for keycode in range(first_keycode, first_keycode + count):
+            keysyms.extend(KEYBOARD.get(keycode, (0, 0)))
+        return FakeCookie(FakeReply(keysyms_per_keycode=2, keysyms=keysyms))
+
+    def GrabKeyChecked(self, owner_events, window, modifiers, key, pointer, keyboard):
+        if key in self.taken:
+            return FakeCookie(error=RuntimeError("BadAccess"))
+        self.grabs.append((key, modifiers))
+        return FakeCookie()
+
+    def UngrabKey(self, key, window, modifiers):
+        self.ungrabs.append((key, modifiers))
+
+    def QueryPointer(self, window):
+        mask = self.masks.pop(0) if self.masks else 0
+        return FakeCookie(FakeReply(mask=mask))
+
+
+class FakeConnection:
+    """xcffib.Connectionの代用"""
+
+    pref_screen = 0
+
+    def __init__(self):
+        self.core = FakeCore()
+
+    def get_setup(self):
+        return FakeReply(
+            roots=[FakeReply(root=ROOT)], min_keycode=MIN_KEYCODE, max_keycode=255
+        )
+
+    def get_file_descriptor(self):
+        return -1
+
+    def poll_for_event(self):
+        return None
+
+    def flush(self):
+        pass
+
+
+class KeyPressEvent:
+    """KeyPressイベントの代用（クラス名で判定される）"""
+
+    def __init__(self, detail, state, time=0):
+        self.detail = detail
+        self.state = state
+        self.time = time
+
+
+class KeyReleaseEvent(KeyPressEvent):
+    """KeyReleaseイベントの代用"""
+
+
+@pytest.fixture
+def connection():
+    """偽のX接続のフィクスチャ"""
+    return FakeConnection()
+
+
+@pytest.fixture
+def on_hotkey():
+    """ホットキーの通知先のフィクスチャ"""
+    return Mock()
+
+
+@pytest.fixture
+def listener(connection, on_hotkey, monkeypatch):
+    """XcbHotkeyListenerのフィクスチャ（イベント処理スレッドは開始しない）"""
+    listener = XcbHotkeyListener(
+        {"send": "ctrl+alt+v", "copy": "ctrl+alt+c"},
+        on_hotkey,
+        connection=connection,
+    )
+    monkeypatch.setattr(listener, "_event_loop", lambda: None)
+    yield listener
+    listener.stop()
+
+
+def test_parse_binding():
+    """キーの組み合わせを修飾キーのマスクとキーシンボルに変換できることを確認"""
+    assert parse_binding("ctrl+alt+v") == (4 | 8, ord("v"))
+    assert parse_binding("super+Return") == (64, 0xFF0D)
+    assert parse_binding("shift+F5") == (1, 0xFFC2)
+    assert parse_binding("ctrl+V") == (4, ord("v"))
+
+
+@pytest.mark.parametrize("binding", ["hyper+v", "ctrl+NoSuchKey", "ctrl+"])
+def test_parse_binding_invalid(binding):
+    """解析できないキーの組み合わせはValueErrorになることを確認"""
+    with pytest.raises(ValueError):
+        parse_binding(binding)
+
+
+def test_start_grabs_with_lock_modifiers(listener, connection):
+    """CapsLock・NumLockの組み合わせごとにルートウィンドウで登録することを確認"""
+    success, error_msg = listener.start()
+
+    assert success
+    assert error_msg == ""
+    assert sorted(connection.core.grabs) == sorted(
+        [(55, 12 | ignored) for ignored in IGNORED_MASKS]
+        + [(54, 12 | ignored) for ignored in IGNORED_MASKS]
+    )
+    assert listener.get_metrics()["actions"] == ["copy", "send"]
+
+
+def test_start_reports_taken_keys(listener, connection):
+    """他のアプリケーションが登録済みのキーはエラーに含め、残りで開始することを確認"""
+    connection.core.taken.add(54)
+
+    success, error_msg = listener.start()
+
+    assert success
+    assert "ctrl+alt+c" in error_msg
+    assert listener.get_metrics()["actions"] == ["send"]
+
+
+def test_start_fails_without_any_grab(connection, on_hotkey):
+    """1つも登録できない場合は開始しないことを確認"""
+    listener = XcbHotkeyListener(
+        {"send": "ctrl+alt+x"}, on_hotkey, connection=connection
+    )
+
+    success, error_msg = listener.start()
+
+    assert not success
+    assert "キーボード配列にないキーです" in error_msg
+    assert not listener.get_metrics()["running"]
+
+
+def test_key_press_notifies_after_modifiers_released(listener, connection, on_hotkey):
+    """修飾キーが離されてから操作名と押された時刻を通知することを確認"""
+    listener.start()
+    connection.core.masks = [12, 12, 0]
+
+    # NumLockが有効な状態で押された場合も反応する
+    listener.handle_event(KeyPressEvent(55, 12 | 16))
+
+    on_hotkey.assert_called_once()
+    action, pressed_at = on_hotkey.call_args.args
+    assert action == "send"
+    assert isinstance(pressed_at, float)
+    assert connection.core.masks == []
+
+
+def test_key_press_uses_dispatch(connection, on_hotkey, monkeypatch):
+    """dispatch指定時は通知をdispatch経由で行うことを確認"""
+    dispatched = []
+    listener = XcbHotkeyListener(
+        {"copy": "ctrl+alt+c"}, on_hotkey, dispatch=dispatched.append,
+        connection=connection,
+    )
+    monkeypatch.setattr(listener, "_event_loop", lambda: None)
+    listener.start()
+
+    listener.handle_event(KeyPressEvent(54, 12))
+
+    on_hotkey.assert_not_called()
+    dispatched[0]()
+    assert on_hotkey.call_args.args[0] == "copy"
+
+
+def test_auto_repeat_is_ignored(listener, on_hotkey):
+    """自動リピート（離した時刻と同じ時刻の押下）は通知しないことを確認"""
+    listener.start()
+
+    listener.handle_event(KeyPressEvent(55, 12, time=100))
+    listener.handle_event(KeyReleaseEvent(55, 12, time=150))
+    listener.handle_event(KeyPressEvent(55, 12, time=150))
+
+    assert on_hotkey.call_count == 1
+    assert listener.get_metrics()["press_count"] == 1
+
+
+def test_stop_ungrabs(listener, connection):
+    """停止時にすべての登録を解除することを確認"""
+    listener.start()
+    listener.stop()
+
+    assert sorted(connection.core.ungrabs) == sorted(
+        [(55, 12 | ignored) for ignored in IGNORED_MASKS]
+        + [(54, 12 | ignored) for ignored in IGNORED_MASKS]
+    )
+    assert listener.get_metrics()["actions"] == []
@@ -0,0 +1,198 @@
+"""JobQueueのpytestテスト"""
+
+import asyncio
+import threading
+
+import pytest
+from mini_text_core.utils.async_runner import AsyncRunner
+from mini_text_core.utils.job_queue import Job, JobQueue
+
+
+class Blocker:
+    """解放されるまで実行中のままになるジョブ"""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    async def __call__(self, progress):
+        self.started.set()
+        while not self.release.is_set():
+            await asyncio.sleep(0.005)
+        return "blocker"
+
+
+@pytest.fixture
+def runner():
+    """専用スレッドで動き、コールバックを同期的に実行するAsyncRunnerのフィクスチャ"""
+    runner = AsyncRunner(lambda func: func())
+    yield runner
+    runner.close()
+
+
+@pytest.fixture
+def queue(runner):
+    """JobQueueのフィクスチャ"""
+    return JobQueue(runner, max_pending=2)
+
+
+def make_job(value, log=None):
+    """値を返すジョブを作成"""
+
+    async def job(progress):
+        if log is not None:
+            log.append(("start", value))
+        await asyncio.sleep(0.01)
+        if log is not None:
+            log.append(("end", value))
+        return value
+
+    return job
+
+
+def wait_until(condition, timeout=1.0):
+    """条件が満たされるまで待機"""
+    event = threading.Event()
+    for _ in range(int(timeout / 0.005)):
+        if condition():
+            return True
+        event.wait(0.005)
+    return condition()
+
+
+def test_jobs_run_one_at_a_time_in_order(queue):
+    """ジョブが投入順に1件ずつ実行されることを確認"""
+    log = []
+    results = []
+
+    queue.submit(make_job(1, log), on_done=results.append)
+    queue.submit(make_job(2, log), on_done=results.append)
+
+    assert wait_until(lambda: len(results) == 2)
+    assert results == [1, 2]
+    assert log == [("start", 1), ("end", 1), ("start", 2), ("end", 2)]
+
+
+def test_pending_jobs_with_same_key_are_coalesced(queue):
+    """同じキーの待機中のジョブが最新の1件にまとめられることを確認"""
+    blocker = Blocker()
+    results = []
+
+    queue.submit(blocker, on_done=results.append, key="send")
+    assert blocker.started.wait(1)
+    old = queue.submit(make_job("old"), on_done=results.append, key="send")
+    new = queue.submit(make_job("new"), on_done=results.append, key="send")
+    blocker.release.set()
+
+    assert wait_until(lambda: len(results) == 2)
+    assert results == ["blocker", "new"]
+    assert old.state == Job.CANCELLED
+    assert old.coalesced == 0
+    assert new.coalesced == 1
+    assert queue.get_metrics()["coalesced_count"] == 1
+
+
+def test_pending_jobs_with_different_keys_are_not_coalesced(runner):
+    """内容の異なるキーのジョブはまとめずにすべて実行することを確認"""
+    queue = JobQueue(runner, max_pending=3)
+    blocker = Blocker()
+    results = []
+
+    queue.submit(blocker, on_done=results.append)
+    assert blocker.started.wait(1)
+    queue.submit(make_job("a"), on_done=results.append, key=("send", ("0x1",), "a"))
+    queue.submit(make_job("b"), on_done=results.append, key=("send", ("0x1",), "b"))
+    queue.submit(make_job("c"), on_done=results.append, key=("send", ("0x2",), "b"))
+    blocker.release.set()
+
+    assert wait_until(lambda: len(results) == 4)
+    assert results == ["blocker", "a", "b", "c"]
+    assert queue.get_metrics()["coalesced_count"] == 0
+
+
+def test_submit_rejected_when_queue_is_full(queue):
+    """待機中のジョブが上限に達した場合は投入を拒否することを確認"""
+    blocker = Blocker()
+
+    queue.submit(blocker)
+    assert blocker.started.wait(1)
+    assert queue.submit(make_job(1)) is not None
+    assert queue.submit(make_job(2)) is not None
+
+    assert queue.submit(make_job(3)) is None
+    assert queue.get_metrics()["rejected_count"] == 1
+
+    blocker.release.set()
+    assert wait_until(lambda: queue.get_queue_depth() == 0)
+
+
+def test_cancel_all(queue):
+    """待機中・実行中のジョブがすべてキャンセルされることを確認"""
+    blocker = Blocker()
+    results = []
+
+    running = queue.submit(blocker, on_done=results.append)
+    assert blocker.started.wait(1)
+    pending = queue.submit(make_job(1), on_done=results.append)
+
+    assert queue.cancel_all() == 2
+
+    assert queue.get_queue_depth() == 0
+    assert running.state == Job.CANCELLED
+    assert pending.state == Job.CANCELLED
+    assert queue.get_metrics()["cancelled_count"] == 2
+
+    # キャンセル後に投入したジョブは実行される
+    queue.submit(make_job(2), on_done=results.append)
+    assert wait_until(lambda: results == [2])
+
+
+def test_progress_is_dispatched(queue):
+    """進捗がon_progressに渡されることを確認"""
+    progress_log = []
+    done = threading.Event()
+
+    async def job(progress):
+        for i in range(3):
+            progress(i + 1, 3)
+        return None
+
+    queue.submit(
+        job,
+        on_done=lambda result: done.set(),
+        on_progress=lambda d, t: progress_log.append((d, t)),
+    )
+
+    assert done.wait(1)
+    assert progress_log == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_error_is_passed_to_on_error(queue):
+    """例外がon_errorに渡されることを確認"""
+    errors = []
+
+    async def job(progress):
+        raise RuntimeError("失敗")
+
+    queue.submit(job, on_error=errors.append)
+
+    assert wait_until(lambda: len(errors) == 1)
+    assert str(errors[0]) == "失敗"
+    assert wait_until(lambda: queue.get_metrics()["failed_count"] == 1)
+
+
+def test_get_metrics(queue):
+    """メトリクスの集計を確認"""
+    results = []
+
+    queue.submit(make_job(1), on_done=results.append)
+    queue.submit(make_job(2), on_done=results.append)
+    assert wait_until(lambda: queue.get_metrics()["completed_count"] == 2)
+
+    metrics = queue.get_metrics()
+    assert metrics["queue_depth"] == 0
+    assert metrics["running"] is False
+    assert metrics["submitted_count"] == 2
+    assert metrics["failed_count"] == 0
+    assert metrics["average_run_time"] > 0
+    assert metrics["max_wait_time"] >= metrics["average_wait_time"]
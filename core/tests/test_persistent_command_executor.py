@@ -0,0 +1,134 @@
+"""PersistentX11CommandExecutorのpytestテスト"""
+
+import pytest
+from mini_text_core.utils.persistent_command_executor import PersistentX11CommandExecutor
+
+
+@pytest.fixture
+def executor():
+    """PersistentX11CommandExecutorのフィクスチャ"""
+    executor = PersistentX11CommandExecutor()
+    yield executor
+    executor.close()
+
+
+def test_execute_simple_command(executor):
+    """単純なコマンド実行が成功することを確認"""
+    success, stdout, stderr = executor.execute(["echo", "test"])
+
+    assert success
+    assert stdout == "test\n"
+    assert stderr == ""
+
+
+def test_worker_is_reused(executor):
+    """複数回の実行で同じワーカープロセスが使われることを確認"""
+    executor.execute(["echo", "1"])
+    pid = executor._process.pid
+
+    success, stdout, stderr = executor.execute(["echo", "2"])
+
+    assert success
+    assert stdout == "2\n"
+    assert executor._process.pid == pid
+
+
+def test_output_without_trailing_newline(executor):
+    """改行で終わらない出力がそのまま返されることを確認"""
+    success, stdout, stderr = executor.execute(["printf", "a b"])
+
+    assert success
+    assert stdout == "a b"
+
+
+def test_arguments_are_quoted(executor):
+    """空白や記号を含む引数がシェルに解釈されないことを確認"""
+    success, stdout, stderr = executor.execute(["echo", "テスト; $HOME 'x'"])
+
+    assert success
+    assert stdout == "テスト; $HOME 'x'\n"
+
+
+def test_execute_command_with_error(executor):
+    """エラーを返すコマンドが適切に処理されることを確認"""
+    success, stdout, stderr = executor.execute(["ls", "/nonexistent_directory_12345"])
+
+    assert not success
+    assert stderr != ""
+
+    # 失敗後もワーカーは使い続けられる
+    success, stdout, stderr = executor.execute(["echo", "ok"])
+    assert success
+    assert stdout == "ok\n"
+
+
+def test_execute_nonexistent_command(executor):
+    """存在しないコマンドの実行が適切に失敗することを確認"""
+    success, stdout, stderr = executor.execute(["nonexistent_command_12345"])
+
+    assert not success
+    assert "見つかりません" in stderr
+
+
+def test_exit_status_127_is_not_command_not_found(executor):
+    """コマンド自身の終了コード127を「見つからない」と扱わないことを確認"""
+    success, stdout, stderr = executor.execute(["sh", "-c", "echo 失敗 >&2; exit 127"])
+
+    assert not success
+    assert stderr == "失敗\n"
+
+
+def test_execute_with_input_data(executor):
+    """標準入力を使用したコマンドは単発実行で処理されることを確認"""
+    success, stdout, stderr = executor.execute(["cat"], input_data="テスト入力")
+
+    assert success
+    assert stdout == "テスト入力"
+    assert executor._process is None
+
+
+def test_restart_after_crash(executor):
+    """ワーカーが落ちた場合に透過的に再起動されることを確認"""
+    executor.execute(["echo", "1"])
+    old_process = executor._process
+    old_process.kill()
+    old_process.wait()
+
+    success, stdout, stderr = executor.execute(["echo", "2"])
+
+    assert success
+    assert stdout == "2\n"
+    assert executor._process is not old_process
+
+
+def test_worker_exit_during_command(executor):
+    """コマンド実行中にワーカーが終了した場合に失敗を返し、次回は再起動することを確認"""
+    success, stdout, stderr = executor.execute(["exit"])
+
+    assert not success
+    assert executor._process is None
+
+    success, stdout, stderr = executor.execute(["echo", "ok"])
+    assert success
+
+
+def test_timeout(executor, monkeypatch):
+    """タイムアウト時にワーカーが停止されることを確認"""
+    monkeypatch.setattr(executor, "TIMEOUT", 0.2)
+
+    success, stdout, stderr = executor.execute(["sleep", "5"])
+
+    assert not success
+    assert "タイムアウト" in stderr
+    assert executor._process is None
+
+
+def test_close(executor):
+    """close()でワーカーが停止することを確認"""
+    executor.execute(["echo", "1"])
+    process = executor._process
+
+    executor.close()
+
+    assert executor._process is None
+    assert process.poll() is not None
@@ -0,0 +1,187 @@
+"""XcbReadinessProbeのpytestテスト"""
+
+import struct
+import time
+
+import pytest
+from unittest.mock import Mock
+from mini_text_core.services import readiness_probe
+from mini_text_core.services.readiness_probe import XcbReadinessProbe
+
+
+ROOT = 1
+ATOMS = {"_NET_ACTIVE_WINDOW": 100, "PRIMARY": 1, "CLIPBOARD": 200}
+
+
+class FakeValue:
+    """xcffib.Listの代用"""
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def to_atoms(self):
+        return struct.unpack(f"{len(self.data) // 4}I", self.data)
+
+
+class FakeReply:
+    """xcffibの返信の代用"""
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+class FakeCookie:
+    """xcffibのクッキーの代用"""
+
+    def __init__(self, reply):
+        self._reply = reply
+
+    def reply(self):
+        return self._reply
+
+
+class SelectionNotifyEvent:
+    """XFixesSelectionNotifyイベントの代用（クラス名で判定される）"""
+
+    def __init__(self, selection):
+        self.selection = selection
+
+
+class FakeCore:
+    """xcffibのcoreリクエストの代用"""
+
+    def __init__(self):
+        self.active_window = 0
+        self.focus = 0
+        # GetInputFocusが呼ばれるたびに実行されるフック
+        self.on_poll = None
+
+    def InternAtom(self, only_if_exists, name_len, name):
+        return FakeCookie(FakeReply(atom=ATOMS[name]))
+
+    def GetProperty(self, delete, window, prop, prop_type, offset, length):
+        data = struct.pack("I", self.active_window)
+        return FakeCookie(FakeReply(format=32, value_len=1, value=FakeValue(data)))
+
+    def GetInputFocus(self):
+        if self.on_poll is not None:
+            self.on_poll()
+        return FakeCookie(FakeReply(focus=self.focus))
+
+
+class FakeConnection:
+    """xcffib.Connectionの代用"""
+
+    pref_screen = 0
+
+    def __init__(self):
+        self.core = FakeCore()
+        self.xfixes = Mock()
+        self.events = []
+
+    def __call__(self, key):
+        return self.xfixes
+
+    def get_setup(self):
+        return FakeReply(roots=[FakeReply(root=ROOT)])
+
+    def get_file_descriptor(self):
+        return -1
+
+    def poll_for_event(self):
+        return self.events.pop(0) if self.events else None
+
+    def flush(self):
+        pass
+
+
+@pytest.fixture
+def connection(monkeypatch):
+    """偽のX接続のフィクスチャ（xcffib.xfixesが未インストールでも動作させる）"""
+    monkeypatch.setattr(readiness_probe, "xcffib", Mock())
+    return FakeConnection()
+
+
+@pytest.fixture
+def probe(connection):
+    """XcbReadinessProbeのフィクスチャ"""
+    return XcbReadinessProbe(connection=connection)
+
+
+def test_subscribes_selection_owner_changes(probe, connection):
+    """PRIMARY/CLIPBOARDの所有者の設定を購読することを確認"""
+    connection.xfixes.QueryVersion.assert_called_once()
+    selected = [call.args[1] for call in connection.xfixes.SelectSelectionInput.call_args_list]
+    assert selected == [ATOMS["PRIMARY"], ATOMS["CLIPBOARD"]]
+
+
+def test_wait_for_active_window_returns_immediately(probe, connection):
+    """既にアクティブな場合は待たずにTrueを返すことを確認"""
+    connection.core.active_window = 12345
+
+    start = time.monotonic()
+    assert probe.wait_for_active_window("12345", 5.0)
+    assert time.monotonic() - start < 0.5
+
+
+def test_wait_for_active_window_detects_input_focus(probe, connection):
+    """_NET_ACTIVE_WINDOWがなくても入力フォーカスで判定することを確認"""
+    connection.core.focus = 12345
+
+    assert probe.wait_for_active_window("12345", 1.0)
+
+
+def test_wait_for_active_window_polls_until_active(probe, connection):
+    """アクティブになるまでポーリングすることを確認"""
+    polls = []
+
+    def on_poll():
+        polls.append(1)
+        if len(polls) == 3:
+            connection.core.focus = 12345
+
+    connection.core.on_poll = on_poll
+
+    assert probe.wait_for_active_window("12345", 5.0)
+    assert len(polls) == 3
+
+
+def test_wait_for_active_window_timeout(probe, connection):
+    """上限時間内にアクティブにならない場合はFalseを返すことを確認"""
+    connection.core.active_window = 99999
+
+    start = time.monotonic()
+    assert not probe.wait_for_active_window("12345", 0.05)
+    assert time.monotonic() - start >= 0.05
+
+
+def test_wait_for_selection_change(probe, connection):
+    """mark以降の所有者設定を検知することを確認"""
+    mark = probe.mark_selection("CLIPBOARD")
+    connection.events.append(SelectionNotifyEvent(ATOMS["CLIPBOARD"]))
+
+    assert probe.wait_for_selection_change("CLIPBOARD", mark, 1.0)
+
+
+def test_mark_selection_ignores_earlier_events(probe, connection, monkeypatch):
+    """mark前の通知と他の選択範囲の通知では完了扱いにならないことを確認"""
+    connection.events.append(SelectionNotifyEvent(ATOMS["CLIPBOARD"]))
+    mark = probe.mark_selection("CLIPBOARD")
+    connection.events.append(SelectionNotifyEvent(ATOMS["PRIMARY"]))
+
+    waits = []
+    monkeypatch.setattr(
+        readiness_probe.select, "select", lambda r, w, x, timeout: waits.append(timeout)
+    )
+
+    assert not probe.wait_for_selection_change("CLIPBOARD", mark, 0.05)
+    assert waits
+    assert probe.mark_selection("PRIMARY") == 1
+
+
+def test_clipboard_change_notifier(probe, connection):
+    """mark_change/wait_for_changeがCLIPBOARDの通知を使用することを確認"""
+    mark = probe.mark_change()
+    connection.events.append(SelectionNotifyEvent(ATOMS["CLIPBOARD"]))
+
+    assert probe.wait_for_change(mark, 1.0)
@@ -0,0 +1,634 @@
+"""TextServiceのpytestテスト"""
+
+import pytest
+from unittest.mock import Mock, call, patch
+from mini_text_core.services.text_service import TextService
+from mini_text_core.utils.timing import Tracer
+
+
+@pytest.fixture
+def mock_executor():
+    """モックExecutorのフィクスチャ"""
+    return Mock()
+
+
+@pytest.fixture
+def mock_window_service():
+    """モックWindowServiceのフィクスチャ"""
+    return Mock()
+
+
+@pytest.fixture
+def mock_clipboard_service():
+    """モックClipboardServiceのフィクスチャ"""
+    return Mock()
+
+
+@pytest.fixture
+def service(mock_executor, mock_window_service, mock_clipboard_service):
+    """TextServiceのフィクスチャ"""
+    return TextService(
+        window_service=mock_window_service,
+        clipboard_service=mock_clipboard_service,
+        executor=mock_executor,
+    )
+
+
+def test_send_text_success(service, mock_executor, mock_window_service, mock_clipboard_service):
+    """テキスト送信が成功することを確認"""
+    # 各サービスのモック戻り値を設定
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_window_service.activate_window.return_value = (True, "")
+    mock_executor.execute.return_value = (True, "", "")
+
+    success, error_msg = service.send_text("12345", "テストテキスト", 0.1, 0.1)
+
+    # 成功することを確認
+    assert success
+    assert error_msg == ""
+
+    # 各サービスが正しく呼ばれたことを確認
+    mock_clipboard_service.copy_to_clipboard.assert_called_once_with("テストテキスト")
+    mock_window_service.activate_window.assert_called_once_with("12345", 0.1)
+    mock_executor.execute.assert_called_once_with(["xdotool", "key", "ctrl+v"])
+
+
+def test_send_text_clipboard_failure(service, mock_window_service, mock_clipboard_service):
+    """クリップボードコピー失敗時の処理を確認"""
+    # クリップボードコピーが失敗
+    mock_clipboard_service.copy_to_clipboard.return_value = (False, "クリップボードエラー")
+
+    success, error_msg = service.send_text("12345", "テストテキスト", 0.1, 0.1)
+
+    # 失敗することを確認
+    assert not success
+    assert "クリップボードエラー" in error_msg
+
+    # ウィンドウアクティベートは実行されないことを確認
+    mock_window_service.activate_window.assert_not_called()
+
+
+def test_send_text_activate_failure(service, mock_executor, mock_window_service, mock_clipboard_service):
+    """ウィンドウアクティベート失敗時の処理を確認"""
+    # クリップボードコピーは成功、アクティベートが失敗
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_window_service.activate_window.return_value = (False, "ウィンドウエラー")
+
+    success, error_msg = service.send_text("12345", "テストテキスト", 0.1, 0.1)
+
+    # 失敗することを確認
+    assert not success
+    assert "ウィンドウエラー" in error_msg
+
+    # ペースト操作は実行されないことを確認
+    mock_executor.execute.assert_not_called()
+
+
+def test_send_text_paste_failure(service, mock_executor, mock_window_service, mock_clipboard_service):
+    """ペースト操作失敗時の処理を確認"""
+    # クリップボードとアクティベートは成功、ペーストが失敗
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_window_service.activate_window.return_value = (True, "")
+    mock_executor.execute.return_value = (False, "", "ペーストエラー")
+
+    success, error_msg = service.send_text("12345", "テストテキスト", 0.1, 0.1)
+
+    # 失敗することを確認
+    assert not success
+    assert "ペースト操作に失敗" in error_msg
+
+
+def test_receive_text_success(service, mock_executor, mock_clipboard_service):
+    """テキスト受信が成功することを確認"""
+    # 各操作のモック戻り値を設定
+    mock_executor.execute.return_value = (True, "", "")
+    mock_clipboard_service.get_from_clipboard.return_value = (True, "受信したテキスト", "")
+
+    success, text, error_msg = service.receive_text(0.0)
+
+    # 成功することを確認
+    assert success
+    assert text == "受信したテキスト"
+    assert error_msg == ""
+
+    # Ctrl+A と Ctrl+C が実行されたことを確認
+    assert mock_executor.execute.call_count == 2
+    mock_clipboard_service.get_from_clipboard.assert_called_once()
+
+
+def test_receive_text_select_all_failure(service, mock_executor):
+    """全選択操作失敗時の処理を確認"""
+    # Ctrl+Aが失敗
+    mock_executor.execute.return_value = (False, "", "全選択エラー")
+
+    success, text, error_msg = service.receive_text(0.0)
+
+    # 失敗することを確認
+    assert not success
+    assert text == ""
+    assert "全選択操作に失敗" in error_msg
+
+
+def test_receive_text_copy_failure(service, mock_executor):
+    """コピー操作失敗時の処理を確認"""
+    # Ctrl+Aは成功、Ctrl+Cが失敗
+    mock_executor.execute.side_effect = [
+        (True, "", ""),  # Ctrl+A成功
+        (False, "", "コピーエラー"),  # Ctrl+C失敗
+    ]
+
+    success, text, error_msg = service.receive_text(0.0)
+
+    # 失敗することを確認
+    assert not success
+    assert text == ""
+    assert "コピー操作に失敗" in error_msg
+
+
+def test_receive_text_clipboard_get_failure(service, mock_executor, mock_clipboard_service):
+    """クリップボード取得失敗時の処理を確認"""
+    # Ctrl+A, Ctrl+Cは成功、クリップボード取得が失敗
+    mock_executor.execute.return_value = (True, "", "")
+    mock_clipboard_service.get_from_clipboard.return_value = (False, "", "クリップボード取得エラー")
+
+    success, text, error_msg = service.receive_text(0.0)
+
+    # 失敗することを確認
+    assert not success
+    assert text == ""
+    assert "クリップボード取得エラー" in error_msg
+
+
+def test_send_text_with_readiness(mock_executor, mock_window_service, mock_clipboard_service):
+    """readiness指定時は固定待機せず、アクティブになるまで待つことを確認"""
+    readiness = Mock()
+    service = TextService(
+        mock_window_service, mock_clipboard_service, mock_executor, readiness=readiness
+    )
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_window_service.activate_window.return_value = (True, "")
+    mock_executor.execute.return_value = (True, "", "")
+
+    success, error_msg = service.send_text("12345", "テストテキスト", 0.3, 0.3)
+
+    assert success
+    mock_window_service.activate_window.assert_called_once_with("12345", 0)
+    readiness.wait_for_active_window.assert_called_once_with("12345", 0.3)
+
+
+def test_send_text_with_readiness_timeout_still_pastes(
+    mock_executor, mock_window_service, mock_clipboard_service
+):
+    """アクティブ化を検知できなくても上限到達後にペーストすることを確認"""
+    readiness = Mock()
+    readiness.wait_for_active_window.return_value = False
+    service = TextService(
+        mock_window_service, mock_clipboard_service, mock_executor, readiness=readiness
+    )
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_window_service.activate_window.return_value = (True, "")
+    mock_executor.execute.return_value = (True, "", "")
+
+    success, error_msg = service.send_text("12345", "テストテキスト", 0.3, 0.3)
+
+    assert success
+    mock_executor.execute.assert_called_once_with(["xdotool", "key", "ctrl+v"])
+
+
+def test_receive_text_with_readiness(mock_executor, mock_window_service, mock_clipboard_service):
+    """readiness指定時はPRIMARY・CLIPBOARDの更新を待つことを確認"""
+    readiness = Mock()
+    readiness.mark_selection.side_effect = lambda selection: {"PRIMARY": 3, "CLIPBOARD": 7}[selection]
+    service = TextService(
+        mock_window_service, mock_clipboard_service, mock_executor, readiness=readiness
+    )
+    mock_executor.execute.return_value = (True, "", "")
+    mock_clipboard_service.get_from_clipboard.return_value = (True, "受信したテキスト", "")
+
+    with patch("mini_text_core.services.text_service.time.sleep") as mock_sleep:
+        success, text, error_msg = service.receive_text(0.3)
+
+    assert success
+    assert text == "受信したテキスト"
+    mock_sleep.assert_not_called()
+    assert readiness.wait_for_selection_change.call_args_list == [
+        call("PRIMARY", 3, 0.3),
+        call("CLIPBOARD", 7, 0.3),
+    ]
+
+
+def test_receive_text_with_clipboard_notifier(mock_executor, mock_window_service, mock_clipboard_service):
+    """クリップボードの更新を検知した時点で取得することを確認"""
+    notifier = Mock()
+    notifier.mark_change.return_value = 5
+    notifier.wait_for_change.return_value = True
+    service = TextService(
+        mock_window_service,
+        mock_clipboard_service,
+        mock_executor,
+        clipboard_notifier=notifier,
+    )
+    mock_executor.execute.return_value = (True, "", "")
+    mock_clipboard_service.get_from_clipboard.return_value = (True, "受信したテキスト", "")
+
+    with patch("mini_text_core.services.text_service.time.sleep") as mock_sleep:
+        success, text, error_msg = service.receive_text(0.3)
+
+    assert success
+    assert text == "受信したテキスト"
+    # 全選択後の待機のみ固定時間
+    mock_sleep.assert_called_once_with(0.3)
+    notifier.wait_for_change.assert_called_once_with(5, TextService.RECEIVE_DEADLINE)
+
+
+def test_receive_text_clipboard_not_changed(mock_executor, mock_window_service, mock_clipboard_service):
+    """期限内にクリップボードが更新されない場合は古い内容を返さないことを確認"""
+    notifier = Mock()
+    notifier.mark_change.return_value = 0
+    notifier.wait_for_change.return_value = False
+    service = TextService(
+        mock_window_service,
+        mock_clipboard_service,
+        mock_executor,
+        clipboard_notifier=notifier,
+    )
+    mock_executor.execute.return_value = (True, "", "")
+
+    with patch("mini_text_core.services.text_service.time.sleep"):
+        success, text, error_msg = service.receive_text(5.0)
+
+    assert not success
+    assert text == ""
+    assert "更新されませんでした" in error_msg
+    # key_waitの方が長い場合はkey_waitを期限とする
+    notifier.wait_for_change.assert_called_once_with(0, 5.0)
+    mock_clipboard_service.get_from_clipboard.assert_not_called()
+
+
+def test_send_text_many_copies_once(service, mock_executor, mock_window_service, mock_clipboard_service):
+    """クリップボードへのコピーは1回で、送信先ごとにアクティブ化とペーストを行うことを確認"""
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_window_service.activate_window.side_effect = [
+        (True, ""),
+        (False, "ウィンドウエラー"),
+        (True, ""),
+    ]
+    mock_executor.execute.return_value = (True, "", "")
+
+    results = service.send_text_many(["1", "2", "3"], "テストテキスト", 0.1, 0.1)
+
+    assert results == [
+        ("1", True, ""),
+        ("2", False, "ウィンドウエラー"),
+        ("3", True, ""),
+    ]
+    mock_clipboard_service.copy_to_clipboard.assert_called_once_with("テストテキスト")
+    assert mock_window_service.activate_window.call_args_list == [
+        call("1", 0.1),
+        call("2", 0.1),
+        call("3", 0.1),
+    ]
+    # 失敗した送信先ではペーストしない
+    assert mock_executor.execute.call_count == 2
+
+
+def test_send_text_many_clipboard_failure(service, mock_window_service, mock_clipboard_service):
+    """クリップボードコピー失敗時は全送信先が失敗になることを確認"""
+    mock_clipboard_service.copy_to_clipboard.return_value = (False, "クリップボードエラー")
+
+    results = service.send_text_many(["1", "2"], "テストテキスト", 0.1, 0.1)
+
+    assert results == [
+        ("1", False, "クリップボードエラー"),
+        ("2", False, "クリップボードエラー"),
+    ]
+    mock_window_service.activate_window.assert_not_called()
+
+
+def test_send_text_records_phase_spans(mock_executor, mock_window_service, mock_clipboard_service):
+    """送信の処理段階ごとに所要時間が記録されることを確認"""
+    tracer = Tracer(enabled=True)
+    service = TextService(
+        mock_window_service, mock_clipboard_service, mock_executor, tracer=tracer
+    )
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_window_service.activate_window.return_value = (True, "")
+    mock_executor.execute.return_value = (True, "", "")
+
+    service.send_text("12345", "テスト", 0.1, 0.1)
+
+    spans = tracer.get_spans()
+    assert [span["name"] for span in spans] == [
+        "send_text.copy", "send_text.activate", "send_text.paste", "send_text"
+    ]
+    assert spans[-1]["attrs"] == {"chars": 3, "success": True}
+
+
+def test_receive_text_records_phase_spans(mock_executor, mock_window_service, mock_clipboard_service):
+    """受信の処理段階ごとに所要時間が記録されることを確認"""
+    tracer = Tracer(enabled=True)
+    service = TextService(
+        mock_window_service, mock_clipboard_service, mock_executor, tracer=tracer
+    )
+    mock_executor.execute.return_value = (True, "", "")
+    mock_clipboard_service.get_from_clipboard.return_value = (True, "取得", "")
+
+    with patch("mini_text_core.services.text_service.time.sleep"):
+        service.receive_text(0.1)
+
+    assert list(tracer.get_histograms()) == [
+        "receive_text",
+        "receive_text.copy",
+        "receive_text.read",
+        "receive_text.select_all",
+        "receive_text.wait_clipboard",
+        "receive_text.wait_primary",
+    ]
+
+
+def test_send_text_chained(mock_executor, mock_window_service, mock_clipboard_service):
+    """chain_commands指定時はアクティブ化・待機・ペーストを1回の起動で行うことを確認"""
+    service = TextService(
+        mock_window_service, mock_clipboard_service, mock_executor, chain_commands=True
+    )
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_executor.execute.return_value = (True, "", "")
+
+    success, error_msg = service.send_text("12345", "テストテキスト", 0.3, 0.1)
+
+    assert success
+    mock_window_service.activate_window.assert_not_called()
+    mock_executor.execute.assert_called_once_with(
+        [
+            "xdotool", "windowactivate", "--sync", "12345",
+            "sleep", "0.3", "key", "ctrl+v",
+        ]
+    )
+
+
+def test_send_text_chained_with_readiness(
+    mock_executor, mock_window_service, mock_clipboard_service
+):
+    """readiness指定時はアクティブになるまでの待機の前後で2回起動することを確認"""
+    readiness = Mock()
+    readiness.wait_for_active_window.return_value = True
+    service = TextService(
+        mock_window_service,
+        mock_clipboard_service,
+        mock_executor,
+        readiness=readiness,
+        chain_commands=True,
+    )
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_executor.execute.return_value = (True, "", "")
+
+    success, _ = service.send_text("12345", "テストテキスト", 0.3, 0.1)
+
+    assert success
+    readiness.wait_for_active_window.assert_called_once_with("12345", 0.3)
+    assert mock_executor.execute.call_args_list == [
+        call(["xdotool", "windowactivate", "--sync", "12345"]),
+        call(["xdotool", "key", "ctrl+v"]),
+    ]
+
+
+def test_send_text_chained_activate_failure(
+    mock_executor, mock_window_service, mock_clipboard_service
+):
+    """連結時もアクティブ化の失敗を区別して報告することを確認"""
+    service = TextService(
+        mock_window_service, mock_clipboard_service, mock_executor, chain_commands=True
+    )
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_executor.execute.side_effect = [
+        (False, "", "BadWindow"),
+        (False, "", ""),  # getactivewindow
+    ]
+
+    success, error_msg = service.send_text("12345", "テストテキスト", 0.3, 0.1)
+
+    assert not success
+    assert error_msg == "ウィンドウのアクティブ化に失敗しました: BadWindow"
+
+
+def test_receive_text_chained(mock_executor, mock_window_service, mock_clipboard_service):
+    """chain_commands指定時は全選択・待機・コピーを1回の起動で行うことを確認"""
+    service = TextService(
+        mock_window_service, mock_clipboard_service, mock_executor, chain_commands=True
+    )
+    mock_executor.execute.return_value = (True, "", "")
+    mock_clipboard_service.get_from_clipboard.return_value = (True, "取得", "")
+
+    with patch("time.sleep") as mock_sleep:
+        success, text, error_msg = service.receive_text(0.2)
+
+    assert success
+    assert text == "取得"
+    # 全選択後の待機はxdotoolのsleepとして連結し、Python側ではコピー後のみ待機
+    mock_sleep.assert_called_once_with(0.2)
+    mock_executor.execute.assert_called_once_with(
+        ["xdotool", "key", "ctrl+a", "sleep", "0.2", "key", "ctrl+c"]
+    )
+
+
+def test_send_text_sequence_activates_once(
+    mock_executor, mock_window_service, mock_clipboard_service
+):
+    """まとめて送信はアクティブ化を1回だけ行い、テキストごとにペーストすることを確認"""
+    service = TextService(
+        mock_window_service, mock_clipboard_service, mock_executor, chain_commands=True
+    )
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_executor.execute.return_value = (True, "", "")
+    progress = Mock()
+
+    results = service.send_text_sequence(
+        "12345", ["一", "二", "三"], 0.3, 0.1, ["Return"], progress
+    )
+
+    assert results == [(True, ""), (True, ""), (True, "")]
+    assert mock_clipboard_service.copy_to_clipboard.call_args_list == [
+        call("一"), call("二"), call("三")
+    ]
+    assert mock_executor.execute.call_args_list == [
+        call(
+            [
+                "xdotool", "windowactivate", "--sync", "12345", "sleep", "0.3",
+                "key", "ctrl+v", "sleep", "0.1", "key", "Return",
+            ]
+        ),
+        call(["xdotool", "key", "ctrl+v", "sleep", "0.1", "key", "Return"]),
+        # 最後のテキストの後は待機・区切りのキー入力をしない
+        call(["xdotool", "key", "ctrl+v"]),
+    ]
+    assert progress.call_args_list == [call(1, 3), call(2, 3), call(3, 3)]
+
+
+def test_send_text_sequence_without_chain(
+    mock_executor, mock_window_service, mock_clipboard_service
+):
+    """連結しない場合は操作ごとに起動し、待機はPython側で行うことを確認"""
+    service = TextService(mock_window_service, mock_clipboard_service, mock_executor)
+    mock_clipboard_service.copy_to_clipboard.return_value = (True, "")
+    mock_executor.execute.return_value = (True, "", "")
+
+    with patch("time.sleep") as mock_sleep:
+        results = service.send_text_sequence("12345", ["一", "二"], 0.3, 0.1)
+
+    assert results == [(True, ""), (True, "")]
+    assert mock_executor.execute.call_args_list == [
+        call(["xdotool", "windowactivate", "--sync", "12345"]),
+        call(["xdotool", "key", "ctrl+v"]),
+        call(["xdotool", "key", "ctrl+v"]),
+    ]
+    assert mock_sleep.call_args_list == [call(0.3), call(0.1)]
+
+
+def test_send_text_sequence_stops_after_failure(
+    mock_executor, mock_window_service, mock_clipboard_service
+):
+    """途中で失敗した場合は残りのテキストを送信しないことを確認"""
+    service = TextService(
+        mock_window_service, mock_clipboard_service, mock_executor, chain_commands=True
+    )
+    mock_clipboard_service.copy_to_clipboard.side_effect = [
+        (True, ""),
+        (False, "クリップボードエラー"),
+    ]
+    mock_executor.execute.return_value = (True, "", "")
+
+    results = service.send_text_sequence("12345", ["一", "二", "三"], 0.3, 0.1)
+
+    assert results[0] == (True, "")
+    assert results[1] == (False, "クリップボードエラー")
+    assert not results[2][0]
+    assert mock_clipboard_service.copy_to_clipboard.call_count == 2
+    assert mock_executor.execute.call_count == 1
+
+
+def test_receive_text_from_chained(mock_executor, mock_window_service, mock_clipboard_service):
+    """アクティブ化・入力欄のクリック・全選択・コピーを1回の起動で行うことを確認"""
+    service = TextService(
+        mock_window_service, mock_clipboard_service, mock_executor, chain_commands=True
+    )
+    mock_executor.execute.return_value = (True, "", "")
+    mock_clipboard_service.get_from_clipboard.return_value = (True, "取得", "")
+
+    with patch("time.sleep") as mock_sleep:
+        success, text, error_msg = service.receive_text_from(
+            "12345", 0.3, 0.2, focus_point=(40, 120)
+        )
+
+    assert success
+    assert text == "取得"
+    mock_sleep.assert_called_once_with(0.2)
+    mock_executor.execute.assert_called_once_with(
+        [
+            "xdotool", "windowactivate", "--sync", "12345", "sleep", "0.3",
+            "mousemove", "--window", "12345", "40", "120", "click", "1",
+            "mousemove", "restore",
+            "key", "ctrl+a", "sleep", "0.2", "key", "ctrl+c",
+        ]
+    )
+
+
+def test_receive_text_from_without_chain(
+    service, mock_executor, mock_window_service, mock_clipboard_service
+):
+    """連結しない場合はアクティブ化してから全選択・コピーすることを確認"""
+    mock_executor.execute.return_value = (True, "", "")
+    mock_clipboard_service.get_from_clipboard.return_value = (True, "取得", "")
+
+    with patch("time.sleep") as mock_sleep:
+        success, text, error_msg = service.receive_text_from("12345", 0.3, 0.2)
+
+    assert success
+    assert text == "取得"
+    assert mock_executor.execute.call_args_list == [
+        call(["xdotool", "windowactivate", "--sync", "12345"]),
+        call(["xdotool", "key", "ctrl+a"]),
+        call(["xdotool", "key", "ctrl+c"]),
+    ]
+    assert mock_sleep.call_args_list == [call(0.3), call(0.2), call(0.2)]
+
+
+def test_receive_text_from_activate_failure(
+    service, mock_executor, mock_window_service, mock_clipboard_service
+):
+    """アクティブ化に失敗した場合は全選択・コピーしないことを確認"""
+    mock_executor.execute.return_value = (False, "", "BadWindow")
+
+    success, text, error_msg = service.receive_text_from("12345", 0.3, 0.2)
+
+    assert not success
+    assert "ウィンドウのアクティブ化に失敗しました" in error_msg
+    mock_executor.execute.assert_called_once_with(
+        ["xdotool", "windowactivate", "--sync", "12345"]
+    )
+    mock_clipboard_service.get_from_clipboard.assert_not_called()
+
+
+def test_receive_text_reads_primary(mock_executor, mock_window_service, mock_clipboard_service):
+    """read_primary指定時は選択済みのテキストをキー入力・待機なしで返すことを確認"""
+    tracer = Tracer(enabled=True)
+    service = TextService(
+        mock_window_service,
+        mock_clipboard_service,
+        mock_executor,
+        tracer=tracer,
+        read_primary=True,
+    )
+    mock_clipboard_service.get_from_primary.return_value = (True, "選択したテキスト", "")
+
+    with patch("mini_text_core.services.text_service.time.sleep") as mock_sleep:
+        success, text, error_msg = service.receive_text(0.3)
+
+    assert success
+    assert text == "選択したテキスト"
+    assert error_msg == ""
+    mock_executor.execute.assert_not_called()
+    mock_sleep.assert_not_called()
+    mock_clipboard_service.get_from_clipboard.assert_not_called()
+    spans = tracer.get_spans()
+    assert [span["name"] for span in spans] == [
+        "receive_text.read_primary", "receive_text"
+    ]
+    assert spans[-1]["attrs"] == {"success": True, "chars": 8, "source": "primary"}
+
+
+@pytest.mark.parametrize("primary_result", [(True, "", ""), (False, "", "エラー")])
+def test_receive_text_falls_back_when_primary_empty(
+    mock_executor, mock_window_service, mock_clipboard_service, primary_result
+):
+    """PRIMARYが空または取得できない場合は全選択・コピーで取得することを確認"""
+    service = TextService(
+        mock_window_service, mock_clipboard_service, mock_executor, read_primary=True
+    )
+    mock_clipboard_service.get_from_primary.return_value = primary_result
+    mock_executor.execute.return_value = (True, "", "")
+    mock_clipboard_service.get_from_clipboard.return_value = (True, "受信したテキスト", "")
+
+    success, text, error_msg = service.receive_text(0.0)
+
+    assert success
+    assert text == "受信したテキスト"
+    assert mock_executor.execute.call_args_list == [
+        call(["xdotool", "key", "ctrl+a"]),
+        call(["xdotool", "key", "ctrl+c"]),
+    ]
+
+
+def test_receive_text_from_ignores_primary(
+    mock_executor, mock_window_service, mock_clipboard_service
+):
+    """receive_text_fromはread_primary指定時もPRIMARYを読まないことを確認"""
+    service = TextService(
+        mock_window_service, mock_clipboard_service, mock_executor, read_primary=True
+    )
+    mock_executor.execute.return_value = (True, "", "")
+    mock_clipboard_service.get_from_clipboard.return_value = (True, "受信したテキスト", "")
+
+    success, text, error_msg = service.receive_text_from("12345", 0.0, 0.0)
+
+    assert success
+    mock_clipboard_service.get_from_primary.assert_not_called()
@@ -0,0 +1,173 @@
+"""Tracerのpytestテスト"""
+
+import json
+import threading
+import time
+
+import pytest
+from mini_text_core.utils.timing import Histogram, Tracer
+
+
+@pytest.fixture
+def tracer():
+    """有効なTracerのフィクスチャ"""
+    return Tracer(enabled=True)
+
+
+def test_disabled_tracer_records_nothing():
+    """無効時は区間を記録しないことを確認"""
+    tracer = Tracer()
+
+    with tracer.span("exec", command=["xdotool"]) as span:
+        span.set(exit_code=0)
+
+    assert tracer.get_spans() == []
+    assert tracer.get_histograms() == {}
+    # 無効時は同じオブジェクトを使い回す
+    assert tracer.span("a") is tracer.span("b")
+
+
+def test_span_records_duration_and_attrs(tracer):
+    """区間の所要時間と属性が記録されることを確認"""
+    with tracer.span("exec", command=["xdotool", "key", "ctrl+v"]) as span:
+        span.set(exit_code=0, bytes_out=3)
+
+    spans = tracer.get_spans()
+    assert len(spans) == 1
+    assert spans[0]["name"] == "exec"
+    assert spans[0]["duration_ms"] >= 0
+    assert spans[0]["thread_id"] == threading.get_ident()
+    assert spans[0]["attrs"] == {
+        "command": ["xdotool", "key", "ctrl+v"],
+        "exit_code": 0,
+        "bytes_out": 3,
+    }
+
+
+def test_record_with_start_time(tracer):
+    """開始時刻を指定して区間を記録できることを確認（無効時は記録しない）"""
+    start = time.perf_counter() - 0.05
+
+    tracer.record("hotkey.send", start, ok=True)
+    Tracer().record("hotkey.send", start)
+
+    spans = tracer.get_spans()
+    assert len(spans) == 1
+    assert spans[0]["name"] == "hotkey.send"
+    assert spans[0]["duration_ms"] >= 50
+    assert spans[0]["attrs"] == {"ok": True}
+
+
+def test_span_records_exception(tracer):
+    """例外が発生した区間も記録されることを確認"""
+    with pytest.raises(RuntimeError):
+        with tracer.span("send_text"):
+            raise RuntimeError("失敗")
+
+    assert tracer.get_spans()[0]["attrs"] == {"error": "RuntimeError"}
+
+
+def test_histograms_aggregate_by_name(tracer):
+    """区間名ごとにヒストグラムに集計されることを確認"""
+    for _ in range(3):
+        with tracer.span("send_text.paste"):
+            pass
+    with tracer.span("send_text.copy"):
+        pass
+
+    histograms = tracer.get_histograms()
+    assert list(histograms) == ["send_text.copy", "send_text.paste"]
+    assert histograms["send_text.paste"]["count"] == 3
+    assert sum(histograms["send_text.paste"]["buckets"].values()) == 3
+
+
+def test_histogram_percentile():
+    """パーセンタイルがバケットの上限値（最大値以下）で推定されることを確認"""
+    histogram = Histogram()
+    for duration in (0.5, 3, 3, 40, 250):
+        histogram.add(duration)
+
+    summary = histogram.summary()
+    assert summary["count"] == 5
+    assert summary["min_ms"] == 0.5
+    assert summary["max_ms"] == 250
+    assert summary["p50_ms"] == 5
+    assert summary["p99_ms"] == 250
+    assert summary["buckets"]["<=5"] == 2
+
+
+def test_max_spans():
+    """保持するスパン数が上限を超えないことを確認（集計は全件）"""
+    tracer = Tracer(enabled=True, max_spans=2)
+    for _ in range(5):
+        with tracer.span("exec"):
+            pass
+
+    assert len(tracer.get_spans()) == 2
+    assert tracer.get_histograms()["exec"]["count"] == 5
+
+
+def test_clear(tracer):
+    """クリアで記録が破棄されることを確認"""
+    with tracer.span("exec"):
+        pass
+
+    tracer.clear()
+
+    assert tracer.get_spans() == []
+    assert tracer.format_summary() == "計測結果はありません"
+
+
+def test_dump_json(tracer, tmp_path):
+    """JSONファイルに保存できることを確認"""
+    with tracer.span("exec", command=["xdotool"]):
+        pass
+    path = tmp_path / "out" / "timing.json"
+
+    success, error_msg = tracer.dump_json(str(path))
+
+    assert success
+    assert error_msg == ""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["histograms"]["exec"]["count"] == 1
+    assert data["spans"][0]["attrs"]["command"] == ["xdotool"]
+
+
+def test_dump_chrome_trace(tracer, tmp_path):
+    """Chrome trace形式で保存できることを確認"""
+    with tracer.span("receive_text"):
+        with tracer.span("receive_text.copy"):
+            pass
+    path = tmp_path / "trace.json"
+
+    success, _ = tracer.dump_chrome_trace(str(path))
+
+    assert success
+    events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+    # 内側の区間が先に終了して記録される
+    assert [e["name"] for e in events] == ["receive_text.copy", "receive_text"]
+    assert all(e["ph"] == "X" for e in events)
+    assert events[1]["ts"] <= events[0]["ts"]
+    assert events[0]["cat"] == "receive_text"
+
+
+def test_dump_failure(tracer, tmp_path):
+    """保存に失敗した場合はエラーメッセージを返すことを確認"""
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+
+    success, error_msg = tracer.dump_json(str(blocker / "timing.json"))
+
+    assert not success
+    assert "計測結果の保存に失敗しました" in error_msg
+
+
+def test_format_summary(tracer):
+    """集計が表形式で出力されることを確認"""
+    with tracer.span("send_text"):
+        pass
+
+    lines = tracer.format_summary().splitlines()
+
+    assert lines[0].split()[:2] == ["name", "count"]
+    assert lines[1].split()[:2] == ["send_text", "1"]
@@ -0,0 +1,267 @@
+"""WindowListCacheのpytestテスト"""
+
+import threading
+
+import pytest
+from unittest.mock import Mock
+from mini_text_core.services import window_list_cache
+from mini_text_core.services.window_list_cache import WindowListCache
+from mini_text_core.services.xcb_window_backend import ATOM_WM_NAME
+
+
+ROOT = 1
+ATOMS = {"_NET_CLIENT_LIST": 100, "_NET_WM_NAME": 101, "UTF8_STRING": 102}
+
+
+class PropertyNotifyEvent:
+    """xcffib.xproto.PropertyNotifyEventの代用"""
+
+    def __init__(self, window, atom):
+        self.window = window
+        self.atom = atom
+
+
+class MapNotifyEvent:
+    """xcffib.xproto.MapNotifyEventの代用"""
+
+    def __init__(self, window):
+        self.window = window
+
+
+class UnmapNotifyEvent(MapNotifyEvent):
+    """xcffib.xproto.UnmapNotifyEventの代用"""
+
+
+class DestroyNotifyEvent(MapNotifyEvent):
+    """xcffib.xproto.DestroyNotifyEventの代用"""
+
+
+class WindowError(Exception):
+    """xcffib.xproto.WindowError（BadWindow、xcffib.ProtocolException）の代用"""
+
+
+@pytest.fixture
+def server():
+    """Xサーバー側の状態（テストから書き換える）"""
+    return {
+        "client_list": [10, 20],
+        "states": {10: ("ウィンドウ1", True), 20: ("ウィンドウ2", True)},
+    }
+
+
+@pytest.fixture
+def mock_backend(server):
+    """モックXcbWindowBackendのフィクスチャ"""
+    backend = Mock()
+    backend.root = ROOT
+    backend.get_atom.side_effect = ATOMS.__getitem__
+    backend.get_client_list.side_effect = lambda: list(server["client_list"])
+    backend.get_window_states.side_effect = lambda ids: {
+        w: server["states"][w] for w in ids if w in server["states"]
+    }
+    return backend
+
+
+@pytest.fixture
+def cache(mock_backend):
+    """開始済みWindowListCacheのフィクスチャ"""
+    cache = WindowListCache(mock_backend)
+    # イベントが来ないコネクションで開始
+    mock_backend.connection.poll_for_event.return_value = None
+    mock_backend.connection.get_file_descriptor.return_value = -1
+    cache._event_loop = lambda: None
+    assert cache.start()
+    yield cache
+    cache.stop()
+
+
+def test_initial_snapshot(cache, mock_backend):
+    """開始時に一覧が取得され、各ウィンドウのイベントが購読されることを確認"""
+    assert cache.get_window_list() == [("10", "ウィンドウ1"), ("20", "ウィンドウ2")]
+
+    # ルート + 2ウィンドウ分の購読
+    assert mock_backend.connection.core.ChangeWindowAttributes.call_count == 3
+
+
+def test_get_window_list_does_not_query_server(cache, mock_backend):
+    """一覧取得時にXサーバーへ問い合わせないことを確認"""
+    mock_backend.get_window_states.reset_mock()
+    mock_backend.get_client_list.reset_mock()
+
+    cache.get_window_list()
+    cache.get_window_list()
+
+    mock_backend.get_window_states.assert_not_called()
+    mock_backend.get_client_list.assert_not_called()
+
+
+def test_client_list_change_fetches_only_new_windows(cache, mock_backend, server):
+    """_NET_CLIENT_LIST変更時に追加されたウィンドウだけを取得することを確認"""
+    server["client_list"] = [10, 20, 30]
+    server["states"][30] = ("ウィンドウ3", True)
+
+    cache.handle_event(PropertyNotifyEvent(ROOT, ATOMS["_NET_CLIENT_LIST"]))
+
+    mock_backend.get_window_states.assert_called_with([30])
+    assert cache.get_window_list()[-1] == ("30", "ウィンドウ3")
+
+
+def test_client_list_change_removes_closed_windows(cache, server):
+    """_NET_CLIENT_LISTから消えたウィンドウが削除されることを確認"""
+    server["client_list"] = [20]
+
+    cache.handle_event(PropertyNotifyEvent(ROOT, ATOMS["_NET_CLIENT_LIST"]))
+
+    assert cache.get_window_list() == [("20", "ウィンドウ2")]
+    assert cache.get_metrics()["invalidation_count"] == 1
+
+
+def test_title_change(cache, mock_backend, server):
+    """_NET_WM_NAME/WM_NAME変更時にそのウィンドウだけを再取得することを確認"""
+    server["states"][20] = ("新しいタイトル", True)
+
+    cache.handle_event(PropertyNotifyEvent(20, ATOMS["_NET_WM_NAME"]))
+
+    mock_backend.get_window_states.assert_called_with([20])
+    assert cache.get_window_list()[1] == ("20", "新しいタイトル")
+
+    server["states"][10] = ("WM_NAME変更", True)
+    cache.handle_event(PropertyNotifyEvent(10, ATOM_WM_NAME))
+    assert cache.get_window_list()[0] == ("10", "WM_NAME変更")
+
+
+def test_unrelated_property_is_ignored(cache, mock_backend):
+    """関係ないプロパティの変更では再取得しないことを確認"""
+    mock_backend.get_window_states.reset_mock()
+
+    cache.handle_event(PropertyNotifyEvent(10, 999))
+
+    mock_backend.get_window_states.assert_not_called()
+
+
+def test_map_and_unmap(cache):
+    """マップ状態の変更が表示に反映されることを確認"""
+    cache.handle_event(UnmapNotifyEvent(10))
+    assert cache.get_window_list() == [("20", "ウィンドウ2")]
+
+    cache.handle_event(MapNotifyEvent(10))
+    assert cache.get_window_list() == [("10", "ウィンドウ1"), ("20", "ウィンドウ2")]
+
+
+def test_destroy_invalidates(cache):
+    """破棄通知でキャッシュから削除されることを確認"""
+    cache.handle_event(DestroyNotifyEvent(10))
+
+    assert cache.get_window_list() == [("20", "ウィンドウ2")]
+    assert cache.get_metrics()["invalidation_count"] == 1
+
+
+def test_process_pending_events(cache, mock_backend):
+    """キューのイベントがすべて処理されることを確認"""
+    mock_backend.connection.poll_for_event.side_effect = [
+        DestroyNotifyEvent(10),
+        DestroyNotifyEvent(20),
+        None,
+    ]
+
+    cache.process_pending_events()
+
+    assert cache.get_window_list() == []
+    assert cache.get_metrics()["event_count"] == 2
+
+
+def test_bad_window_error_does_not_stop_processing(cache, mock_backend, monkeypatch):
+    """閉じられたウィンドウのBadWindowを読み飛ばし、後続のイベントを処理することを確認"""
+    monkeypatch.setattr(window_list_cache, "PROTOCOL_ERRORS", (WindowError,))
+    mock_backend.connection.poll_for_event.side_effect = [
+        WindowError("BadWindow"),
+        DestroyNotifyEvent(10),
+        None,
+    ]
+
+    cache.process_pending_events()
+
+    assert cache.get_window_list() == [("20", "ウィンドウ2")]
+    assert cache.get_metrics()["error_count"] == 1
+
+
+def test_event_loop_survives_bad_window(mock_backend, monkeypatch):
+    """イベント処理スレッドがBadWindowで停止せず、キャッシュを使い続けられることを確認"""
+    monkeypatch.setattr(window_list_cache, "PROTOCOL_ERRORS", (WindowError,))
+    monkeypatch.setattr(window_list_cache, "POLL_INTERVAL", 0.01)
+    monkeypatch.setattr(window_list_cache, "select", Mock())
+    polled = threading.Event()
+    events = [WindowError("BadWindow"), None, DestroyNotifyEvent(20)]
+
+    def poll_for_event():
+        if events:
+            return events.pop(0)
+        polled.set()
+        return None
+
+    mock_backend.connection.poll_for_event.side_effect = poll_for_event
+    cache = WindowListCache(mock_backend)
+    assert cache.start()
+    try:
+        assert polled.wait(1)
+        assert cache.get_window_list() == [("10", "ウィンドウ1")]
+        assert cache.get_metrics()["running"]
+    finally:
+        cache.stop()
+
+
+def test_connection_error_stops_event_loop(mock_backend, monkeypatch):
+    """接続断などのエラーではイベント処理を終了してフォールバックさせることを確認"""
+    monkeypatch.setattr(window_list_cache, "PROTOCOL_ERRORS", (WindowError,))
+    monkeypatch.setattr(window_list_cache, "select", Mock())
+    mock_backend.connection.poll_for_event.side_effect = ConnectionError("切断")
+    cache = WindowListCache(mock_backend)
+    assert cache.start()
+
+    cache._thread.join(1)
+
+    assert cache.get_window_list() is None
+    cache.stop()
+
+
+def test_staleness_is_not_reset_without_events(cache, mock_backend):
+    """イベントがない場合は同期時刻を更新しないことを確認"""
+    cache._last_sync -= 100.0
+    mock_backend.connection.poll_for_event.side_effect = [None]
+
+    cache.process_pending_events()
+
+    assert cache.get_staleness() >= 100.0
+
+    mock_backend.connection.poll_for_event.side_effect = [MapNotifyEvent(10), None]
+    cache.process_pending_events()
+
+    assert cache.get_staleness() < 1.0
+
+
+def test_metrics(cache):
+    """メトリクスが取得できることを確認"""
+    metrics = cache.get_metrics()
+
+    assert metrics["running"]
+    assert metrics["window_count"] == 2
+    assert 0 <= metrics["staleness"] < 1.0
+    assert metrics["client_list_refresh_count"] == 1
+
+
+def test_stopped_cache_returns_none(cache):
+    """停止後はNoneを返してフォールバックさせることを確認"""
+    cache.stop()
+
+    assert cache.get_window_list() is None
+    assert cache.get_staleness() is None
+
+
+def test_start_without_client_list(mock_backend):
+    """_NET_CLIENT_LISTがない場合は開始できないことを確認"""
+    mock_backend.get_client_list.side_effect = None
+    mock_backend.get_client_list.return_value = None
+    cache = WindowListCache(mock_backend)
+
+    assert not cache.start()
+    assert cache.get_window_list() is None
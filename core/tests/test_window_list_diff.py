@@ -0,0 +1,110 @@
+"""ウィンドウ一覧の差分計算のpytestテスト"""
+
+import random
+
+import pytest
+from mini_text_core.services.window_list_diff import (
+    apply_window_list_diff,
+    diff_window_lists,
+)
+
+
+def make_windows(count: int, start: int = 0) -> list[tuple[str, str]]:
+    """テスト用のウィンドウ一覧"""
+    return [(str(i), f"ウィンドウ{i}") for i in range(start, start + count)]
+
+
+def apply(old, new):
+    """差分を適用した結果と、差分を返す"""
+    splices, updates = diff_window_lists(old, new)
+    windows = list(old)
+    apply_window_list_diff(windows, splices, updates)
+    return windows, splices, updates
+
+
+def test_no_change():
+    """変更がない場合は編集なしであることを確認"""
+    windows = make_windows(1000)
+
+    assert diff_window_lists(windows, list(windows)) == ([], [])
+
+
+def test_initial_load():
+    """空の一覧からの更新は1回の挿入であることを確認"""
+    new = make_windows(3)
+
+    splices, updates = diff_window_lists([], new)
+
+    assert splices == [(0, 0, new)]
+    assert updates == []
+
+
+def test_window_opened():
+    """ウィンドウが追加された場合は1件の挿入のみであることを確認"""
+    old = make_windows(1000)
+    new = old[:500] + [("new", "新規")] + old[500:]
+
+    windows, splices, updates = apply(old, new)
+
+    assert windows == new
+    assert splices == [(500, 0, [("new", "新規")])]
+    assert updates == []
+
+
+def test_window_closed():
+    """ウィンドウが閉じられた場合は1件の削除のみであることを確認"""
+    old = make_windows(1000)
+    new = old[:10] + old[11:]
+
+    windows, splices, updates = apply(old, new)
+
+    assert windows == new
+    assert splices == [(10, 1, [])]
+
+
+def test_title_changed():
+    """タイトルのみ変更された場合は行を置き換えずに更新することを確認"""
+    old = make_windows(100)
+    new = list(old)
+    new[42] = ("42", "変更後")
+
+    windows, splices, updates = apply(old, new)
+
+    assert windows == new
+    assert splices == []
+    assert updates == [(42, "変更後")]
+
+
+def test_splices_in_descending_order():
+    """置換は後ろから順に並び、タイトルの更新は変更後の位置であることを確認"""
+    old = make_windows(10)
+    new = old[:2] + old[3:7] + [("x", "追加")] + old[7:]
+    new[5] = (new[5][0], "変更後")
+
+    windows, splices, updates = apply(old, new)
+
+    assert windows == new
+    positions = [position for position, _, _ in splices]
+    assert positions == sorted(positions, reverse=True)
+    assert updates == [(5, "変更後")]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_changes(seed):
+    """ランダムな追加・削除・並べ替え・タイトル変更でも一致することを確認"""
+    rng = random.Random(seed)
+    old = make_windows(rng.randint(0, 50))
+    new = [w for w in old if rng.random() > 0.2]
+    for i in range(rng.randint(0, 5)):
+        new.insert(rng.randint(0, len(new)), (f"n{i}", f"新規{i}"))
+    if len(new) > 1 and rng.random() > 0.5:
+        a, b = rng.sample(range(len(new)), 2)
+        new[a], new[b] = new[b], new[a]
+    new = [
+        (window_id, name + "*" if rng.random() > 0.9 else name)
+        for window_id, name in new
+    ]
+
+    windows, _, _ = apply(old, new)
+
+    assert windows == new
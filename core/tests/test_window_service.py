@@ -0,0 +1,235 @@
+"""WindowServiceのpytestテスト"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+from mini_text_core.services.window_service import WindowService
+
+
+@pytest.fixture
+def mock_executor():
+    """モックExecutorのフィクスチャ"""
+    return Mock()
+
+
+@pytest.fixture
+def service(mock_executor):
+    """WindowServiceのフィクスチャ"""
+    return WindowService(mock_executor)
+
+
+def test_get_window_list_success(service, mock_executor):
+    """ウィンドウ一覧取得が成功することを確認"""
+    # モックの戻り値を設定
+    # xdotool search の戻り値
+    mock_executor.execute.side_effect = [
+        (True, "12345\n67890\n", ""),  # search結果
+        (True, "テストウィンドウ1", ""),  # getwindowname for 12345
+        (True, "テストウィンドウ2", ""),  # getwindowname for 67890
+    ]
+
+    result = service.get_window_list()
+
+    # 結果を検証
+    assert len(result) == 2
+    assert result[0] == ("12345", "テストウィンドウ1")
+    assert result[1] == ("67890", "テストウィンドウ2")
+
+
+def test_get_window_list_search_failure(service, mock_executor):
+    """ウィンドウ検索が失敗した場合の処理を確認"""
+    # search コマンドが失敗
+    mock_executor.execute.return_value = (False, "", "エラー")
+
+    result = service.get_window_list()
+
+    # 空のリストが返されることを確認
+    assert result == []
+
+
+def test_get_window_list_empty(service, mock_executor):
+    """ウィンドウが存在しない場合の処理を確認"""
+    # searchは成功するが結果が空
+    mock_executor.execute.return_value = (True, "", "")
+
+    result = service.get_window_list()
+
+    # 空のリストが返されることを確認
+    assert result == []
+
+
+def test_activate_window_success(service, mock_executor):
+    """ウィンドウアクティベートが成功することを確認"""
+    # windowactivateが成功
+    mock_executor.execute.return_value = (True, "", "")
+
+    success, error_msg = service.activate_window("12345", 0.0)
+
+    # 成功することを確認
+    assert success
+    assert error_msg == ""
+
+    # 正しいコマンドが実行されたことを確認
+    mock_executor.execute.assert_called_once_with(
+        ["xdotool", "windowactivate", "--sync", "12345"]
+    )
+
+
+def test_activate_window_failure(service, mock_executor):
+    """ウィンドウアクティベートが失敗した場合の処理を確認"""
+    # windowactivateが失敗
+    mock_executor.execute.return_value = (False, "", "ウィンドウが見つかりません")
+
+    success, error_msg = service.activate_window("99999", 0.0)
+
+    # 失敗することを確認
+    assert not success
+    assert "アクティブ化に失敗" in error_msg
+
+
+def test_get_window_list_with_backend(mock_executor):
+    """バックエンドが設定されている場合はxdotoolを使わないことを確認"""
+    backend = Mock()
+    backend.get_window_list.return_value = [("12345", "テストウィンドウ")]
+    service = WindowService(mock_executor, backend=backend)
+
+    result = service.get_window_list()
+
+    assert result == [("12345", "テストウィンドウ")]
+    mock_executor.execute.assert_not_called()
+
+
+def test_get_window_list_backend_fallback(mock_executor):
+    """バックエンドが結果を返せない場合はxdotoolにフォールバックすることを確認"""
+    backend = Mock()
+    backend.get_window_list.return_value = None
+    service = WindowService(mock_executor, backend=backend)
+    mock_executor.execute.side_effect = [
+        (True, "12345\n", ""),  # search結果
+        (True, "テストウィンドウ", ""),  # getwindowname for 12345
+    ]
+
+    result = service.get_window_list()
+
+    assert result == [("12345", "テストウィンドウ")]
+
+
+class SlowExecutor:
+    """ウィンドウごとに遅延を入れてgetwindownameに応答するExecutor"""
+
+    def __init__(self, titles, delays):
+        self.titles = titles
+        self.delays = delays
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def execute(self, command, input_data=None):
+        if command[1] == "search":
+            return True, "\n".join(self.titles) + "\n", ""
+
+        window_id = command[2]
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delays.get(window_id, 0.0))
+        with self.lock:
+            self.running -= 1
+
+        title = self.titles[window_id]
+        if title is None:
+            # 取得中に閉じられたウィンドウ
+            return False, "", "BadWindow"
+        return True, title, ""
+
+
+def test_get_window_list_concurrent_preserves_order():
+    """並列取得でもsearch結果の順序が維持されることを確認"""
+    executor = SlowExecutor(
+        {"1": "ウィンドウ1", "2": "ウィンドウ2", "3": "ウィンドウ3"},
+        {"1": 0.05, "2": 0.0, "3": 0.02},
+    )
+    service = WindowService(executor, max_workers=3)
+
+    result = service.get_window_list()
+
+    assert result == [("1", "ウィンドウ1"), ("2", "ウィンドウ2"), ("3", "ウィンドウ3")]
+    assert executor.max_running > 1
+
+
+def test_get_window_list_concurrency_limit():
+    """同時実行数がmax_workersを超えないことを確認"""
+    titles = {str(i): f"ウィンドウ{i}" for i in range(10)}
+    executor = SlowExecutor(titles, {window_id: 0.01 for window_id in titles})
+    service = WindowService(executor, max_workers=3)
+
+    result = service.get_window_list()
+
+    assert len(result) == 10
+    assert executor.max_running <= 3
+
+
+def test_get_window_list_concurrent_drops_vanished_windows():
+    """取得中に閉じられたウィンドウが除外されることを確認"""
+    executor = SlowExecutor({"1": "ウィンドウ1", "2": None, "3": "ウィンドウ3"}, {})
+    service = WindowService(executor, max_workers=4)
+
+    result = service.get_window_list()
+
+    assert result == [("1", "ウィンドウ1"), ("3", "ウィンドウ3")]
+
+
+def test_get_window_list_deadline():
+    """制限時間内に取得できなかったウィンドウが除外されることを確認"""
+    executor = SlowExecutor(
+        {"1": "ウィンドウ1", "2": "遅いウィンドウ", "3": "ウィンドウ3"},
+        {"2": 1.0},
+    )
+    service = WindowService(executor, max_workers=3, deadline=0.2)
+
+    start = time.monotonic()
+    result = service.get_window_list()
+    elapsed = time.monotonic() - start
+
+    assert result == [("1", "ウィンドウ1"), ("3", "ウィンドウ3")]
+    assert elapsed < 0.8
+
+
+def test_get_window_list_sequential_deadline():
+    """逐次実行でも制限時間を超えたら残りを打ち切ることを確認"""
+    executor = SlowExecutor(
+        {"1": "ウィンドウ1", "2": "ウィンドウ2", "3": "ウィンドウ3"},
+        {"1": 0.15},
+    )
+    service = WindowService(executor, deadline=0.1)
+
+    result = service.get_window_list()
+
+    assert result == [("1", "ウィンドウ1")]
+
+
+def test_get_pointer_in_active_window(service, mock_executor):
+    """アクティブウィンドウ内でのポインタの位置を取得できることを確認"""
+    mock_executor.execute.side_effect = [
+        (True, "12345\n", ""),
+        (True, "WINDOW=12345\nX=100\nY=200\nWIDTH=640\nHEIGHT=480\nSCREEN=0\n", ""),
+        (True, "X=140\nY=320\nSCREEN=0\nWINDOW=67890\n", ""),
+    ]
+
+    assert service.get_pointer_in_active_window() == ("12345", (40, 120))
+    mock_executor.execute.assert_any_call(
+        ["xdotool", "getwindowgeometry", "--shell", "12345"]
+    )
+
+
+def test_get_pointer_in_active_window_outside(service, mock_executor):
+    """ポインタがウィンドウの外にある場合はNoneを返すことを確認"""
+    mock_executor.execute.side_effect = [
+        (True, "12345\n", ""),
+        (True, "WINDOW=12345\nX=100\nY=200\nWIDTH=640\nHEIGHT=480\nSCREEN=0\n", ""),
+        (True, "X=50\nY=320\nSCREEN=0\nWINDOW=1\n", ""),
+    ]
+
+    assert service.get_pointer_in_active_window() is None
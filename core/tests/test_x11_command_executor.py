@@ -0,0 +1,126 @@
+"""X11CommandExecutorのpytestテスト"""
+
+import pytest
+from unittest.mock import patch
+from mini_text_core.utils.timing import Tracer
+from mini_text_core.utils.x11_command_executor import (
+    TextSink,
+    X11CommandExecutor,
+    iter_encoded_chunks,
+)
+
+
+def test_execute_simple_command():
+    """単純なコマンド実行が成功することを確認"""
+    success, stdout, stderr = X11CommandExecutor.execute(["echo", "test"])
+
+    assert success, "echoコマンドは成功すべき"
+    assert "test" in stdout, "stdoutにtestが含まれるべき"
+    assert stderr == "", "stderrは空であるべき"
+
+
+def test_execute_with_input_data():
+    """標準入力を使用したコマンド実行が成功することを確認"""
+    # catコマンドで標準入力をそのまま出力
+    success, stdout, stderr = X11CommandExecutor.execute(["cat"], input_data="テスト入力")
+
+    assert success, "catコマンドは成功すべき"
+    assert "テスト入力" in stdout, "stdoutに入力データが含まれるべき"
+
+
+def test_execute_nonexistent_command():
+    """存在しないコマンドの実行が適切に失敗することを確認"""
+    success, stdout, stderr = X11CommandExecutor.execute(["nonexistent_command_12345"])
+
+    assert not success, "存在しないコマンドは失敗すべき"
+    assert "見つかりません" in stderr, "エラーメッセージに'見つかりません'が含まれるべき"
+
+
+def test_execute_command_with_error():
+    """エラーを返すコマンドが適切に処理されることを確認"""
+    # ls で存在しないディレクトリを指定
+    success, stdout, stderr = X11CommandExecutor.execute(
+        ["ls", "/nonexistent_directory_12345"]
+    )
+
+    assert not success, "エラーコマンドは失敗すべき"
+    assert stderr != "", "stderrにエラーメッセージが含まれるべき"
+
+
+def test_return_types():
+    """戻り値の型が正しいことを確認"""
+    success, stdout, stderr = X11CommandExecutor.execute(["echo", "test"])
+
+    assert isinstance(success, bool)
+    assert isinstance(stdout, str)
+    assert isinstance(stderr, str)
+
+
+def test_execute_stream_roundtrip():
+    """チャンク単位の入出力でマルチバイト文字が壊れないことを確認"""
+    text = "テスト入力abc" * 50000
+    sink = TextSink()
+
+    success, stderr = X11CommandExecutor.execute_stream(
+        ["cat"], source=iter_encoded_chunks(text, chunk_size=1001), sink=sink
+    )
+
+    assert success
+    assert stderr == ""
+    assert sink.getvalue() == text
+
+
+def test_execute_stream_failure():
+    """終了コードとstderrが返されることを確認"""
+    success, stderr = X11CommandExecutor.execute_stream(
+        ["sh", "-c", "echo エラー >&2; exit 3"]
+    )
+
+    assert not success
+    assert "エラー" in stderr
+
+
+def test_execute_stream_does_not_wait_for_forked_child():
+    """stderrを保持した子プロセスが残っても終了を待たないことを確認（xclip対策）"""
+    success, stderr = X11CommandExecutor.execute_stream(
+        ["sh", "-c", "sleep 5 & exit 0"], timeout=2.0
+    )
+
+    assert success
+
+
+def test_execute_stream_timeout():
+    """転送がないまま制限時間を超えるとタイムアウトすることを確認"""
+    success, stderr = X11CommandExecutor.execute_stream(["sleep", "5"], timeout=0.1)
+
+    assert not success
+    assert "タイムアウト" in stderr
+
+
+def test_execute_stream_nonexistent_command():
+    """存在しないコマンドの実行が適切に失敗することを確認"""
+    success, stderr = X11CommandExecutor.execute_stream(["nonexistent_command_12345"])
+
+    assert not success
+    assert "見つかりません" in stderr
+
+
+def test_execute_records_span():
+    """コマンドごとに終了コードと入出力のバイト数が記録されることを確認"""
+    tracer = Tracer(enabled=True)
+
+    with patch("mini_text_core.utils.x11_command_executor.get_tracer", return_value=tracer):
+        X11CommandExecutor.execute(["cat"], input_data="abc")
+        X11CommandExecutor.execute_stream(
+            ["cat"], source=iter_encoded_chunks("abcd"), sink=TextSink()
+        )
+
+    spans = tracer.get_spans()
+    assert spans[0]["name"] == "exec"
+    assert spans[0]["attrs"] == {
+        "command": ["cat"], "exit_code": 0, "bytes_in": 3, "bytes_out": 3
+    }
+    assert spans[1]["name"] == "exec_stream"
+    assert spans[1]["attrs"] == {
+        "command": ["cat"], "bytes_in": 4, "bytes_out": 4, "exit_code": 0
+    }
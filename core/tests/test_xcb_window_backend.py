@@ -0,0 +1,224 @@
+"""XcbWindowBackendのpytestテスト"""
+
+import shutil
+import struct
+import subprocess
+import time
+
+import pytest
+from mini_text_core.services.xcb_window_backend import (
+    ATOM_WM_NAME,
+    MAP_STATE_VIEWABLE,
+    XcbWindowBackend,
+    xcffib,
+)
+
+
+class FakeValue:
+    """xcffib.Listの代用"""
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def buf(self):
+        return self.data
+
+    def to_atoms(self):
+        return struct.unpack(f"{len(self.data) // 4}I", self.data)
+
+
+class FakeReply:
+    """xcffibの返信の代用"""
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+class FakeCookie:
+    """xcffibのクッキーの代用（reply()で返信または例外を返す）"""
+
+    def __init__(self, reply):
+        self._reply = reply
+
+    def reply(self):
+        if isinstance(self._reply, Exception):
+            raise self._reply
+        return self._reply
+
+
+class FakeCore:
+    """xcffibのcoreリクエストの代用"""
+
+    def __init__(self, atoms, properties, map_states):
+        self.atoms = atoms
+        self.properties = properties
+        self.map_states = map_states
+
+    def InternAtom(self, only_if_exists, name_len, name):
+        return FakeCookie(FakeReply(atom=self.atoms[name]))
+
+    def GetProperty(self, delete, window, prop, prop_type, offset, length):
+        if window not in self.map_states and window != 1:
+            return FakeCookie(RuntimeError("BadWindow"))
+        value = self.properties.get((window, prop))
+        if value is None:
+            return FakeCookie(FakeReply(format=0, value_len=0, value=FakeValue(b"")))
+        data, fmt = value
+        return FakeCookie(
+            FakeReply(format=fmt, value_len=len(data), value=FakeValue(data))
+        )
+
+    def GetWindowAttributes(self, window):
+        if window not in self.map_states:
+            return FakeCookie(RuntimeError("BadWindow"))
+        return FakeCookie(FakeReply(map_state=self.map_states[window]))
+
+
+class FakeConnection:
+    """xcffib.Connectionの代用"""
+
+    pref_screen = 0
+
+    def __init__(self, core):
+        self.core = core
+        self.flush_count = 0
+
+    def get_setup(self):
+        return FakeReply(roots=[FakeReply(root=1)])
+
+    def flush(self):
+        self.flush_count += 1
+
+
+ATOMS = {"_NET_CLIENT_LIST": 100, "_NET_WM_NAME": 101, "UTF8_STRING": 102}
+
+
+def make_connection(client_list, titles, map_states, wm_names=None):
+    """フェイク接続を作成"""
+    properties = {}
+    if client_list is not None:
+        properties[(1, ATOMS["_NET_CLIENT_LIST"])] = (
+            struct.pack(f"{len(client_list)}I", *client_list),
+            32,
+        )
+    for window_id, title in titles.items():
+        properties[(window_id, ATOMS["_NET_WM_NAME"])] = (title.encode("utf-8"), 8)
+    for window_id, title in (wm_names or {}).items():
+        properties[(window_id, ATOM_WM_NAME)] = (title.encode("utf-8"), 8)
+    return FakeConnection(FakeCore(ATOMS, properties, map_states))
+
+
+def test_get_window_list_success():
+    """_NET_CLIENT_LISTと_NET_WM_NAMEから一覧が取得できることを確認"""
+    connection = make_connection(
+        [10, 20],
+        {10: "テストウィンドウ1", 20: "テストウィンドウ2"},
+        {10: MAP_STATE_VIEWABLE, 20: MAP_STATE_VIEWABLE},
+    )
+    backend = XcbWindowBackend(connection=connection)
+
+    result = backend.get_window_list()
+
+    assert result == [("10", "テストウィンドウ1"), ("20", "テストウィンドウ2")]
+    # タイトル取得はまとめて1回だけフラッシュされる
+    assert connection.flush_count == 1
+
+
+def test_get_window_list_falls_back_to_wm_name():
+    """_NET_WM_NAMEがない場合はWM_NAMEを使用することを確認"""
+    connection = make_connection(
+        [10], {}, {10: MAP_STATE_VIEWABLE}, wm_names={10: "legacy"}
+    )
+    backend = XcbWindowBackend(connection=connection)
+
+    assert backend.get_window_list() == [("10", "legacy")]
+
+
+def test_get_window_list_skips_hidden_and_vanished_windows():
+    """非表示のウィンドウや途中で閉じられたウィンドウが除外されることを確認"""
+    connection = make_connection(
+        [10, 20, 30, 40],
+        {10: "表示", 20: "最小化", 40: ""},
+        {10: MAP_STATE_VIEWABLE, 20: 0, 40: MAP_STATE_VIEWABLE},
+    )
+    backend = XcbWindowBackend(connection=connection)
+
+    assert backend.get_window_list() == [("10", "表示")]
+
+
+def test_get_window_list_without_client_list():
+    """_NET_CLIENT_LISTがない場合はNoneを返すことを確認"""
+    connection = make_connection(None, {}, {})
+    backend = XcbWindowBackend(connection=connection)
+
+    assert backend.get_window_list() is None
+
+
+@pytest.mark.skipif(
+    xcffib is None or shutil.which("Xvfb") is None,
+    reason="xcffibとXvfbが必要",
+)
+def test_get_window_list_with_xvfb():
+    """Xvfb上で実際のXサーバーから一覧が取得できることを確認"""
+    import xcffib.xproto
+
+    display = ":97"
+    xvfb = subprocess.Popen(
+        ["Xvfb", display, "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        connection = None
+        for _ in range(50):
+            try:
+                connection = xcffib.connect(display=display)
+                break
+            except xcffib.ConnectionException:
+                time.sleep(0.1)
+        assert connection is not None
+
+        setup = connection.get_setup()
+        screen = setup.roots[connection.pref_screen]
+        core = connection.core
+
+        def intern(name):
+            return core.InternAtom(False, len(name), name).reply().atom
+
+        net_client_list = intern("_NET_CLIENT_LIST")
+        net_wm_name = intern("_NET_WM_NAME")
+        utf8_string = intern("UTF8_STRING")
+
+        # ウィンドウマネージャーの代わりに_NET_CLIENT_LISTを設定する
+        window_ids = []
+        for title in ["Xvfbウィンドウ1", "Xvfbウィンドウ2"]:
+            window_id = connection.generate_id()
+            core.CreateWindow(
+                screen.root_depth, window_id, screen.root, 0, 0, 10, 10, 0,
+                xcffib.xproto.WindowClass.InputOutput, screen.root_visual, 0, [],
+            )
+            data = title.encode("utf-8")
+            core.ChangeProperty(
+                xcffib.xproto.PropMode.Replace, window_id, net_wm_name,
+                utf8_string, 8, len(data), data,
+            )
+            core.MapWindow(window_id)
+            window_ids.append(window_id)
+        core.ChangeProperty(
+            xcffib.xproto.PropMode.Replace, screen.root, net_client_list,
+            xcffib.xproto.Atom.WINDOW, 32, len(window_ids), window_ids,
+        )
+        connection.flush()
+
+        backend = XcbWindowBackend(display=display)
+        result = backend.get_window_list()
+        backend.close()
+        connection.disconnect()
+
+        assert result == [
+            (str(window_ids[0]), "Xvfbウィンドウ1"),
+            (str(window_ids[1]), "Xvfbウィンドウ2"),
+        ]
+    finally:
+        xvfb.terminate()
+        xvfb.wait()
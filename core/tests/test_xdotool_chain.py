@@ -0,0 +1,223 @@
+"""xdotoolのコマンド連結のpytestテスト"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+from mini_text_core.utils import xdotool_chain
+from mini_text_core.utils.xdotool_chain import (
+    ACTIVATE_ERROR,
+    AsyncXdotoolChainRunner,
+    XdotoolChainRunner,
+    build_command,
+    plan,
+)
+
+
+def send_operations(wait_operation):
+    """送信（アクティブ化・待機・ペースト）の操作"""
+    return [
+        xdotool_chain.activate("12345"),
+        wait_operation,
+        xdotool_chain.key("ctrl+v", "ペースト操作に失敗しました"),
+    ]
+
+
+def test_plan_fuses_into_one_chain():
+    """Python側の待機がない場合は1回の起動にまとめることを確認"""
+    operations = send_operations(xdotool_chain.sleep(0.3))
+
+    steps = plan(operations)
+
+    assert steps == [("chain", operations)]
+    assert build_command(operations) == [
+        "xdotool", "windowactivate", "--sync", "12345",
+        "sleep", "0.3", "key", "ctrl+v",
+    ]
+
+
+def test_plan_splits_at_wait():
+    """Python側の待機の前後で分割することを確認"""
+    func = Mock()
+    operations = send_operations(xdotool_chain.wait(func))
+
+    steps = plan(operations)
+
+    assert steps == [
+        ("chain", [operations[0]]),
+        ("wait", func),
+        ("chain", [operations[2]]),
+    ]
+
+
+def test_plan_drops_zero_sleep():
+    """0秒の待機は連結しないことを確認"""
+    operations = send_operations(xdotool_chain.sleep(0))
+
+    steps = plan(operations)
+
+    assert steps == [("chain", [operations[0], operations[2]])]
+
+
+def test_plan_sleep_only_section_runs_without_xdotool():
+    """待機だけの区間はxdotoolを起動しないことを確認"""
+    func = Mock()
+    steps = plan(
+        [
+            xdotool_chain.sleep(0.1),
+            xdotool_chain.sleep(0.2),
+            xdotool_chain.wait(func),
+        ]
+    )
+
+    assert steps == [("sleep", pytest.approx(0.3)), ("wait", func)]
+
+
+def test_build_command_click_restores_pointer():
+    """クリックはウィンドウ内の位置に移動してクリックし、ポインタを戻すことを確認"""
+    operations = [
+        xdotool_chain.activate("12345"),
+        xdotool_chain.click("12345", 40, 120),
+        xdotool_chain.key("ctrl+a", "全選択操作に失敗しました"),
+    ]
+
+    assert build_command(operations) == [
+        "xdotool", "windowactivate", "--sync", "12345",
+        "mousemove", "--window", "12345", "40", "120", "click", "1",
+        "mousemove", "restore",
+        "key", "ctrl+a",
+    ]
+
+
+def test_run_success_single_invocation():
+    """連結したコマンドを1回だけ実行することを確認"""
+    executor = Mock()
+    executor.execute.return_value = (True, "", "")
+    runner = XdotoolChainRunner(executor)
+
+    success, error_msg = runner.run(send_operations(xdotool_chain.sleep(0.3)))
+
+    assert success
+    assert error_msg == ""
+    executor.execute.assert_called_once_with(
+        [
+            "xdotool", "windowactivate", "--sync", "12345",
+            "sleep", "0.3", "key", "ctrl+v",
+        ]
+    )
+
+
+def test_run_calls_wait_between_chains():
+    """Python側の待機を2回の起動の間に実行することを確認"""
+    calls = []
+    executor = Mock()
+    executor.execute.side_effect = lambda command: calls.append(command[1]) or (
+        True,
+        "",
+        "",
+    )
+    runner = XdotoolChainRunner(executor)
+
+    success, _ = runner.run(
+        send_operations(xdotool_chain.wait(lambda: calls.append("wait")))
+    )
+
+    assert success
+    assert calls == ["windowactivate", "wait", "key"]
+
+
+def test_run_failure_in_activation():
+    """アクティブ化に失敗した場合はアクティブ化のエラーとすることを確認"""
+    executor = Mock()
+    executor.execute.side_effect = [
+        (False, "", "BadWindow"),
+        (True, "99999\n", ""),  # getactivewindow: 別のウィンドウ
+    ]
+    runner = XdotoolChainRunner(executor)
+
+    success, error_msg = runner.run(send_operations(xdotool_chain.sleep(0.3)))
+
+    assert not success
+    assert error_msg == f"{ACTIVATE_ERROR}: BadWindow"
+    assert executor.execute.call_args.args[0] == ["xdotool", "getactivewindow"]
+
+
+def test_run_failure_after_activation():
+    """アクティブ化後のキー入力で失敗した場合はそのエラーとすることを確認"""
+    executor = Mock()
+    executor.execute.side_effect = [
+        (False, "", "キー入力エラー"),
+        (True, "12345\n", ""),  # getactivewindow: 対象のウィンドウ
+    ]
+    runner = XdotoolChainRunner(executor)
+
+    success, error_msg = runner.run(send_operations(xdotool_chain.sleep(0.3)))
+
+    assert not success
+    assert error_msg == "ペースト操作に失敗しました: キー入力エラー"
+
+
+def test_run_failure_without_activation_does_not_probe():
+    """アクティブ化を含まない連結の失敗は先頭のキー入力のエラーとすることを確認"""
+    executor = Mock()
+    executor.execute.return_value = (False, "", "エラー")
+    runner = XdotoolChainRunner(executor)
+
+    success, error_msg = runner.run(
+        [
+            xdotool_chain.key("ctrl+a", "全選択操作に失敗しました"),
+            xdotool_chain.sleep(0.3),
+            xdotool_chain.key("ctrl+c", "コピー操作に失敗しました"),
+        ]
+    )
+
+    assert not success
+    assert error_msg == "全選択操作に失敗しました: エラー"
+    executor.execute.assert_called_once()
+
+
+def test_run_stops_after_failure():
+    """失敗した場合は以降の操作を実行しないことを確認"""
+    executor = Mock()
+    executor.execute.return_value = (False, "", "エラー")
+    func = Mock()
+    runner = XdotoolChainRunner(executor)
+
+    success, _ = runner.run(
+        [
+            xdotool_chain.key("ctrl+a", "全選択操作に失敗しました"),
+            xdotool_chain.wait(func),
+            xdotool_chain.key("ctrl+c", "コピー操作に失敗しました"),
+        ]
+    )
+
+    assert not success
+    func.assert_not_called()
+
+
+def test_async_run_failure_after_activation():
+    """asyncio版でもアクティブ化後の失敗を判定することを確認"""
+    executor = AsyncMock()
+    executor.execute.side_effect = [
+        (True, "", ""),
+        (False, "", "キー入力エラー"),
+        (True, "12345\n", ""),
+    ]
+    func = Mock()
+    runner = AsyncXdotoolChainRunner(executor)
+
+    success, error_msg = asyncio.run(
+        runner.run(
+            [
+                xdotool_chain.activate("12345"),
+                xdotool_chain.wait(func),
+                xdotool_chain.key("ctrl+v", "ペースト操作に失敗しました"),
+            ]
+        )
+    )
+
+    # 分割後の2回目の起動（キー入力のみ）で失敗したため確認は不要
+    assert not success
+    assert error_msg == "ペースト操作に失敗しました: キー入力エラー"
+    func.assert_called_once()
+    assert executor.execute.await_count == 2
@@ -2,19 +2,30 @@
 """mini-text GTK4アプリケーションのエントリーポイント"""
 
 import sys
+
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Gdk', '4.0')
-from gi.repository import Gtk, Gdk, Gio
+from gi.repository import Gtk, Gdk, Gio, GLib
+
+import mini_text  # noqa: F401  共通パッケージ（mini_text_core）の検索パスを設定
 
-from mini_text.utils.dependency_checker import DependencyChecker
-from mini_text.utils.x11_command_executor import X11CommandExecutor
-from mini_text.config.config_manager import ConfigManager
-from mini_text.services.window_service import WindowService
+from mini_text_core.utils.dependency_checker import (
+    DependencyCache,
+    DependencyChecker,
+)
+from mini_text_core.config.config_manager import ConfigManager
+from mini_text_core.engine import create_engine
+from mini_text_core.services.hotkey_listener import create_hotkey_listener
 from mini_text.services.gtk_clipboard_service import GtkClipboardService
-from mini_text.services.text_service import TextService
+from mini_text.services.async_gtk_clipboard_service import AsyncGtkClipboardService
+from mini_text_core.utils.job_queue import JobQueue
+from mini_text_core.utils.timing import get_tracer
+from mini_text.ui.glib_async import create_async_runner, glib_dispatch
 from mini_text.ui.main_window import MainWindow
-from mini_text.ui.settings_dialog import SettingsDialog
+
+# 依存関係の確認を省略するオプション（起動スクリプトで確認済みの場合）
+SKIP_CHECKS_OPTION = "--skip-checks"
 
 
 class MiniTextApplication(Gtk.Application):
@@ -29,7 +40,12 @@ class MiniTextApplication(Gtk.Application):
         # サービスの初期化
         self.config_manager = None
         self.text_service = None
+        self.async_text_service = None
+        self.async_runner = None
+        self.job_queue = None
         self.window_service = None
+        self.engine = None
+        self.hotkey_listener = None
         self.main_window = None
 
     def do_startup(self):
@@ -41,6 +57,10 @@ class MiniTextApplication(Gtk.Application):
         settings_action.connect("activate", self.on_settings_action)
         self.add_action(settings_action)
 
+        timing_action = Gio.SimpleAction.new("timing", None)
+        timing_action.connect("activate", self.on_timing_action)
+        self.add_action(timing_action)
+
         quit_action = Gio.SimpleAction.new("quit", None)
         quit_action.connect("activate", self.on_quit_action)
         self.add_action(quit_action)
@@ -48,18 +68,48 @@ class MiniTextApplication(Gtk.Application):
         # 設定マネージャーを初期化
         self.config_manager = ConfigManager()
 
-        # X11コマンド実行ユーティリティを作成
-        executor = X11CommandExecutor()
+        # コマンド実行と送受信の所要時間の計測（既定では無効）
+        get_tracer().set_enabled(self.config_manager.is_timing_enabled())
 
-        # サービスを作成
-        self.window_service = WindowService(executor)
+        # コマンド実行・ウィンドウ一覧・準備完了判定は共通パッケージで作成
+        # （ウィンドウ一覧はX11イベントで更新される
+        # キャッシュから取得、利用できない場合はxdotoolにフォールバック）
+        self.engine = create_engine(self.config_manager)
+        self.window_service = self.engine.window_service
 
         # GTK4 Clipboardサービスを使用
         display = Gdk.Display.get_default()
         clipboard = display.get_clipboard()
-        clipboard_service = GtkClipboardService(clipboard)
+        primary = display.get_primary_clipboard()
+        clipboard_service = GtkClipboardService(clipboard, primary)
 
-        self.text_service = TextService(self.window_service, clipboard_service, executor)
+        # コピー後は"changed"シグナルでクリップボードの更新を検知して取得
+        self.text_service = self.engine.create_text_service(
+            clipboard_service, clipboard_notifier=clipboard_service
+        )
+
+        # 送受信はasyncio版サービスで実行し、UIスレッドをブロックしない
+        self.async_runner = create_async_runner()
+        async_clipboard_service = AsyncGtkClipboardService(clipboard, primary)
+        self.async_text_service = self.engine.create_async_text_service(
+            async_clipboard_service, clipboard_notifier=async_clipboard_service
+        )
+        # 送受信ジョブは1件ずつ順に実行（連続操作は最新の1件にまとめる）
+        self.job_queue = JobQueue(self.async_runner)
+
+    def do_shutdown(self):
+        """アプリケーション終了時の後処理"""
+        # 実行中のジョブ・イベント処理スレッド・X接続を停止
+        if self.hotkey_listener:
+            self.hotkey_listener.close()
+        if self.job_queue:
+            self.job_queue.cancel_all()
+        if self.async_runner:
+            self.async_runner.close()
+        if self.engine:
+            self.engine.close()
+
+        Gtk.Application.do_shutdown(self)
 
     def do_activate(self):
         """アプリケーションアクティベート時の処理"""
@@ -73,18 +123,51 @@ class MiniTextApplication(Gtk.Application):
             application=self,
             text_service=self.text_service,
             window_service=self.window_service,
-            config_manager=self.config_manager
+            config_manager=self.config_manager,
+            async_text_service=self.async_text_service,
+            job_queue=self.job_queue
         )
+        if self.config_manager.is_hotkeys_enabled():
+            # 最初のフレームの表示を待たせないよう、表示後に登録する
+            GLib.idle_add(self._start_hotkey_listener)
         self.main_window.present()
 
+    def _start_hotkey_listener(self):
+        """グローバルホットキーの登録（他のアプリケーションから送受信を開始）"""
+        self.hotkey_listener = create_hotkey_listener(
+            self.config_manager.get_hotkeys(),
+            self.main_window.on_hotkey,
+            dispatch=glib_dispatch,
+        )
+        if self.hotkey_listener is not None:
+            success, error_msg = self.hotkey_listener.start()
+            if error_msg:
+                self.main_window.show_status(
+                    f"ホットキーを登録できませんでした: {error_msg}", is_error=True
+                )
+        return False  # idle_addを一回限りにする
+
     def on_settings_action(self, action, param):
         """設定アクション"""
+        # .uiファイルの読み込みを初回の表示まで遅らせる
+        from mini_text.ui.settings_dialog import SettingsDialog
+
         dialog = SettingsDialog(
             parent=self.main_window,
             config_manager=self.config_manager
         )
         dialog.present()
 
+    def on_timing_action(self, action, param):
+        """所要時間の計測アクション"""
+        from mini_text.ui.timing_dialog import TimingDialog
+
+        dialog = TimingDialog(
+            parent=self.main_window,
+            config_manager=self.config_manager
+        )
+        dialog.present()
+
     def on_quit_action(self, action, param):
         """終了アクション"""
         self.quit()
@@ -97,7 +180,8 @@ def check_dependencies() -> bool:
     Returns:
         bool: 全ての依存関係が満たされている場合True
     """
-    all_available, missing = DependencyChecker.check_dependencies()
+    # 前回から PATH・ツールが変わっていなければ確認を省略（~/.cache/mini-text）
+    all_available, missing = DependencyChecker.check_all(cache=DependencyCache())
 
     if not all_available:
         error_message = (
@@ -116,13 +200,15 @@ def check_dependencies() -> bool:
 
 def main():
     """メイン関数"""
+    argv = [arg for arg in sys.argv if arg != SKIP_CHECKS_OPTION]
+
     # 依存関係チェック
-    if not check_dependencies():
+    if len(argv) == len(sys.argv) and not check_dependencies():
         sys.exit(1)
 
     # アプリケーションを作成・実行
     app = MiniTextApplication()
-    return app.run(sys.argv)
+    return app.run(argv)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,154 @@
+"""asyncio版GTK4クリップボードサービス"""
+
+import asyncio
+import threading
+from typing import Optional
+import gi
+
+gi.require_version("Gdk", "4.0")
+from gi.repository import Gdk, GLib
+
+
+class AsyncGtkClipboardService:
+    """
+    Gdk.Clipboardをasyncioから使用するクリップボード操作サービス (SRP)
+
+    GTKはメインスレッド以外から操作できないため、Gdk.Clipboardの呼び出しは
+    GLib.idle_addでメインループに渡し、結果をイベントループに戻す。
+    そのためイベントループがUIと統合されていても別スレッドでも動作する
+    """
+
+    # クリップボード読み込みのタイムアウト(秒)
+    TIMEOUT = 5.0
+
+    def __init__(
+        self, clipboard: Gdk.Clipboard, primary: Optional[Gdk.Clipboard] = None
+    ):
+        """
+        Args:
+            clipboard: Gdk.Clipboardインスタンス
+            primary: PRIMARYのGdk.Clipboardインスタンス
+                （Noneの場合はclipboardと同じディスプレイのものを使用）
+        """
+        self.clipboard = clipboard
+        if primary is None:
+            primary = clipboard.get_display().get_primary_clipboard()
+        self.primary = primary
+
+        # "changed"シグナルの受信回数（クリップボード更新通知）
+        self._change_count = 0
+        self._changed = threading.Condition()
+        self.clipboard.connect("changed", self._on_changed)
+
+    async def copy_to_clipboard(self, text: str) -> tuple[bool, str]:
+        """
+        クリップボードにテキストをコピー
+
+        Args:
+            text: コピーするテキスト
+
+        Returns:
+            tuple[bool, str]: (成功したか, エラーメッセージ)
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def copy():
+            try:
+                self.clipboard.set(text)
+                result = (True, "")
+            except Exception as e:
+                result = (False, f"クリップボードへのコピーに失敗しました: {str(e)}")
+            loop.call_soon_threadsafe(_set_result, future, result)
+            return False  # idle_addを一回限りにする
+
+        GLib.idle_add(copy)
+        return await future
+
+    async def get_from_clipboard(self) -> tuple[bool, str, str]:
+        """
+        クリップボードからテキストを取得
+
+        Returns:
+            tuple[bool, str, str]: (成功したか, テキスト, エラーメッセージ)
+        """
+        return await self._read_text(self.clipboard, "クリップボードからの取得")
+
+    async def get_from_primary(self) -> tuple[bool, str, str]:
+        """
+        PRIMARY（マウスで選択中のテキスト）を取得
+
+        選択しているアプリケーションがない場合は失敗する
+
+        Returns:
+            tuple[bool, str, str]: (成功したか, テキスト, エラーメッセージ)
+        """
+        return await self._read_text(self.primary, "選択中のテキストの取得")
+
+    def mark_change(self) -> int:
+        """
+        現時点のクリップボード更新回数を取得（コピー操作の前に呼び出す）
+
+        Returns:
+            int: wait_for_changeに渡す値
+        """
+        with self._changed:
+            return self._change_count
+
+    def wait_for_change(self, mark: int, timeout: float) -> bool:
+        """
+        mark_change以降にクリップボードが更新されるまで待機
+
+        "changed"シグナルはメインスレッドで届くため、メインスレッド以外
+        （asyncio.to_threadなど）から呼び出す
+
+        Args:
+            mark: mark_changeの戻り値
+            timeout: 待機時間の上限(秒)
+
+        Returns:
+            bool: 上限時間内に更新されたか
+        """
+        with self._changed:
+            return self._changed.wait_for(
+                lambda: self._change_count > mark, timeout=timeout
+            )
+
+    async def _read_text(
+        self, clipboard: Gdk.Clipboard, operation: str
+    ) -> tuple[bool, str, str]:
+        """クリップボード（CLIPBOARD / PRIMARY）のテキストをメインループ経由で読み込む"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def on_read_finish(clipboard, async_result):
+            """非同期読み込み完了時のコールバック（メインスレッド）"""
+            try:
+                text = clipboard.read_text_finish(async_result)
+                result = (True, text if text is not None else "", "")
+            except Exception as e:
+                result = (False, "", f"{operation}に失敗しました: {str(e)}")
+            loop.call_soon_threadsafe(_set_result, future, result)
+
+        def start_read():
+            clipboard.read_text_async(None, on_read_finish)
+            return False  # idle_addを一回限りにする
+
+        GLib.idle_add(start_read)
+
+        try:
+            return await asyncio.wait_for(future, timeout=self.TIMEOUT)
+        except asyncio.TimeoutError:
+            return False, "", f"{operation}がタイムアウトしました"
+
+    def _on_changed(self, _clipboard) -> None:
+        """クリップボードの"changed"シグナルのハンドラ（メインスレッド）"""
+        with self._changed:
+            self._change_count += 1
+            self._changed.notify_all()
+
+
+def _set_result(future: asyncio.Future, result) -> None:
+    """キャンセル済みでなければFutureに結果を設定"""
+    if not future.done():
+        future.set_result(result)
@@ -1,20 +1,28 @@
 """GTK4 Gdk.Clipboardを使用したクリップボードサービス"""
 
-from typing import Optional
-import time
+from typing import Callable, Optional
 import gi
 
 gi.require_version("Gdk", "4.0")
-from gi.repository import Gdk, GLib
+from gi.repository import Gdk, Gio, GLib
 
 
 class GtkClipboardService:
     """GTK4 Gdk.Clipboardを使用したクリップボード操作サービス (SRP)"""
 
-    def __init__(self, clipboard: Optional[Gdk.Clipboard] = None):
+    # クリップボード読み込みのタイムアウト(秒)
+    READ_TIMEOUT = 5.0
+
+    def __init__(
+        self,
+        clipboard: Optional[Gdk.Clipboard] = None,
+        primary: Optional[Gdk.Clipboard] = None,
+    ):
         """
         Args:
             clipboard: Gdk.Clipboardインスタンス（Noneの場合はデフォルトを使用）
+            primary: PRIMARYのGdk.Clipboardインスタンス
+                （Noneの場合はclipboardと同じディスプレイのものを使用）
         """
         if clipboard is None:
             display = Gdk.Display.get_default()
@@ -23,6 +31,13 @@ class GtkClipboardService:
             self.clipboard = display.get_clipboard()
         else:
             self.clipboard = clipboard
+        if primary is None:
+            primary = self.clipboard.get_display().get_primary_clipboard()
+        self.primary = primary
+
+        # "changed"シグナルの受信回数（クリップボード更新通知）
+        self._change_count = 0
+        self.clipboard.connect("changed", self._on_changed)
 
     def copy_to_clipboard(self, text: str) -> tuple[bool, str]:
         """
@@ -40,58 +55,169 @@ class GtkClipboardService:
         except Exception as e:
             return False, f"クリップボードへのコピーに失敗しました: {str(e)}"
 
+    def get_from_clipboard_async(
+        self,
+        callback: Callable[[bool, str, str], None],
+        cancellable: Optional[Gio.Cancellable] = None,
+    ) -> None:
+        """
+        クリップボードからテキストを取得（非同期）
+
+        読み込みを開始してすぐに戻り、完了時にメインスレッドでcallbackを呼ぶ
+
+        Args:
+            callback: 完了時に(成功したか, テキスト, エラーメッセージ)で呼ばれる関数
+            cancellable: 読み込みを中断するためのGio.Cancellable(オプション)
+        """
+        self._read_text_async(
+            self.clipboard, "クリップボードからの取得", callback, cancellable
+        )
+
     def get_from_clipboard(self) -> tuple[bool, str, str]:
         """
         クリップボードからテキストを取得（同期）
 
-        注意: GTK4のAPIは非同期のみだが、GLib.MainContextを使用して
-        メインループを回しながら同期的に待機
+        注意: GTK4のAPIは非同期のみのため、get_from_clipboard_asyncを開始し、
+        完了するまでメインループを回して待機する
 
         Returns:
             tuple[bool, str, str]: (成功したか, テキスト, エラーメッセージ)
         """
-        try:
-            # 結果を格納する変数
-            result = {"text": None, "error": None, "done": False}
-
-            def on_read_finish(_clipboard, async_result):
-                """非同期読み込み完了時のコールバック"""
-                try:
-                    text = self.clipboard.read_text_finish(async_result)
-                    result["text"] = text if text is not None else ""
-                except Exception as e:
-                    result["error"] = str(e)
-                finally:
-                    result["done"] = True
-
-            # 非同期読み込み開始
-            self.clipboard.read_text_async(None, on_read_finish)
-
-            # メインループを回しながら完了を待機
-            context = GLib.MainContext.default()
-            timeout = 5.0  # 5秒タイムアウト
-            start_time = time.time()
-
-            while not result["done"]:
-                # メインコンテキストのイベントを処理
-                while context.pending():
-                    context.iteration(False)
-
-                # タイムアウトチェック
-                if time.time() - start_time > timeout:
-                    return False, "", "クリップボードからの取得がタイムアウトしました"
-
-                # CPU負荷を下げるため短時間スリープ
-                time.sleep(0.01)
-
-            if result["error"]:
-                return (
-                    False,
-                    "",
-                    f"クリップボードからの取得に失敗しました: {result['error']}",
-                )
-
-            return True, result["text"], ""
+        return self._read_text(self.clipboard, "クリップボードからの取得")
+
+    def get_from_primary_async(
+        self,
+        callback: Callable[[bool, str, str], None],
+        cancellable: Optional[Gio.Cancellable] = None,
+    ) -> None:
+        """
+        PRIMARY（マウスで選択中のテキスト）を取得（非同期）
+
+        選択しているアプリケーションがない場合は失敗する
+
+        Args:
+            callback: 完了時に(成功したか, テキスト, エラーメッセージ)で呼ばれる関数
+            cancellable: 読み込みを中断するためのGio.Cancellable(オプション)
+        """
+        self._read_text_async(
+            self.primary, "選択中のテキストの取得", callback, cancellable
+        )
+
+    def get_from_primary(self) -> tuple[bool, str, str]:
+        """
+        PRIMARY（マウスで選択中のテキスト）を取得（同期）
+
+        Returns:
+            tuple[bool, str, str]: (成功したか, テキスト, エラーメッセージ)
+        """
+        return self._read_text(self.primary, "選択中のテキストの取得")
+
+    def mark_change(self) -> int:
+        """
+        現時点のクリップボード更新回数を取得（コピー操作の前に呼び出す）
+
+        Returns:
+            int: wait_for_changeに渡す値
+        """
+        return self._change_count
+
+    def wait_for_change(self, mark: int, timeout: float) -> bool:
+        """
+        mark_change以降にクリップボードが更新されるまで待機（同期）
 
+        メインループを回しながら"changed"シグナルを待つため、
+        更新された時点で戻る
+
+        Args:
+            mark: mark_changeの戻り値
+            timeout: 待機時間の上限(秒)
+
+        Returns:
+            bool: 上限時間内に更新されたか
+        """
+        return self._iterate_until(lambda: self._change_count > mark, timeout)
+
+    def _read_text_async(
+        self,
+        clipboard: Gdk.Clipboard,
+        operation: str,
+        callback: Callable[[bool, str, str], None],
+        cancellable: Optional[Gio.Cancellable],
+    ) -> None:
+        """クリップボード（CLIPBOARD / PRIMARY）のテキストを非同期に読み込む"""
+
+        def on_read_finish(clipboard, async_result):
+            """非同期読み込み完了時のコールバック"""
+            try:
+                text = clipboard.read_text_finish(async_result)
+            except Exception as e:
+                callback(False, "", f"{operation}に失敗しました: {str(e)}")
+                return
+            callback(True, text if text is not None else "", "")
+
+        clipboard.read_text_async(cancellable, on_read_finish)
+
+    def _read_text(
+        self, clipboard: Gdk.Clipboard, operation: str
+    ) -> tuple[bool, str, str]:
+        """
+        クリップボード（CLIPBOARD / PRIMARY）のテキストを読み込む（同期）
+
+        読み込みを開始し、完了するまでメインループを回して待機する
+        """
+        result = {}
+
+        def on_done(success: bool, text: str, error_msg: str) -> None:
+            result["value"] = (success, text, error_msg)
+
+        cancellable = Gio.Cancellable()
+        try:
+            self._read_text_async(clipboard, operation, on_done, cancellable)
         except Exception as e:
-            return False, "", f"クリップボードからの取得に失敗しました: {str(e)}"
+            return False, "", f"{operation}に失敗しました: {str(e)}"
+
+        if not self._iterate_until(lambda: "value" in result, self.READ_TIMEOUT):
+            # 完了していない読み込みは中断
+            cancellable.cancel()
+            return False, "", f"{operation}がタイムアウトしました"
+
+        return result["value"]
+
+    @staticmethod
+    def _iterate_until(condition: Callable[[], bool], timeout: float) -> bool:
+        """
+        条件を満たすまでメインループを回す
+
+        context.iteration(True)でイベントが届くまでブロックし、
+        上限時間はGLibのタイムアウトソースで起こすため、待機中はCPUを使わない
+
+        Args:
+            condition: 完了条件
+            timeout: 待機時間の上限(秒)
+
+        Returns:
+            bool: 上限時間内に条件を満たしたか
+        """
+        if condition():
+            return True
+
+        context = GLib.MainContext.default()
+        state = {"timed_out": False}
+
+        def on_timeout():
+            state["timed_out"] = True
+            return False  # 一回限り
+
+        source_id = GLib.timeout_add(int(timeout * 1000), on_timeout)
+        try:
+            while not condition() and not state["timed_out"]:
+                context.iteration(True)
+        finally:
+            if not state["timed_out"]:
+                GLib.source_remove(source_id)
+
+        return condition()
+
+    def _on_changed(self, _clipboard) -> None:
+        """クリップボードの"changed"シグナルのハンドラ"""
+        self._change_count += 1
@@ -0,0 +1,9 @@
+"""ウィンドウのアクティブ化・選択範囲の更新を検知する準備完了判定（mini_text_core.services.readiness_probeの互換モジュール）"""
+
+import sys
+
+from mini_text_core.services import readiness_probe
+
+# 旧モジュール名でも共通パッケージのモジュールそのものを参照させる
+# （クラスの同一性とunittest.mock.patchの対象を共通パッケージと一致させる）
+sys.modules[__name__] = readiness_probe
@@ -0,0 +1,9 @@
+"""XCBでXサーバーと直接通信するウィンドウ一覧バックエンド（mini_text_core.services.xcb_window_backendの互換モジュール）"""
+
+import sys
+
+from mini_text_core.services import xcb_window_backend
+
+# 旧モジュール名でも共通パッケージのモジュールそのものを参照させる
+# （クラスの同一性とunittest.mock.patchの対象を共通パッケージと一致させる）
+sys.modules[__name__] = xcb_window_backend
@@ -0,0 +1,39 @@
+"""GLibメインループとasyncioの統合"""
+
+import asyncio
+from typing import Callable
+
+from gi.repository import GLib
+
+from mini_text_core.utils.async_runner import AsyncRunner
+
+
+def glib_dispatch(func: Callable[[], None]) -> None:
+    """関数をGLibメインループ（UIスレッド）で実行する"""
+
+    def invoke():
+        func()
+        return False  # idle_addを一回限りにする
+
+    GLib.idle_add(invoke)
+
+
+def create_async_runner() -> AsyncRunner:
+    """
+    GTK4用のAsyncRunnerを作成
+
+    PyGObject 3.50以降ではGLibEventLoopPolicyでasyncioをGLibメインループ上で動かす。
+    それ以前のバージョンでは専用スレッドでイベントループを動かし、
+    結果をGLib.idle_addでUIスレッドに戻す
+
+    Returns:
+        AsyncRunner: UIスレッドから使用するランナー
+    """
+    try:
+        from gi.events import GLibEventLoopPolicy
+    except ImportError:
+        return AsyncRunner(glib_dispatch)
+
+    policy = GLibEventLoopPolicy()
+    asyncio.set_event_loop_policy(policy)
+    return AsyncRunner(glib_dispatch, loop=policy.get_event_loop())
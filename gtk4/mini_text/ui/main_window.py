@@ -1,14 +1,19 @@
 """GTK4メインウィンドウ"""
 
-import time
+import asyncio
 from pathlib import Path
+from typing import Optional
 import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk, GLib
 
-from mini_text.services.window_service import WindowService
-from mini_text.services.text_service import TextService
-from mini_text.config.config_manager import ConfigManager
+from mini_text_core.services.window_service import WindowService
+from mini_text_core.services.text_service import TextService
+from mini_text_core.services.async_text_service import AsyncTextService
+from mini_text_core.config.config_manager import ConfigManager
+from mini_text_core.utils.job_queue import JobQueue
+from mini_text_core.utils.timing import get_tracer
+from mini_text.ui.window_list_model import WindowListModel
 
 
 @Gtk.Template(filename=str(Path(__file__).parent / "resources" / "main_window.ui"))
@@ -22,7 +27,12 @@ class MainWindow(Gtk.ApplicationWindow):
     text_view = Gtk.Template.Child()
     send_button = Gtk.Template.Child()
     copy_button = Gtk.Template.Child()
+    copy_from_button = Gtk.Template.Child()
+    cancel_button = Gtk.Template.Child()
     refresh_button = Gtk.Template.Child()
+    queue_add_button = Gtk.Template.Child()
+    queue_send_button = Gtk.Template.Child()
+    queue_clear_button = Gtk.Template.Child()
     status_label = Gtk.Template.Child()
 
     def __init__(
@@ -31,6 +41,8 @@ class MainWindow(Gtk.ApplicationWindow):
         text_service: TextService,
         window_service: WindowService,
         config_manager: ConfigManager,
+        async_text_service: Optional[AsyncTextService] = None,
+        job_queue: Optional[JobQueue] = None,
         **kwargs
     ):
         """
@@ -39,12 +51,34 @@ class MainWindow(Gtk.ApplicationWindow):
             text_service: テキスト送受信サービス
             window_service: ウィンドウ操作サービス
             config_manager: 設定管理
+            async_text_service: 非同期テキスト送受信サービス
+                （job_queueと併せて指定した場合、送受信中もUIをブロックしない）
+            job_queue: 送受信ジョブのキュー
         """
         super().__init__(application=application, **kwargs)
 
         self.text_service = text_service
         self.window_service = window_service
         self.config_manager = config_manager
+        self.async_text_service = async_text_service
+        self.job_queue = job_queue
+
+        # 最後に開始したウィンドウ一覧の取得（古い結果を破棄するため）
+        self._refresh_generation = 0
+
+        # まとめて送信するテキストのキュー
+        self.send_queue: list[str] = []
+
+        # ウィンドウごとのコピー対象の入力欄の位置（待機後のコピーで記録する）
+        self.focus_points: dict[str, tuple[int, int]] = {}
+
+        # 最後に送信したウィンドウ（グローバルホットキーでの送信先）
+        self.last_send_target: Optional[str] = None
+
+        # ウィンドウ一覧のモデル（更新は差分のみ適用）
+        self.window_list_model = WindowListModel()
+        self.window_list.set_model(self.window_list_model.selection)
+        self.window_list.set_factory(self.window_list_model.create_factory())
 
         # テキストバッファを取得
         self.text_buffer = self.text_view.get_buffer()
@@ -63,8 +97,11 @@ class MainWindow(Gtk.ApplicationWindow):
         # CSSでエラー表示用のスタイルを追加
         self.setup_css()
 
-        # 初回のウィンドウリスト取得
-        self.refresh_window_list()
+        # 初回のウィンドウリスト取得（最初のフレームの表示を待たせない）
+        if self._is_async():
+            self.refresh_window_list()
+        else:
+            GLib.idle_add(self._refresh_on_idle)
 
     def setup_css(self):
         """CSSスタイルを設定"""
@@ -101,30 +138,54 @@ class MainWindow(Gtk.ApplicationWindow):
         self.refresh_button.connect('clicked', self.on_refresh_clicked)
         self.send_button.connect('clicked', self.on_send_clicked)
         self.copy_button.connect('clicked', self.on_copy_clicked)
+        self.copy_from_button.connect('clicked', self.on_copy_from_clicked)
+        self.cancel_button.connect('clicked', self.on_cancel_clicked)
+        self.queue_add_button.connect('clicked', self.on_queue_add_clicked)
+        self.queue_send_button.connect('clicked', self.on_queue_send_clicked)
+        self.queue_clear_button.connect('clicked', self.on_queue_clear_clicked)
         self.connect('close-request', self.on_close_request)
 
     def refresh_window_list(self):
-        """ウィンドウ一覧を更新"""
-        # ListBoxをクリア
-        while True:
-            row = self.window_list.get_row_at_index(0)
-            if row is None:
-                break
-            self.window_list.remove(row)
+        """
+        ウィンドウ一覧を更新
 
-        # ウィンドウ一覧を取得
-        windows = self.window_service.get_window_list()
+        非同期サービス使用時は別スレッドで取得し、UIスレッドをブロックしない
+        （送受信ジョブのキューは通さないため、送受信中でも更新できる）
+        """
+        if not self._is_async():
+            self._set_window_list(self.window_service.get_window_list())
+            return
 
-        # リストに追加
-        for window_id, window_name in windows:
-            label = Gtk.Label(label=f"{window_id}: {window_name}")
-            label.set_halign(Gtk.Align.START)
-            label.set_margin_start(6)
-            label.set_margin_end(6)
-            label.set_margin_top(3)
-            label.set_margin_bottom(3)
-            self.window_list.append(label)
+        self._refresh_generation += 1
+        generation = self._refresh_generation
+        self.show_status("ウィンドウリストを取得中...")
+        self.job_queue.runner.submit(
+            asyncio.to_thread(self.window_service.get_window_list),
+            lambda windows: self._on_window_list_loaded(generation, windows),
+            lambda e: self._on_window_list_failed(generation, e),
+        )
 
+    def _refresh_on_idle(self):
+        """ウィンドウ一覧を更新（アイドルコールバック）"""
+        self.refresh_window_list()
+        return False  # idle_addを一回限りにする
+
+    def _on_window_list_loaded(self, generation: int, windows: list[tuple[str, str]]):
+        """ウィンドウ一覧の取得完了時の処理（後から開始した取得がある場合は破棄）"""
+        if generation == self._refresh_generation:
+            self._set_window_list(windows)
+
+    def _on_window_list_failed(self, generation: int, error: BaseException):
+        """ウィンドウ一覧の取得失敗時の処理"""
+        if generation == self._refresh_generation:
+            self.show_status(
+                f"エラー: ウィンドウリストの取得に失敗しました: {str(error)}",
+                is_error=True,
+            )
+
+    def _set_window_list(self, windows: list[tuple[str, str]]):
+        """ウィンドウ一覧を表示（前回との差分のみ更新）"""
+        self.window_list_model.update(windows)
         self.show_status(f"ウィンドウリストを更新しました ({len(windows)}件)")
 
     def on_refresh_clicked(self, button):
@@ -133,9 +194,9 @@ class MainWindow(Gtk.ApplicationWindow):
 
     def on_send_clicked(self, button):
         """送信ボタンクリック時の処理"""
-        # 選択されているウィンドウを取得
-        selected_row = self.window_list.get_selected_row()
-        if not selected_row:
+        # 選択されているウィンドウのIDを取得（複数選択可、一覧の表示順に送信する）
+        window_ids = self.window_list_model.get_selected_window_ids()
+        if not window_ids:
             self.show_status("ウィンドウを選択してください", is_error=True)
             return
 
@@ -148,24 +209,171 @@ class MainWindow(Gtk.ApplicationWindow):
             self.show_status("送信するテキストを入力してください", is_error=True)
             return
 
-        # ウィンドウIDを取得
-        label = selected_row.get_child()
-        window_id = label.get_label().split(":")[0]
-
         # 設定から待機時間を取得
         activate_wait = self.config_manager.get_timing("window_activate_wait")
         key_wait = self.config_manager.get_timing("key_input_wait")
 
+        # 複数選択時はクリップボードへのコピーを1回にまとめて送信
+        if len(window_ids) > 1:
+            if self._is_async():
+                self.show_status(f"テキストを送信中... ({len(window_ids)}件)")
+                self._run_async(
+                    lambda progress: self.async_text_service.send_text_many(
+                        window_ids, text, activate_wait, key_wait, progress
+                    ),
+                    self._on_send_many_finished,
+                    key=("send", tuple(window_ids), text),
+                    on_progress=self._on_send_progress,
+                )
+            else:
+                self._on_send_many_finished(
+                    self.text_service.send_text_many(
+                        window_ids, text, activate_wait, key_wait
+                    )
+                )
+            return
+
+        window_id = window_ids[0]
+        # ホットキーでの送信先として記録
+        self.last_send_target = window_id
+
         # テキストを送信
-        success, error_msg = self.text_service.send_text(
-            window_id, text, activate_wait, key_wait
-        )
+        if self._is_async():
+            self.show_status("テキストを送信中...")
+            self._run_async(
+                lambda progress: self.async_text_service.send_text(
+                    window_id, text, activate_wait, key_wait
+                ),
+                self._on_send_finished,
+                key=("send", (window_id,), text),
+            )
+        else:
+            self._on_send_finished(
+                self.text_service.send_text(window_id, text, activate_wait, key_wait)
+            )
 
+    def _on_send_finished(self, result: tuple[bool, str]):
+        """送信完了時の処理"""
+        success, error_msg = result
         if success:
             self.show_status("テキストを送信しました")
         else:
             self.show_status(f"エラー: {error_msg}", is_error=True)
 
+    def _on_send_progress(self, done: int, total: int):
+        """複数ウィンドウへの送信の進捗を表示"""
+        self.show_status(f"テキストを送信中... ({done}/{total})")
+
+    def _on_send_many_finished(self, results: list[tuple[str, bool, str]]):
+        """複数ウィンドウへの送信完了時の処理"""
+        failures = [
+            (window_id, error_msg)
+            for window_id, success, error_msg in results
+            if not success
+        ]
+        if not failures:
+            self.show_status(f"テキストを送信しました ({len(results)}件)")
+            return
+
+        details = ", ".join(
+            f"{window_id}: {error_msg}" for window_id, error_msg in failures
+        )
+        self.show_status(
+            f"エラー: {len(results)}件中{len(failures)}件の送信に失敗しました ({details})",
+            is_error=True,
+        )
+
+    def on_queue_add_clicked(self, button):
+        """キューに追加ボタンクリック時の処理"""
+        start_iter = self.text_buffer.get_start_iter()
+        end_iter = self.text_buffer.get_end_iter()
+        text = self.text_buffer.get_text(start_iter, end_iter, False)
+        if not text:
+            self.show_status("キューに追加するテキストを入力してください", is_error=True)
+            return
+
+        # 次のテキストを続けて入力できるようにクリアする
+        self.send_queue.append(text)
+        self.text_buffer.set_text("")
+        self._update_queue_buttons()
+        self.show_status(f"キューに追加しました ({len(self.send_queue)}件)")
+
+    def on_queue_send_clicked(self, button):
+        """まとめて送信ボタンクリック時の処理"""
+        window_ids = self.window_list_model.get_selected_window_ids()
+        if len(window_ids) != 1:
+            self.show_status(
+                "まとめて送信する送信先のウィンドウを1つ選択してください", is_error=True
+            )
+            return
+        if not self.send_queue:
+            self.show_status("キューにテキストがありません", is_error=True)
+            return
+
+        window_id = window_ids[0]
+        # ホットキーでの送信先として記録
+        self.last_send_target = window_id
+        texts = list(self.send_queue)
+        activate_wait = self.config_manager.get_timing("window_activate_wait")
+        key_wait = self.config_manager.get_paste_wait()
+        separator_keys = self.config_manager.get_separator_keys()
+
+        # アクティブ化は1回のみで、テキストごとにコピーとペーストを繰り返す
+        if self._is_async():
+            self.show_status(f"テキストを送信中... ({len(texts)}件)")
+            self._run_async(
+                lambda progress: self.async_text_service.send_text_sequence(
+                    window_id, texts, activate_wait, key_wait, separator_keys, progress
+                ),
+                lambda results: self._on_send_sequence_finished(texts, results),
+                key=("send_sequence", window_id, tuple(texts)),
+                on_progress=self._on_send_progress,
+            )
+        else:
+            self._on_send_sequence_finished(
+                texts,
+                self.text_service.send_text_sequence(
+                    window_id, texts, activate_wait, key_wait, separator_keys
+                ),
+            )
+
+    def _on_send_sequence_finished(
+        self, texts: list[str], results: list[tuple[bool, str]]
+    ):
+        """まとめて送信の完了時の処理（送信できたテキストをキューから削除）"""
+        sent = 0
+        for success, _ in results:
+            if not success:
+                break
+            sent += 1
+        # 送信中にクリアされた場合などはキューを変更しない
+        if self.send_queue[:sent] == texts[:sent]:
+            del self.send_queue[:sent]
+        self._update_queue_buttons()
+
+        if sent == len(texts):
+            self.show_status(f"テキストを送信しました ({sent}件)")
+            return
+        error_msg = results[sent][1]
+        self.show_status(
+            f"エラー: {len(texts)}件中{sent}件を送信しました"
+            f"（残りはキューに残っています）: {error_msg}",
+            is_error=True,
+        )
+
+    def on_queue_clear_clicked(self, button):
+        """キューをクリアボタンクリック時の処理"""
+        self.send_queue.clear()
+        self._update_queue_buttons()
+        self.show_status("キューをクリアしました")
+
+    def _update_queue_buttons(self):
+        """キューの件数をボタンに表示（空の場合は無効化）"""
+        count = len(self.send_queue)
+        self.queue_send_button.set_label(f"まとめて送信 ({count})")
+        self.queue_send_button.set_sensitive(count > 0)
+        self.queue_clear_button.set_sensitive(count > 0)
+
     def on_copy_clicked(self, button):
         """コピーボタンクリック時の処理"""
         # 設定から待機時間を取得
@@ -177,14 +385,78 @@ class MainWindow(Gtk.ApplicationWindow):
             f"{copyfrom_wait}秒後にコピーを開始します。対象のテキストボックスをクリックしてください"
         )
 
-        # GLibのタイムアウトを使用して非同期実行
-        GLib.timeout_add_seconds(int(copyfrom_wait), self._do_copy, key_wait)
+        if self._is_async():
+            self._run_async(
+                lambda progress: self._copy_after_wait(copyfrom_wait, key_wait),
+                self._on_wait_copy_finished,
+                key="wait_copy",
+            )
+        else:
+            # GLibのタイムアウトを使用して非同期実行
+            GLib.timeout_add_seconds(int(copyfrom_wait), self._do_copy, key_wait)
+
+    async def _copy_after_wait(self, copyfrom_wait: float, key_wait: float):
+        """
+        copyfrom_wait秒待ってからテキストを取得（コルーチン）
+
+        Returns:
+            (受信結果, クリックされた入力欄の位置（取得できない場合はNone）)
+        """
+        await asyncio.sleep(copyfrom_wait)
+        pointer = await asyncio.to_thread(
+            self.window_service.get_pointer_in_active_window
+        )
+        return await self.async_text_service.receive_text(key_wait), pointer
 
     def _do_copy(self, key_wait):
         """コピー実行（タイムアウトコールバック）"""
-        # テキストを取得
-        success, text, error_msg = self.text_service.receive_text(key_wait)
+        pointer = self.window_service.get_pointer_in_active_window()
+        self._on_wait_copy_finished(
+            (self.text_service.receive_text(key_wait), pointer)
+        )
+        return False  # タイムアウトを一回限りにする
+
+    def _on_wait_copy_finished(self, outcome):
+        """待機後のコピー完了時の処理（成功した場合は入力欄の位置を記録）"""
+        result, pointer = outcome
+        if result[0] and pointer is not None:
+            window_id, point = pointer
+            self.focus_points[window_id] = point
+        self._on_copy_finished(result)
+
+    def on_copy_from_clicked(self, button):
+        """選択先からコピーボタンクリック時の処理"""
+        window_ids = self.window_list_model.get_selected_window_ids()
+        if len(window_ids) != 1:
+            self.show_status("コピー元のウィンドウを1つ選択してください", is_error=True)
+            return
 
+        window_id = window_ids[0]
+        activate_wait = self.config_manager.get_timing("window_activate_wait")
+        key_wait = self.config_manager.get_timing("key_input_wait")
+        # 以前のコピーで記録した入力欄があればクリックしてフォーカスする
+        focus_point = self.focus_points.get(window_id)
+
+        # ユーザーのクリックを待たず、すぐにアクティブ化して全選択・コピーする
+        if self._is_async():
+            self.show_status("テキストをコピー中...")
+            self._run_async(
+                lambda progress: self.async_text_service.receive_text_from(
+                    window_id, activate_wait, key_wait, focus_point
+                ),
+                self._on_copy_finished,
+                key=("copy_from", window_id),
+            )
+        else:
+            self._on_copy_finished(
+                self.text_service.receive_text_from(
+                    window_id, activate_wait, key_wait, focus_point
+                )
+            )
+
+    def _on_copy_finished(self, result: tuple[bool, str, str]):
+        """コピー完了時の処理"""
+        success, text, error_msg = result
         if success:
             # テキストバッファに設定
             self.text_buffer.set_text(text)
@@ -192,7 +464,132 @@ class MainWindow(Gtk.ApplicationWindow):
         else:
             self.show_status(f"エラー: {error_msg}", is_error=True)
 
-        return False  # タイムアウトを一回限りにする
+    def on_hotkey(self, action: str, pressed_at: float):
+        """
+        グローバルホットキーが押されたときの処理（UIスレッドで呼ばれる）
+
+        Args:
+            action: "send"（最後に送信したウィンドウに送信）または
+                "copy"（フォーカスのあるウィンドウから取得）
+            pressed_at: ホットキーが押された時刻（time.perf_counter()の値）
+        """
+        if action == "send":
+            self._send_by_hotkey(pressed_at)
+        elif action == "copy":
+            self._copy_by_hotkey(pressed_at)
+
+    def _send_by_hotkey(self, pressed_at: float):
+        """入力欄のテキストを最後に送信したウィンドウに送信"""
+        if self.last_send_target is None:
+            self.show_status(
+                "ホットキーでの送信先がありません（一度ボタンで送信してください）",
+                is_error=True,
+            )
+            return
+
+        start_iter = self.text_buffer.get_start_iter()
+        end_iter = self.text_buffer.get_end_iter()
+        text = self.text_buffer.get_text(start_iter, end_iter, False)
+        if not text:
+            self.show_status("送信するテキストを入力してください", is_error=True)
+            return
+
+        window_id = self.last_send_target
+        activate_wait = self.config_manager.get_timing("window_activate_wait")
+        key_wait = self.config_manager.get_timing("key_input_wait")
+
+        def on_done(result):
+            self._on_hotkey_finished("send", pressed_at, result)
+            self._on_send_finished(result)
+
+        if self._is_async():
+            self._run_async(
+                lambda progress: self.async_text_service.send_text(
+                    window_id, text, activate_wait, key_wait
+                ),
+                on_done,
+                key=("hotkey_send", window_id, text),
+            )
+        else:
+            on_done(
+                self.text_service.send_text(window_id, text, activate_wait, key_wait)
+            )
+
+    def _copy_by_hotkey(self, pressed_at: float):
+        """フォーカスのあるウィンドウから待たずにテキストを取得"""
+        key_wait = self.config_manager.get_timing("key_input_wait")
+
+        def on_done(result):
+            self._on_hotkey_finished("copy", pressed_at, result)
+            self._on_copy_finished(result)
+
+        # ホットキーを押したウィンドウにフォーカスがあるため、すぐに全選択・コピーする
+        if self._is_async():
+            self._run_async(
+                lambda progress: self.async_text_service.receive_text(key_wait),
+                on_done,
+                key="hotkey_copy",
+            )
+        else:
+            on_done(self.text_service.receive_text(key_wait))
+
+    def _on_hotkey_finished(self, action: str, pressed_at: float, result):
+        """ホットキーが押されてから送受信が完了するまでの時間を記録"""
+        get_tracer().record(f"hotkey.{action}", pressed_at, ok=result[0])
+
+    def _is_async(self) -> bool:
+        """非同期サービスを使用するか"""
+        return self.async_text_service is not None and self.job_queue is not None
+
+    def _run_async(self, factory, on_done, key=None, on_progress=None):
+        """
+        送受信ジョブをキューに投入（UIスレッドはブロックしない）
+
+        実行中に同じ操作を連続して行った場合、待機中のジョブは最新の1件にまとめられる
+        （まとめた件数はステータスバーに表示する）
+
+        Args:
+            factory: 進捗通知の関数を受け取り、実行するコルーチンを返す関数
+            on_done: 完了時にUIスレッドで呼ばれるコールバック
+            key: 連続投入をまとめるためのキー（送信は送信先とテキストを含め、
+                内容の異なる送信がまとめられないようにする。完了時の処理が
+                異なる操作は、まとめると古い方の処理が行われないため別のキーにする）
+            on_progress: 進捗通知時にUIスレッドで呼ばれるコールバック
+        """
+
+        def done(result):
+            self._update_cancel_button()
+            on_done(result)
+
+        def error(e):
+            self._update_cancel_button()
+            self.show_status(f"エラー: {str(e)}", is_error=True)
+
+        job = self.job_queue.submit(factory, done, error, on_progress, key=key)
+        if job is None:
+            self.show_status(
+                "処理待ちの操作が多すぎます。完了を待ってから再度実行してください",
+                is_error=True,
+            )
+        elif job.coalesced:
+            self.show_status(
+                f"処理待ちの同じ操作{job.coalesced}件を最新の1件にまとめました"
+            )
+        self._update_cancel_button()
+
+    def on_cancel_clicked(self, button):
+        """キャンセルボタンクリック時の処理"""
+        if not self._is_async():
+            return
+        count = self.job_queue.cancel_all()
+        self._update_cancel_button()
+        if count:
+            self.show_status(f"{count}件の操作をキャンセルしました")
+
+    def _update_cancel_button(self):
+        """処理中・処理待ちの操作がある場合のみキャンセルボタンを有効化"""
+        busy = self._is_async() and self.job_queue.get_queue_depth() > 0
+        self.cancel_button.set_sensitive(busy)
 
     def show_status(self, message: str, is_error: bool = False):
         """ステータスメッセージを表示"""
@@ -6,7 +6,7 @@ import gi
 gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk
 
-from mini_text.config.config_manager import ConfigManager
+from mini_text_core.config.config_manager import ConfigManager
 
 
 @Gtk.Template(filename=str(Path(__file__).parent / "resources" / "settings_dialog.ui"))
@@ -0,0 +1,95 @@
+"""GTK4所要時間の計測ダイアログ"""
+
+from pathlib import Path
+from typing import Optional
+import gi
+
+gi.require_version("Gtk", "4.0")
+from gi.repository import Gtk
+
+from mini_text_core.config.config_manager import ConfigManager
+from mini_text_core.utils.timing import Tracer, get_default_dump_path, get_tracer
+
+
+@Gtk.Template(filename=str(Path(__file__).parent / "resources" / "timing_dialog.ui"))
+class TimingDialog(Gtk.Dialog):
+    """処理段階ごとの所要時間を表示するデバッグ用ダイアログ"""
+
+    __gtype_name__ = "TimingDialog"
+
+    # UIエレメント（.uiファイルからバインド）
+    enabled_check = Gtk.Template.Child()
+    summary_view = Gtk.Template.Child()
+    status_label = Gtk.Template.Child()
+    refresh_button = Gtk.Template.Child()
+    clear_button = Gtk.Template.Child()
+    save_json_button = Gtk.Template.Child()
+    save_trace_button = Gtk.Template.Child()
+    close_button = Gtk.Template.Child()
+
+    def __init__(
+        self,
+        parent,
+        config_manager: ConfigManager,
+        tracer: Optional[Tracer] = None,
+        **kwargs,
+    ):
+        """
+        Args:
+            parent: 親ウィンドウ
+            config_manager: 設定管理
+            tracer: 表示するトレーサー（Noneの場合は共有のものを使用）
+        """
+        super().__init__(transient_for=parent, **kwargs)
+
+        self.config_manager = config_manager
+        self.tracer = tracer or get_tracer()
+
+        self.enabled_check.set_active(self.tracer.enabled)
+        self.refresh_summary()
+
+        # シグナル接続
+        self.connect_signals()
+
+    def connect_signals(self):
+        """シグナルとハンドラを接続"""
+        self.enabled_check.connect("toggled", self.on_enabled_toggled)
+        self.refresh_button.connect("clicked", lambda button: self.refresh_summary())
+        self.clear_button.connect("clicked", self.on_clear_clicked)
+        self.save_json_button.connect("clicked", self.on_save_json_clicked)
+        self.save_trace_button.connect("clicked", self.on_save_trace_clicked)
+        self.close_button.connect("clicked", lambda button: self.close())
+
+    def refresh_summary(self):
+        """集計結果を表示"""
+        self.summary_view.get_buffer().set_text(self.tracer.format_summary())
+
+    def on_enabled_toggled(self, button):
+        """計測の有効・無効の切り替え時の処理（設定にも保存）"""
+        enabled = button.get_active()
+        self.tracer.set_enabled(enabled)
+        self.config_manager.set_timing_enabled(enabled)
+        self.config_manager.save_config()
+
+    def on_clear_clicked(self, button):
+        """クリアボタンクリック時の処理"""
+        self.tracer.clear()
+        self.refresh_summary()
+        self.status_label.set_text("")
+
+    def on_save_json_clicked(self, button):
+        """JSONで保存ボタンクリック時の処理"""
+        path = get_default_dump_path("timing")
+        self.show_result(path, *self.tracer.dump_json(path))
+
+    def on_save_trace_clicked(self, button):
+        """Chrome traceで保存ボタンクリック時の処理"""
+        path = get_default_dump_path("trace")
+        self.show_result(path, *self.tracer.dump_chrome_trace(path))
+
+    def show_result(self, path: str, success: bool, error_msg: str):
+        """保存結果を表示"""
+        if success:
+            self.status_label.set_text(f"保存しました: {path}")
+        else:
+            self.status_label.set_text(error_msg)
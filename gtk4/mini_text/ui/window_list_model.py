@@ -0,0 +1,93 @@
+"""ウィンドウ一覧のリストモデル（Gio.ListStore + Gtk.ListView用）"""
+
+from gi.repository import Gio, GObject, Gtk
+
+from mini_text_core.services.window_list_diff import diff_window_lists
+
+
+class WindowItem(GObject.Object):
+    """ウィンドウ一覧の項目"""
+
+    __gtype_name__ = 'MiniTextWindowItem'
+
+    window_id = GObject.Property(type=str, default="")
+    # 表示する文字列（"ID: 名前"）
+    label = GObject.Property(type=str, default="")
+
+    def __init__(self, window_id: str, window_name: str):
+        super().__init__(window_id=window_id)
+        self.set_window_name(window_name)
+
+    def set_window_name(self, window_name: str):
+        """タイトルを変更（表示中の行にはバインディングで反映される）"""
+        self.label = f"{self.window_id}: {window_name}"
+
+
+class WindowListModel:
+    """
+    ウィンドウ一覧のリストモデル (SRP)
+
+    一覧の更新は前回との差分のみをGio.ListStoreに適用する（変更のない行は
+    作り直さず、選択状態も維持される）。行のウィジェットはGtk.ListViewが
+    表示中の分だけ作成・再利用するため、ウィンドウ数が多くても増えない
+    """
+
+    def __init__(self):
+        self.store = Gio.ListStore(item_type=WindowItem)
+        self.selection = Gtk.MultiSelection(model=self.store)
+        # 現在の一覧（差分の計算用）
+        self._windows: list[tuple[str, str]] = []
+
+    def create_factory(self) -> Gtk.SignalListItemFactory:
+        """行のウィジェットを作成・再利用するファクトリを作成"""
+        factory = Gtk.SignalListItemFactory()
+        factory.connect('setup', self._on_setup)
+        factory.connect('bind', self._on_bind)
+        factory.connect('unbind', self._on_unbind)
+        return factory
+
+    def update(self, windows: list[tuple[str, str]]):
+        """
+        一覧を更新（差分のみ適用）
+
+        Args:
+            windows: [(window_id, window_name), ...]
+        """
+        splices, updates = diff_window_lists(self._windows, windows)
+        for position, removed, added in splices:
+            items = [WindowItem(window_id, name) for window_id, name in added]
+            self.store.splice(position, removed, items)
+        for position, window_name in updates:
+            self.store.get_item(position).set_window_name(window_name)
+        self._windows = list(windows)
+
+    def get_selected_window_ids(self) -> list[str]:
+        """選択されているウィンドウのID（一覧の表示順）"""
+        bitset = self.selection.get_selection()
+        return [
+            self.store.get_item(bitset.get_nth(i)).window_id
+            for i in range(bitset.get_size())
+        ]
+
+    def _on_setup(self, factory, list_item):
+        """行のウィジェットを作成"""
+        label = Gtk.Label()
+        label.set_halign(Gtk.Align.START)
+        label.set_margin_start(6)
+        label.set_margin_end(6)
+        label.set_margin_top(3)
+        label.set_margin_bottom(3)
+        list_item.set_child(label)
+
+    def _on_bind(self, factory, list_item):
+        """行のウィジェットに項目を割り当て（タイトルの変更に追従する）"""
+        label = list_item.get_child()
+        label.binding = list_item.get_item().bind_property(
+            'label', label, 'label', GObject.BindingFlags.SYNC_CREATE
+        )
+
+    def _on_unbind(self, factory, list_item):
+        """行のウィジェットから項目を外す（再利用のため）"""
+        label = list_item.get_child()
+        label.binding.unbind()
+        label.binding = None
@@ -0,0 +1,9 @@
+"""UIスレッドからコルーチンを実行するためのランナー（mini_text_core.utils.async_runnerの互換モジュール）"""
+
+import sys
+
+from mini_text_core.utils import async_runner
+
+# 旧モジュール名でも共通パッケージのモジュールそのものを参照させる
+# （クラスの同一性とunittest.mock.patchの対象を共通パッケージと一致させる）
+sys.modules[__name__] = async_runner
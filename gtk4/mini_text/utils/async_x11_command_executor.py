@@ -0,0 +1,9 @@
+"""asyncio版X11コマンド実行ユーティリティ（mini_text_core.utils.async_x11_command_executorの互換モジュール）"""
+
+import sys
+
+from mini_text_core.utils import async_x11_command_executor
+
+# 旧モジュール名でも共通パッケージのモジュールそのものを参照させる
+# （クラスの同一性とunittest.mock.patchの対象を共通パッケージと一致させる）
+sys.modules[__name__] = async_x11_command_executor
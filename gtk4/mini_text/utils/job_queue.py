@@ -0,0 +1,9 @@
+"""送受信ジョブのキュー（mini_text_core.utils.job_queueの互換モジュール）"""
+
+import sys
+
+from mini_text_core.utils import job_queue
+
+# 旧モジュール名でも共通パッケージのモジュールそのものを参照させる
+# （クラスの同一性とunittest.mock.patchの対象を共通パッケージと一致させる）
+sys.modules[__name__] = job_queue
@@ -0,0 +1,13 @@
+"""
+常駐ワーカーを使用するX11コマンド実行ユーティリティ
+
+mini_text_core.utils.persistent_command_executorの互換モジュール
+"""
+
+import sys
+
+from mini_text_core.utils import persistent_command_executor
+
+# 旧モジュール名でも共通パッケージのモジュールそのものを参照させる
+# （クラスの同一性とunittest.mock.patchの対象を共通パッケージと一致させる）
+sys.modules[__name__] = persistent_command_executor
@@ -0,0 +1,9 @@
+"""送受信処理の所要時間の計測（mini_text_core.utils.timingの互換モジュール）"""
+
+import sys
+
+from mini_text_core.utils import timing
+
+# 旧モジュール名でも共通パッケージのモジュールそのものを参照させる
+# （クラスの同一性とunittest.mock.patchの対象を共通パッケージと一致させる）
+sys.modules[__name__] = timing
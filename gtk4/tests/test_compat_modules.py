@@ -0,0 +1,26 @@
+"""旧モジュール名（mini_text.*）の互換モジュールのpytestテスト
+
+共通パッケージ（mini_text_core）自体のテストはcore/testsにある
+"""
+
+import importlib
+
+import pytest
+from mini_text_core.config import config_manager
+from mini_text_core.services import text_service, window_service
+from mini_text_core.utils import job_queue, x11_command_executor
+
+
+@pytest.mark.parametrize(
+    "name, module",
+    [
+        ("mini_text.config.config_manager", config_manager),
+        ("mini_text.services.text_service", text_service),
+        ("mini_text.services.window_service", window_service),
+        ("mini_text.utils.job_queue", job_queue),
+        ("mini_text.utils.x11_command_executor", x11_command_executor),
+    ],
+)
+def test_compat_module_is_core_module(name, module):
+    """旧モジュール名が共通パッケージのモジュールそのものを指すことを確認"""
+    assert importlib.import_module(name) is module
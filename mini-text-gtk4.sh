@@ -5,11 +5,13 @@
 #   ./mini-text-gtk4.sh           # アプリケーションを実行
 #   ./mini-text-gtk4.sh --setup   # 環境セットアップのみ
 #   ./mini-text-gtk4.sh --test    # テストを実行
+#   ./mini-text-gtk4.sh --skip-checks  # 依存関係の確認を省略して実行
 
 set -e
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 GTK4_DIR="$SCRIPT_DIR/gtk4"
+CORE_DIR="$SCRIPT_DIR/core"
 VENV_DIR="$GTK4_DIR/venv"
 
 # カラー出力
@@ -31,39 +33,26 @@ print_error() {
 }
 
 # システム依存関係のチェック
+# xdotool・PyGObject・GTK4を1つのPythonインタプリタでまとめて確認する
+# （前回から PATH・ツールが変わっていなければ ~/.cache/mini-text のキャッシュを使用）
 check_system_dependencies() {
     print_info "システム依存関係をチェック中..."
 
-    local missing_deps=()
-
-    # xdotoolのチェック
-    if ! command -v xdotool &> /dev/null; then
-        missing_deps+=("xdotool")
-    fi
-
-    # python3-giのチェック（PyGObjectモジュールで確認）
-    if ! python3 -c "import gi" &> /dev/null; then
-        missing_deps+=("python3-gi")
-    fi
-
-    # GTK4のチェック
-    if ! python3 -c "import gi; gi.require_version('Gtk', '4.0'); from gi.repository import Gtk" &> /dev/null; then
-        missing_deps+=("gir1.2-gtk-4.0")
+    local missing_deps
+    if missing_deps=$(PYTHONPATH="$CORE_DIR" python3 -m mini_text_core.utils.dependency_checker --gtk4); then
+        print_info "システム依存関係: OK"
+        return 0
     fi
 
-    if [ ${#missing_deps[@]} -ne 0 ]; then
-        print_error "以下のシステム依存関係が不足しています:"
-        for dep in "${missing_deps[@]}"; do
-            echo "  - $dep"
-        done
-        echo ""
-        echo "インストールコマンド:"
-        echo "  sudo apt install ${missing_deps[*]}"
-        return 1
-    fi
-
-    print_info "システム依存関係: OK"
-    return 0
+    print_error "以下のシステム依存関係が不足しています:"
+    local dep
+    for dep in $missing_deps; do
+        echo "  - $dep"
+    done
+    echo ""
+    echo "インストールコマンド:"
+    echo "  sudo apt install" $missing_deps
+    return 1
 }
 
 # venv環境のセットアップ
@@ -111,7 +100,8 @@ run_app() {
     source "$VENV_DIR/bin/activate"
 
     cd "$GTK4_DIR"
-    python main.py
+    # 依存関係はこのスクリプトで確認済み（または--skip-checks指定）
+    python main.py --skip-checks
 }
 
 # メイン処理
@@ -125,8 +115,21 @@ main() {
         exit 1
     fi
 
+    # --skip-checksは他のオプションと併用できる
+    local skip_checks=false
+    local args=()
+    local arg
+    for arg in "$@"; do
+        if [ "$arg" = "--skip-checks" ]; then
+            skip_checks=true
+        else
+            args+=("$arg")
+        fi
+    done
+    set -- "${args[@]}"
+
     # システム依存関係のチェック
-    if ! check_system_dependencies; then
+    if [ "$skip_checks" = false ] && ! check_system_dependencies; then
         exit 1
     fi
 
@@ -149,6 +152,7 @@ main() {
             echo "  $0           アプリケーションを実行"
             echo "  $0 --setup   環境セットアップのみ"
             echo "  $0 --test    テストを実行"
+            echo "  $0 --skip-checks  依存関係の確認を省略（他のオプションと併用可）"
             echo "  $0 --help    このヘルプを表示"
             ;;
         "")
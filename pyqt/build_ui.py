@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Qt Designerの.uiファイルをPythonモジュールにコンパイルするビルドスクリプト
+
+使用方法:
+    python build_ui.py            # mini_text/ui/compiled/ にコンパイル
+    python build_ui.py --check    # 最新か確認（古い・存在しない場合は終了コード1）
+    python build_ui.py --measure  # 実行時の読み込みとコンパイル済みの構築の所要時間を比較
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from mini_text.ui.ui_loader import (
+    COMPILED_DIR,
+    RESOURCES_DIR,
+    compile_ui,
+    get_source_hash,
+    load_ui,
+)
+
+
+def get_ui_names() -> list[str]:
+    """コンパイル対象の.uiファイルの名前（拡張子なし）"""
+    return sorted(path.stem for path in RESOURCES_DIR.glob("*.ui"))
+
+
+def is_up_to_date(name: str) -> bool:
+    """コンパイル済みのモジュールが.uiファイルと一致しているか"""
+    compiled = COMPILED_DIR / f"ui_{name}.py"
+    if not compiled.exists():
+        return False
+    source_hash = get_source_hash(RESOURCES_DIR / f"{name}.ui")
+    return f'SOURCE_SHA256 = "{source_hash}"' in compiled.read_text(encoding="utf-8")
+
+
+def measure(repeat: int) -> None:
+    """
+    .uiファイルごとに実行時の読み込み（uic.loadUi）とコンパイル済みの
+    モジュールでの構築の所要時間を計測して表示
+
+    Args:
+        repeat: 計測回数
+    """
+    # 画面がない環境でも計測できるようにする
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6 import uic
+    from PyQt6.QtWidgets import QApplication, QDialog, QMainWindow
+
+    app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841
+
+    print(f"{'ui':<16}  {'loadUi':>10}  {'compiled':>10}  {'delta':>10}")
+    for name in get_ui_names():
+        widget_class = QMainWindow if name == "main_window" else QDialog
+        ui_file = RESOURCES_DIR / f"{name}.ui"
+
+        runtime_samples = []
+        compiled_samples = []
+        for _ in range(repeat):
+            widget = widget_class()
+            start = time.perf_counter()
+            uic.loadUi(ui_file, widget)
+            runtime_samples.append(time.perf_counter() - start)
+            widget.deleteLater()
+
+            widget = widget_class()
+            start = time.perf_counter()
+            used_compiled = load_ui(widget, name)
+            compiled_samples.append(time.perf_counter() - start)
+            widget.deleteLater()
+            if not used_compiled:
+                print(f"エラー: {name}はコンパイルされていません", file=sys.stderr)
+                sys.exit(1)
+
+        runtime = statistics.median(runtime_samples)
+        compiled = statistics.median(compiled_samples)
+        print(
+            f"{name:<16}  {runtime * 1000:>8.2f}ms  {compiled * 1000:>8.2f}ms"
+            f"  {(runtime - compiled) * 1000:>8.2f}ms"
+        )
+
+
+def main():
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check", action="store_true",
+        help="コンパイル済みのモジュールが最新か確認する",
+    )
+    parser.add_argument(
+        "--measure", action="store_true", help="読み込みの所要時間を比較する"
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="計測回数")
+    args = parser.parse_args()
+
+    if args.check:
+        stale = [name for name in get_ui_names() if not is_up_to_date(name)]
+        for name in stale:
+            print(f"古いか存在しません: {name}.ui")
+        sys.exit(1 if stale else 0)
+
+    for name in get_ui_names():
+        output_file = compile_ui(name)
+        print(f"{name}.ui -> mini_text/ui/compiled/{output_file.name}")
+
+    if args.measure:
+        measure(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
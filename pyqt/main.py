@@ -5,14 +5,25 @@ import sys
 import os
 from PyQt6.QtWidgets import QApplication, QMessageBox
 
-from mini_text.utils.dependency_checker import DependencyChecker
-from mini_text.utils.x11_command_executor import X11CommandExecutor
-from mini_text.config.config_manager import ConfigManager
-from mini_text.services.window_service import WindowService
-from mini_text.services.clipboard_service import ClipboardService
-from mini_text.services.text_service import TextService
+import mini_text  # noqa: F401  共通パッケージ（mini_text_core）の検索パスを設定
+
+from mini_text_core.utils.dependency_checker import (
+    DependencyCache,
+    DependencyChecker,
+)
+from mini_text_core.config.config_manager import ConfigManager
+from mini_text_core.engine import create_engine
+from mini_text_core.services.hotkey_listener import create_hotkey_listener
+from mini_text.services.qt_clipboard_service import QtClipboardService
+from mini_text.services.async_qt_clipboard_service import AsyncQtClipboardService
+from mini_text_core.utils.job_queue import JobQueue
+from mini_text_core.utils.timing import get_tracer
+from mini_text.ui.qt_async import create_async_runner, run_event_loop
 from mini_text.ui.main_window import MainWindow
 
+# 依存関係の確認を省略するオプション（確認済みの場合）
+SKIP_CHECKS_OPTION = "--skip-checks"
+
 
 def check_dependencies() -> bool:
     """
@@ -21,7 +32,8 @@ def check_dependencies() -> bool:
     Returns:
         bool: 全ての依存関係が満たされている場合True
     """
-    all_available, missing = DependencyChecker.check_dependencies()
+    # 前回から PATH・ツールが変わっていなければ確認を省略（~/.cache/mini-text）
+    all_available, missing = DependencyChecker.check_all(cache=DependencyCache())
 
     if not all_available:
         # エラーダイアログを表示
@@ -59,30 +71,82 @@ def main():
         else:
             os.environ["QT_PLUGIN_PATH"] = system_qt6_plugins
 
+    argv = [arg for arg in sys.argv if arg != SKIP_CHECKS_OPTION]
+
     # 依存関係チェック（Qt初期化前に実行）
-    if not check_dependencies():
+    if len(argv) == len(sys.argv) and not check_dependencies():
         sys.exit(1)
 
     # QApplicationを作成
-    app = QApplication(sys.argv)
+    app = QApplication(argv)
 
     # 設定マネージャーを初期化
     config_manager = ConfigManager()
 
-    # X11コマンド実行ユーティリティを作成
-    executor = X11CommandExecutor()
-
-    # サービスを作成
-    window_service = WindowService(executor)
-    clipboard_service = ClipboardService(executor)
-    text_service = TextService(window_service, clipboard_service, executor)
+    # コマンド実行と送受信の所要時間の計測（既定では無効）
+    get_tracer().set_enabled(config_manager.is_timing_enabled())
+
+    # コマンド実行・ウィンドウ一覧・準備完了判定は共通パッケージで作成
+    # （ウィンドウ一覧はX11イベントで更新される
+    # キャッシュから取得、利用できない場合はxdotoolにフォールバック）
+    engine = create_engine(config_manager)
+    window_service = engine.window_service
+
+    # クリップボードはQClipboardでアプリケーション自身が所有する（xclipを起動しない）
+    clipboard_service = QtClipboardService(app.clipboard())
+
+    # コピー後はdataChangedシグナルでクリップボードの更新を検知して取得
+    text_service = engine.create_text_service(
+        clipboard_service, clipboard_notifier=clipboard_service
+    )
+
+    # 送受信はasyncio版サービスで実行し、UIスレッドをブロックしない
+    async_runner = create_async_runner(app)
+    async_clipboard_service = AsyncQtClipboardService(
+        app.clipboard(), async_runner.dispatch
+    )
+    async_text_service = engine.create_async_text_service(
+        async_clipboard_service, clipboard_notifier=async_clipboard_service
+    )
+    # 送受信ジョブは1件ずつ順に実行（連続操作は最新の1件にまとめる）
+    job_queue = JobQueue(async_runner)
 
     # メインウィンドウを作成
-    main_window = MainWindow(text_service, window_service, config_manager)
+    main_window = MainWindow(
+        text_service,
+        window_service,
+        config_manager,
+        async_text_service=async_text_service,
+        job_queue=job_queue,
+    )
     main_window.show()
 
+    # グローバルホットキー（他のアプリケーションから送受信を開始）
+    hotkey_listener = None
+    if config_manager.is_hotkeys_enabled():
+        hotkey_listener = create_hotkey_listener(
+            config_manager.get_hotkeys(),
+            main_window.on_hotkey,
+            dispatch=async_runner.dispatch,
+        )
+    if hotkey_listener is not None:
+        success, error_msg = hotkey_listener.start()
+        if error_msg:
+            main_window.show_status(
+                f"ホットキーを登録できませんでした: {error_msg}", is_error=True
+            )
+
     # アプリケーションを実行
-    sys.exit(app.exec())
+    exit_code = run_event_loop(app, async_runner)
+
+    # 実行中のジョブ・イベント処理スレッド・X接続を停止
+    if hotkey_listener is not None:
+        hotkey_listener.close()
+    job_queue.cancel_all()
+    async_runner.close()
+    engine.close()
+
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
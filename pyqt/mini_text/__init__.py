@@ -1,5 +1,15 @@
 """
 mini-text: Linux X11デスクトップ環境でウィンドウ間のテキスト送受信を支援するアプリケーション
+
+UIに依存しない処理は共通パッケージ（core/mini_text_core）にある
 """
 
+import importlib.util
+import sys
+from pathlib import Path
+
 __version__ = "0.1.0"
+
+# 共通パッケージがインストールされていない場合はリポジトリ内のものを使用
+if importlib.util.find_spec("mini_text_core") is None:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "core"))
@@ -0,0 +1,9 @@
+"""asyncio版クリップボード操作サービス（mini_text_core.services.async_clipboard_serviceの互換モジュール）"""
+
+import sys
+
+from mini_text_core.services import async_clipboard_service
+
+# 旧モジュール名でも共通パッケージのモジュールそのものを参照させる
+# （クラスの同一性とunittest.mock.patchの対象を共通パッケージと一致させる）
+sys.modules[__name__] = async_clipboard_service
@@ -0,0 +1,136 @@
+"""asyncio版QClipboardクリップボードサービス"""
+
+import asyncio
+import threading
+from typing import Any, Callable
+
+
+class AsyncQtClipboardService:
+    """
+    QClipboardをasyncioから使用するクリップボード操作サービス (SRP)
+
+    QClipboardはGUIスレッド以外から操作できないため、呼び出しは
+    dispatch（QtDispatcher）でGUIスレッドに渡し、結果をイベントループに戻す。
+    そのためイベントループがqasyncでも別スレッドでも動作する
+    """
+
+    def __init__(self, clipboard, dispatch: Callable[[Callable[[], None]], None]):
+        """
+        Args:
+            clipboard: QClipboardインスタンス
+            dispatch: 関数をGUIスレッドで実行させる関数（AsyncRunner.dispatch）
+        """
+        self.clipboard = clipboard
+        self.dispatch = dispatch
+
+        # dataChangedシグナルの受信回数（クリップボード更新通知）
+        self._change_count = 0
+        self._changed = threading.Condition()
+        self.clipboard.dataChanged.connect(self._on_data_changed)
+
+    async def copy_to_clipboard(self, text: str) -> tuple[bool, str]:
+        """
+        クリップボードにテキストをコピー
+
+        Args:
+            text: コピーするテキスト
+
+        Returns:
+            tuple[bool, str]: (成功したか, エラーメッセージ)
+        """
+        try:
+            await self._call_in_gui_thread(lambda: self.clipboard.setText(text))
+            return True, ""
+        except Exception as e:
+            return False, f"クリップボードへのコピーに失敗しました: {str(e)}"
+
+    async def get_from_clipboard(self) -> tuple[bool, str, str]:
+        """
+        クリップボードからテキストを取得
+
+        Returns:
+            tuple[bool, str, str]: (成功したか, テキスト, エラーメッセージ)
+        """
+        try:
+            text = await self._call_in_gui_thread(self.clipboard.text)
+            return True, text, ""
+        except Exception as e:
+            return False, "", f"クリップボードからの取得に失敗しました: {str(e)}"
+
+    async def get_from_primary(self) -> tuple[bool, str, str]:
+        """
+        PRIMARY（マウスで選択中のテキスト）を取得
+
+        Returns:
+            tuple[bool, str, str]: (成功したか, テキスト, エラーメッセージ)
+        """
+        try:
+            text = await self._call_in_gui_thread(
+                lambda: self.clipboard.text(self.clipboard.Mode.Selection)
+            )
+            return True, text, ""
+        except Exception as e:
+            return False, "", f"選択中のテキストの取得に失敗しました: {str(e)}"
+
+    def mark_change(self) -> int:
+        """
+        現時点のクリップボード更新回数を取得（コピー操作の前に呼び出す）
+
+        Returns:
+            int: wait_for_changeに渡す値
+        """
+        with self._changed:
+            return self._change_count
+
+    def wait_for_change(self, mark: int, timeout: float) -> bool:
+        """
+        mark_change以降にクリップボードが更新されるまで待機
+
+        dataChangedシグナルはGUIスレッドで届くため、GUIスレッド以外
+        （asyncio.to_threadなど）から呼び出す
+
+        Args:
+            mark: mark_changeの戻り値
+            timeout: 待機時間の上限(秒)
+
+        Returns:
+            bool: 上限時間内に更新されたか
+        """
+        with self._changed:
+            return self._changed.wait_for(
+                lambda: self._change_count > mark, timeout=timeout
+            )
+
+    async def _call_in_gui_thread(self, func: Callable[[], Any]) -> Any:
+        """関数をGUIスレッドで実行し、結果（または例外）を待つ"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def invoke():
+            try:
+                result = func()
+            except Exception as e:
+                loop.call_soon_threadsafe(_set_exception, future, e)
+                return
+            loop.call_soon_threadsafe(_set_result, future, result)
+
+        self.dispatch(invoke)
+        return await future
+
+    def _on_data_changed(self) -> None:
+        """dataChangedシグナルのハンドラ（GUIスレッド）"""
+        with self._changed:
+            self._change_count += 1
+            self._changed.notify_all()
+
+
+def _set_result(future: asyncio.Future, result) -> None:
+    """キャンセル済みでなければFutureに結果を設定"""
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future, error: BaseException) -> None:
+    """キャンセル済みでなければFutureに例外を設定"""
+    if not future.done():
+        future.set_exception(error)
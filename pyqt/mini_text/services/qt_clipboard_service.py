@@ -0,0 +1,119 @@
+"""QClipboardを使用したクリップボードサービス"""
+
+from typing import Optional
+
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtGui import QClipboard, QGuiApplication
+
+
+class QtClipboardService:
+    """
+    QClipboardを使用したクリップボード操作サービス (SRP)
+
+    xclipを起動せず、アプリケーション自身がCLIPBOARDの所有者になるため、
+    コピーごとのプロセス起動と常駐するxclipプロセスがなくなる。
+    大きなデータのINCR転送はQtのxcbプラットフォームプラグインが処理する
+
+    注意: QClipboardはGUIスレッドから呼び出すこと。
+    アプリケーション終了後もクリップボードの内容を残すには
+    クリップボードマネージャーが必要
+    """
+
+    def __init__(self, clipboard: Optional[QClipboard] = None):
+        """
+        Args:
+            clipboard: QClipboardインスタンス（Noneの場合はアプリケーションのものを使用）
+        """
+        if clipboard is None:
+            clipboard = QGuiApplication.clipboard()
+            if clipboard is None:
+                raise RuntimeError("クリップボードが取得できません")
+        self.clipboard = clipboard
+
+        # dataChangedシグナルの受信回数（クリップボード更新通知）
+        self._change_count = 0
+        self.clipboard.dataChanged.connect(self._on_data_changed)
+
+    def copy_to_clipboard(self, text: str) -> tuple[bool, str]:
+        """
+        クリップボードにテキストをコピー
+
+        Args:
+            text: コピーするテキスト
+
+        Returns:
+            tuple[bool, str]: (成功したか, エラーメッセージ)
+        """
+        try:
+            self.clipboard.setText(text, QClipboard.Mode.Clipboard)
+            return True, ""
+        except Exception as e:
+            return False, f"クリップボードへのコピーに失敗しました: {str(e)}"
+
+    def get_from_clipboard(self) -> tuple[bool, str, str]:
+        """
+        クリップボードからテキストを取得
+
+        Returns:
+            tuple[bool, str, str]: (成功したか, テキスト, エラーメッセージ)
+        """
+        try:
+            return True, self.clipboard.text(QClipboard.Mode.Clipboard), ""
+        except Exception as e:
+            return False, "", f"クリップボードからの取得に失敗しました: {str(e)}"
+
+    def get_from_primary(self) -> tuple[bool, str, str]:
+        """
+        PRIMARY（マウスで選択中のテキスト）を取得
+
+        Returns:
+            tuple[bool, str, str]: (成功したか, テキスト, エラーメッセージ)
+        """
+        try:
+            return True, self.clipboard.text(QClipboard.Mode.Selection), ""
+        except Exception as e:
+            return False, "", f"選択中のテキストの取得に失敗しました: {str(e)}"
+
+    def mark_change(self) -> int:
+        """
+        現時点のクリップボード更新回数を取得（コピー操作の前に呼び出す）
+
+        Returns:
+            int: wait_for_changeに渡す値
+        """
+        return self._change_count
+
+    def wait_for_change(self, mark: int, timeout: float) -> bool:
+        """
+        mark_change以降にクリップボードが更新されるまで待機
+
+        ローカルのQEventLoopでdataChangedシグナルかタイマーを待つため、
+        更新された時点で戻り、待機中にCPUを使わない
+
+        Args:
+            mark: mark_changeの戻り値
+            timeout: 待機時間の上限(秒)
+
+        Returns:
+            bool: 上限時間内に更新されたか
+        """
+        if self._change_count > mark:
+            return True
+
+        loop = QEventLoop()
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.timeout.connect(loop.quit)
+        self.clipboard.dataChanged.connect(loop.quit)
+        timer.start(int(timeout * 1000))
+        try:
+            loop.exec()
+        finally:
+            timer.stop()
+            self.clipboard.dataChanged.disconnect(loop.quit)
+
+        return self._change_count > mark
+
+    def _on_data_changed(self) -> None:
+        """dataChangedシグナルのハンドラ"""
+        self._change_count += 1
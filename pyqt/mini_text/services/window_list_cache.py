@@ -0,0 +1,9 @@
+"""X11イベント駆動のウィンドウ一覧キャッシュ（mini_text_core.services.window_list_cacheの互換モジュール）"""
+
+import sys
+
+from mini_text_core.services import window_list_cache
+
+# 旧モジュール名でも共通パッケージのモジュールそのものを参照させる
+# （クラスの同一性とunittest.mock.patchの対象を共通パッケージと一致させる）
+sys.modules[__name__] = window_list_cache
@@ -0,0 +1 @@
+"""build_ui.pyが.uiファイルからコンパイルしたモジュール（ui_<名前>.py、リポジトリには含めない）"""
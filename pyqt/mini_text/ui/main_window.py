@@ -1,15 +1,22 @@
 """メインウィンドウ"""
 
+import asyncio
 import os
 import time
-from pathlib import Path
-from PyQt6 import QtCore, uic
+from typing import Optional
+from PyQt6 import QtCore
 from PyQt6.QtWidgets import QMainWindow, QMessageBox
 from PyQt6.QtCore import Qt
 
-from mini_text.services.window_service import WindowService
-from mini_text.services.text_service import TextService
-from mini_text.config.config_manager import ConfigManager
+from mini_text_core.services.window_service import WindowService
+from mini_text_core.services.text_service import TextService
+from mini_text_core.services.async_text_service import AsyncTextService
+from mini_text_core.config.config_manager import ConfigManager
+from mini_text_core.utils.job_queue import JobQueue
+from mini_text_core.utils.timing import get_tracer
+from mini_text.ui.timing_dialog import TimingDialog
+from mini_text.ui.ui_loader import load_ui
+from mini_text.ui.window_list_model import WindowListModel
 
 
 class MainWindow(QMainWindow):
@@ -20,18 +27,34 @@ class MainWindow(QMainWindow):
         text_service: TextService,
         window_service: WindowService,
         config_manager: ConfigManager,
+        async_text_service: Optional[AsyncTextService] = None,
+        job_queue: Optional[JobQueue] = None,
     ):
         """
         Args:
             text_service: テキスト送受信サービス
             window_service: ウィンドウ操作サービス
             config_manager: 設定管理
+            async_text_service: 非同期テキスト送受信サービス
+                （job_queueと併せて指定した場合、送受信中もUIをブロックしない）
+            job_queue: 送受信ジョブのキュー
         """
         super().__init__()
 
         self.text_service = text_service
         self.window_service = window_service
         self.config_manager = config_manager
+        self.async_text_service = async_text_service
+        self.job_queue = job_queue
+
+        # まとめて送信するテキストのキュー
+        self.send_queue: list[str] = []
+
+        # ウィンドウごとのコピー対象の入力欄の位置（待機後のコピーで記録する）
+        self.focus_points: dict[str, tuple[int, int]] = {}
+
+        # 最後に送信したウィンドウ（グローバルホットキーでの送信先）
+        self.last_send_target: Optional[str] = None
 
         # UIをセットアップ
         self.setup_ui()
@@ -46,15 +69,16 @@ class MainWindow(QMainWindow):
     def setup_ui(self) -> None:
         """
         UIをセットアップ
-        - .uiファイルをロード
+        - .uiファイルをロード（コンパイル済みのモジュールがあればそれを使用）
         - シグナルとスロットを接続
         - 常に最前面フラグを設定
         """
-        # .uiファイルのパスを取得
-        ui_file = Path(__file__).parent / "resources" / "main_window.ui"
-
         # UIをロード
-        uic.loadUi(ui_file, self)
+        load_ui(self, "main_window")
+
+        # ウィンドウ一覧のモデル（更新は差分のみ適用）
+        self.window_list_model = WindowListModel(self)
+        self.window_list.setModel(self.window_list_model)
 
         # 常に最前面に設定
         self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, True)
@@ -63,24 +87,21 @@ class MainWindow(QMainWindow):
         self.refresh_button.clicked.connect(self.on_refresh_clicked)
         self.send_button.clicked.connect(self.on_send_clicked)
         self.copy_button.clicked.connect(self.on_copy_clicked)
+        self.copy_from_button.clicked.connect(self.on_copy_from_clicked)
+        self.cancel_button.clicked.connect(self.on_cancel_clicked)
+        self.queue_add_button.clicked.connect(self.on_queue_add_clicked)
+        self.queue_send_button.clicked.connect(self.on_queue_send_clicked)
+        self.queue_clear_button.clicked.connect(self.on_queue_clear_clicked)
 
         # メニューアクションを接続
         self.action_settings.triggered.connect(self.on_settings_clicked)
+        self.action_timing.triggered.connect(self.on_timing_clicked)
         self.action_quit.triggered.connect(self.close)
 
     def refresh_window_list(self) -> None:
-        """ウィンドウ一覧を更新"""
-        # リストをクリア
-        self.window_list.clear()
-
-        # ウィンドウ一覧を取得
+        """ウィンドウ一覧を更新（前回との差分のみ反映）"""
         windows = self.window_service.get_window_list()
-
-        # リストに追加
-        for window_id, window_name in windows:
-            # 表示形式: "ID: 名前"
-            display_text = f"{window_id}: {window_name}"
-            self.window_list.addItem(display_text)
+        self.window_list_model.update(windows)
 
         # ステータスバーに表示
         self.show_status(f"ウィンドウリストを更新しました ({len(windows)}件)")
@@ -91,9 +112,9 @@ class MainWindow(QMainWindow):
 
     def on_send_clicked(self) -> None:
         """送信ボタンクリック時の処理"""
-        # ウィンドウが選択されているか確認
-        current_item = self.window_list.currentItem()
-        if not current_item:
+        # ウィンドウIDを取得（複数選択可、一覧の表示順に送信する）
+        window_ids = self._get_selected_window_ids()
+        if not window_ids:
             self.show_status("ウィンドウを選択してください", is_error=True)
             return
 
@@ -103,23 +124,175 @@ class MainWindow(QMainWindow):
             self.show_status("送信するテキストを入力してください", is_error=True)
             return
 
-        # ウィンドウIDを取得 (表示形式: "ID: 名前" から IDを抽出)
-        window_id = current_item.text().split(":")[0]
-
         # 設定から待機時間を取得
         activate_wait = self.config_manager.get_timing("window_activate_wait")
         key_wait = self.config_manager.get_timing("key_input_wait")
 
+        # 複数選択時はクリップボードへのコピーを1回にまとめて送信
+        if len(window_ids) > 1:
+            if self._is_async():
+                self.show_status(f"テキストを送信中... ({len(window_ids)}件)")
+                self._run_async(
+                    lambda progress: self.async_text_service.send_text_many(
+                        window_ids, text, activate_wait, key_wait, progress
+                    ),
+                    self._on_send_many_finished,
+                    key=("send", tuple(window_ids), text),
+                    on_progress=self._on_send_progress,
+                )
+            else:
+                self._on_send_many_finished(
+                    self.text_service.send_text_many(
+                        window_ids, text, activate_wait, key_wait
+                    )
+                )
+            return
+
+        window_id = window_ids[0]
+        # ホットキーでの送信先として記録
+        self.last_send_target = window_id
+
         # テキストを送信
-        success, error_msg = self.text_service.send_text(
-            window_id, text, activate_wait, key_wait
-        )
+        if self._is_async():
+            self.show_status("テキストを送信中...")
+            self._run_async(
+                lambda progress: self.async_text_service.send_text(
+                    window_id, text, activate_wait, key_wait
+                ),
+                self._on_send_finished,
+                key=("send", (window_id,), text),
+            )
+        else:
+            self._on_send_finished(
+                self.text_service.send_text(window_id, text, activate_wait, key_wait)
+            )
 
+    def _on_send_finished(self, result: tuple[bool, str]) -> None:
+        """送信完了時の処理"""
+        success, error_msg = result
         if success:
             self.show_status("テキストを送信しました")
         else:
             self.show_status(f"エラー: {error_msg}", is_error=True)
 
+    def _on_send_progress(self, done: int, total: int) -> None:
+        """複数ウィンドウへの送信の進捗を表示"""
+        self.show_status(f"テキストを送信中... ({done}/{total})")
+
+    def _on_send_many_finished(self, results: list[tuple[str, bool, str]]) -> None:
+        """複数ウィンドウへの送信完了時の処理"""
+        failures = [
+            (window_id, error_msg)
+            for window_id, success, error_msg in results
+            if not success
+        ]
+        if not failures:
+            self.show_status(f"テキストを送信しました ({len(results)}件)")
+            return
+
+        details = ", ".join(
+            f"{window_id}: {error_msg}" for window_id, error_msg in failures
+        )
+        self.show_status(
+            f"エラー: {len(results)}件中{len(failures)}件の送信に失敗しました ({details})",
+            is_error=True,
+        )
+
+    def _get_selected_window_ids(self) -> list[str]:
+        """選択されているウィンドウのID（一覧の表示順）"""
+        selected_rows = self.window_list.selectionModel().selectedRows()
+        rows = sorted(index.row() for index in selected_rows)
+        return [self.window_list_model.window_id(row) for row in rows]
+
+    def on_queue_add_clicked(self) -> None:
+        """キューに追加ボタンクリック時の処理"""
+        text = self.text_edit.toPlainText()
+        if not text:
+            self.show_status("キューに追加するテキストを入力してください", is_error=True)
+            return
+
+        # 次のテキストを続けて入力できるようにクリアする
+        self.send_queue.append(text)
+        self.text_edit.setPlainText("")
+        self._update_queue_buttons()
+        self.show_status(f"キューに追加しました ({len(self.send_queue)}件)")
+
+    def on_queue_send_clicked(self) -> None:
+        """まとめて送信ボタンクリック時の処理"""
+        window_ids = self._get_selected_window_ids()
+        if len(window_ids) != 1:
+            self.show_status(
+                "まとめて送信する送信先のウィンドウを1つ選択してください", is_error=True
+            )
+            return
+        if not self.send_queue:
+            self.show_status("キューにテキストがありません", is_error=True)
+            return
+
+        window_id = window_ids[0]
+        # ホットキーでの送信先として記録
+        self.last_send_target = window_id
+        texts = list(self.send_queue)
+        activate_wait = self.config_manager.get_timing("window_activate_wait")
+        key_wait = self.config_manager.get_paste_wait()
+        separator_keys = self.config_manager.get_separator_keys()
+
+        # アクティブ化は1回のみで、テキストごとにコピーとペーストを繰り返す
+        if self._is_async():
+            self.show_status(f"テキストを送信中... ({len(texts)}件)")
+            self._run_async(
+                lambda progress: self.async_text_service.send_text_sequence(
+                    window_id, texts, activate_wait, key_wait, separator_keys, progress
+                ),
+                lambda results: self._on_send_sequence_finished(texts, results),
+                key=("send_sequence", window_id, tuple(texts)),
+                on_progress=self._on_send_progress,
+            )
+        else:
+            self._on_send_sequence_finished(
+                texts,
+                self.text_service.send_text_sequence(
+                    window_id, texts, activate_wait, key_wait, separator_keys
+                ),
+            )
+
+    def _on_send_sequence_finished(
+        self, texts: list[str], results: list[tuple[bool, str]]
+    ) -> None:
+        """まとめて送信の完了時の処理（送信できたテキストをキューから削除）"""
+        sent = 0
+        for success, _ in results:
+            if not success:
+                break
+            sent += 1
+        # 送信中にクリアされた場合などはキューを変更しない
+        if self.send_queue[:sent] == texts[:sent]:
+            del self.send_queue[:sent]
+        self._update_queue_buttons()
+
+        if sent == len(texts):
+            self.show_status(f"テキストを送信しました ({sent}件)")
+            return
+        error_msg = results[sent][1]
+        self.show_status(
+            f"エラー: {len(texts)}件中{sent}件を送信しました"
+            f"（残りはキューに残っています）: {error_msg}",
+            is_error=True,
+        )
+
+    def on_queue_clear_clicked(self) -> None:
+        """キューをクリアボタンクリック時の処理"""
+        self.send_queue.clear()
+        self._update_queue_buttons()
+        self.show_status("キューをクリアしました")
+
+    def _update_queue_buttons(self) -> None:
+        """キューの件数をボタンに表示（空の場合は無効化）"""
+        count = len(self.send_queue)
+        self.queue_send_button.setText(f"まとめて送信 ({count})")
+        self.queue_send_button.setEnabled(count > 0)
+        self.queue_clear_button.setEnabled(count > 0)
+
     def on_copy_clicked(self) -> None:
         """コピーボタンクリック時の処理"""
         # 設定から待機時間を取得
@@ -131,6 +304,15 @@ class MainWindow(QMainWindow):
             f"{copyfrom_wait}秒後にコピーを開始します。対象のテキストボックスをクリックしてください"
         )
 
+        if self._is_async():
+            # 待機もイベントループ上で行い、UIスレッドをブロックしない
+            self._run_async(
+                lambda progress: self._copy_after_wait(copyfrom_wait, key_wait),
+                self._on_wait_copy_finished,
+                key="wait_copy",
+            )
+            return
+
         # GUIを更新してメッセージを表示
         QtCore.QCoreApplication.processEvents()
 
@@ -138,8 +320,65 @@ class MainWindow(QMainWindow):
         time.sleep(copyfrom_wait)
 
         # テキストを取得
-        success, text, error_msg = self.text_service.receive_text(key_wait)
+        pointer = self.window_service.get_pointer_in_active_window()
+        self._on_wait_copy_finished(
+            (self.text_service.receive_text(key_wait), pointer)
+        )
+
+    async def _copy_after_wait(self, copyfrom_wait: float, key_wait: float):
+        """
+        copyfrom_wait秒待ってからテキストを取得（コルーチン）
 
+        Returns:
+            (受信結果, クリックされた入力欄の位置（取得できない場合はNone）)
+        """
+        await asyncio.sleep(copyfrom_wait)
+        pointer = await asyncio.to_thread(
+            self.window_service.get_pointer_in_active_window
+        )
+        return await self.async_text_service.receive_text(key_wait), pointer
+
+    def _on_wait_copy_finished(self, outcome) -> None:
+        """待機後のコピー完了時の処理（成功した場合は入力欄の位置を記録）"""
+        result, pointer = outcome
+        if result[0] and pointer is not None:
+            window_id, point = pointer
+            self.focus_points[window_id] = point
+        self._on_copy_finished(result)
+
+    def on_copy_from_clicked(self) -> None:
+        """選択先からコピーボタンクリック時の処理"""
+        window_ids = self._get_selected_window_ids()
+        if len(window_ids) != 1:
+            self.show_status("コピー元のウィンドウを1つ選択してください", is_error=True)
+            return
+
+        window_id = window_ids[0]
+        activate_wait = self.config_manager.get_timing("window_activate_wait")
+        key_wait = self.config_manager.get_timing("key_input_wait")
+        # 以前のコピーで記録した入力欄があればクリックしてフォーカスする
+        focus_point = self.focus_points.get(window_id)
+
+        # ユーザーのクリックを待たず、すぐにアクティブ化して全選択・コピーする
+        if self._is_async():
+            self.show_status("テキストをコピー中...")
+            self._run_async(
+                lambda progress: self.async_text_service.receive_text_from(
+                    window_id, activate_wait, key_wait, focus_point
+                ),
+                self._on_copy_finished,
+                key=("copy_from", window_id),
+            )
+        else:
+            self._on_copy_finished(
+                self.text_service.receive_text_from(
+                    window_id, activate_wait, key_wait, focus_point
+                )
+            )
+
+    def _on_copy_finished(self, result: tuple[bool, str, str]) -> None:
+        """コピー完了時の処理"""
+        success, text, error_msg = result
         if success:
             # テキストボックスに表示
             self.text_edit.setPlainText(text)
@@ -147,6 +386,131 @@ class MainWindow(QMainWindow):
         else:
             self.show_status(f"エラー: {error_msg}", is_error=True)
 
+    def on_hotkey(self, action: str, pressed_at: float) -> None:
+        """
+        グローバルホットキーが押されたときの処理（UIスレッドで呼ばれる）
+
+        Args:
+            action: "send"（最後に送信したウィンドウに送信）または
+                "copy"（フォーカスのあるウィンドウから取得）
+            pressed_at: ホットキーが押された時刻（time.perf_counter()の値）
+        """
+        if action == "send":
+            self._send_by_hotkey(pressed_at)
+        elif action == "copy":
+            self._copy_by_hotkey(pressed_at)
+
+    def _send_by_hotkey(self, pressed_at: float) -> None:
+        """入力欄のテキストを最後に送信したウィンドウに送信"""
+        if self.last_send_target is None:
+            self.show_status(
+                "ホットキーでの送信先がありません（一度ボタンで送信してください）",
+                is_error=True,
+            )
+            return
+
+        text = self.text_edit.toPlainText()
+        if not text:
+            self.show_status("送信するテキストを入力してください", is_error=True)
+            return
+
+        window_id = self.last_send_target
+        activate_wait = self.config_manager.get_timing("window_activate_wait")
+        key_wait = self.config_manager.get_timing("key_input_wait")
+
+        def on_done(result):
+            self._on_hotkey_finished("send", pressed_at, result)
+            self._on_send_finished(result)
+
+        if self._is_async():
+            self._run_async(
+                lambda progress: self.async_text_service.send_text(
+                    window_id, text, activate_wait, key_wait
+                ),
+                on_done,
+                key=("hotkey_send", window_id, text),
+            )
+        else:
+            on_done(
+                self.text_service.send_text(window_id, text, activate_wait, key_wait)
+            )
+
+    def _copy_by_hotkey(self, pressed_at: float) -> None:
+        """フォーカスのあるウィンドウから待たずにテキストを取得"""
+        key_wait = self.config_manager.get_timing("key_input_wait")
+
+        def on_done(result):
+            self._on_hotkey_finished("copy", pressed_at, result)
+            self._on_copy_finished(result)
+
+        # ホットキーを押したウィンドウにフォーカスがあるため、すぐに全選択・コピーする
+        if self._is_async():
+            self._run_async(
+                lambda progress: self.async_text_service.receive_text(key_wait),
+                on_done,
+                key="hotkey_copy",
+            )
+        else:
+            on_done(self.text_service.receive_text(key_wait))
+
+    def _on_hotkey_finished(self, action: str, pressed_at: float, result) -> None:
+        """ホットキーが押されてから送受信が完了するまでの時間を記録"""
+        get_tracer().record(f"hotkey.{action}", pressed_at, ok=result[0])
+
+    def _is_async(self) -> bool:
+        """非同期サービスを使用するか"""
+        return self.async_text_service is not None and self.job_queue is not None
+
+    def _run_async(self, factory, on_done, key=None, on_progress=None) -> None:
+        """
+        送受信ジョブをキューに投入（UIスレッドはブロックしない）
+
+        実行中に同じ操作を連続して行った場合、待機中のジョブは最新の1件にまとめられる
+        （まとめた件数はステータスバーに表示する）
+
+        Args:
+            factory: 進捗通知の関数を受け取り、実行するコルーチンを返す関数
+            on_done: 完了時にUIスレッドで呼ばれるコールバック
+            key: 連続投入をまとめるためのキー（送信は送信先とテキストを含め、
+                内容の異なる送信がまとめられないようにする。完了時の処理が
+                異なる操作は、まとめると古い方の処理が行われないため別のキーにする）
+            on_progress: 進捗通知時にUIスレッドで呼ばれるコールバック
+        """
+
+        def done(result):
+            self._update_cancel_button()
+            on_done(result)
+
+        def error(e):
+            self._update_cancel_button()
+            self.show_status(f"エラー: {str(e)}", is_error=True)
+
+        job = self.job_queue.submit(factory, done, error, on_progress, key=key)
+        if job is None:
+            self.show_status(
+                "処理待ちの操作が多すぎます。完了を待ってから再度実行してください",
+                is_error=True,
+            )
+        elif job.coalesced:
+            self.show_status(
+                f"処理待ちの同じ操作{job.coalesced}件を最新の1件にまとめました"
+            )
+        self._update_cancel_button()
+
+    def on_cancel_clicked(self) -> None:
+        """キャンセルボタンクリック時の処理"""
+        if not self._is_async():
+            return
+        count = self.job_queue.cancel_all()
+        self._update_cancel_button()
+        if count:
+            self.show_status(f"{count}件の操作をキャンセルしました")
+
+    def _update_cancel_button(self) -> None:
+        """処理中・処理待ちの操作がある場合のみキャンセルボタンを有効化"""
+        busy = self._is_async() and self.job_queue.get_queue_depth() > 0
+        self.cancel_button.setEnabled(busy)
+
     def on_settings_clicked(self) -> None:
         """設定メニュークリック時の処理"""
         # Phase 4で実装
@@ -154,6 +518,11 @@ class MainWindow(QMainWindow):
             self, "情報", "設定機能はPhase 4で実装されます"
         )
 
+    def on_timing_clicked(self) -> None:
+        """所要時間の計測メニュークリック時の処理"""
+        dialog = TimingDialog(self, self.config_manager)
+        dialog.show()
+
     def show_status(self, message: str, is_error: bool = False) -> None:
         """
         ステータスバーにメッセージを表示
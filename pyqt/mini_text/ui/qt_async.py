@@ -0,0 +1,78 @@
+"""Qtイベントループとasyncioの統合"""
+
+import asyncio
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtWidgets import QApplication
+
+from mini_text_core.utils.async_runner import AsyncRunner
+
+
+class QtDispatcher(QObject):
+    """
+    関数をQtのメインスレッドで実行させるディスパッチャ
+
+    別スレッドからシグナルを発行すると、キュー接続によって
+    メインスレッドのイベントループでスロットが実行される
+    """
+
+    _invoke = pyqtSignal(object)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._invoke.connect(self._on_invoke)
+
+    def __call__(self, func: Callable[[], None]) -> None:
+        """関数をメインスレッドで実行する"""
+        self._invoke.emit(func)
+
+    def _on_invoke(self, func: Callable[[], None]) -> None:
+        func()
+
+
+def create_async_runner(app: QApplication) -> AsyncRunner:
+    """
+    PyQt6用のAsyncRunnerを作成
+
+    qasyncがインストールされている場合はasyncioをQtのイベントループ上で動かす
+    （この場合はrun_event_loop()でアプリケーションを実行すること）。
+    ない場合は専用スレッドでイベントループを動かし、結果をシグナルでUIスレッドに戻す
+
+    Args:
+        app: QApplicationインスタンス
+
+    Returns:
+        AsyncRunner: UIスレッドから使用するランナー
+    """
+    dispatcher = QtDispatcher(app)
+
+    try:
+        import qasync
+    except ImportError:
+        return AsyncRunner(dispatcher)
+
+    loop = qasync.QEventLoop(app)
+    asyncio.set_event_loop(loop)
+    return AsyncRunner(dispatcher, loop=loop)
+
+
+def run_event_loop(app: QApplication, runner: AsyncRunner) -> int:
+    """
+    アプリケーションのイベントループを実行
+
+    Args:
+        app: QApplicationインスタンス
+        runner: create_async_runner()で作成したランナー
+
+    Returns:
+        int: 終了コード（app.exit()・QApplication.exit()に渡された値）
+    """
+    if runner.owns_loop():
+        return app.exec()
+
+    # qasyncのループはQtのイベントループを兼ねる
+    # （run_forever()は内部で実行したapp.exec()の終了コードを返す）
+    with runner.loop:
+        exit_code = runner.loop.run_forever()
+    return exit_code if isinstance(exit_code, int) else 0
@@ -0,0 +1,79 @@
+"""所要時間の計測ダイアログ"""
+
+from typing import Optional
+from PyQt6.QtGui import QFontDatabase
+from PyQt6.QtWidgets import QDialog
+
+from mini_text_core.config.config_manager import ConfigManager
+from mini_text_core.utils.timing import Tracer, get_default_dump_path, get_tracer
+from mini_text.ui.ui_loader import load_ui
+
+
+class TimingDialog(QDialog):
+    """処理段階ごとの所要時間を表示するデバッグ用ダイアログ"""
+
+    def __init__(
+        self,
+        parent,
+        config_manager: ConfigManager,
+        tracer: Optional[Tracer] = None,
+    ):
+        """
+        Args:
+            parent: 親ウィンドウ
+            config_manager: 設定管理
+            tracer: 表示するトレーサー（Noneの場合は共有のものを使用）
+        """
+        super().__init__(parent)
+
+        self.config_manager = config_manager
+        self.tracer = tracer or get_tracer()
+
+        load_ui(self, "timing_dialog")
+        self.summary_view.setFont(
+            QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
+        )
+
+        self.enabled_check.setChecked(self.tracer.enabled)
+        self.refresh_summary()
+
+        # シグナルとスロットを接続
+        self.enabled_check.toggled.connect(self.on_enabled_toggled)
+        self.refresh_button.clicked.connect(self.refresh_summary)
+        self.clear_button.clicked.connect(self.on_clear_clicked)
+        self.save_json_button.clicked.connect(self.on_save_json_clicked)
+        self.save_trace_button.clicked.connect(self.on_save_trace_clicked)
+        self.close_button.clicked.connect(self.close)
+
+    def refresh_summary(self) -> None:
+        """集計結果を表示"""
+        self.summary_view.setPlainText(self.tracer.format_summary())
+
+    def on_enabled_toggled(self, enabled: bool) -> None:
+        """計測の有効・無効の切り替え時の処理（設定にも保存）"""
+        self.tracer.set_enabled(enabled)
+        self.config_manager.set_timing_enabled(enabled)
+        self.config_manager.save_config()
+
+    def on_clear_clicked(self) -> None:
+        """クリアボタンクリック時の処理"""
+        self.tracer.clear()
+        self.refresh_summary()
+        self.status_label.setText("")
+
+    def on_save_json_clicked(self) -> None:
+        """JSONで保存ボタンクリック時の処理"""
+        path = get_default_dump_path("timing")
+        self.show_result(path, *self.tracer.dump_json(path))
+
+    def on_save_trace_clicked(self) -> None:
+        """Chrome traceで保存ボタンクリック時の処理"""
+        path = get_default_dump_path("trace")
+        self.show_result(path, *self.tracer.dump_chrome_trace(path))
+
+    def show_result(self, path: str, success: bool, error_msg: str) -> None:
+        """保存結果を表示"""
+        if success:
+            self.status_label.setText(f"保存しました: {path}")
+        else:
+            self.status_label.setText(error_msg)
@@ -0,0 +1,130 @@
+"""Qt Designerの.uiファイルの読み込み（事前にコンパイルしたPythonモジュールを優先）
+
+uic.loadUiは起動のたびにXMLを解析してウィンドウを組み立てるため、
+build_ui.pyで.uiファイルをPythonモジュール（mini_text/ui/compiled/ui_<名前>.py）に
+コンパイルしておき、存在する場合はそれを使用する。
+
+コンパイル済みのモジュールには元の.uiファイルのSHA-256を記録し、
+.uiファイルが変更されている場合（古い場合）は使用せず実行時に読み込む
+"""
+
+import hashlib
+import importlib
+import io
+from pathlib import Path
+from typing import Optional
+
+
+# .uiファイルのディレクトリ
+RESOURCES_DIR = Path(__file__).parent / "resources"
+
+# コンパイル済みのモジュールを置くパッケージ
+COMPILED_PACKAGE = "mini_text.ui.compiled"
+COMPILED_DIR = Path(__file__).parent / "compiled"
+
+
+def get_source_hash(ui_file: Path) -> str:
+    """
+    .uiファイルのSHA-256を取得
+
+    Args:
+        ui_file: .uiファイルのパス
+
+    Returns:
+        str: 16進数のハッシュ値
+    """
+    return hashlib.sha256(ui_file.read_bytes()).hexdigest()
+
+
+def load_ui(
+    widget,
+    name: str,
+    resources_dir: Path = RESOURCES_DIR,
+    compiled_package: str = COMPILED_PACKAGE,
+) -> bool:
+    """
+    .uiファイルの内容をウィジェットに構築
+
+    uic.loadUiと同様に、名前の付いた子ウィジェット・アクションを
+    ウィジェットの属性として設定する
+
+    Args:
+        widget: 構築先のウィジェット（QMainWindow、QDialogなど）
+        name: .uiファイルの名前（拡張子なし）
+        resources_dir: .uiファイルのディレクトリ
+        compiled_package: コンパイル済みのモジュールを置くパッケージ
+
+    Returns:
+        bool: コンパイル済みのモジュールを使用したか
+            （Falseの場合は実行時にuic.loadUiで読み込んだ）
+    """
+    ui_file = resources_dir / f"{name}.ui"
+    ui_class = _find_compiled_class(ui_file, f"{compiled_package}.ui_{name}")
+    if ui_class is None:
+        # uicはXMLの解析器を含むため、必要な場合のみ読み込む
+        from PyQt6 import uic
+
+        uic.loadUi(ui_file, widget)
+        return False
+
+    ui = ui_class()
+    ui.setupUi(widget)
+    # setupUiは子ウィジェットをUiクラスの属性に設定するため、ウィジェットに移す
+    for attr_name, value in vars(ui).items():
+        setattr(widget, attr_name, value)
+    return True
+
+
+def _find_compiled_class(ui_file: Path, module_name: str) -> Optional[type]:
+    """コンパイル済みのUiクラスを取得（ない場合・古い場合はNone）"""
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+    if getattr(module, "SOURCE_SHA256", None) != get_source_hash(ui_file):
+        return None
+    return getattr(module, "UI_CLASS", None)
+
+
+def compile_ui(
+    name: str,
+    resources_dir: Path = RESOURCES_DIR,
+    output_dir: Path = COMPILED_DIR,
+) -> Path:
+    """
+    .uiファイルをPythonモジュールにコンパイル
+
+    Args:
+        name: .uiファイルの名前（拡張子なし）
+        resources_dir: .uiファイルのディレクトリ
+        output_dir: 出力先のディレクトリ
+
+    Returns:
+        Path: 出力したモジュールのパス
+    """
+    from PyQt6 import uic
+
+    ui_file = resources_dir / f"{name}.ui"
+    output = io.StringIO()
+    uic.compileUi(str(ui_file), output)
+    source = output.getvalue()
+
+    class_name = _get_ui_class_name(source)
+    source += (
+        "\n\n# build_ui.pyが追加（mini_text.ui.ui_loaderが参照）\n"
+        f'SOURCE_SHA256 = "{get_source_hash(ui_file)}"\n'
+        f"UI_CLASS = {class_name}\n"
+    )
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_file = output_dir / f"ui_{name}.py"
+    output_file.write_text(source, encoding="utf-8")
+    return output_file
+
+
+def _get_ui_class_name(source: str) -> str:
+    """uic.compileUiが生成したUiクラスの名前を取得"""
+    for line in source.splitlines():
+        if line.startswith("class Ui_"):
+            return line[len("class "):].split("(")[0].split(":")[0].strip()
+    raise ValueError("Uiクラスが見つかりません")
@@ -0,0 +1,67 @@
+"""ウィンドウ一覧のリストモデル（QListView用）"""
+
+from typing import Optional
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QObject, Qt
+
+from mini_text_core.services.window_list_diff import diff_window_lists
+
+
+class WindowListModel(QAbstractListModel):
+    """
+    ウィンドウ一覧のリストモデル (SRP)
+
+    一覧の更新は前回との差分のみを行の削除・挿入・変更として通知する
+    （変更のない行の選択状態は維持される）。項目ごとのQListWidgetItemを
+    作らず、QListViewが表示中の行だけを描画する
+    """
+
+    # ウィンドウIDを取得するロール
+    WindowIdRole = Qt.ItemDataRole.UserRole
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        # [(window_id, window_name), ...]
+        self._windows: list[tuple[str, str]] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """行数（リストのため子を持たない）"""
+        if parent.isValid():
+            return 0
+        return len(self._windows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """行のデータ（表示形式: "ID: 名前"）"""
+        if not index.isValid() or not 0 <= index.row() < len(self._windows):
+            return None
+        window_id, window_name = self._windows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{window_id}: {window_name}"
+        if role == self.WindowIdRole:
+            return window_id
+        return None
+
+    def update(self, windows: list[tuple[str, str]]) -> None:
+        """
+        一覧を更新（差分のみ適用）
+
+        Args:
+            windows: [(window_id, window_name), ...]
+        """
+        splices, updates = diff_window_lists(self._windows, windows)
+        for position, removed, added in splices:
+            if removed:
+                self.beginRemoveRows(QModelIndex(), position, position + removed - 1)
+                del self._windows[position:position + removed]
+                self.endRemoveRows()
+            if added:
+                self.beginInsertRows(QModelIndex(), position, position + len(added) - 1)
+                self._windows[position:position] = added
+                self.endInsertRows()
+        for position, window_name in updates:
+            self._windows[position] = (self._windows[position][0], window_name)
+            index = self.index(position)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+
+    def window_id(self, row: int) -> str:
+        """行のウィンドウID"""
+        return self._windows[row][0]
@@ -1,30 +1,9 @@
-"""依存関係チェックユーティリティ"""
+"""依存関係チェックユーティリティ（mini_text_core.utils.dependency_checkerの互換モジュール）"""
 
-import shutil
+import sys
 
+from mini_text_core.utils import dependency_checker
 
-class DependencyChecker:
-    """xdotool/xclipのインストール確認を行うクラス"""
-
-    # 必要な外部コマンドのリスト
-    REQUIRED_COMMANDS = ["xdotool", "xclip"]
-
-    @staticmethod
-    def check_dependencies() -> tuple[bool, list[str]]:
-        """
-        必要な外部コマンドがインストールされているかチェック
-
-        Returns:
-            tuple[bool, list[str]]: (全て利用可能か, 不足しているツールのリスト)
-        """
-        missing_tools = []
-
-        for command in DependencyChecker.REQUIRED_COMMANDS:
-            # shutil.which()でコマンドの存在を確認
-            if shutil.which(command) is None:
-                missing_tools.append(command)
-
-        # 全てのツールが利用可能ならTrue
-        all_available = len(missing_tools) == 0
-
-        return all_available, missing_tools
+# 旧モジュール名でも共通パッケージのモジュールそのものを参照させる
+# （クラスの同一性とunittest.mock.patchの対象を共通パッケージと一致させる）
+sys.modules[__name__] = dependency_checker
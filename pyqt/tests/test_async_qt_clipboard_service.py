@@ -0,0 +1,82 @@
+"""AsyncQtClipboardServiceのユニットテスト"""
+
+import asyncio
+import threading
+import unittest
+from unittest.mock import Mock
+from mini_text.services.async_qt_clipboard_service import AsyncQtClipboardService
+
+
+class TestAsyncQtClipboardService(unittest.TestCase):
+    """AsyncQtClipboardServiceのテストケース"""
+
+    def setUp(self):
+        """各テストの前に実行される準備処理"""
+        self.mock_clipboard = Mock()
+        self.dispatched = []
+
+        def dispatch(func):
+            # GUIスレッドの代わりに別スレッドで実行
+            self.dispatched.append(func)
+            threading.Thread(target=func).start()
+
+        self.service = AsyncQtClipboardService(self.mock_clipboard, dispatch)
+        # dataChangedに接続されたハンドラ
+        self.on_data_changed = self.mock_clipboard.dataChanged.connect.call_args.args[0]
+
+    def test_copy_to_clipboard_success(self):
+        """GUIスレッド経由でコピーすることを確認"""
+        success, error_msg = asyncio.run(self.service.copy_to_clipboard("テストテキスト"))
+
+        self.assertTrue(success)
+        self.assertEqual(len(self.dispatched), 1)
+        self.mock_clipboard.setText.assert_called_once_with("テストテキスト")
+
+    def test_copy_to_clipboard_failure(self):
+        """コピーで例外が発生した場合の処理を確認"""
+        self.mock_clipboard.setText.side_effect = RuntimeError("エラー")
+
+        success, error_msg = asyncio.run(self.service.copy_to_clipboard("テストテキスト"))
+
+        self.assertFalse(success)
+        self.assertIn("コピーに失敗", error_msg)
+
+    def test_get_from_clipboard_success(self):
+        """GUIスレッド経由で取得することを確認"""
+        self.mock_clipboard.text.return_value = "取得したテキスト"
+
+        success, text, error_msg = asyncio.run(self.service.get_from_clipboard())
+
+        self.assertTrue(success)
+        self.assertEqual(text, "取得したテキスト")
+
+    def test_wait_for_change(self):
+        """dataChangedで待機が解除されることを確認"""
+        mark = self.service.mark_change()
+        threading.Timer(0.01, self.on_data_changed).start()
+
+        self.assertTrue(self.service.wait_for_change(mark, 1.0))
+        self.assertEqual(self.service.mark_change(), mark + 1)
+
+    def test_wait_for_change_timeout(self):
+        """更新されない場合はFalseを返すことを確認"""
+        mark = self.service.mark_change()
+
+        self.assertFalse(self.service.wait_for_change(mark, 0.01))
+
+
+    def test_get_from_primary_success(self):
+        """GUIスレッド経由でPRIMARYから取得することを確認"""
+        self.mock_clipboard.text.return_value = "選択したテキスト"
+
+        success, text, error_msg = asyncio.run(self.service.get_from_primary())
+
+        self.assertTrue(success)
+        self.assertEqual(text, "選択したテキスト")
+        self.assertEqual(len(self.dispatched), 1)
+        self.mock_clipboard.text.assert_called_once_with(
+            self.mock_clipboard.Mode.Selection
+        )
+
+if __name__ == "__main__":
+    unittest.main()
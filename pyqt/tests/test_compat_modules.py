@@ -0,0 +1,34 @@
+"""旧モジュール名（mini_text.*）の互換モジュールのユニットテスト
+
+共通パッケージ（mini_text_core）自体のテストはcore/testsにある
+"""
+
+import importlib
+import unittest
+
+import mini_text  # noqa: F401  共通パッケージ（mini_text_core）の検索パスを設定
+from mini_text_core.config import config_manager
+from mini_text_core.services import clipboard_service, text_service, window_service
+from mini_text_core.utils import job_queue, x11_command_executor
+
+
+class TestCompatModules(unittest.TestCase):
+    """互換モジュールのテストケース"""
+
+    def test_compat_module_is_core_module(self):
+        """旧モジュール名が共通パッケージのモジュールそのものを指すことを確認"""
+        modules = {
+            "mini_text.config.config_manager": config_manager,
+            "mini_text.services.clipboard_service": clipboard_service,
+            "mini_text.services.text_service": text_service,
+            "mini_text.services.window_service": window_service,
+            "mini_text.utils.job_queue": job_queue,
+            "mini_text.utils.x11_command_executor": x11_command_executor,
+        }
+        for name, module in modules.items():
+            with self.subTest(name=name):
+                self.assertIs(importlib.import_module(name), module)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+"""qt_asyncのユニットテスト"""
+
+import importlib.util
+import unittest
+from unittest.mock import MagicMock, Mock
+
+PYQT6_AVAILABLE = importlib.util.find_spec("PyQt6") is not None
+
+if PYQT6_AVAILABLE:
+    from mini_text.ui.qt_async import run_event_loop
+
+
+@unittest.skipUnless(PYQT6_AVAILABLE, "PyQt6が必要")
+class TestRunEventLoop(unittest.TestCase):
+    """run_event_loopのテストケース"""
+
+    def test_returns_exit_code_of_app(self):
+        """専用スレッドのループの場合はapp.exec()の終了コードを返すことを確認"""
+        app = Mock()
+        app.exec.return_value = 3
+        runner = Mock()
+        runner.owns_loop.return_value = True
+
+        self.assertEqual(run_event_loop(app, runner), 3)
+
+    def test_returns_exit_code_with_qasync(self):
+        """qasyncの場合もapp.exit()に渡された終了コードを返すことを確認"""
+        app = Mock()
+        runner = Mock()
+        runner.owns_loop.return_value = False
+        runner.loop = MagicMock()
+        # qasyncのrun_forever()は内部のapp.exec()の戻り値を返す
+        runner.loop.run_forever.return_value = 2
+
+        self.assertEqual(run_event_loop(app, runner), 2)
+        runner.loop.__enter__.assert_called_once()
+        runner.loop.__exit__.assert_called_once()
+        app.exec.assert_not_called()
+
+    def test_qasync_without_exit_code(self):
+        """終了コードを返さないqasyncの場合は0を返すことを確認"""
+        runner = Mock()
+        runner.owns_loop.return_value = False
+        runner.loop = MagicMock()
+        runner.loop.run_forever.return_value = None
+
+        self.assertEqual(run_event_loop(Mock(), runner), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""ui_loaderのユニットテスト"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+from mini_text.ui.ui_loader import get_source_hash, load_ui
+
+
+COMPILED_MODULE = '''
+class Ui_Sample:
+    def setupUi(self, widget):
+        widget.setup_called = True
+        self.send_button = "send_button"
+        self.action_quit = "action_quit"
+
+
+SOURCE_SHA256 = "{source_hash}"
+UI_CLASS = Ui_Sample
+'''
+
+
+class TestUiLoader(unittest.TestCase):
+    """load_uiのテストケース"""
+
+    def setUp(self):
+        """各テストの前に実行される準備処理"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        self.resources_dir = root / "resources"
+        self.resources_dir.mkdir()
+        self.ui_file = self.resources_dir / "sample.ui"
+        self.ui_file.write_text("<ui version=\"4.0\"/>", encoding="utf-8")
+
+        # コンパイル済みのモジュールを置くパッケージ（テストごとに別の名前）
+        self.package = f"compiled_{id(self)}"
+        self.package_dir = root / self.package
+        self.package_dir.mkdir()
+        (self.package_dir / "__init__.py").write_text("", encoding="utf-8")
+        sys.path.insert(0, str(root))
+
+        self.mock_uic = Mock()
+        self.pyqt = Mock(uic=self.mock_uic)
+
+    def tearDown(self):
+        """各テストの後に実行される後処理"""
+        sys.path.remove(self.temp_dir.name)
+        for name in list(sys.modules):
+            if name.startswith(self.package):
+                del sys.modules[name]
+        self.temp_dir.cleanup()
+
+    def write_compiled(self, source_hash: str):
+        """コンパイル済みのモジュールを作成"""
+        (self.package_dir / "ui_sample.py").write_text(
+            COMPILED_MODULE.format(source_hash=source_hash), encoding="utf-8"
+        )
+
+    def load(self, widget) -> bool:
+        """テスト用のディレクトリとパッケージでload_uiを呼び出す"""
+        with patch.dict(sys.modules, {"PyQt6": self.pyqt}):
+            return load_ui(
+                widget,
+                "sample",
+                resources_dir=self.resources_dir,
+                compiled_package=self.package,
+            )
+
+    def test_uses_compiled_module(self):
+        """最新のコンパイル済みのモジュールがある場合はそれを使用することを確認"""
+        self.write_compiled(get_source_hash(self.ui_file))
+        widget = Mock()
+
+        used_compiled = self.load(widget)
+
+        self.assertTrue(used_compiled)
+        self.assertTrue(widget.setup_called)
+        # 子ウィジェットがウィジェットの属性として参照できる
+        self.assertEqual(widget.send_button, "send_button")
+        self.assertEqual(widget.action_quit, "action_quit")
+        self.mock_uic.loadUi.assert_not_called()
+
+    def test_falls_back_when_not_compiled(self):
+        """コンパイル済みのモジュールがない場合は実行時に読み込むことを確認"""
+        widget = Mock()
+
+        used_compiled = self.load(widget)
+
+        self.assertFalse(used_compiled)
+        self.mock_uic.loadUi.assert_called_once_with(self.ui_file, widget)
+
+    def test_falls_back_when_stale(self):
+        """.uiファイルが変更されている場合は実行時に読み込むことを確認"""
+        self.write_compiled(get_source_hash(self.ui_file))
+        self.ui_file.write_text("<ui version=\"4.0\"><class/></ui>", encoding="utf-8")
+        widget = Mock()
+
+        used_compiled = self.load(widget)
+
+        self.assertFalse(used_compiled)
+        self.mock_uic.loadUi.assert_called_once_with(self.ui_file, widget)
+
+
+if __name__ == "__main__":
+    unittest.main()